@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+BatchVerifier Class
+
+- Verifies Falcon-512 signatures in bulk: (message, signature, public_key) tuples.
+- Large batches are split into chunks and verified across a process pool;
+  small batches run in-process where pool overhead would dominate.
+- Results come back in input order.
+- With `short_circuit=True`, chunks are dispatched one wave (one chunk per worker)
+  at a time and the remaining waves are skipped once any signature fails.
+- Each worker keeps the VerifyingKeys (NTT(h) precomputed) of the public keys it has seen.
+- Checks already in the shared SignatureCache are skipped; new successes are added to it.
+"""
+
+import sys
+import os
+import multiprocessing
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
+
+# Add project root to sys.path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+sys.path.append(project_root)
+
+from Zyiron_Chain.blockchain.constants import Constants
+from Zyiron_Chain.falcon.falcon.falcon import VerifyingKey
+from Zyiron_Chain.accounts.signature_cache import SignatureCache
+
+
+# 🔑 Per-process VerifyingKey cache (lives in each pool worker and in the parent)
+_VERIFYING_KEYS = {}
+_VERIFYING_KEYS_MAX = 1024
+
+
+def _get_verifying_key(public_key) -> Optional[VerifyingKey]:
+    """
+    Accepts a VerifyingKey, a list of h coefficients, or the Base64 `{"h": [...]}`
+    encoding stored by KeyManager.
+    """
+    if public_key is None:
+        return None
+    if isinstance(public_key, VerifyingKey):
+        return public_key
+
+    cache_key = public_key if isinstance(public_key, str) else tuple(public_key)
+    verifying_key = _VERIFYING_KEYS.get(cache_key)
+    if verifying_key is None:
+        if isinstance(public_key, str):
+            from Zyiron_Chain.accounts.key_manager import KeyManager
+            verifying_key = KeyManager.verifying_key_from_public_key(public_key)
+        else:
+            verifying_key = VerifyingKey([int(coef) for coef in public_key])
+
+        if len(_VERIFYING_KEYS) >= _VERIFYING_KEYS_MAX:
+            _VERIFYING_KEYS.clear()
+        _VERIFYING_KEYS[cache_key] = verifying_key
+    return verifying_key
+
+
+def _verify_chunk(chunk: Sequence[Tuple]) -> List[bool]:
+    """
+    Verify one chunk of (message, signature, public_key) tuples. Runs inside pool workers.
+    Any malformed entry verifies as False.
+    """
+    results = []
+    for message, signature, public_key in chunk:
+        try:
+            verifying_key = _get_verifying_key(public_key)
+            if verifying_key is None or not signature:
+                results.append(False)
+                continue
+            if isinstance(message, str):
+                message = message.encode("utf-8")
+            if isinstance(signature, str):
+                signature = bytes.fromhex(signature)
+            results.append(bool(verifying_key.verify(message, signature)))
+        except Exception:
+            results.append(False)
+    return results
+
+
+class BatchVerifier:
+    def __init__(self, worker_count: Optional[int] = None, chunk_size: Optional[int] = None,
+                 cache: Optional[SignatureCache] = None):
+        """
+        :param worker_count: Pool size (defaults to Constants.SIGNATURE_VERIFY_WORKER_COUNT).
+        :param chunk_size: Signatures per pool task (defaults to Constants.SIGNATURE_VERIFY_CHUNK_SIZE).
+        :param cache: Verification result cache (defaults to the process-wide SignatureCache).
+        """
+        self.worker_count = max(1, int(worker_count or Constants.SIGNATURE_VERIFY_WORKER_COUNT))
+        self.chunk_size = max(1, int(chunk_size or Constants.SIGNATURE_VERIFY_CHUNK_SIZE))
+        self.cache = cache if cache is not None else SignatureCache.shared()
+        self._pool = None
+
+    def _get_pool(self):
+        """
+        Start the worker pool on first parallel batch and keep it for later batches.
+        """
+        if self._pool is None:
+            print(f"[BatchVerifier] INFO: Starting signature verification pool with {self.worker_count} workers.")
+            self._pool = multiprocessing.Pool(processes=self.worker_count)
+        return self._pool
+
+    def close(self):
+        """
+        Shut down the worker pool (if started).
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+
+    def verify_batch(self, items: Iterable[Tuple], short_circuit: bool = True) -> List[bool]:
+        """
+        Verify (message, signature, public_key) tuples and return one bool per item, in input order.
+        - Items found in the SignatureCache are reported True without any crypto work.
+        - Batches below `Constants.SIGNATURE_VERIFY_MIN_PARALLEL` are verified in-process.
+        - With `short_circuit`, verification stops after the first wave containing a failure;
+          items that were never checked are reported as False.
+        """
+        items = list(items)
+        if not items:
+            return []
+
+        results = [False] * len(items)
+        cache_keys = [self.cache.make_key(*item) for item in items]
+        pending = []
+        for position, cache_key in enumerate(cache_keys):
+            if self.cache.contains(cache_key):
+                results[position] = True
+            else:
+                pending.append(position)
+
+        if not pending:
+            return results
+
+        chunks = [pending[i:i + self.chunk_size] for i in range(0, len(pending), self.chunk_size)]
+        use_pool = self.worker_count > 1 and len(pending) >= Constants.SIGNATURE_VERIFY_MIN_PARALLEL
+        wave_size = self.worker_count if use_pool else 1
+
+        try:
+            for wave_start in range(0, len(chunks), wave_size):
+                wave = chunks[wave_start:wave_start + wave_size]
+                item_chunks = [[items[position] for position in chunk] for chunk in wave]
+                if use_pool:
+                    wave_results = self._get_pool().map(_verify_chunk, item_chunks)
+                else:
+                    wave_results = [_verify_chunk(chunk) for chunk in item_chunks]
+
+                wave_ok = True
+                for chunk, chunk_results in zip(wave, wave_results):
+                    for position, valid in zip(chunk, chunk_results):
+                        results[position] = valid
+                        if valid:
+                            self.cache.add(cache_keys[position])
+                        else:
+                            wave_ok = False
+
+                if short_circuit and not wave_ok:
+                    checked = sum(len(chunk) for chunk in chunks[:wave_start + wave_size])
+                    print(f"[BatchVerifier.verify_batch] ❌ ERROR: Signature check failed at item {results.index(False)}; skipping remaining {len(pending) - checked} signatures.")
+                    break
+
+            return results
+
+        except Exception as e:
+            print(f"[BatchVerifier.verify_batch] ❌ ERROR: Batch verification failed: {e}")
+            self.close()
+            return [False] * len(items)
+
+    def verify_all(self, items: Iterable[Tuple]) -> bool:
+        """
+        Return True only if every signature in the batch is valid (short-circuits on the first failure).
+        """
+        return all(self.verify_batch(items, short_circuit=True))
+
+    @staticmethod
+    def transaction_checks(transactions: Iterable, resolve_public_key: Callable) -> List[Tuple]:
+        """
+        Build the (message, signature, public_key) tuples for every signed input of `transactions`.
+        - Coinbase transactions carry no signatures and are skipped.
+        - The signed message is the transaction hash (as in `Transaction.sign`), the signature is
+          the hex `script_sig` of each input, and `resolve_public_key(tx, tx_in)` supplies the key.
+        """
+        checks = []
+        for tx in transactions:
+            tx_type = tx.get("type") if isinstance(tx, dict) else getattr(tx, "type", None)
+            if tx_type == "COINBASE":
+                continue
+
+            if isinstance(tx, dict):
+                message = tx.get("tx_hash") or tx.get("hash")
+                inputs = tx.get("inputs", [])
+            else:
+                message = getattr(tx, "tx_hash", None) or getattr(tx, "hash", None)
+                inputs = getattr(tx, "inputs", [])
+
+            for tx_in in inputs:
+                script_sig = tx_in.get("script_sig") if isinstance(tx_in, dict) else getattr(tx_in, "script_sig", None)
+                checks.append((message, script_sig, resolve_public_key(tx, tx_in)))
+        return checks
+
+    @staticmethod
+    def public_key_resolver(utxo_lookup: Callable, key_manager=None, network: Optional[str] = None) -> Callable:
+        """
+        Public-key resolver for any signer: looks up the spent output with `utxo_lookup(tx_out_id)`
+        and returns the input's own `public_key` when it hashes to that output's `script_pub_key`.
+        - Inputs without a public key fall back to the local wallet (`key_manager`), if given.
+        - A key that does not match the spent output, or an unknown output, resolves to None.
+        """
+        def resolve(tx, tx_in):
+            try:
+                from Zyiron_Chain.accounts.key_manager import KeyManager
+
+                if isinstance(tx_in, dict):
+                    tx_out_id, public_key = tx_in.get("tx_out_id"), tx_in.get("public_key")
+                else:
+                    tx_out_id, public_key = tx_in.tx_out_id, getattr(tx_in, "public_key", None)
+
+                utxo = utxo_lookup(tx_out_id)
+                if not utxo:
+                    return None
+                script_pub_key = utxo.get("script_pub_key") if isinstance(utxo, dict) else getattr(utxo, "script_pub_key", None)
+                if not script_pub_key:
+                    return None
+
+                net = network or getattr(key_manager, "network", None) or Constants.NETWORK
+                if public_key:
+                    return public_key if KeyManager.hash_public_key(public_key, net) == script_pub_key else None
+                if key_manager is not None:
+                    return key_manager.get_raw_public_key(script_pub_key, net)
+                return None
+            except Exception:
+                return None
+        return resolve
+
+    @staticmethod
+    def key_manager_resolver(key_manager, utxo_lookup: Callable) -> Callable:
+        """
+        Resolver for inputs signed by the local wallet; keys carried on the input are preferred
+        (see `public_key_resolver`).
+        """
+        return BatchVerifier.public_key_resolver(utxo_lookup, key_manager=key_manager)
@@ -19,9 +19,11 @@ import os
 import json
 import base64
 import hashlib
+import threading
+from collections import OrderedDict
   # Import Wallet for Falcon key generation
 from Zyiron_Chain.blockchain.constants import Constants
-from Zyiron_Chain.falcon.falcon.falcon import HEAD_LEN, SALT_LEN, SecretKey, PublicKey
+from Zyiron_Chain.falcon.falcon.falcon import HEAD_LEN, SALT_LEN, SecretKey, PublicKey, VerifyingKey
 from Zyiron_Chain.accounts.wallet_api import serialize_complex 
 import os
 import qrcode
@@ -32,9 +34,21 @@ from PIL import Image, ImageDraw, ImageFont
 
 SIGNATURE_MAX_LENGTH = 750
 
+# 🔑 Process-wide signing state shared by every KeyManager instance:
+# - `_SIGNING_KEY_CACHE` is an LRU of fully expanded Falcon SecretKeys (Gram matrix,
+#   FFT basis and ffLDL tree already built), keyed by (network, identifier).
+# - `_VERIFYING_KEY_CACHE` is the matching LRU of VerifyingKeys (NTT(h) precomputed).
+# - `_SHARED_MANAGERS` holds one KeyManager per key file so callers such as
+#   `Transaction.sign` do not re-read the key file for every signature.
+_SIGNING_KEY_CACHE = OrderedDict()
+_VERIFYING_KEY_CACHE = OrderedDict()
+_SHARED_MANAGERS = {}
+_SIGNING_KEY_LOCK = threading.Lock()
+
 class KeyManager:
     def __init__(self, key_file="Keys/KeyManager_Public_Private_Keys.json"):
         self.key_file = key_file
+        self._key_file_mtime = None
         self.network = "mainnet"  # Default network
         self.keys = {}
         self.MAX_KEYGEN_ATTEMPTS = 10  # Increased from 3 to handle Falcon-512 complexity
@@ -194,6 +208,7 @@ class KeyManager:
                 if os.path.exists(self.key_file):
                     with open(self.key_file, "r") as f:
                         self.keys = json.load(f)
+                    self._key_file_mtime = os.path.getmtime(self.key_file)
                     print(f"✅ Loaded existing key file: {self.key_file}")
                     return
                 
@@ -764,8 +779,8 @@ class KeyManager:
             if not key_data:
                 raise ValueError(f"Key '{identifier}' not found in network '{network}'")
 
-            # ✅ Deserialize keys
-            secret_key, _ = self.deserialize_falcon_key(key_data)
+            # ✅ Reuse the cached, pre-expanded SecretKey
+            secret_key = self.get_signing_key(network, identifier)
 
             # ✅ Ensure bytes format
             message_bytes = message.encode("utf-8") if isinstance(message, str) else message
@@ -780,6 +795,113 @@ class KeyManager:
 
 
 
+    @classmethod
+    def shared(cls, key_file="Keys/KeyManager_Public_Private_Keys.json") -> "KeyManager":
+        """
+        Return the process-wide KeyManager for `key_file`, creating it on first use.
+        The key file is only re-read when its modification time changes on disk.
+        """
+        path = os.path.abspath(key_file)
+        with _SIGNING_KEY_LOCK:
+            manager = _SHARED_MANAGERS.get(path)
+
+        if manager is None:
+            manager = cls(key_file)
+            with _SIGNING_KEY_LOCK:
+                manager = _SHARED_MANAGERS.setdefault(path, manager)
+        elif os.path.exists(key_file) and os.path.getmtime(key_file) != manager._key_file_mtime:
+            print(f"🔄 Key file changed on disk. Reloading: {key_file}")
+            manager.load_or_initialize_keys()
+
+        return manager
+
+    def get_signing_key(self, network: str, identifier: str) -> SecretKey:
+        """
+        Return a ready-to-sign Falcon SecretKey from the process-wide LRU cache.
+        - Keys are rebuilt only on a cache miss or when the stored private key changed.
+        - The least recently used key is evicted beyond `Constants.SIGNING_KEY_CACHE_SIZE`.
+        """
+        key_data = self.keys.get(network, {}).get("keys", {}).get(identifier)
+        if not key_data:
+            raise ValueError(f"Key '{identifier}' not found in network '{network}'")
+
+        cache_key = (network, identifier)
+        fingerprint = hashlib.sha3_256(str(key_data["private_key"]).encode("utf-8")).hexdigest()
+
+        with _SIGNING_KEY_LOCK:
+            cached = _SIGNING_KEY_CACHE.get(cache_key)
+            if cached and cached[0] == fingerprint:
+                _SIGNING_KEY_CACHE.move_to_end(cache_key)
+                return cached[1]
+
+        # ✅ Expand outside the lock: building the ffLDL tree is the expensive part
+        private_polys = self.deserialize_polynomials(key_data["private_key"])
+        secret_key = SecretKey(512, polys=[
+            private_polys['f'],
+            private_polys['g'],
+            private_polys['F'],
+            private_polys['G']
+        ])
+
+        with _SIGNING_KEY_LOCK:
+            _SIGNING_KEY_CACHE[cache_key] = (fingerprint, secret_key)
+            _SIGNING_KEY_CACHE.move_to_end(cache_key)
+            while len(_SIGNING_KEY_CACHE) > max(1, Constants.SIGNING_KEY_CACHE_SIZE):
+                _SIGNING_KEY_CACHE.popitem(last=False)
+
+        return secret_key
+
+    def get_verifying_key(self, network: str, identifier: str) -> VerifyingKey:
+        """
+        Return a verify-only Falcon key built from the stored public polynomial h.
+        - No SecretKey / FFT tree is reconstructed; NTT(h) is computed once and cached (LRU).
+        """
+        key_data = self.keys.get(network, {}).get("keys", {}).get(identifier)
+        if not key_data:
+            raise ValueError(f"Key '{identifier}' not found in network '{network}'")
+
+        cache_key = (network, identifier)
+        fingerprint = hashlib.sha3_256(str(key_data["public_key"]).encode("utf-8")).hexdigest()
+
+        with _SIGNING_KEY_LOCK:
+            cached = _VERIFYING_KEY_CACHE.get(cache_key)
+            if cached and cached[0] == fingerprint:
+                _VERIFYING_KEY_CACHE.move_to_end(cache_key)
+                return cached[1]
+
+        verifying_key = self.verifying_key_from_public_key(key_data["public_key"])
+
+        with _SIGNING_KEY_LOCK:
+            _VERIFYING_KEY_CACHE[cache_key] = (fingerprint, verifying_key)
+            _VERIFYING_KEY_CACHE.move_to_end(cache_key)
+            while len(_VERIFYING_KEY_CACHE) > max(1, Constants.SIGNING_KEY_CACHE_SIZE):
+                _VERIFYING_KEY_CACHE.popitem(last=False)
+
+        return verifying_key
+
+    @staticmethod
+    def verifying_key_from_public_key(public_key: str) -> VerifyingKey:
+        """
+        Build a VerifyingKey from the Base64 `{"h": [...]}` public-key encoding stored in the key file.
+        """
+        try:
+            public_key_json = json.loads(base64.b64decode(public_key).decode("utf-8"))
+            return VerifyingKey([int(coef) for coef in public_key_json["h"]])
+        except Exception as e:
+            raise ValueError(f"Public key deserialization failed: {str(e)}")
+
+    @staticmethod
+    def hash_public_key(public_key: str, network: str) -> str:
+        """
+        Network-prefixed hash of a Base64 `{"h": [...]}` public key, i.e. the script_pub_key it pays to.
+        """
+        try:
+            public_key_json = json.loads(base64.b64decode(public_key).decode("utf-8"))
+            serialized_key = json.dumps({"h": public_key_json["h"]}, default=serialize_complex).encode("utf-8")
+        except Exception as e:
+            raise ValueError(f"Public key deserialization failed: {str(e)}")
+        return ("ZYT" if network == "testnet" else "ZYC") + hashlib.sha3_384(serialized_key).hexdigest()
+
     def deserialize_falcon_key(self, key_data: dict) -> tuple[SecretKey, PublicKey]:
         """
         Fully reconstruct Falcon keys from serialized data with validation.
@@ -817,15 +939,15 @@ class KeyManager:
 
 
     def verify_transaction(self, message: bytes, signature: (str|bytes), network: str, identifier: str) -> bool:
-        """Verify a signature using the deserialize_falcon_key function"""
+        """Verify a signature with the cached verify-only key (see get_verifying_key)"""
         try:
             # Get key data
             key_data = self.keys[network]["keys"].get(identifier)
             if not key_data:
                 raise ValueError(f"Key '{identifier}' not found")
             
-            # Deserialize keys using centralized function
-            _, public_key = self.deserialize_falcon_key(key_data)
+            # Verify-only key: no secret key reconstruction
+            public_key = self.get_verifying_key(network, identifier)
             
             # Convert inputs to bytes if needed
             signature_bytes = base64.b64decode(signature) if isinstance(signature, str) else signature
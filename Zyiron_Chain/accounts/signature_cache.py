@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+SignatureCache Class
+
+- Bounded LRU of successful Falcon-512 verifications, shared by mempool admission
+  and block validation so a transaction's signatures are only checked once.
+- Entries are keyed by (tx hash, SHA3-256 of the signature, SHA3-256 of the public key);
+  only successful verifications are stored.
+- Entries for a transaction are evicted once it is confirmed in a stored block,
+  or when the block that contained it is rolled back.
+"""
+
+import sys
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+# Add project root to sys.path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+sys.path.append(project_root)
+
+from Zyiron_Chain.blockchain.constants import Constants
+
+
+class SignatureCache:
+    _shared_instance = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        :param max_entries: LRU capacity (defaults to Constants.SIGNATURE_CACHE_SIZE).
+        """
+        self.max_entries = max(1, int(max_entries or Constants.SIGNATURE_CACHE_SIZE))
+        self._entries: "OrderedDict[Tuple[str, str, str], None]" = OrderedDict()
+        self._by_tx: Dict[str, Set[Tuple[str, str, str]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def shared(cls) -> "SignatureCache":
+        """
+        Process-wide cache used by StandardMempool, SmartMempool, BlockManager and BlockStorage.
+        """
+        with cls._shared_lock:
+            if cls._shared_instance is None:
+                cls._shared_instance = cls()
+            return cls._shared_instance
+
+    # -------------------------------------------------------------------------
+    # Key helpers
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _normalize_tx_hash(message) -> Optional[str]:
+        if isinstance(message, (bytes, bytearray)):
+            try:
+                return bytes(message).decode("utf-8")
+            except UnicodeDecodeError:
+                return bytes(message).hex()
+        return message if isinstance(message, str) and message else None
+
+    @staticmethod
+    def _signature_digest(signature) -> Optional[str]:
+        if not signature:
+            return None
+        if isinstance(signature, str):
+            try:
+                signature = bytes.fromhex(signature)
+            except ValueError:
+                signature = signature.encode("utf-8")
+        return hashlib.sha3_256(bytes(signature)).hexdigest()
+
+    @staticmethod
+    def _public_key_digest(public_key) -> Optional[str]:
+        if public_key is None:
+            return None
+        if hasattr(public_key, "h"):
+            public_key = public_key.h
+        if isinstance(public_key, str):
+            encoded = public_key.encode("utf-8")
+        elif isinstance(public_key, (bytes, bytearray)):
+            encoded = bytes(public_key)
+        else:
+            encoded = ",".join(str(int(coef)) for coef in public_key).encode("utf-8")
+        return hashlib.sha3_256(encoded).hexdigest()
+
+    def make_key(self, message, signature, public_key) -> Optional[Tuple[str, str, str]]:
+        """
+        Build the cache key for a (message, signature, public_key) check, or None if any part is missing.
+        """
+        try:
+            tx_hash = self._normalize_tx_hash(message)
+            signature_digest = self._signature_digest(signature)
+            public_key_digest = self._public_key_digest(public_key)
+        except Exception:
+            return None
+        if not tx_hash or not signature_digest or not public_key_digest:
+            return None
+        return (tx_hash, signature_digest, public_key_digest)
+
+    @staticmethod
+    def _get_tx_hash(tx) -> Optional[str]:
+        if isinstance(tx, dict):
+            return tx.get("tx_hash") or tx.get("hash")
+        return getattr(tx, "tx_hash", None) or getattr(tx, "hash", None)
+
+    # -------------------------------------------------------------------------
+    # Lookup & insertion
+    # -------------------------------------------------------------------------
+    def contains(self, key: Optional[Tuple[str, str, str]]) -> bool:
+        """
+        Return True if this exact check has already verified successfully.
+        """
+        if key is None:
+            return False
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True
+            self.misses += 1
+            return False
+
+    def add(self, key: Optional[Tuple[str, str, str]]) -> None:
+        """
+        Record a successful verification, evicting the least recently used entry when full.
+        """
+        if key is None:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return
+            self._entries[key] = None
+            self._by_tx.setdefault(key[0], set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self._discard_index(old_key)
+
+    def _discard_index(self, key: Tuple[str, str, str]) -> None:
+        keys = self._by_tx.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_tx[key[0]]
+
+    # -------------------------------------------------------------------------
+    # Eviction
+    # -------------------------------------------------------------------------
+    def evict_transaction(self, tx_hash) -> int:
+        """
+        Drop every cached verification for one transaction hash. Returns the number of entries removed.
+        """
+        tx_hash = self._normalize_tx_hash(tx_hash)
+        if not tx_hash:
+            return 0
+        with self._lock:
+            keys = self._by_tx.pop(tx_hash, set())
+            for key in keys:
+                self._entries.pop(key, None)
+            return len(keys)
+
+    def evict_transactions(self, transactions: Iterable) -> int:
+        """
+        Drop the cached verifications for a block's transactions (dicts or objects).
+        """
+        removed = 0
+        for tx in transactions or []:
+            removed += self.evict_transaction(self._get_tx_hash(tx))
+        return removed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_tx.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
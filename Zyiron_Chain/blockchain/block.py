@@ -45,6 +45,7 @@ from typing import List, Union, Optional
 from Zyiron_Chain.blockchain.constants import Constants
 from Zyiron_Chain.utils.hashing import Hashing
 from Zyiron_Chain.utils.diff_conversion import DifficultyConverter # Make sure this is imported
+from Zyiron_Chain.blockchain.merkle_tree import MerkleTree
 
 class Block:
     def __init__(
@@ -57,7 +58,8 @@ class Block:
         difficulty: Union[int, str] = None,
         miner_address: str = None,
         fees: Union[int, float, Decimal] = 0,
-        version: str = Constants.VERSION
+        version: str = Constants.VERSION,
+        merkle_tree: Optional[MerkleTree] = None
     ):
         """
         Initializes a Block object with:
@@ -65,6 +67,8 @@ class Block:
         - Uses Proof-of-Work mined hash for block linkage.
         - Ensures only valid 96-character SHA3-384 hex hashes are accepted.
         - Includes fallback logic to prevent crashes due to missing or incorrect data.
+        - `merkle_tree`: optional prebuilt tree for exactly `transactions` (e.g. the miner's
+          incrementally maintained tree); used when its tx_ids match, otherwise rebuilt.
         """
         try:
             print(f"[Block.__init__] INFO: Initializing Block #{index}")
@@ -108,8 +112,9 @@ class Block:
                 print(f"[Block.__init__] ⚠️ WARNING: Invalid `fees` for Block {index}. Defaulting to 0.")
                 self.fees = Decimal(0)
 
-            # ✅ Compute Merkle Root
-            self.merkle_root = self._compute_merkle_root()
+            # ✅ Compute Merkle Root (tree is cached for incremental updates and proofs)
+            self._merkle_tree = None
+            self.merkle_root = self._compute_merkle_root(merkle_tree)
 
             # ✅ Initialize mining fields
             self.hash = None
@@ -135,72 +140,76 @@ class Block:
             raise
 
 
-    def _compute_merkle_root(self) -> str:
+    def _compute_merkle_root(self, merkle_tree: Optional[MerkleTree] = None) -> str:
         """
         Compute the Merkle root for the block's transactions using single SHA3-384 hashing.
-        - If no transactions, returns a hash of ZERO_HASH.
-        - Ensures all transactions are serialized before hashing.
-        - Uses a pairwise tree structure to derive the final root.
+        - If no transactions, returns ZERO_HASH.
+        - A prebuilt `merkle_tree` (e.g. the miner's) is adopted and synced like the cached one,
+          so a leaf cached before its transaction changed cannot leak into the root.
+        - The tree is synced against the block's transactions: every leaf digest is recomputed,
+          but only the paths of leaves that changed (or were appended) are rehashed.
         - Returns a hex string for LMDB compatibility.
         """
         try:
             # ✅ If no transactions, return a default Merkle root
             if not self.transactions:
+                self._merkle_tree = None
                 return Constants.ZERO_HASH  # ✅ Return default hash if no transactions exist
 
-            # ✅ Convert transactions into SHA3-384 hashes (stored as hex)
-            tx_hashes = []
-            for tx in self.transactions:
-                try:
-                    # Ensure transaction has a serializable format
-                    if hasattr(tx, "to_dict"):
-                        tx_serialized = json.dumps(tx.to_dict(), sort_keys=True).encode("utf-8")
-                    elif isinstance(tx, dict):
-                        tx_serialized = json.dumps(tx, sort_keys=True).encode("utf-8")
-                    else:
-                        print(f"[Block._compute_merkle_root] ❌ ERROR: Invalid transaction format: {type(tx)}")
-                        return Constants.ZERO_HASH
+            if merkle_tree is not None:
+                self._merkle_tree = merkle_tree
+                self._merkle_tree.sync(self.transactions)
+            elif getattr(self, "_merkle_tree", None) is None:
+                self._merkle_tree = MerkleTree(self.transactions)
+            else:
+                self._merkle_tree.sync(self.transactions)
 
-                    # Compute SHA3-384 hash of the serialized transaction
-                    tx_hash = Hashing.hash(tx_serialized).hex()
-                    tx_hashes.append(tx_hash)
-                except Exception as e:
-                    print(f"[Block._compute_merkle_root] ❌ ERROR: Failed to process transaction: {e}")
-                    return Constants.ZERO_HASH
+            return self._merkle_tree.root
 
-            # ✅ If no valid transactions exist, return ZERO_HASH
-            if not tx_hashes:
-                return Constants.ZERO_HASH  # ✅ Return default hash
+        except Exception as e:
+            print(f"[Block._compute_merkle_root] ❌ ERROR: Merkle root computation failed: {e}")
+            self._merkle_tree = None
+            return Constants.ZERO_HASH
 
-            # ✅ Compute Merkle tree
-            while len(tx_hashes) > 1:
-                if len(tx_hashes) % 2 != 0:
-                    tx_hashes.append(tx_hashes[-1])  # Duplicate last hash if odd
+    def get_merkle_proof(self, tx_id: str) -> Optional[List[dict]]:
+        """
+        Return the Merkle inclusion proof for a transaction in this block, or None if absent.
+        Verify with `MerkleTree.verify_proof(leaf_hash, proof, block.merkle_root)`.
+        """
+        try:
+            if getattr(self, "_merkle_tree", None) is None:
+                self._compute_merkle_root()
+            if self._merkle_tree is None:
+                return None
+            return self._merkle_tree.get_proof_by_tx_id(tx_id)
+        except Exception as e:
+            print(f"[Block.get_merkle_proof] ❌ ERROR: Failed to build Merkle proof for {tx_id}: {e}")
+            return None
 
-                new_level = [
-                    Hashing.hash((tx_hashes[i] + tx_hashes[i + 1]).encode("utf-8")).hex()
-                    for i in range(0, len(tx_hashes), 2)
-                ]
-                tx_hashes = new_level
+    def get_pow_header_parts(self) -> tuple:
+        """
+        Split the PoW header string around the nonce.
+        - Returns (prefix, suffix) so that `prefix + str(nonce) + suffix` is the exact
+          header string hashed by `calculate_hash()`.
+        - Lets PoW workers vary only the nonce without rebuilding the whole header.
+        """
+        previous_hash_hex = self.previous_hash if isinstance(self.previous_hash, str) else Constants.ZERO_HASH
+        merkle_root_hex = self.merkle_root if isinstance(self.merkle_root, str) else Constants.ZERO_HASH
+        difficulty_hex = self.difficulty if isinstance(self.difficulty, str) else "00" * 48
+        miner_address_hex = self.miner_address if isinstance(self.miner_address, str) else "00" * 128
 
-            return tx_hashes[0]
+        prefix = f"{self.index}|{previous_hash_hex}|{merkle_root_hex}|{self.timestamp}|"
+        suffix = f"|{difficulty_hex}|{miner_address_hex}"
+        return prefix, suffix
 
-        except Exception as e:
-            print(f"[Block._compute_merkle_root] ❌ ERROR: Merkle root computation failed: {e}")
-            return Constants.ZERO_HASH
-        
     def calculate_hash(self) -> str:
         """
         Calculate the block's hash using single SHA3-384.
         Ensures it does not overwrite the PoW-mined hash.
         """
         try:
-            previous_hash_hex = self.previous_hash if isinstance(self.previous_hash, str) else Constants.ZERO_HASH
-            merkle_root_hex = self.merkle_root if isinstance(self.merkle_root, str) else Constants.ZERO_HASH
-            difficulty_hex = self.difficulty if isinstance(self.difficulty, str) else "00" * 48
-            miner_address_hex = self.miner_address if isinstance(self.miner_address, str) else "00" * 128
-
-            header_str = f"{self.index}|{previous_hash_hex}|{merkle_root_hex}|{self.timestamp}|{self.nonce}|{difficulty_hex}|{miner_address_hex}"
+            header_prefix, header_suffix = self.get_pow_header_parts()
+            header_str = f"{header_prefix}{self.nonce}{header_suffix}"
             pow_hash = Hashing.hash(header_str.encode("utf-8")).hex()
 
             # ✅ Ensure mined_hash is not overwritten after PoW completion
@@ -35,6 +35,8 @@ from Zyiron_Chain.transactions.payment_type import PaymentTypeManager
 from Zyiron_Chain.utils.deserializer import Deserializer
 
 from Zyiron_Chain.utils.diff_conversion import DifficultyConverter
+from Zyiron_Chain.accounts.batch_verifier import BatchVerifier
+from Zyiron_Chain.storage.lmdb_capacity import MapSizeController
 
 class BlockManager:
     def __init__(
@@ -80,6 +82,9 @@ class BlockManager:
             # ✅ Initialize in-memory chain
             self.chain = blockchain.chain  # In-memory chain list
 
+            # ✅ Falcon signature batch verifier (process pool started on first large block)
+            self.batch_verifier = BatchVerifier()
+
             # ✅ Network & version settings
             self.network = Constants.NETWORK
             self.version = Constants.VERSION
@@ -184,6 +189,11 @@ class BlockManager:
 
             print(f"[BlockManager.validate_block] ✅ INFO: Block {block.index} timestamp validated.")
 
+            # ✅ Verify all input signatures as one batch (stops at the first invalid signature)
+            if not self.verify_block_signatures(block):
+                print(f"[BlockManager.validate_block] ❌ ERROR: Block {block.index} contains an invalid transaction signature.")
+                return False
+
             # ✅ Optionally Validate Transaction Confirmations
             if check_confirmations:
                 for tx in block.transactions:
@@ -225,6 +235,31 @@ class BlockManager:
 
 
 
+    def verify_block_signatures(self, block) -> bool:
+        """
+        Verify the Falcon-512 signatures of every non-Coinbase input in the block with the BatchVerifier.
+        Public keys come from each input and must hash to the spent output's script_pub_key;
+        the TransactionManager's KeyManager is the fallback for inputs without one.
+        """
+        try:
+            key_manager = getattr(self.transaction_manager, "key_manager", None)
+            utxo_manager = getattr(self.transaction_manager, "utxo_manager", None)
+            if not utxo_manager:
+                print(f"[BlockManager.verify_block_signatures] ❌ ERROR: No UTXOManager available to resolve signer keys for Block {block.index}.")
+                return False
+
+            resolver = BatchVerifier.public_key_resolver(utxo_manager.get_utxo, key_manager=key_manager)
+            checks = BatchVerifier.transaction_checks(block.transactions, resolver)
+            if not checks:
+                return True
+
+            print(f"[BlockManager.verify_block_signatures] INFO: Verifying {len(checks)} signatures in Block {block.index}...")
+            return self.batch_verifier.verify_all(checks)
+
+        except Exception as e:
+            print(f"[BlockManager.verify_block_signatures] ❌ ERROR: Signature verification failed for Block {block.index}: {e}")
+            return False
+
     def calculate_merkle_root(self, transactions) -> str:
         """
         Compute the Merkle root using single SHA3-384 hashing.
@@ -385,7 +420,7 @@ class BlockManager:
 
             # ✅ Update latest block index in LMDB
             try:
-                with self.block_storage.full_block_store.env.begin(write=True) as txn:
+                with self.block_storage.full_block_store.begin(write=True) as txn:
                     txn.put(b"latest_block_index", str(block.index).encode("utf-8"))
                     print(f"[BlockManager.add_block] ✅ INFO: Updated latest_block_index to {block.index}")
             except Exception as e:
@@ -399,6 +434,9 @@ class BlockManager:
                 print(f"[BlockManager.add_block] ❌ ERROR: Failed to store Block {block.index} in block storage: {e}")
                 return False
 
+            # ✅ Drop the block's transactions from the block template
+            self.transaction_manager.on_block_connected(block)
+
             return True
 
         except Exception as e:
@@ -427,7 +465,7 @@ class BlockManager:
 
             # ✅ Fallback: Try direct LMDB scan if block_metadata provides no method
             if hasattr(self.block_metadata, "env"):
-                with self.block_metadata.env.begin() as txn:
+                with MapSizeController.transaction(self.block_metadata.env) as txn:
                     cursor = txn.cursor()
                     latest_index = -1
                     latest_block = None
@@ -11,13 +11,16 @@ Blockchain Class
 
 import sys
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 # Adjust Python path for project structure
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
 sys.path.append(project_root)
 
 import json
 import time
+import itertools
+import multiprocessing
+from decimal import Decimal
 import lmdb
 # -------------------------------------------------------------------------
 # Imports from our new splitted storage modules and block code
@@ -25,6 +28,7 @@ import lmdb
 from Zyiron_Chain.storage.block_storage import BlockStorage
 from Zyiron_Chain.blockchain.block_manager import BlockManager
 from Zyiron_Chain.blockchain.block import Block
+from Zyiron_Chain.blockchain.merkle_tree import MerkleTree
 
 from Zyiron_Chain.blockchain.genesis_block import GenesisBlockManager  # Hypothetical genesis block generator
 
@@ -37,6 +41,82 @@ from Zyiron_Chain.storage.lmdatabase import LMDBManager
 from Zyiron_Chain.utils.diff_conversion import DifficultyConverter
 from Zyiron_Chain.transactions.coinbase import CoinbaseTx
 from Zyiron_Chain.transactions.tx import Transaction
+from Zyiron_Chain.accounts.batch_verifier import BatchVerifier
+
+
+
+def _check_block_context_free(block_data: dict) -> Tuple[int, Optional[str]]:
+    """
+    Context-free checks for one stored block dictionary, run inside `validate_chain` pool workers.
+    Needs nothing but the block itself, so blocks can be checked in any order.
+    - Structure: header fields, 96-hex hash, transaction list with a Coinbase and no duplicate tx_ids.
+    - Transactions: non-Coinbase inputs must carry a hex `script_sig` (Falcon signature); amounts must be valid.
+    - Merkle root recomputed with `MerkleTree`.
+    - PoW: the header string (same layout as `Block.get_pow_header_parts`) must hash to the stored
+      hash, and the hash must be below the block's difficulty target.
+
+    Returns:
+        (height, None) if the block passes, otherwise (height, reason).
+    """
+    header = block_data.get("header") if isinstance(block_data, dict) else None
+    height = header.get("index", -1) if isinstance(header, dict) else -1
+
+    try:
+        if not isinstance(header, dict):
+            return height, "missing header"
+
+        missing_fields = [field for field in ("index", "previous_hash", "merkle_root", "timestamp", "nonce", "difficulty", "miner_address") if field not in header]
+        if missing_fields:
+            return height, f"missing header fields {missing_fields}"
+
+        block_hash = block_data.get("hash")
+        if not isinstance(block_hash, str) or len(block_hash) != 96 or not all(c in "0123456789abcdef" for c in block_hash):
+            return height, f"invalid block hash {block_hash}"
+
+        transactions = block_data.get("transactions")
+        if not isinstance(transactions, list) or not transactions:
+            return height, "no transactions"
+
+        seen_tx_ids = set()
+        coinbase_count = 0
+        for tx in transactions:
+            if not isinstance(tx, dict) or not tx.get("tx_id"):
+                return height, "transaction missing tx_id"
+            if tx["tx_id"] in seen_tx_ids:
+                return height, f"duplicate transaction {tx['tx_id']}"
+            seen_tx_ids.add(tx["tx_id"])
+
+            if tx.get("type") == "COINBASE":
+                coinbase_count += 1
+            else:
+                for tx_in in tx.get("inputs", []):
+                    script_sig = tx_in.get("script_sig") if isinstance(tx_in, dict) else None
+                    if not script_sig:
+                        return height, f"unsigned input in transaction {tx['tx_id']}"
+                    bytes.fromhex(script_sig)
+
+            for tx_out in tx.get("outputs", []):
+                if Decimal(str(tx_out.get("amount", "0"))) < 0:
+                    return height, f"negative output in transaction {tx['tx_id']}"
+
+        if coinbase_count != 1:
+            return height, f"expected 1 Coinbase transaction, found {coinbase_count}"
+
+        if MerkleTree(transactions).root != header["merkle_root"]:
+            return height, "Merkle root mismatch"
+
+        header_str = (f"{header['index']}|{header['previous_hash']}|{header['merkle_root']}|"
+                      f"{header['timestamp']}|{header['nonce']}|{header['difficulty']}|{header['miner_address']}")
+        if Hashing.hash(header_str.encode("utf-8")).hex() != block_hash:
+            return height, "header does not hash to the stored block hash"
+
+        if int(block_hash, 16) >= DifficultyConverter.from_hex(DifficultyConverter.convert(header["difficulty"])):
+            return height, "hash does not meet the difficulty target"
+
+        return height, None
+
+    except Exception as e:
+        return height, f"malformed block data: {e}"
 
 
 
@@ -82,6 +162,9 @@ class Blockchain:
             self.transaction_manager = transaction_manager
             self.key_manager = key_manager
 
+            # ✅ Batch Falcon-512 signature verification (successes land in the shared SignatureCache)
+            self.batch_verifier = BatchVerifier()
+
             # ✅ In-memory blockchain representation
             self.chain = []
 
@@ -126,8 +209,7 @@ class Blockchain:
         try:
             print("[Blockchain.load_chain_from_storage] INFO: Loading blockchain from LMDB...")
 
-            stored_blocks = self.full_block_store.get_all_blocks()
-            if not stored_blocks:
+            if self.block_storage.get_latest_height() < 0:
                 print("[Blockchain.load_chain_from_storage] ❌ WARNING: No blocks found in LMDB.")
                 self.chain = []  # Explicitly clear the chain if empty
                 return []
@@ -135,7 +217,7 @@ class Blockchain:
             loaded_blocks = []
             previous_hash = Constants.ZERO_HASH
 
-            for block_data in stored_blocks:
+            for block_data in self.block_storage.iter_blocks():
                 try:
                     header = block_data.get("header", {})
                     transactions_data = block_data.get("transactions", [])
@@ -387,6 +469,11 @@ class Blockchain:
 
             # ✅ Add to in-memory chain
             self.chain.append(block)
+
+            # ✅ Drop the block's transactions from the block template
+            if self.transaction_manager is not None:
+                self.transaction_manager.on_block_connected(block)
+
             print(f"[Blockchain.add_block] ✅ SUCCESS: Block {block.index} added to the chain.")
             return True
 
@@ -562,6 +649,11 @@ class Blockchain:
                     print(f"[Blockchain.validate_block] ❌ ERROR: Invalid transaction {getattr(tx, 'tx_id', 'UNKNOWN')} in Block {block.index}.")
                     return False
 
+            # ✅ Verify every input signature in one batch
+            if not self.verify_block_signatures(block):
+                print(f"[Blockchain.validate_block] ❌ ERROR: Block {block.index} contains invalid Falcon-512 signatures.")
+                return False
+
             print(f"[Blockchain.validate_block] ✅ SUCCESS: Block {block.index} validated.")
             return True
 
@@ -571,6 +663,33 @@ class Blockchain:
 
 
 
+    def verify_block_signatures(self, block: Block) -> bool:
+        """
+        Verify the Falcon-512 signatures of every non-Coinbase input in the block with the BatchVerifier.
+        Public keys come from each input and must hash to the spent output's script_pub_key;
+        the local KeyManager is the fallback for inputs without one.
+        """
+        try:
+            utxo_manager = getattr(self.transaction_manager, "utxo_manager", None) or getattr(self.utxo_storage, "utxo_manager", None)
+            if not utxo_manager:
+                print(f"[Blockchain.verify_block_signatures] ❌ ERROR: No UTXOManager available to resolve signer keys for Block {block.index}.")
+                return False
+
+            key_manager = self.key_manager or getattr(self.transaction_manager, "key_manager", None)
+            resolver = BatchVerifier.public_key_resolver(utxo_manager.get_utxo, key_manager=key_manager)
+            checks = BatchVerifier.transaction_checks(block.transactions, resolver)
+            if not checks:
+                return True
+
+            print(f"[Blockchain.verify_block_signatures] INFO: Verifying {len(checks)} signatures in Block {block.index}...")
+            return self.batch_verifier.verify_all(checks)
+
+        except Exception as e:
+            print(f"[Blockchain.verify_block_signatures] ❌ ERROR: Signature verification failed for Block {block.index}: {e}")
+            return False
+
+
+
     def purge_chain():
         """
         Placeholder function for purging the blockchain.
@@ -578,108 +697,153 @@ class Blockchain:
         """
         pass
 
-    def validate_chain(self, chain: Optional[List[Block]] = None) -> bool:
+    def validate_chain(self, chain: Optional[List[Block]] = None, resume: bool = True,
+                       worker_count: Optional[int] = None) -> bool:
         """
-        Validate the entire blockchain with robust fallback mechanisms.
-        - Ensures each block is valid and linked correctly.
-        - Validates all transactions in each block using the TransactionManager.
-        - Handles missing or invalid data gracefully.
-        - Uses stored `mined_hash` for accurate previous_hash comparison.
-        - Falls back to block_storage if `chain` is None or incomplete.
+        Validate the blockchain in two phases per batch of blocks:
+        - Phase 1 (parallel): context-free checks (structure, PoW, Merkle root, input
+          signature fields) fan out across a process pool via `_check_block_context_free`.
+        - Phase 2 (sequential): `previous_hash` linkage, version and transaction/UTXO
+          rules are checked in height order with the TransactionManager.
+        - When validating from block_storage, resumes after the `validated_height`
+          checkpoint and advances it every `VALIDATION_CHECKPOINT_INTERVAL` blocks.
+        - Reports throughput in blocks/sec.
+
+        Args:
+            chain (List[Block], optional): In-memory blocks to validate. Defaults to streaming from block_storage.
+            resume (bool): Continue from the stored checkpoint instead of height 0 (storage mode only).
+            worker_count (int, optional): Pool size. Defaults to `Constants.VALIDATION_WORKER_COUNT`.
         """
+        pool = None
         try:
             print("[Blockchain.validate_chain] INFO: Validating blockchain...")
 
-            if chain is None or len(chain) == 0:
-                print("[Blockchain.validate_chain] INFO: No in-memory chain found. Using block_storage fallback.")
-                chain = []
-                height = 0
-                while True:
-                    block = self.block_storage.get_block_by_height(height)
-                    if not block:
-                        print(f"[Blockchain.validate_chain] INFO: Reached end of chain at block height {height}.")
-                        break
-                    chain.append(block)
-                    height += 1
-
-            if not chain:
-                print("[Blockchain.validate_chain] ❌ ERROR: Blockchain is empty.")
-                return False
+            worker_count = max(1, int(worker_count or Constants.VALIDATION_WORKER_COUNT))
+            batch_size = max(1, Constants.VALIDATION_BATCH_SIZE)
+            use_checkpoint = not chain
+            expected_previous_hash = None
 
-            if len(chain) > 0:
-                print(f"[DEBUG] Block 0 previous_hash: {chain[0].previous_hash}")
-                print(f"[DEBUG] Expected previous_hash: {Constants.ZERO_HASH}")
+            if use_checkpoint:
+                latest_height = self.block_storage.get_latest_height()
+                if latest_height < 0:
+                    print("[Blockchain.validate_chain] ❌ ERROR: Blockchain is empty.")
+                    return False
 
-            for i, block in enumerate(chain):
-                print(f"[Blockchain.validate_chain] INFO: Validating Block {block.index}...")
+                start_height = self.block_storage.get_validated_height() + 1 if resume else 0
+                if start_height > latest_height:
+                    print(f"[Blockchain.validate_chain] ✅ SUCCESS: Chain already validated up to height {latest_height}.")
+                    return True
 
-                # ✅ Ensure index is present
-                if not hasattr(block, "index"):
-                    print(f"[Blockchain.validate_chain] ⚠️ WARNING: Block at position {i} missing 'index'. Setting fallback index.")
-                    block.index = i
+                if start_height > 0:
+                    checkpoint_header = next(self.block_storage.iter_blocks(start_height - 1, start_height - 1, headers_only=True), None)
+                    if not checkpoint_header:
+                        print(f"[Blockchain.validate_chain] ⚠️ WARNING: Checkpoint block {start_height - 1} missing. Revalidating from Genesis.")
+                        start_height = 0
+                    else:
+                        expected_previous_hash = checkpoint_header["hash"]
 
-                # ✅ Validate block structure & PoW
-                if not self.validate_block(block):
-                    print(f"[Blockchain.validate_chain] ❌ ERROR: Block {block.index} failed structural or PoW validation.")
-                    return False
+                print(f"[Blockchain.validate_chain] INFO: Validating blocks {start_height}..{latest_height} from block_storage.")
+                blocks = self.block_storage.iter_blocks(start=start_height, end=latest_height)
+            else:
+                blocks = (block.to_dict() if hasattr(block, "to_dict") else block for block in chain)
 
-                # ✅ Genesis block check
-                if i == 0:
-                    if block.previous_hash != Constants.ZERO_HASH:
-                        print(f"[Blockchain.validate_chain] ❌ ERROR: Genesis block previous hash mismatch.\nExpected: {Constants.ZERO_HASH}\nFound:    {block.previous_hash}")
-                        return False
+            if worker_count > 1:
+                pool = multiprocessing.Pool(processes=worker_count)
+
+            validated = 0
+            last_height = None
+            started_at = time.time()
+
+            while True:
+                batch = list(itertools.islice(blocks, batch_size))
+                if not batch:
+                    break
+
+                # ✅ Phase 1: context-free checks in parallel
+                if pool:
+                    results = pool.map(_check_block_context_free, batch, chunksize=max(1, len(batch) // worker_count))
                 else:
-                    # ✅ Use mined_hash or fallback to hash for previous block
-                    previous_block = chain[i - 1]
-                    expected_prev_hash = getattr(previous_block, "mined_hash", previous_block.hash)
-
-                    # Ensure previous_hash exists
-                    if not hasattr(block, "previous_hash"):
-                        print(f"[Blockchain.validate_chain] ⚠️ WARNING: Block {block.index} missing 'previous_hash'. Using fallback.")
-                        block.previous_hash = expected_prev_hash
-
-                    # ✅ Check block linkage
-                    if block.previous_hash != expected_prev_hash:
-                        print(f"[Blockchain.validate_chain] ❌ ERROR: Block {block.index} not linked correctly.")
-                        print(f"Expected: {expected_prev_hash}")
-                        print(f"Found:    {block.previous_hash}")
+                    results = [_check_block_context_free(block_data) for block_data in batch]
+
+                # ✅ Phase 2: ordered linkage & transaction rules
+                for block_data, (height, error) in zip(batch, results):
+                    if error:
+                        print(f"[Blockchain.validate_chain] ❌ ERROR: Block {height} failed context-free validation: {error}")
                         return False
 
-                # ✅ Validate each transaction
-                if not hasattr(block, "transactions") or not isinstance(block.transactions, list):
-                    print(f"[Blockchain.validate_chain] ⚠️ WARNING: Block {block.index} has no valid transaction list. Skipping transaction checks.")
-                    continue
+                    if not self._validate_block_in_order(block_data, expected_previous_hash):
+                        return False
 
-                for j, tx in enumerate(block.transactions):
-                    try:
-                        # Deserialize from dict if needed
-                        if isinstance(tx, dict):
-                            tx_type = tx.get("type", "STANDARD")
-                            tx_obj = CoinbaseTx.from_dict(tx) if tx_type == "COINBASE" else Transaction.from_dict(tx)
-                            block.transactions[j] = tx_obj
-                            tx = tx_obj
+                    expected_previous_hash = block_data["hash"]
+                    last_height = height
+                    validated += 1
 
-                        # Ensure transaction ID
-                        if not hasattr(tx, "tx_id"):
-                            print(f"[Blockchain.validate_chain] ⚠️ WARNING: Transaction in Block {block.index} missing 'tx_id'. Generating fallback.")
-                            tx.tx_id = Hashing.hash(json.dumps(tx.to_dict(), sort_keys=True).encode("utf-8")).hex()
+                    if use_checkpoint and validated % Constants.VALIDATION_CHECKPOINT_INTERVAL == 0:
+                        self.block_storage.set_validated_height(last_height)
 
-                        # Validate transaction
-                        if not self.transaction_manager.validate_transaction(tx):
-                            print(f"[Blockchain.validate_chain] ❌ ERROR: Invalid transaction {tx.tx_id} in Block {block.index}.")
-                            return False
+                elapsed = max(time.time() - started_at, 1e-9)
+                print(f"[Blockchain.validate_chain] INFO: {validated} blocks validated up to height {last_height} ({validated / elapsed:.1f} blocks/sec).")
 
-                    except Exception as tx_err:
-                        print(f"[Blockchain.validate_chain] ❌ ERROR: Exception while validating transaction in Block {block.index}: {tx_err}")
-                        return False
+            if validated == 0:
+                print("[Blockchain.validate_chain] ❌ ERROR: Blockchain is empty.")
+                return False
 
-            print("[Blockchain.validate_chain] ✅ SUCCESS: Blockchain validated successfully.")
+            if use_checkpoint:
+                self.block_storage.set_validated_height(last_height)
+
+            elapsed = max(time.time() - started_at, 1e-9)
+            print(f"[Blockchain.validate_chain] ✅ SUCCESS: Blockchain validated successfully "
+                  f"({validated} blocks in {elapsed:.2f}s, {validated / elapsed:.1f} blocks/sec, {worker_count} workers).")
             return True
 
         except Exception as e:
             print(f"[Blockchain.validate_chain] ❌ ERROR: Blockchain validation failed: {e}")
             return False
 
+        finally:
+            if pool:
+                pool.close()
+                pool.join()
+
+    def _validate_block_in_order(self, block_data: dict, expected_previous_hash: Optional[str]) -> bool:
+        """
+        Sequential half of `validate_chain`: checks that depend on the blocks before this one.
+        - Genesis must reference ZERO_HASH; every other block must reference the previous mined hash.
+        - Block version must match the chain version.
+        - Every transaction must pass `TransactionManager.validate_transaction` (UTXO & spend rules).
+        """
+        header = block_data["header"]
+        height = int(header["index"])
+
+        if height == 0:
+            if header["previous_hash"] != Constants.ZERO_HASH:
+                print(f"[Blockchain.validate_chain] ❌ ERROR: Genesis block previous hash mismatch.\nExpected: {Constants.ZERO_HASH}\nFound:    {header['previous_hash']}")
+                return False
+        elif expected_previous_hash is not None and header["previous_hash"] != expected_previous_hash:
+            print(f"[Blockchain.validate_chain] ❌ ERROR: Block {height} not linked correctly.")
+            print(f"Expected: {expected_previous_hash}")
+            print(f"Found:    {header['previous_hash']}")
+            return False
+
+        if str(header.get("version", Constants.VERSION)) != Constants.VERSION:
+            print(f"[Blockchain.validate_chain] ❌ ERROR: Block {height} has mismatched version. "
+                  f"Expected {Constants.VERSION}, found {header.get('version')}.")
+            return False
+
+        for tx_data in block_data["transactions"]:
+            try:
+                tx = CoinbaseTx.from_dict(tx_data) if tx_data.get("type") == "COINBASE" else Transaction.from_dict(tx_data)
+
+                if not self.transaction_manager.validate_transaction(tx):
+                    print(f"[Blockchain.validate_chain] ❌ ERROR: Invalid transaction {tx.tx_id} in Block {height}.")
+                    return False
+
+            except Exception as tx_err:
+                print(f"[Blockchain.validate_chain] ❌ ERROR: Exception while validating transaction in Block {height}: {tx_err}")
+                return False
+
+        return True
+
 
 
     def _parse_difficulty(self, value) -> str:
@@ -23,6 +23,17 @@ import lmdb
 
 
 
+def hash_transaction_signature(falcon_signature: bytes):
+    """
+    Salt a Falcon-512 signature and compute the SHA3-384 hash stored in `block.data`.
+
+    Returns:
+        tuple: (512-byte salt, 48-byte SHA3-384 hash of signature + salt).
+    """
+    salt = os.urandom(512)
+    return salt, hashlib.sha3_384(falcon_signature + salt).digest()
+
+
 def store_transaction_signature(tx_id: bytes, falcon_signature: bytes, txindex_path: str) -> bytes:
     """
     Stores the Falcon-512 signature in `txindex.lmdb` and writes the SHA3-384 
@@ -39,27 +50,16 @@ def store_transaction_signature(tx_id: bytes, falcon_signature: bytes, txindex_p
     Returns:
         bytes: SHA3-384 hash (48 bytes) stored in block.data.
     """
-    # Generate a 512-byte cryptographic salt
-    salt = os.urandom(512)
+    # Imported lazily: SignatureStore depends on Constants
+    from Zyiron_Chain.storage.signature_store import SignatureStore
 
-    # Compute SHA3-384 hash: Falcon-512 Signature + Salt
-    sha3_384_hash = hashlib.sha3_384(falcon_signature + salt).digest()
-
-    # Ensure the LMDB environment is opened correctly
-    env = lmdb.open(txindex_path, map_size=512 * 1024 * 1024, max_dbs=1)
-
-    # Store full Falcon-512 signature + salt in `txindex.lmdb`
     try:
-        with env.begin(write=True) as txn:
-            txn.put(tx_id, salt + falcon_signature)  # Store salt + full signature
-
+        # Shared, long-lived `txindex.lmdb` environment (no per-call open/close)
+        sha3_384_hash = SignatureStore.shared(txindex_path).put(tx_id, falcon_signature)
         print(f"[INFO] ✅ Falcon-512 Signature stored in `txindex.lmdb` for TX ID {tx_id.hex()}.")
-
     except Exception as e:
         print(f"[ERROR] ❌ Failed to store Falcon-512 Signature: {e}")
-
-    # Close LMDB environment after use
-    env.close()
+        _, sha3_384_hash = hash_transaction_signature(falcon_signature)
 
     # Return SHA3-384 hashed signature for block storage (`block.data`)
     return sha3_384_hash
@@ -113,11 +113,16 @@ class Constants:
         "regnet": "REG-UTXO"
     }
     UTXO_FLAG = UTXO_FLAGS[NETWORK]
+    UTXO_RECORD_VERSION = 1  # 📦 **Binary UTXO record layout version (see utils/utxo_codec.py)**
 
 
 # In Constants class:
-    LMDB_MAP_SIZE = 128 * 1024 * 1024  # 128MB (was incorrectly set to 1024 bytes)
+    LMDB_MAP_SIZE = 128 * 1024 * 1024  # 128MB initial map (grown on demand, see MapSizeController)
     LMDB_MAX_READERS = 200
+    LMDB_MAP_GROWTH_THRESHOLD = 0.80  # 📈 Grow the map before a write would take it past 80% full
+    LMDB_MAP_GROWTH_FACTOR = 2.0  # ✖️ Geometric growth per resize
+    LMDB_MAP_SIZE_MAX = 1024 * 1024 * 1024 * 1024  # 🧱 1TB ceiling on the (virtual) map size
+    LMDB_RESIZE_EVENT_HISTORY = 100  # 📊 Resize events kept per environment for metrics
     
     DATABASES = {
         "block_metadata": "block_metadata",
@@ -164,6 +169,22 @@ class Constants:
         MIN_DIFFICULTY_FACTOR = 0.85  # ⬇️ **Max decrease: 15%**
         MAX_DIFFICULTY_FACTOR = 4.0  # ⬆️ **Max increase: 400%**
 
+    # 🔹 **Proof-of-Work Worker Settings**
+    POW_WORKER_COUNT = max(1, os.cpu_count() or 1)  # ⛏️ **One PoW worker process per CPU core**
+    POW_PROGRESS_INTERVAL = 100000  # 📊 **Log mining progress every 100k nonces per worker**
+    POW_STOP_CHECK_INTERVAL = 1024  # 🛑 **Workers poll the shared stop flag every 1024 nonces**
+
+    # 🔹 **Chain Validation Settings**
+    VALIDATION_WORKER_COUNT = max(1, os.cpu_count() or 1)  # 🧮 **Process-pool size for context-free block checks**
+    VALIDATION_BATCH_SIZE = 256  # 📦 **Blocks read and fanned out to the pool per batch**
+    VALIDATION_CHECKPOINT_INTERVAL = 1000  # 📍 **Persist the validated-height checkpoint every 1000 blocks**
+
+    # 🔹 **Signature Batch Verification**
+    SIGNATURE_VERIFY_WORKER_COUNT = max(1, os.cpu_count() or 1)  # ✍️ **Process-pool size for Falcon signature batches**
+    SIGNATURE_VERIFY_CHUNK_SIZE = 64  # 📦 **Signatures verified per pool task**
+    SIGNATURE_VERIFY_MIN_PARALLEL = 128  # ⚖️ **Smaller batches are verified in-process**
+    SIGNATURE_CACHE_SIZE = 100000  # 🧠 **Successful verifications kept in the shared LRU cache**
+
     # 🔹 **Coin Economics (Fixed Supply Model)**
     MAX_SUPPLY = 70_000_000 if NETWORK == "mainnet" else None  # 🪙 **Fixed supply for mainnet, no max for testnet & regnet**
     INITIAL_COINBASE_REWARD = 5.0  # 🎁 **Fixed block reward per mined block**
@@ -198,6 +219,7 @@ class Constants:
 
     # 🔹 **Hashing & Security**
     ZERO_HASH = "0" * 96  # 📌 **SHA3-384 produces 96-character hex hashes**
+    SIGNING_KEY_CACHE_SIZE = 32  # 🔑 **Expanded Falcon-512 SecretKeys kept ready per process (LRU)**
     # 🔹 **SHA3-384 Hash & Difficulty Target Settings**
     SHA3_384_HASH_SIZE = 96  # ✅ **SHA3-384 produces 96-character hex hashes**
     DIFFICULTY_TARGET_SIZE = 384  # ✅ **Target size in bits for SHA3-384 difficulty calculations**
@@ -208,6 +230,8 @@ class Constants:
     MULTIHOP_MIN_CHANNEL_LIFETIME = 3600  # ⏳ **1-hour min channel open time**
     MULTIHOP_MAX_HOPS = 10  # 🔄 **Max 10 hops per transaction**
     MULTIHOP_REBROADCAST_TIMEOUT = 180  # ⏳ **Rebroadcast pending multi-hop transactions after 3 minutes**
+    MULTIHOP_MAX_ROUTES = 3  # 🧭 **Alternative routes computed per payment (k shortest paths)**
+    MULTIHOP_ROUTE_CACHE_SIZE = 4096  # 🗂️ **Cached route lookups, invalidated on channel changes**
 
     # 🔹 **Instant Payment & HTLC Settings**
     HTLC_LOCK_TIME = 120  # ⏳ **HTLC lock expires in 2 minutes**
@@ -246,7 +270,9 @@ class Constants:
 
 # 🔹 **Database Configuration**
     # Define the maximum block data file size before a new one is created (512 MB)
-    BLOCK_DATA_FILE_SIZE_BYTES = 512  # ✅ Convert MB → Bytes (512MB)
+    BLOCK_DATA_FILE_SIZE_BYTES = 512 * 1024 * 1024  # ✅ Convert MB → Bytes (512MB)
+    BLOCK_SEGMENT_MAX_OPEN = 8  # 📂 **Sealed block segments kept open read-only (LRU)**
+    BLOCK_SEGMENT_MAP_FILL_RATIO = 0.90  # 📦 **Seal the head segment before its LMDB map is full**
 
 
 
@@ -352,6 +378,8 @@ class Constants:
         "regnet": 3    # ⏳ Flush every 3 seconds for Regnet
     }
     LMDB_WAL_FLUSH_INTERVAL = LMDB_WAL_FLUSH_INTERVAL_SETTINGS[NETWORK]  # ✅ Auto-switching WAL timer
+    LMDB_WAL_MAX_PENDING_OPS = 1000  # 📦 Flush early once this many writes are queued
+    LMDB_GROUP_COMMIT_ENABLED = True  # ✅ Route high-write LMDBManager puts/deletes through the WAL
 
     # 🔹 **High-Write Databases That Require WAL**
     LMDB_HIGH_WRITE_DATABASES = {
@@ -31,6 +31,7 @@ from Zyiron_Chain.blockchain.block import Block
 from Zyiron_Chain.utils.hashing import Hashing
 from Zyiron_Chain.utils.deserializer import Deserializer
 from Zyiron_Chain.storage.block_storage import BlockStorage
+from Zyiron_Chain.storage.lmdb_capacity import MapSizeController
 from Zyiron_Chain.accounts.key_manager import KeyManager
 from Zyiron_Chain.utils.diff_conversion import DifficultyConverter  # ✅ Make sure this import exists
 from threading import Lock
@@ -119,7 +120,7 @@ class GenesisBlockManager:
                 if genesis_block.transactions:
                     coinbase_tx = genesis_block.transactions[0]
                     if hasattr(coinbase_tx, "tx_id"):
-                        with self.block_storage.env.begin(write=True) as txn:
+                        with MapSizeController.transaction(self.block_storage.env, write=True) as txn:
                             txn.put(b"GENESIS_COINBASE", coinbase_tx.tx_id.encode("utf-8"))
                         print(f"[GenesisBlockManager.ensure_genesis_block] INFO: Stored Genesis Coinbase TX ID: {coinbase_tx.tx_id}")
 
@@ -558,7 +559,7 @@ class GenesisBlockManager:
 
             # ✅ Serialize and Store Genesis Block
             genesis_block_serialized = json.dumps(genesis_block.to_dict(), sort_keys=True).encode("utf-8")
-            with self.block_storage.env.begin(write=True) as txn:
+            with MapSizeController.transaction(self.block_storage.env, write=True) as txn:
                 txn.put(f"block:0".encode(), genesis_block_serialized)
             print("[GenesisBlockManager.store_genesis_block] ✅ SUCCESS: Genesis block stored correctly in LMDB.")
 
@@ -574,7 +575,7 @@ class GenesisBlockManager:
                         print(f"[GenesisBlockManager.store_genesis_block] ⚠️ WARNING: Skipping invalid transaction format for {tx.tx_id}.")
                         continue
 
-                    with self.tx_storage.env.begin(write=True) as txn:
+                    with MapSizeController.transaction(self.tx_storage.env, write=True) as txn:
                         txn.put(tx.tx_id.encode("utf-8"), json.dumps({
                             "block_hash": genesis_block.hash,
                             "inputs": tx_inputs,
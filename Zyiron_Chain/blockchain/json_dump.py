@@ -85,10 +85,9 @@ class BlockchainIndexer:
         """Dumps the last 500 full blocks into a JSON file for integrity checks."""
         try:
             print("\n📦 Exporting last 500 blockchain blocks for integrity check...")
-            all_blocks = self.block_storage.get_all_blocks()
-
-            # Take last 500 or fewer
-            recent_blocks = all_blocks[-500:] if len(all_blocks) > 500 else all_blocks
+            # Stream only the last 500 (or fewer) blocks
+            latest_height = self.block_storage.get_latest_height()
+            recent_blocks = self.block_storage.iter_blocks(start=max(0, latest_height - 499))
 
             block_data = []
             for b in recent_blocks:
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+MerkleTree Class
+
+- Keeps every level of a block's transaction Merkle tree as raw 48-byte SHA3-384 digests.
+- `sync()` compares leaf digests position by position and only recomputes the paths of
+  leaves that changed (or were appended). Callers that already hold leaf digests for
+  immutable transactions (e.g. the BlockTemplate) pass them in to skip re-serialization.
+- Appending or replacing a transaction only recomputes the path from that leaf to the root.
+- Produces and verifies Merkle inclusion proofs.
+- Root values match the original `Block._compute_merkle_root` rule:
+  leaf = SHA3-384(json.dumps(tx, sort_keys=True)), node = SHA3-384(hex(left) + hex(right)),
+  with the last node duplicated on odd-sized levels.
+"""
+
+import sys
+import os
+import json
+from typing import Dict, List, Optional
+
+# Add project root to sys.path
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+sys.path.append(project_root)
+
+from Zyiron_Chain.blockchain.constants import Constants
+from Zyiron_Chain.utils.hashing import Hashing
+
+
+class MerkleTree:
+    def __init__(self, transactions: Optional[List] = None):
+        """
+        Build the tree for the given transactions (dicts or objects with `to_dict()`).
+        """
+        self._tx_ids: List[Optional[str]] = []
+        self._levels: List[List[bytes]] = [[]]
+
+        for tx in transactions or []:
+            self._tx_ids.append(self._get_tx_id(tx))
+            self._levels[0].append(self.hash_transaction(tx))
+        self._rebuild_levels()
+
+    # -------------------------------------------------------------------------
+    # Hashing helpers
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _get_tx_id(tx) -> Optional[str]:
+        tx_id = tx.get("tx_id") if isinstance(tx, dict) else getattr(tx, "tx_id", None)
+        if isinstance(tx_id, bytes):
+            tx_id = tx_id.hex()
+        return tx_id if isinstance(tx_id, str) and tx_id else None
+
+    @staticmethod
+    def hash_transaction(tx) -> bytes:
+        """
+        Compute the raw leaf digest of a transaction.
+        """
+        if hasattr(tx, "to_dict"):
+            tx_serialized = json.dumps(tx.to_dict(), sort_keys=True).encode("utf-8")
+        elif isinstance(tx, dict):
+            tx_serialized = json.dumps(tx, sort_keys=True).encode("utf-8")
+        else:
+            raise TypeError(f"Invalid transaction format: {type(tx)}")
+        return Hashing.hash(tx_serialized)
+
+    @staticmethod
+    def hash_pair(left: bytes, right: bytes) -> bytes:
+        """
+        Combine two child digests into their parent digest.
+        """
+        return Hashing.hash(left.hex().encode("utf-8") + right.hex().encode("utf-8"))
+
+    # -------------------------------------------------------------------------
+    # Tree maintenance
+    # -------------------------------------------------------------------------
+    def _rebuild_levels(self) -> None:
+        """
+        Recompute every level above the leaves.
+        """
+        del self._levels[1:]
+        level = self._levels[0]
+        while len(level) > 1:
+            level = [
+                self.hash_pair(level[i], level[i + 1] if i + 1 < len(level) else level[i])
+                for i in range(0, len(level), 2)
+            ]
+            self._levels.append(level)
+
+    def _update_path(self, position: int) -> None:
+        """
+        Recompute only the nodes on the path from leaf `position` to the root.
+        """
+        level_index = 0
+        node_index = position
+
+        while len(self._levels[level_index]) > 1:
+            nodes = self._levels[level_index]
+            parent_index = node_index // 2
+            left = nodes[2 * parent_index]
+            right = nodes[2 * parent_index + 1] if 2 * parent_index + 1 < len(nodes) else left
+
+            if level_index + 1 == len(self._levels):
+                self._levels.append([])
+            upper = self._levels[level_index + 1]
+
+            digest = self.hash_pair(left, right)
+            if parent_index < len(upper):
+                upper[parent_index] = digest
+            else:
+                upper.append(digest)
+
+            level_index += 1
+            node_index = parent_index
+
+        del self._levels[level_index + 1:]
+
+    def append(self, tx, leaf_digest: Optional[bytes] = None) -> int:
+        """
+        Append a transaction as a new leaf. Returns its position.
+        """
+        self._tx_ids.append(self._get_tx_id(tx))
+        self._levels[0].append(leaf_digest or self.hash_transaction(tx))
+        position = len(self._levels[0]) - 1
+        self._update_path(position)
+        return position
+
+    def replace(self, position: int, tx, leaf_digest: Optional[bytes] = None) -> None:
+        """
+        Replace the transaction at `position` and recompute its path.
+        """
+        if position < 0 or position >= len(self._levels[0]):
+            raise IndexError(f"Merkle leaf position {position} out of range.")
+
+        self._tx_ids[position] = self._get_tx_id(tx)
+        self._levels[0][position] = leaf_digest or self.hash_transaction(tx)
+        self._update_path(position)
+
+    def sync(self, transactions: List, leaf_digests: Optional[List[bytes]] = None) -> None:
+        """
+        Bring the tree in line with `transactions`. Positions whose leaf digest is unchanged
+        are skipped, changed ones replaced, new ones appended.
+
+        Args:
+            leaf_digests: Precomputed `hash_transaction` digests aligned with `transactions`;
+                computed here when omitted.
+        """
+        if leaf_digests is None:
+            leaf_digests = [self.hash_transaction(tx) for tx in transactions]
+
+        if len(transactions) < len(self._tx_ids):
+            self._tx_ids = [self._get_tx_id(tx) for tx in transactions]
+            self._levels = [list(leaf_digests)]
+            self._rebuild_levels()
+            return
+
+        leaves = self._levels[0]
+        for position, (tx, digest) in enumerate(zip(transactions, leaf_digests)):
+            if position >= len(leaves):
+                self.append(tx, digest)
+            elif leaves[position] != digest:
+                self.replace(position, tx, digest)
+            else:
+                self._tx_ids[position] = self._get_tx_id(tx)
+
+    def copy(self) -> "MerkleTree":
+        """
+        Independent copy sharing the (immutable) digests, for handing a tree to a Block.
+        """
+        tree = MerkleTree()
+        tree._tx_ids = list(self._tx_ids)
+        tree._levels = [list(level) for level in self._levels]
+        return tree
+
+    def tx_ids(self) -> List[Optional[str]]:
+        return list(self._tx_ids)
+
+    # -------------------------------------------------------------------------
+    # Root & proofs
+    # -------------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._levels[0])
+
+    @property
+    def root(self) -> str:
+        """
+        Merkle root as a hex string (ZERO_HASH if the tree is empty).
+        """
+        if not self._levels[0]:
+            return Constants.ZERO_HASH
+        return self._levels[-1][0].hex()
+
+    def get_proof(self, position: int) -> List[Dict[str, str]]:
+        """
+        Return the inclusion proof for the leaf at `position`, from leaf level upwards.
+        Each step is {"hash": sibling_hex, "side": "left" | "right"}.
+        """
+        if position < 0 or position >= len(self._levels[0]):
+            raise IndexError(f"Merkle leaf position {position} out of range.")
+
+        proof = []
+        node_index = position
+        for nodes in self._levels[:-1]:
+            if node_index % 2 == 0:
+                sibling = nodes[node_index + 1] if node_index + 1 < len(nodes) else nodes[node_index]
+                proof.append({"hash": sibling.hex(), "side": "right"})
+            else:
+                proof.append({"hash": nodes[node_index - 1].hex(), "side": "left"})
+            node_index //= 2
+        return proof
+
+    def get_proof_by_tx_id(self, tx_id: str) -> Optional[List[Dict[str, str]]]:
+        """
+        Return the inclusion proof for a transaction ID, or None if it is not in the tree.
+        """
+        if tx_id not in self._tx_ids:
+            return None
+        return self.get_proof(self._tx_ids.index(tx_id))
+
+    def get_leaf(self, position: int) -> str:
+        """
+        Return the leaf digest at `position` as hex.
+        """
+        return self._levels[0][position].hex()
+
+    @staticmethod
+    def verify_proof(leaf_hash: str, proof: List[Dict[str, str]], merkle_root: str) -> bool:
+        """
+        Check that `leaf_hash` (hex) is included under `merkle_root` (hex) using `proof`.
+        """
+        try:
+            digest = bytes.fromhex(leaf_hash)
+            for step in proof:
+                sibling = bytes.fromhex(step["hash"])
+                if step["side"] == "left":
+                    digest = MerkleTree.hash_pair(sibling, digest)
+                else:
+                    digest = MerkleTree.hash_pair(digest, sibling)
+            return digest.hex() == merkle_root
+        except Exception as e:
+            print(f"[MerkleTree.verify_proof] ❌ ERROR: Invalid proof: {e}")
+            return False
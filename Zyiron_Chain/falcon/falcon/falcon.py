@@ -15,7 +15,7 @@ from Zyiron_Chain.falcon.falcon.common import q
 from numpy import set_printoptions
 from math import sqrt
 from Zyiron_Chain.falcon.falcon.fft import fft, ifft, sub, neg, add_fft, mul_fft
-from Zyiron_Chain.falcon.falcon.ntt import sub_zq, mul_zq, div_zq
+from Zyiron_Chain.falcon.falcon.ntt import sub_zq, mul_zq, div_zq, ntt, intt, mul_ntt
 from Zyiron_Chain.falcon.falcon.ffsampling import gram, ffldl_fft, ffsampling_fft
 from Zyiron_Chain.falcon.falcon.ntrugen import ntru_gen
 from Zyiron_Chain.falcon.falcon.encoding import compress, decompress
@@ -189,6 +189,92 @@ def normalize_tree(tree, sigma):
         tree[1] = 0
 
 
+def hash_to_point(n, message, salt):
+    """
+    Hash a message to a point in Z[x] mod(Phi, q).
+    Inspired by the Parse function from NewHope.
+    """
+    if q > (1 << 16):
+        raise ValueError("The modulus is too large")
+
+    k = (1 << 16) // q
+    # Create a SHAKE object and hash the salt and message.
+    shake = SHAKE256.new()
+    shake.update(salt)
+    shake.update(message)
+    # Output pseudorandom bytes and map them to coefficients.
+    hashed = [0 for i in range(n)]
+    i = 0
+    while i < n:
+        # Takes 2 bytes, transform them in a 16 bits integer
+        twobytes = shake.read(2)
+        elt = (twobytes[0] << 8) + twobytes[1]  # This breaks in Python 2.x
+        # Implicit rejection sampling
+        if elt < k * q:
+            hashed[i] = elt % q
+            i += 1
+    return hashed
+
+
+class VerifyingKey:
+    """
+    Verify-only Falcon public key, built from h alone (no secret key needed).
+
+    NTT(h) is computed once at construction, so each verification costs
+    one forward NTT of s1 and one inverse NTT of the product.
+    """
+
+    def __init__(self, h):
+        """Initialize a verifying key from the public polynomial h."""
+        self.n = len(h)
+        if self.n not in Params:
+            raise ValueError("Unsupported Falcon degree: {n}".format(n=self.n))
+        self.h = [coef % q for coef in h]
+        self.h_ntt = ntt(self.h)
+        self.signature_bound = Params[self.n]["sig_bound"]
+        self.sig_bytelen = Params[self.n]["sig_bytelen"]
+
+    def __repr__(self):
+        """Print the object in readable form."""
+        rep = "Verifying key for n = {n}:\n\n".format(n=self.n)
+        rep += "h = {h}\n".format(h=self.h)
+        return rep
+
+    def hash_to_point(self, message, salt):
+        """Hash a message to a point in Z[x] mod(Phi, q)."""
+        return hash_to_point(self.n, message, salt)
+
+    def verify(self, message, signature):
+        """
+        Verify a signature.
+        """
+        # Unpack the salt and the short polynomial s1
+        salt = signature[HEAD_LEN:HEAD_LEN + SALT_LEN]
+        enc_s = signature[HEAD_LEN + SALT_LEN:]
+        s1 = decompress(enc_s, self.sig_bytelen - HEAD_LEN - SALT_LEN, self.n)
+
+        # Check that the encoding is valid
+        if (s1 is False):
+            print("Invalid encoding")
+            return False
+
+        # Compute s0 = hashed - s1 * h using the precomputed NTT(h),
+        # and normalize its coefficients in (-q/2, q/2]
+        hashed = self.hash_to_point(message, salt)
+        s0 = sub_zq(hashed, intt(mul_ntt(ntt(s1), self.h_ntt)))
+        s0 = [(coef + (q >> 1)) % q - (q >> 1) for coef in s0]
+
+        # Check that the (s0, s1) is short
+        norm_sign = sum(coef ** 2 for coef in s0)
+        norm_sign += sum(coef ** 2 for coef in s1)
+        if norm_sign > self.signature_bound:
+            print("Squared norm of signature is too large:", norm_sign)
+            return False
+
+        # If all checks are passed, accept
+        return True
+
+
 class PublicKey:
     """
     This class contains methods for performing public key operations in Falcon.
@@ -277,27 +363,7 @@ class SecretKey:
         Hash a message to a point in Z[x] mod(Phi, q).
         Inspired by the Parse function from NewHope.
         """
-        n = self.n
-        if q > (1 << 16):
-            raise ValueError("The modulus is too large")
-
-        k = (1 << 16) // q
-        # Create a SHAKE object and hash the salt and message.
-        shake = SHAKE256.new()
-        shake.update(salt)
-        shake.update(message)
-        # Output pseudorandom bytes and map them to coefficients.
-        hashed = [0 for i in range(n)]
-        i = 0
-        while i < n:
-            # Takes 2 bytes, transform them in a 16 bits integer
-            twobytes = shake.read(2)
-            elt = (twobytes[0] << 8) + twobytes[1]  # This breaks in Python 2.x
-            # Implicit rejection sampling
-            if elt < k * q:
-                hashed[i] = elt % q
-                i += 1
-        return hashed
+        return hash_to_point(self.n, message, salt)
 
     def sample_preimage(self, point, seed=None):
         """
@@ -18,6 +18,7 @@ It is probably possible to use templating to merge both implementations.
 
 from Zyiron_Chain.falcon.falcon.common import split, merge         # Import split and merge
 from Zyiron_Chain.falcon.falcon.fft_constants import roots_dict    # Import constants useful for the FFT
+from Zyiron_Chain.falcon.falcon import numpy_backend              # Optional vectorized backend for large degrees
 
 
 def split_fft(f_fft):
@@ -31,6 +32,8 @@ def split_fft(f_fft):
     Corresponds to algorithm 1 (splitfft_2) of Falcon's documentation.
     """
     n = len(f_fft)
+    if numpy_backend.use_backend(n):
+        return numpy_backend.split_fft(f_fft)
     w = roots_dict[n]
     f0_fft = [0] * (n // 2)
     f1_fft = [0] * (n // 2)
@@ -52,6 +55,8 @@ def merge_fft(f_list_fft):
     """
     f0_fft, f1_fft = f_list_fft
     n = 2 * len(f0_fft)
+    if numpy_backend.use_backend(n):
+        return numpy_backend.merge_fft(f_list_fft)
     w = roots_dict[n]
     f_fft = [0] * n
     for i in range(n // 2):
@@ -69,6 +74,8 @@ def fft(f):
     Format: input as coefficients, output as FFT
     """
     n = len(f)
+    if numpy_backend.use_backend(n):
+        return numpy_backend.fft_array(f).tolist()
     if (n > 2):
         f0, f1 = split(f)
         f0_fft = fft(f0)
@@ -90,6 +97,8 @@ def ifft(f_fft):
     Format: input as FFT, output as coefficients
     """
     n = len(f_fft)
+    if numpy_backend.use_backend(n):
+        return numpy_backend.ifft_array(f_fft).tolist()
     if (n > 2):
         f0_fft, f1_fft = split_fft(f_fft)
         f0 = ifft(f0_fft)
@@ -122,16 +131,22 @@ def sub(f, g):
 
 def mul(f, g):
     """Multiplication of two polynomials (coefficient representation)."""
+    if numpy_backend.use_backend(len(f)):
+        return numpy_backend.mul(f, g)
     return ifft(mul_fft(fft(f), fft(g)))
 
 
 def div(f, g):
     """Division of two polynomials (coefficient representation)."""
+    if numpy_backend.use_backend(len(f)):
+        return numpy_backend.div(f, g)
     return ifft(div_fft(fft(f), fft(g)))
 
 
 def adj(f):
     """Ajoint of a polynomial (coefficient representation)."""
+    if numpy_backend.use_backend(len(f)):
+        return numpy_backend.adj(f)
     return ifft(adj_fft(fft(f)))
 
 
@@ -9,6 +9,7 @@ It is probably possible to use templating to merge both implementations.
 """
 from Zyiron_Chain.falcon.falcon.common import split, merge, q                     # Import split and merge
 from Zyiron_Chain.falcon.falcon.ntt_constants import roots_dict_Zq, inv_mod_q     # Import constants useful for the FFT
+from Zyiron_Chain.falcon.falcon import numpy_backend                              # Optional vectorized backend for large degrees
 
 
 """i2 is the inverse of 2 mod q."""
@@ -64,6 +65,8 @@ def ntt(f):
     Format: input as coefficients, output as NTT
     """
     n = len(f)
+    if numpy_backend.use_backend(n):
+        return numpy_backend.ntt(f)
     if (n > 2):
         f0, f1 = split(f)
         f0_ntt = ntt(f0)
@@ -85,6 +88,8 @@ def intt(f_ntt):
     Format: input as NTT, output as coefficients
     """
     n = len(f_ntt)
+    if numpy_backend.use_backend(n):
+        return numpy_backend.intt(f_ntt)
     if (n > 2):
         f0_ntt, f1_ntt = split_ntt(f_ntt)
         f0 = intt(f0_ntt)
@@ -117,12 +122,16 @@ def sub_zq(f, g):
 
 def mul_zq(f, g):
     """Multiplication of two polynomials (coefficient representation)."""
+    if numpy_backend.use_backend(len(f)):
+        return numpy_backend.mul_zq(f, g)
     return intt(mul_ntt(ntt(f), ntt(g)))
 
 
 def div_zq(f, g):
     """Division of two polynomials (coefficient representation)."""
     try:
+        if numpy_backend.use_backend(len(f)):
+            return numpy_backend.div_zq(f, g)
         return intt(div_ntt(ntt(f), ntt(g)))
     except ZeroDivisionError:
         raise
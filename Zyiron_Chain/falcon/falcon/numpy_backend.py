@@ -0,0 +1,291 @@
+"""This file contains an optional NumPy backend for the FFT and the NTT.
+
+The list-based code in fft.py and ntt.py recurses down to polynomials of degree 2
+and handles one coefficient at a time. Here, each level of the split/merge
+recursion is done at once on a 2D array (one row per sub-polynomial), and
+element-wise operations are vectorized.
+
+The results are bit-identical to the list-based implementation:
+- the NTT only uses exact int64 arithmetic mod q (every intermediate product < 2 ** 63),
+- the FFT performs the same IEEE-754 operations in the same order,
+  including CPython's algorithm for complex division.
+
+fft.py and ntt.py only dispatch here for polynomials of degree >= MIN_DEGREE,
+since NumPy call overhead dominates on small inputs. Set the environment variable
+FALCON_NUMPY_BACKEND=0 to disable the backend.
+"""
+import os
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+from Zyiron_Chain.falcon.falcon.common import q
+from Zyiron_Chain.falcon.falcon.fft_constants import roots_dict
+from Zyiron_Chain.falcon.falcon.ntt_constants import roots_dict_Zq, inv_mod_q
+
+
+"""True if NumPy is available and the backend has not been disabled."""
+ENABLED = (np is not None) and (os.environ.get("FALCON_NUMPY_BACKEND", "1") != "0")
+
+
+"""Smallest degree for which fft.py and ntt.py use this backend."""
+MIN_DEGREE = 64
+
+
+"""i2 is the inverse of 2 mod q."""
+i2 = 6145
+
+
+"""sqr1 is a square root of (-1) mod q."""
+sqr1 = roots_dict_Zq[2][0]
+
+
+# Tables are built lazily, once per degree.
+_perm_cache = {}
+_roots_cache = {}
+_roots_Zq_cache = {}
+_inv_roots_Zq_cache = {}
+_inv_mod_q_array = None
+
+
+def use_backend(n):
+    """Return True if polynomials of degree n should go through this backend."""
+    return ENABLED and n >= MIN_DEGREE
+
+
+def _split_permutation(n):
+    """
+    Order in which the coefficients of a polynomial of degree n reach the
+    leaves of the split recursion (pairs of coefficients, left to right).
+    """
+    if n not in _perm_cache:
+        idx = np.arange(n).reshape(1, n)
+        while idx.shape[1] > 2:
+            k, m = idx.shape
+            idx = idx.reshape(k, m // 2, 2).transpose(0, 2, 1).reshape(2 * k, m // 2)
+        _perm_cache[n] = idx.reshape(-1)
+    return _perm_cache[n]
+
+
+def _roots(m):
+    """Even-indexed complex roots of phi_m, as used by split_fft / merge_fft."""
+    if m not in _roots_cache:
+        _roots_cache[m] = np.array(roots_dict[m][0::2], dtype=np.complex128)
+    return _roots_cache[m]
+
+
+def _roots_Zq(m):
+    """Even-indexed roots of phi_m mod q, as used by merge_ntt."""
+    if m not in _roots_Zq_cache:
+        _roots_Zq_cache[m] = np.array(roots_dict_Zq[m][0::2], dtype=np.int64)
+    return _roots_Zq_cache[m]
+
+
+def _inv_roots_Zq(m):
+    """Inverses mod q of the even-indexed roots of phi_m, as used by split_ntt."""
+    if m not in _inv_roots_Zq_cache:
+        _inv_roots_Zq_cache[m] = np.array([inv_mod_q[w] for w in roots_dict_Zq[m][0::2]], dtype=np.int64)
+    return _inv_roots_Zq_cache[m]
+
+
+def _inv_mod_q():
+    """inv_mod_q as an int64 lookup table."""
+    global _inv_mod_q_array
+    if _inv_mod_q_array is None:
+        _inv_mod_q_array = np.array(inv_mod_q, dtype=np.int64)
+    return _inv_mod_q_array
+
+
+"""
+FFT (complex128 arrays).
+"""
+
+
+def _cmul(a, b):
+    """
+    Element-wise complex product, computed as CPython does:
+    (ar * br - ai * bi) + (ar * bi + ai * br) * 1j.
+    NumPy's complex multiply may fuse these operations, which changes the rounding.
+    """
+    out = np.empty(np.broadcast(a, b).shape, dtype=np.complex128)
+    out.real = a.real * b.real - a.imag * b.imag
+    out.imag = a.real * b.imag + a.imag * b.real
+    return out
+
+
+def _half(a):
+    """Multiply by 0.5 (exact in binary floating point)."""
+    out = np.empty(a.shape, dtype=np.complex128)
+    out.real = 0.5 * a.real
+    out.imag = 0.5 * a.imag
+    return out
+
+
+def fft_array(f):
+    """Compute the FFT of a polynomial mod (x ** n + 1). Returns a complex128 array."""
+    n = len(f)
+    a = np.asarray(f, dtype=np.float64)[_split_permutation(n)].reshape(n // 2, 2)
+    f_fft = np.empty((n // 2, 2), dtype=np.complex128)
+    f_fft.real[:, 0] = a[:, 0]
+    f_fft.imag[:, 0] = a[:, 1]
+    f_fft.real[:, 1] = a[:, 0]
+    f_fft.imag[:, 1] = -a[:, 1]
+    m = 4
+    while m <= n:
+        f0_fft = f_fft[0::2]
+        f1_fft = f_fft[1::2]
+        w_f1 = _cmul(_roots(m), f1_fft)
+        f_fft = np.empty((f0_fft.shape[0], m), dtype=np.complex128)
+        f_fft[:, 0::2] = f0_fft + w_f1
+        f_fft[:, 1::2] = f0_fft - w_f1
+        m *= 2
+    return f_fft[0]
+
+
+def ifft_array(f_fft):
+    """Compute the inverse FFT of a polynomial mod (x ** n + 1). Returns a float64 array."""
+    n = len(f_fft)
+    rows = np.asarray(f_fft, dtype=np.complex128).reshape(1, n)
+    m = n
+    while m > 2:
+        even = rows[:, 0::2]
+        odd = rows[:, 1::2]
+        split = np.empty((2 * rows.shape[0], m // 2), dtype=np.complex128)
+        split[0::2] = _half(even + odd)
+        split[1::2] = _cmul(_half(even - odd), np.conj(_roots(m)))
+        rows = split
+        m //= 2
+    leaves = np.empty((n // 2, 2), dtype=np.float64)
+    leaves[:, 0] = rows[:, 0].real
+    leaves[:, 1] = rows[:, 0].imag
+    f = np.empty(n, dtype=np.float64)
+    f[_split_permutation(n)] = leaves.reshape(-1)
+    return f
+
+
+def split_fft(f_fft):
+    """Split a polynomial in FFT representation (see fft.split_fft)."""
+    f_fft = np.asarray(f_fft, dtype=np.complex128)
+    even = f_fft[0::2]
+    odd = f_fft[1::2]
+    f0_fft = _half(even + odd)
+    f1_fft = _cmul(_half(even - odd), np.conj(_roots(len(f_fft))))
+    return [f0_fft.tolist(), f1_fft.tolist()]
+
+
+def merge_fft(f_list_fft):
+    """Merge two polynomials in FFT representation (see fft.merge_fft)."""
+    f0_fft = np.asarray(f_list_fft[0], dtype=np.complex128)
+    f1_fft = np.asarray(f_list_fft[1], dtype=np.complex128)
+    w_f1 = _cmul(_roots(2 * len(f0_fft)), f1_fft)
+    f_fft = np.empty(2 * len(f0_fft), dtype=np.complex128)
+    f_fft[0::2] = f0_fft + w_f1
+    f_fft[1::2] = f0_fft - w_f1
+    return f_fft.tolist()
+
+
+def div_fft_array(f_fft, g_fft):
+    """
+    Element-wise complex division using the same algorithm as CPython's
+    complex.__truediv__ (NumPy's own division rounds differently).
+    """
+    a_re, a_im = f_fft.real, f_fft.imag
+    b_re, b_im = g_fft.real, g_fft.imag
+    if np.any((b_re == 0) & (b_im == 0)):
+        raise ZeroDivisionError("complex division by zero")
+
+    by_real = np.abs(b_re) >= np.abs(b_im)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = np.where(by_real, b_im / b_re, b_re / b_im)
+        denom = np.where(by_real, b_re + b_im * ratio, b_re * ratio + b_im)
+        re = np.where(by_real, (a_re + a_im * ratio) / denom, (a_re * ratio + a_im) / denom)
+        im = np.where(by_real, (a_im - a_re * ratio) / denom, (a_im * ratio - a_re) / denom)
+    out = np.empty(re.shape, dtype=np.complex128)
+    out.real = re
+    out.imag = im
+    return out
+
+
+def mul(f, g):
+    """Multiplication of two polynomials (coefficient representation)."""
+    return ifft_array(_cmul(fft_array(f), fft_array(g))).tolist()
+
+
+def div(f, g):
+    """Division of two polynomials (coefficient representation)."""
+    return ifft_array(div_fft_array(fft_array(f), fft_array(g))).tolist()
+
+
+def adj(f):
+    """Ajoint of a polynomial (coefficient representation)."""
+    return ifft_array(np.conj(fft_array(f))).tolist()
+
+
+"""
+NTT (int64 arrays, coefficients in [0, q)).
+"""
+
+
+def ntt_array(f):
+    """Compute the NTT of a polynomial. Returns an int64 array."""
+    n = len(f)
+    a = (np.asarray(f, dtype=np.int64) % q)[_split_permutation(n)].reshape(n // 2, 2)
+    f_ntt = np.empty((n // 2, 2), dtype=np.int64)
+    f_ntt[:, 0] = (a[:, 0] + sqr1 * a[:, 1]) % q
+    f_ntt[:, 1] = (a[:, 0] - sqr1 * a[:, 1]) % q
+    m = 4
+    while m <= n:
+        f0_ntt = f_ntt[0::2]
+        w_f1 = _roots_Zq(m) * f_ntt[1::2]
+        f_ntt = np.empty((f0_ntt.shape[0], m), dtype=np.int64)
+        f_ntt[:, 0::2] = (f0_ntt + w_f1) % q
+        f_ntt[:, 1::2] = (f0_ntt - w_f1) % q
+        m *= 2
+    return f_ntt[0]
+
+
+def intt_array(f_ntt):
+    """Compute the inverse NTT of a polynomial. Returns an int64 array."""
+    n = len(f_ntt)
+    rows = (np.asarray(f_ntt, dtype=np.int64) % q).reshape(1, n)
+    m = n
+    while m > 2:
+        even = rows[:, 0::2]
+        odd = rows[:, 1::2]
+        split = np.empty((2 * rows.shape[0], m // 2), dtype=np.int64)
+        split[0::2] = (i2 * (even + odd)) % q
+        split[1::2] = ((i2 * (even - odd)) % q * _inv_roots_Zq(m)) % q
+        rows = split
+        m //= 2
+    leaves = np.empty((n // 2, 2), dtype=np.int64)
+    leaves[:, 0] = (i2 * (rows[:, 0] + rows[:, 1])) % q
+    leaves[:, 1] = ((i2 * inv_mod_q[sqr1]) % q * (rows[:, 0] - rows[:, 1])) % q
+    f = np.empty(n, dtype=np.int64)
+    f[_split_permutation(n)] = leaves.reshape(-1)
+    return f
+
+
+def ntt(f):
+    """Compute the NTT of a polynomial (list output)."""
+    return ntt_array(f).tolist()
+
+
+def intt(f_ntt):
+    """Compute the inverse NTT of a polynomial (list output)."""
+    return intt_array(f_ntt).tolist()
+
+
+def mul_zq(f, g):
+    """Multiplication of two polynomials (coefficient representation)."""
+    return intt_array((ntt_array(f) * ntt_array(g)) % q).tolist()
+
+
+def div_zq(f, g):
+    """Division of two polynomials (coefficient representation)."""
+    g_ntt = ntt_array(g)
+    if np.any(g_ntt == 0):
+        raise ZeroDivisionError
+    return intt_array((ntt_array(f) * _inv_mod_q()[g_ntt]) % q).tolist()
+
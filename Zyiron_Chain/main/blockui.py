@@ -700,8 +700,10 @@ class BlockchainUI:
             )
 
             # Mempools
-            self.standard_mempool = StandardMempool(utxo_storage=self.utxo_storage)
-            self.smart_mempool = SmartMempool(utxo_storage=self.utxo_storage)
+            self.standard_mempool = StandardMempool(utxo_storage=self.utxo_storage, key_manager=self.key_manager,
+                                                    block_template=self.transaction_manager.block_template)
+            self.smart_mempool = SmartMempool(utxo_storage=self.utxo_storage, key_manager=self.key_manager,
+                                              block_template=self.transaction_manager.block_template)
 
             # Payment Processor
             self.payment_processor = PaymentProcessor(
@@ -2079,7 +2081,7 @@ class BlockchainUI:
             self.orphan_blocks_label.config(text=f"Orphan Blocks: {orphan_count}")
 
             # Average mining time (last 10 blocks)
-            blocks = self.block_storage.get_all_blocks()[-10:]
+            blocks = list(self.block_storage.iter_blocks(start=max(0, self.block_storage.get_latest_height() - 9)))
             if len(blocks) >= 2:
                 timestamps = [b.timestamp if hasattr(b, "timestamp") else b.get("timestamp", 0) for b in blocks]
                 intervals = [timestamps[i] - timestamps[i - 1] for i in range(1, len(timestamps))]
@@ -2101,7 +2103,7 @@ class BlockchainUI:
                 self.recent_blocks_tree.delete(item)
             
             # Get recent blocks (last 10)
-            blocks = self.block_storage.get_all_blocks()[-10:]
+            blocks = list(self.block_storage.iter_blocks(start=max(0, self.block_storage.get_latest_height() - 9)))
             
             for block in reversed(blocks):
                 if hasattr(block, 'to_dict'):
@@ -2597,8 +2599,8 @@ class BlockchainUI:
     def export_last_500_blocks(self):
         """Export the last 500 blocks to JSON"""
         try:
-            all_blocks = self.block_storage.get_all_blocks()
-            recent_blocks = all_blocks[-500:] if len(all_blocks) > 500 else all_blocks
+            latest_height = self.block_storage.get_latest_height()
+            recent_blocks = self.block_storage.iter_blocks(start=max(0, latest_height - 499))
 
             block_data = []
             for b in recent_blocks:
@@ -2668,7 +2670,7 @@ class BlockchainUI:
             utxo_count = len(self.utxo_storage.get_all_utxos())
             orphan_count = len(self.orphan_blocks.get_all_orphans())
 
-            blocks = self.block_storage.get_all_blocks()[-10:]
+            blocks = list(self.block_storage.iter_blocks(start=max(0, self.block_storage.get_latest_height() - 9)))
             avg_block_time = "N/A"
             if len(blocks) >= 2:
                 timestamps = []
@@ -2717,7 +2719,7 @@ class BlockchainUI:
             """
             try:
                 timestamps = []
-                blocks = self.block_storage.get_all_blocks()[-10:]  # last 10 blocks
+                blocks = list(self.block_storage.iter_blocks(start=max(0, self.block_storage.get_latest_height() - 9)))  # last 10 blocks
                 for block in blocks:
                     if hasattr(block, 'timestamp'):
                         timestamps.append(block.timestamp)
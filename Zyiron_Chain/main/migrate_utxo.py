@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Offline UTXO Migration Tool
+
+- Converts legacy JSON UTXO records in `utxo.lmdb` to the compact binary format
+  (see `utils/utxo_codec.py`).
+- Safe to re-run; records already in binary format are left untouched.
+- Stop the node before running.
+"""
+
+import os
+import sys
+import time
+
+# Adjust Python path for project structure
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+sys.path.append(project_root)
+
+from Zyiron_Chain.storage.utxostorage import UTXOStorage
+
+
+def migrate_utxo_records(batch_size: int = 10000):
+    """
+    Open UTXO storage and convert every JSON record to the binary format.
+    Returns the number of records converted.
+    """
+    utxo_storage = UTXOStorage()
+
+    start_time = time.time()
+    converted = utxo_storage.migrate_to_binary_records(batch_size=batch_size)
+    elapsed = time.time() - start_time
+
+    print(f"[migrate_utxo] ✅ Converted {converted} UTXO records in {elapsed:.2f}s")
+    print("[migrate_utxo] INFO: LMDB reuses freed pages; run `mdb_copy -c` to compact the file on disk.")
+    return converted
+
+
+if __name__ == "__main__":
+    batch = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    migrate_utxo_records(batch_size=batch)
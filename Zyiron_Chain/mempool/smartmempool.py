@@ -28,19 +28,25 @@ from Zyiron_Chain.storage.lmdatabase import LMDBManager
 
 from Zyiron_Chain.network.peerconstant import PeerConstants
 from Zyiron_Chain.utils.deserializer import Deserializer
+from Zyiron_Chain.accounts.batch_verifier import BatchVerifier
 
 class SmartMempool:
     """Manages the Smart Mempool with dynamic transaction prioritization."""
 
-    def __init__(self, utxo_storage, peer_id: str = None, max_size_mb=None):
+    def __init__(self, utxo_storage, peer_id: str = None, max_size_mb=None, key_manager=None, block_template=None):
         """
         Initialize the Smart Mempool.
 
         :param utxo_storage: UTXOStorage instance for validating UTXOs
         :param peer_id: Optional peer identifier (defaults to current user)
         :param max_size_mb: Optional override for mempool size
+        :param key_manager: Optional KeyManager used to resolve public keys for signature checks
+        :param block_template: Optional BlockTemplate kept in step with admissions and removals
         """
         self.utxo_storage = utxo_storage
+        self.key_manager = key_manager
+        self.block_template = block_template
+        self.batch_verifier = BatchVerifier()
         self.peer_id = peer_id if peer_id is not None else f"peer_{PeerConstants.PEER_USER_ID}"
         self.transactions = {}  # In-memory transaction tracking
         self.lock = Lock()  # Handle concurrency
@@ -99,6 +105,11 @@ class SmartMempool:
                     print(f"[Mempool] ❌ Fee below minimum for {tx_type} TX")
                     return False
 
+                # Verify input signatures (results are cached for block validation)
+                if not self._verify_signatures(transaction):
+                    print(f"[Mempool] ❌ Invalid Falcon-512 signature in {tx_type} TX {tx_id}")
+                    return False
+
                 # Handle expiration (if block height provided)
                 if current_block_height is not None:
                     if hasattr(transaction, 'block_height_at_lock'):
@@ -122,6 +133,8 @@ class SmartMempool:
                     "type": tx_type
                 }
                 self.current_size_bytes += tx_size
+                if self.block_template is not None:
+                    self.block_template.add_transaction(transaction, tx_type)
 
                 # Persist to LMDB if configured
                 if hasattr(self, "lmdb") and self.lmdb:
@@ -146,6 +159,19 @@ class SmartMempool:
 
 
 
+    def _verify_signatures(self, transaction) -> bool:
+        """
+        Verify the Falcon-512 signature of every input with the BatchVerifier.
+        Signer keys come from the inputs (checked against the spent outputs), falling back to the local wallet.
+        """
+        utxo_manager = getattr(self.utxo_storage, "utxo_manager", None)
+        if not utxo_manager:
+            print("[Mempool] ❌ No UTXOManager available to resolve signer keys. Refusing transaction.")
+            return False
+
+        resolver = BatchVerifier.public_key_resolver(utxo_manager.get_utxo, key_manager=self.key_manager)
+        return self.batch_verifier.verify_all(BatchVerifier.transaction_checks([transaction], resolver))
+
     def evict_transactions(self, size_needed: int):
         """
         Evict low-priority transactions to free space.
@@ -209,6 +235,8 @@ class SmartMempool:
                 tx_size = self.transactions[tx_id]["transaction"].size
                 self.current_size_bytes -= tx_size
                 del self.transactions[tx_id]
+            if self.block_template is not None:
+                self.block_template.remove_transaction(tx_id)
 
             # ✅ Remove from LMDB
             self.lmdb.delete(tx_id)
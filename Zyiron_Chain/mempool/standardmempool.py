@@ -9,6 +9,7 @@ from Zyiron_Chain.blockchain.constants import Constants
 from Zyiron_Chain.utils.hashing import Hashing
 from Zyiron_Chain.storage.lmdatabase import LMDBManager
 import hashlib
+import bisect
 from Zyiron_Chain.utils.deserializer import Deserializer
 import sys
 import os
@@ -22,16 +23,22 @@ from decimal import Decimal
 from Zyiron_Chain.blockchain.constants import Constants
 from Zyiron_Chain.transactions.fees import FeeModel
 from Zyiron_Chain.storage.lmdatabase import LMDBManager
+from Zyiron_Chain.accounts.batch_verifier import BatchVerifier
 
 class StandardMempool:
-    def __init__(self, utxo_storage, max_size_mb=None):
+    def __init__(self, utxo_storage, max_size_mb=None, key_manager=None, block_template=None):
         """
         Initialize the Standard Mempool with LMDB-backed storage.
 
         :param utxo_storage: UTXOStorage instance for validating UTXOs
         :param max_size_mb: Optional override of max size in MB
+        :param key_manager: Optional KeyManager used to resolve public keys for signature checks
+        :param block_template: Optional BlockTemplate kept in step with admissions and removals
         """
         self.utxo_storage = utxo_storage
+        self.key_manager = key_manager
+        self.block_template = block_template
+        self.batch_verifier = BatchVerifier()
         self.lock = Lock()
 
         # Use LMDB for transaction persistence
@@ -47,6 +54,15 @@ class StandardMempool:
         self.expiry_time = Constants.MEMPOOL_TRANSACTION_EXPIRY
         self.fee_model = FeeModel(max_supply=Decimal(Constants.MAX_SUPPLY))
 
+        # Fee-rate priority index: per transaction type, a list of
+        # (fee_per_byte, -timestamp, hashed_tx_id) kept sorted ascending.
+        # The tail is the best block candidate, the head the first to evict.
+        self._fee_index = {
+            tx_type: [] for tx_type, config in Constants.TRANSACTION_MEMPOOL_MAP.items()
+            if config["mempool"] == "StandardMempool"
+        }
+        self._index_entries = {}  # hashed_tx_id -> (tx_type, index entry, tx_data)
+
         # Load persisted transactions on startup
         self._load_pending_transactions()
 
@@ -54,16 +70,67 @@ class StandardMempool:
 
 
     def _load_pending_transactions(self):
-        """Load pending transactions from LMDB into memory."""
+        """Rebuild the fee-rate index and size counter from the transactions persisted in LMDB."""
         with self.lock:
-            stored_txs = self.lmdb.get_all_transactions()  # Use the new method
-            self.current_size_bytes = sum(tx["size"] for tx in stored_txs)
-
-            # Ensure transaction IDs use double SHA3-384 hashing
-            for tx in stored_txs:
-                tx["tx_id"] = hashlib.sha3_384(tx["tx_id"].encode()).hexdigest()
-
-            print(f"[MEMPOOL] Loaded {len(stored_txs)} pending transactions from LMDB.")
+            for tx_type in self._fee_index:
+                self._fee_index[tx_type] = []
+            self._index_entries = {}
+            self.current_size_bytes = 0
+
+            for _, tx_data in self.lmdb.get_by_prefix("mempool:"):
+                if isinstance(tx_data, dict) and tx_data.get("tx_id"):
+                    self._index_transaction(tx_data, keep_sorted=False)
+
+            for entries in self._fee_index.values():
+                entries.sort()
+
+            print(f"[MEMPOOL] Loaded {len(self._index_entries)} pending transactions from LMDB.")
+
+    @staticmethod
+    def _classify_transaction(tx_id: str) -> str:
+        """Map a raw transaction ID to its type using the prefixes in Constants.TRANSACTION_MEMPOOL_MAP."""
+        for tx_type, config in Constants.TRANSACTION_MEMPOOL_MAP.items():
+            if any(tx_id.startswith(prefix) for prefix in config["prefixes"]):
+                return tx_type
+        return "STANDARD"
+
+    def _index_transaction(self, tx_data, keep_sorted=True):
+        """Add a stored transaction record to the fee-rate index (caller holds the lock)."""
+        hashed_tx_id = tx_data["tx_id"]
+        if hashed_tx_id in self._index_entries:
+            return
+
+        tx_type = tx_data.get("tx_type", "STANDARD")
+        entries = self._fee_index.setdefault(tx_type, [])
+        entry = (float(tx_data.get("fee_per_byte", 0)), -int(tx_data.get("timestamp", 0)), hashed_tx_id)
+        if keep_sorted:
+            bisect.insort(entries, entry)
+        else:
+            entries.append(entry)
+
+        self._index_entries[hashed_tx_id] = (tx_type, entry, tx_data)
+        self.current_size_bytes += int(tx_data.get("size", 0))
+
+    def _discard_transaction(self, hashed_tx_id):
+        """
+        Remove a transaction from LMDB, the fee-rate index and the size counter (caller holds the lock).
+        Returns the stored record, or None if it was not in the mempool.
+        """
+        indexed = self._index_entries.pop(hashed_tx_id, None)
+        self.lmdb.delete(f"mempool:{hashed_tx_id}")
+        if indexed is None:
+            return None
+
+        tx_type, entry, tx_data = indexed
+        entries = self._fee_index.get(tx_type, [])
+        position = bisect.bisect_left(entries, entry)
+        if position < len(entries) and entries[position] == entry:
+            del entries[position]
+
+        self.current_size_bytes = max(0, self.current_size_bytes - int(tx_data.get("size", 0)))
+        if self.block_template is not None:
+            self.block_template.remove_transaction(hashed_tx_id)
+        return tx_data
 
     def validate_transaction_inputs(self, transaction):
         """
@@ -82,13 +149,7 @@ class StandardMempool:
 
     def __len__(self):
         """Returns the number of transactions in the LMDB-backed Standard Mempool."""
-        try:
-            # Fetch all transaction keys in LMDB under the "mempool:" prefix
-            transaction_keys = self.lmdb.get_keys_by_prefix("mempool:")
-            return len(transaction_keys)
-        except Exception as e:
-            print(f"[ERROR] Failed to count transactions in mempool: {e}")
-            return 0  # Return 0 if an error occurs
+        return len(self._index_entries)
 
     def add_transaction(self, transaction, smart_contract, fee_model):
         """
@@ -142,6 +203,11 @@ class StandardMempool:
                 print("[ERROR] Invalid or spent UTXO inputs detected")
                 return False
 
+            # Verify input signatures as one batch
+            if not self._verify_signatures(transaction):
+                print(f"[ERROR] Invalid Falcon-512 signature in transaction {hashed_tx_id[:12]}")
+                return False
+
             # Calculate minimum required fee
             min_fee = fee_model.calculate_fee(
                 payment_type="STANDARD",
@@ -155,40 +221,55 @@ class StandardMempool:
                 print(f"[ERROR] Insufficient fee: {transaction.fee} < {min_fee}")
                 return False
 
-            # Check mempool capacity and evict if needed
-            if self._exceeds_capacity(transaction.size):
-                self._evict_low_priority_transactions(transaction.size)
-
-            # Register with smart contract
-            try:
-                smart_contract.register_transaction(
-                    transaction_id=hashed_tx_id,
-                    parent_id=getattr(transaction, 'parent_id', None),
-                    utxo_id=getattr(transaction, 'utxo_id', None),
-                    sender=getattr(transaction, 'sender', None),
-                    recipient=getattr(transaction, 'recipient', None),
-                    amount=sum(out.amount for out in transaction.outputs),
-                    fee=transaction.fee
-                )
-            except Exception as e:
-                print(f"[ERROR] Smart contract registration failed: {str(e)}")
-                return False
-
-            # Store transaction in LMDB
+            # Build the LMDB record
+            fee_per_byte = float(transaction.fee) / transaction.size if transaction.size > 0 else 0.0
             tx_data = {
                 'tx_id': hashed_tx_id,
+                'tx_type': self._classify_transaction(tx_id),
                 'size': transaction.size,
-                'fee': transaction.fee,
-                'fee_per_byte': transaction.fee / transaction.size,
+                'fee': str(transaction.fee),
+                'fee_per_byte': fee_per_byte,
                 'timestamp': int(time.time()),
                 'inputs': [inp.tx_out_id for inp in transaction.inputs],
                 'outputs': [out.script_pub_key for out in transaction.outputs],
-                'status': 'PENDING'
+                'status': 'PENDING',
+                'transaction': transaction.to_dict()  # Full signed transaction, rebuilt after a restart
             }
 
+            # Duplicate check, capacity/eviction and insert happen under one lock, so a resubmitted
+            # transaction evicts nothing and concurrent admissions cannot both pass the capacity check
             with self.lock:
-                self.lmdb.put(f"mempool:{hashed_tx_id}", json.dumps(tx_data).encode())
-                self.current_size_bytes += transaction.size
+                if hashed_tx_id in self._index_entries:
+                    print(f"[WARN] Transaction {hashed_tx_id[:12]} already in mempool")
+                    return False
+
+                # Check mempool capacity and evict lower fee-rate transactions if needed
+                if self._exceeds_capacity(transaction.size):
+                    if not self._evict_low_priority_transactions(transaction.size, fee_per_byte):
+                        print(f"[ERROR] Mempool full: fee rate {fee_per_byte:.8f} too low for transaction {hashed_tx_id[:12]}")
+                        return False
+
+                # Register with smart contract
+                try:
+                    smart_contract.register_transaction(
+                        transaction_id=hashed_tx_id,
+                        parent_id=getattr(transaction, 'parent_id', None),
+                        utxo_id=getattr(transaction, 'utxo_id', None),
+                        sender=getattr(transaction, 'sender', None),
+                        recipient=getattr(transaction, 'recipient', None),
+                        amount=sum(out.amount for out in transaction.outputs),
+                        fee=transaction.fee
+                    )
+                except Exception as e:
+                    print(f"[ERROR] Smart contract registration failed: {str(e)}")
+                    return False
+
+                if not self.lmdb.put(f"mempool:{hashed_tx_id}", tx_data):
+                    print(f"[ERROR] Failed to persist transaction {hashed_tx_id[:12]}")
+                    return False
+                self._index_transaction(tx_data)
+                if self.block_template is not None:
+                    self.block_template.add_transaction(transaction, tx_data["tx_type"], tx_id=hashed_tx_id)
 
             print(f"[SUCCESS] Transaction {hashed_tx_id[:12]} added to mempool")
             return True
@@ -201,19 +282,44 @@ class StandardMempool:
     def _validate_utxo_inputs(self, inputs):
         """Validate all transaction inputs exist and are unspent"""
         for tx_in in inputs:
-            utxo = self.utxo_manager.get_utxo(tx_in.tx_out_id)
-            if not utxo or utxo.get('spent', False):
+            utxo = self.utxo_storage.get(tx_in.tx_out_id)
+            if not utxo or utxo.get('spent_status', False):
                 return False
         return True
 
+    def _verify_signatures(self, transaction):
+        """
+        Verify the Falcon-512 signature of every input with the BatchVerifier.
+        Signer keys come from the inputs (checked against the spent outputs), falling back to the local wallet.
+        """
+        utxo_manager = getattr(self.utxo_storage, "utxo_manager", None)
+        if not utxo_manager:
+            print("[ERROR] ❌ No UTXOManager available to resolve signer keys. Refusing transaction.")
+            return False
+
+        resolver = BatchVerifier.public_key_resolver(utxo_manager.get_utxo, key_manager=self.key_manager)
+        return self.batch_verifier.verify_all(BatchVerifier.transaction_checks([transaction], resolver))
+
     def _exceeds_capacity(self, tx_size):
         """Check if transaction would exceed mempool capacity"""
         return (self.current_size_bytes + tx_size) > self.max_size_bytes
 
-    def _evict_low_priority_transactions(self, required_space):
-        """Evict lowest fee-per-byte transactions to make space"""
-        # Implementation of eviction logic
-        pass
+    def _evict_low_priority_transactions(self, required_space, min_fee_per_byte=None):
+        """
+        Evict lowest fee-per-byte transactions (across all types) until `required_space` fits.
+        Transactions paying at least `min_fee_per_byte` (the incoming transaction's rate) are kept.
+        Returns True if enough space was freed (caller holds the lock).
+        """
+        while self._exceeds_capacity(required_space):
+            lowest = min((entries[0] for entries in self._fee_index.values() if entries), default=None)
+            if lowest is None:
+                return False
+            if min_fee_per_byte is not None and lowest[0] >= min_fee_per_byte:
+                return False
+
+            self._discard_transaction(lowest[2])
+            print(f"[INFO] Evicted transaction {lowest[2][:12]} (fee rate {lowest[0]:.8f}) to free space.")
+        return True
 
     def allocate_block_space(self, block_size_mb, current_block_height):
         """
@@ -265,35 +371,22 @@ class StandardMempool:
             else int(block_size_bytes * Constants.STANDARD_TRANSACTION_ALLOCATION)
         )
 
-        # Fetch transaction prefixes dynamically
-        transaction_prefixes = Constants.TRANSACTION_MEMPOOL_MAP.get(transaction_type, {}).get("prefixes", [])
-
         with self.lock:
-            # Filter transactions dynamically based on prefix mappings
-            filtered_txs = [
-                tx for tx in self.lmdb.get_all_transactions()
-                if any(tx["tx_id"].startswith(prefix) for prefix in transaction_prefixes)
-            ]
-
-            # Ensure transactions use double SHA3-384 hash format
-            for tx in filtered_txs:
-                tx["tx_id"] = hashlib.sha3_384(tx["tx_id"].encode()).hexdigest()
-
-            # Sort transactions by highest fee-per-byte first
-            sorted_txs = sorted(filtered_txs, key=lambda x: x["fee_per_byte"], reverse=True)
-
-            # Select transactions that fit within allocated space
+            # Walk the fee-rate index from the highest fee-per-byte down (O(k) for k selected)
             selected_txs = []
             current_size = 0
-            for tx_data in sorted_txs:
+            for fee_per_byte, _, hashed_tx_id in reversed(self._fee_index.get(transaction_type, [])):
+                # Everything after this point is below the minimum fee requirement
+                if fee_per_byte < Constants.MIN_TRANSACTION_FEE:
+                    break
+
+                tx_data = self._index_entries[hashed_tx_id][2]
                 tx_size = tx_data["size"]
                 if current_size + tx_size > allocation:
                     break
 
-                # Ensure the transaction meets the minimum fee requirement
-                if tx_data["fee_per_byte"] >= Constants.MIN_TRANSACTION_FEE:
-                    selected_txs.append(tx_data)
-                    current_size += tx_size
+                selected_txs.append(tx_data)
+                current_size += tx_size
 
             return selected_txs
 
@@ -335,26 +428,7 @@ class StandardMempool:
         :param size_needed: The size of the new transaction that needs space in bytes.
         """
         with self.lock:
-            # Dynamically adjust max mempool size from Constants
-            max_mempool_size_bytes = Constants.MEMPOOL_MAX_SIZE_MB * 1024 * 1024
-
-            # Sort transactions by lowest fee-per-byte (lowest priority first)
-            sorted_txs = sorted(
-                self.transactions.items(),
-                key=lambda item: item[1]["fee_per_byte"]
-            )
-
-            while self.current_size_bytes + size_needed > max_mempool_size_bytes and sorted_txs:
-                tx_id, tx_data = sorted_txs.pop(0)
-
-                # Ensure we don’t evict high-fee transactions unnecessarily
-                if tx_data["fee_per_byte"] >= Constants.MIN_TRANSACTION_FEE:
-                    print(f"[WARN] Skipping eviction of high-fee transaction {tx_id}.")
-                    continue  # Skip if transaction has a decent fee
-
-                self.remove_transaction(tx_id)
-                self.current_size_bytes -= tx_data["transaction"].size
-                print(f"[INFO] Evicted transaction {tx_id} to free space.")
+            return self._evict_low_priority_transactions(size_needed)
 
     def track_confirmation(self, transaction_id):
         """
@@ -437,16 +511,16 @@ class StandardMempool:
         with self.lock:
             expired_transactions = []
 
-            for tx_hash, data in list(self.transactions.items()):
+            for tx_hash, (_, _, data) in list(self._index_entries.items()):
                 tx_timestamp = data.get("timestamp", 0)  # Ensure timestamp exists, default to 0
                 tx_age = current_time - tx_timestamp if tx_timestamp else float('inf')
 
                 if tx_age > mempool_expiry:
                     expired_transactions.append(tx_hash)
 
-            # Remove expired transactions and print their removal
+            # Remove expired transactions (keyed by hashed ID) and print their removal
             for tx_hash in expired_transactions:
-                self.remove_transaction(tx_hash)
+                self._discard_transaction(tx_hash)
                 print(f"[MEMPOOL] ❌ Removed expired transaction {tx_hash} (Exceeded {mempool_expiry}s).")
 
         print(f"[MEMPOOL] ✅ Cleanup complete: {len(expired_transactions)} transactions removed.")
@@ -467,17 +541,11 @@ class StandardMempool:
                 # Single SHA3-384 hashing of transaction ID
                 single_hashed_tx_id = hashlib.sha3_384(tx_id.encode()).hexdigest()
 
-                # Fetch transaction from LMDB
-                transaction_data = self.lmdb.get(f"mempool:{single_hashed_tx_id}")
-                if not transaction_data:
+                # Remove transaction from LMDB and the fee-rate index
+                if self._discard_transaction(single_hashed_tx_id) is None:
                     print(f"[MEMPOOL][WARN] ⚠️ Attempted to remove non-existent transaction {single_hashed_tx_id}.")
                     return
 
-                transaction = json.loads(transaction_data)
-
-                # Remove transaction from LMDB
-                self.lmdb.delete(f"mempool:{single_hashed_tx_id}")
-
                 # Notify smart contract if provided
                 if smart_contract:
                     try:
@@ -18,6 +18,7 @@ from Zyiron_Chain.transactions.payment_type import PaymentTypeManager
 from Zyiron_Chain.utils.hashing import Hashing
 from Zyiron_Chain.transactions.coinbase import CoinbaseTx
 from Zyiron_Chain.blockchain.block import Block
+from Zyiron_Chain.blockchain.merkle_tree import MerkleTree
 from Zyiron_Chain.blockchain.block_manager import BlockManager
 # Ensure this is at the very top of your script, before any other code
 import time
@@ -71,6 +72,7 @@ class Miner:
         self.genesis_block_manager = genesis_block_manager
         self._mining_active = False  # Mining state flag
         self._current_block = None   # Track current block being mined
+        self._merkle_tree = MerkleTree()  # Reused across candidate blocks (leaf digests from the template)
 
         # ✅ Extract TxStorage from transaction_manager (needed for fallback/validation)
         self.tx_storage = getattr(transaction_manager, "tx_storage", None)
@@ -670,43 +672,58 @@ class Miner:
                     return None
                 print(f"[Miner.mine_block] INFO: Using miner address: {miner_address}")
 
-                # ✅ Get pending transactions
-                pending_txs = self.transaction_manager.mempool.get_pending_transactions(self.current_block_size) or []
-                print(f"[Miner.mine_block] INFO: Retrieved {len(pending_txs)} pending transactions.")
+                # ✅ Build the block from the incremental block template, rebuilding it
+                # whenever higher-fee transactions arrive during Proof-of-Work
+                template = self.transaction_manager.block_template
+                if template.max_size_bytes != int(self.current_block_size * 1024 * 1024):
+                    template.resize(self.current_block_size)
 
-                total_fees = sum(Decimal(tx.get("fee", 0)) for tx in pending_txs)
-                print(f"[Miner.mine_block] INFO: Total block fees: {total_fees} ZYC")
-
-                # ✅ Create coinbase transaction
-                coinbase_tx = self._create_coinbase(miner_address, total_fees)
-                if not coinbase_tx:
-                    print("[Miner.mine_block] ERROR: Failed to create coinbase transaction.")
-                    return None
-
-                valid_txs = [coinbase_tx] + pending_txs
-
-                # ✅ Previous hash
                 previous_hash = getattr(last_block, "mined_hash", last_block.hash)
                 if block_height == 0:
                     previous_hash = Constants.ZERO_HASH
 
-                # ✅ Construct block
-                new_block = Block(
-                    index=block_height,
-                    previous_hash=previous_hash,
-                    transactions=valid_txs,
-                    timestamp=int(time.time()),
-                    nonce=0,
-                    difficulty=current_target,
-                    miner_address=miner_address,
-                    fees=total_fees
-                )
-
-                # ✅ Perform Proof-of-Work
-                print("[Miner.mine_block] INFO: Performing Proof-of-Work.")
-                pow_result = self.pow_manager.perform_pow(new_block)
-
-                if not pow_result:
+                while True:
+                    pending_txs, total_fees, template_version = self.transaction_manager.template_snapshot()
+                    print(f"[Miner.mine_block] INFO: Retrieved {len(pending_txs)} pending transactions.")
+                    print(f"[Miner.mine_block] INFO: Total block fees: {total_fees} ZYC")
+
+                    # ✅ Create coinbase transaction
+                    coinbase_tx = self._create_coinbase(miner_address, total_fees)
+                    if not coinbase_tx:
+                        print("[Miner.mine_block] ERROR: Failed to create coinbase transaction.")
+                        return None
+
+                    valid_txs = [coinbase_tx] + pending_txs
+
+                    # ✅ Update the miner's Merkle tree: cached leaves for template transactions,
+                    # only the coinbase and changed positions are rehashed
+                    self._merkle_tree.sync(valid_txs, template.leaf_digests(valid_txs))
+
+                    # ✅ Construct block
+                    new_block = Block(
+                        index=block_height,
+                        previous_hash=previous_hash,
+                        transactions=valid_txs,
+                        timestamp=int(time.time()),
+                        nonce=0,
+                        difficulty=current_target,
+                        miner_address=miner_address,
+                        fees=total_fees,
+                        merkle_tree=self._merkle_tree.copy()
+                    )
+
+                    # ✅ Perform Proof-of-Work
+                    print("[Miner.mine_block] INFO: Performing Proof-of-Work.")
+                    pow_result = self.pow_manager.perform_pow(
+                        new_block,
+                        refresh_check=lambda: template.has_better_fees(template_version, total_fees)
+                    )
+
+                    if not self.pow_manager.last_pow_interrupted:
+                        break
+                    print("[Miner.mine_block] INFO: Higher-fee transactions arrived. Rebuilding block from template.")
+
+                if not pow_result or pow_result[0] is None:
                     print("[Miner.mine_block] ERROR: PoW failed.")
                     return None
 
@@ -753,6 +770,7 @@ class Miner:
 
                 # ✅ Update block manager in-memory state
                 self.block_manager.chain.append(new_block)
+                self.transaction_manager.on_block_connected(new_block)
 
                 print(f"[Miner.mine_block] ✅ SUCCESS: Block {block_height} mined with hash {mined_hash[:12]}... in {time.time() - start_time:.2f}s")
                 return new_block
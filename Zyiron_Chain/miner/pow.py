@@ -1,6 +1,8 @@
 import time
 import hashlib
 import math
+import multiprocessing
+import queue
 from decimal import Decimal
 import json
 
@@ -14,22 +16,134 @@ sys.path.append(project_root)
 from Zyiron_Chain.blockchain.constants import Constants
 from Zyiron_Chain.utils.hashing import Hashing
 
+class PowHeaderHasher:
+    """
+    Fast-path SHA3-384 hasher for Proof-of-Work over a fixed block header.
+
+    - Serializes the header prefix (everything before the nonce) to bytes once and keeps
+      a `hashlib.sha3_384` midstate of it; each attempt `.copy()`s the midstate and feeds
+      only the nonce and the fixed header tail.
+    - Compares the raw 48-byte digest against a precomputed big-endian target, so no hex
+      conversion or `int(..., 16)` parsing happens per attempt.
+    - Produces exactly the same hash as `Block.calculate_hash()` for the same nonce.
+    """
+
+    DIGEST_SIZE = 48  # SHA3-384 digest size in bytes
+
+    def __init__(self, header_prefix: str, header_suffix: str, target: int):
+        self._midstate = hashlib.sha3_384(header_prefix.encode("utf-8"))
+        self._suffix = header_suffix.encode("utf-8")
+        # ✅ Clamp so the target always fits 48 bytes (digest < 2**384 - 1 for any sane target)
+        self.target = min(int(target), (1 << (8 * self.DIGEST_SIZE)) - 1)
+        self.target_bytes = self.target.to_bytes(self.DIGEST_SIZE, "big")
+
+    @classmethod
+    def from_block(cls, block) -> "PowHeaderHasher":
+        """Builds a hasher from a Block's PoW header parts and difficulty target."""
+        header_prefix, header_suffix = block.get_pow_header_parts()
+        target = int(block.difficulty, 16) if isinstance(block.difficulty, str) else int(block.difficulty)
+        return cls(header_prefix, header_suffix, target)
+
+    def digest(self, nonce: int) -> bytes:
+        """Returns the raw SHA3-384 digest of the header for `nonce`."""
+        hasher = self._midstate.copy()
+        hasher.update(b"%d" % nonce + self._suffix)
+        return hasher.digest()
+
+    def meets_target(self, digest: bytes) -> bool:
+        """Big-endian bytes compare: equivalent to int(digest) < target."""
+        return digest < self.target_bytes
+
+    def search(self, start_nonce: int, step: int, max_nonce: int, count: int):
+        """
+        Tries up to `count` nonces (start_nonce, start_nonce + step, ...) below `max_nonce`.
+
+        Returns:
+            (nonce, hash_hex, attempts) where nonce/hash_hex are None if nothing was found.
+        """
+        midstate_copy = self._midstate.copy
+        suffix = self._suffix
+        target_bytes = self.target_bytes
+        nonce = start_nonce
+        stop = min(max_nonce, start_nonce + step * count)
+        attempts = 0
+
+        while nonce < stop:
+            hasher = midstate_copy()
+            hasher.update(b"%d" % nonce + suffix)
+            attempts += 1
+            digest = hasher.digest()
+            if digest < target_bytes:
+                return nonce, digest.hex(), attempts  # ✅ Hex conversion only on success
+            nonce += step
+
+        return None, None, attempts
+
+
+def _pow_worker(worker_id, worker_count, header_prefix, header_suffix, target, max_nonce,
+                stop_event, result_queue, stats_queue, block_index):
+    """
+    PoW worker process entry point (module-level so it can be pickled on spawn platforms).
+    - Walks its own slice of the nonce space: worker_id, worker_id + worker_count, ...
+    - Hashes through a PowHeaderHasher midstate, polling `stop_event` between batches.
+    - Publishes the first winning (worker_id, nonce, hash) to `result_queue` and sets `stop_event`.
+    - Always reports (worker_id, attempts, elapsed_seconds) to `stats_queue` on exit.
+    """
+    attempts = 0
+    start_time = time.time()
+    nonce = worker_id
+    next_progress = Constants.POW_PROGRESS_INTERVAL
+
+    try:
+        hasher = PowHeaderHasher(header_prefix, header_suffix, target)
+        batch_size = Constants.POW_STOP_CHECK_INTERVAL
+
+        while nonce < max_nonce and not stop_event.is_set():
+            found_nonce, block_hash_hex, batch_attempts = hasher.search(nonce, worker_count, max_nonce, batch_size)
+            attempts += batch_attempts
+
+            if found_nonce is not None:
+                result_queue.put((worker_id, found_nonce, block_hash_hex))
+                stop_event.set()
+                break
+
+            nonce += worker_count * batch_attempts
+
+            if attempts >= next_progress:
+                next_progress += Constants.POW_PROGRESS_INTERVAL
+                elapsed_time = time.time() - start_time
+                print(f"[PowManager._pow_worker] INFO: Block {block_index} | Worker {worker_id} | Nonce {nonce:,} | "
+                      f"Hashrate: {attempts / max(elapsed_time, 1e-9):,.0f} H/s")
+
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"[PowManager._pow_worker] ❌ ERROR: Worker {worker_id} failed on block {block_index}: {e}")
+    finally:
+        stats_queue.put((worker_id, attempts, time.time() - start_time))
+
+
 class PowManager:
     """
     Manages Proof-of-Work (PoW) operations for a block.
 
-    - Uses only single SHA3-384 hashing via Hashing.hash().
+    - Uses single SHA3-384 hashing through the PowHeaderHasher midstate fast path.
+    - Splits the nonce search across a pool of worker processes (Constants.POW_WORKER_COUNT).
     - Retrieves necessary constants from Constants.
     - Provides detailed print statements for progress and errors.
     """
 
-    def __init__(self, block_storage):
+    def __init__(self, block_storage, worker_count: Optional[int] = None):
         """
         Initializes PowManager with access to block storage.
 
         :param block_storage: The storage handler for full blocks.
+        :param worker_count: Number of PoW worker processes (defaults to Constants.POW_WORKER_COUNT).
         """
         self.block_storage = block_storage  # ✅ Ensure `block_storage` is properly assigned
+        self.worker_count = max(1, int(worker_count or Constants.POW_WORKER_COUNT))
+        self.last_pow_stats = {}  # ✅ Per-worker hashrate from the most recent perform_pow() run
+        self.last_pow_interrupted = False  # ✅ True if the last perform_pow() was stopped by `refresh_check`
 
 
 
@@ -75,40 +189,156 @@ class PowManager:
             return False
 
 
-    def perform_pow(self, block):
+    def perform_pow(self, block, refresh_check=None):
+        """
+        Performs Proof-of-Work by searching the nonce space for a hash below the block target.
+        - Uses a multiprocessing worker pool when `worker_count` > 1, otherwise searches in-process.
+        - Stops every worker as soon as one of them finds a valid hash.
+        - Ensures the correct mined hash is assigned to `block.mined_hash`.
+        - Records per-worker hashrate in `self.last_pow_stats`.
+        - `refresh_check` (optional callable) is polled between search batches; when it returns True
+          the search is abandoned, `self.last_pow_interrupted` is set and (None, None) is returned so
+          the caller can rebuild the block (e.g. from a block template with higher fees).
+        """
+        self.last_pow_interrupted = False
+        if self.worker_count <= 1:
+            return self._perform_pow_single(block, refresh_check)
+
+        processes = []
+        try:
+            print(f"[PowManager.perform_pow] INFO: Starting Proof-of-Work for block {block.index} "
+                  f"with {self.worker_count} worker processes...")
+
+            difficulty_int = int(block.difficulty, 16) if isinstance(block.difficulty, str) else block.difficulty
+            max_nonce_limit = 4**64 - 1
+            header_prefix, header_suffix = block.get_pow_header_parts()
+
+            stop_event = multiprocessing.Event()
+            result_queue = multiprocessing.Queue()
+            stats_queue = multiprocessing.Queue()
+            start_time = time.time()
+
+            for worker_id in range(self.worker_count):
+                process = multiprocessing.Process(
+                    target=_pow_worker,
+                    args=(worker_id, self.worker_count, header_prefix, header_suffix, difficulty_int,
+                          max_nonce_limit, stop_event, result_queue, stats_queue, block.index),
+                    daemon=True
+                )
+                process.start()
+                processes.append(process)
+
+            # ✅ Wait for the first winning nonce (or for every worker to exhaust its slice)
+            result = None
+            while result is None:
+                try:
+                    result = result_queue.get(timeout=0.5)
+                except queue.Empty:
+                    if not any(p.is_alive() for p in processes):
+                        break
+                    if refresh_check and refresh_check():
+                        self.last_pow_interrupted = True
+                        break
+
+            stop_event.set()
+            elapsed_time = time.time() - start_time
+            self._collect_worker_stats(stats_queue, len(processes), block.index)
+
+            if result is None and self.last_pow_interrupted:
+                print(f"[PowManager.perform_pow] ⚠️ WARNING: PoW for block {block.index} interrupted after "
+                      f"{elapsed_time:.2f}s to refresh block contents.")
+                return None, None
+
+            if result is None:
+                print(f"[PowManager.perform_pow] ❌ ERROR: Block {block.index} reached max nonce limit without valid hash.")
+                return None, None
+
+            worker_id, nonce, block_hash_hex = result
+            block.nonce = nonce
+            total_attempts = sum(stat["attempts"] for stat in self.last_pow_stats.values())
+            print(f"[PowManager.perform_pow] ✅ SUCCESS: Block {block.index} mined by worker {worker_id} with nonce {nonce} "
+                  f"after {total_attempts:,} attempts in {elapsed_time:.2f} seconds.")
+
+            if not hasattr(block, "mined_hash") or not block.mined_hash:
+                block.mined_hash = block_hash_hex
+
+            return block_hash_hex, nonce
+
+        except Exception as e:
+            print(f"[PowManager.perform_pow] ❌ ERROR: PoW failed for block {block.index}: {e}")
+            return None, None
+
+        finally:
+            for process in processes:
+                process.join(timeout=2)
+                if process.is_alive():
+                    process.terminate()
+
+    def _collect_worker_stats(self, stats_queue, expected: int, block_index: int):
         """
-        Performs Proof-of-Work by incrementing the nonce until a valid hash is found.
-        - Uses `block.calculate_hash()` to compute hash.
+        Drains per-worker (attempts, elapsed) reports and logs each worker's hashrate.
+        Draining before join() also lets workers flush their queues and exit cleanly.
+        """
+        self.last_pow_stats = {}
+        for _ in range(expected):
+            try:
+                worker_id, attempts, elapsed = stats_queue.get(timeout=5)
+            except queue.Empty:
+                print(f"[PowManager._collect_worker_stats] ⚠️ WARNING: Missing hashrate report from a worker for block {block_index}.")
+                break
+
+            hashrate = attempts / elapsed if elapsed > 0 else 0.0
+            self.last_pow_stats[worker_id] = {"attempts": attempts, "elapsed": elapsed, "hashrate": hashrate}
+            print(f"[PowManager._collect_worker_stats] INFO: Worker {worker_id} | Attempts: {attempts:,} | "
+                  f"Hashrate: {hashrate:,.0f} H/s")
+
+        total_hashrate = sum(stat["hashrate"] for stat in self.last_pow_stats.values())
+        print(f"[PowManager._collect_worker_stats] INFO: Block {block_index} | Combined hashrate: {total_hashrate:,.0f} H/s "
+              f"across {len(self.last_pow_stats)} workers.")
+
+    def _perform_pow_single(self, block, refresh_check=None):
+        """
+        Single-process Proof-of-Work fallback (used when only one worker is configured).
+        - Hashes through a PowHeaderHasher midstate (same result as `block.calculate_hash()`).
         - Ensures the correct mined hash is assigned to `block.mined_hash`.
         - Includes real-time block height in logs.
         """
         try:
             print(f"[PowManager.perform_pow] INFO: Starting Proof-of-Work for block {block.index}...")
 
-            difficulty_int = int(block.difficulty, 16) if isinstance(block.difficulty, str) else block.difficulty
+            hasher = PowHeaderHasher.from_block(block)
             max_nonce_limit = 4**64 - 1
 
             nonce = 0
             start_time = time.time()
 
             while nonce < max_nonce_limit:
-                block.nonce = nonce
-                block_hash_hex = block.calculate_hash()
+                found_nonce, block_hash_hex, attempts = hasher.search(nonce, 1, max_nonce_limit, Constants.POW_PROGRESS_INTERVAL)
 
-                if int(block_hash_hex, 16) < difficulty_int:
+                if found_nonce is not None:
                     elapsed_time = time.time() - start_time
-                    print(f"[PowManager.perform_pow] ✅ SUCCESS: Block {block.index} mined after {nonce} attempts in {elapsed_time:.2f} seconds.")
+                    block.nonce = found_nonce
+                    print(f"[PowManager.perform_pow] ✅ SUCCESS: Block {block.index} mined after {found_nonce} attempts in {elapsed_time:.2f} seconds.")
+                    self.last_pow_stats = {0: {"attempts": found_nonce + 1, "elapsed": elapsed_time,
+                                               "hashrate": (found_nonce + 1) / elapsed_time if elapsed_time > 0 else 0.0}}
 
                     if not hasattr(block, "mined_hash") or not block.mined_hash:
                         block.mined_hash = block_hash_hex
 
-                    return block_hash_hex, nonce
+                    return block_hash_hex, found_nonce
 
-                nonce += 1
+                nonce += attempts
+                block.nonce = nonce
 
-                if nonce % 100000 == 0:
-                    elapsed_time = time.time() - start_time
-                    print(f"[PowManager.perform_pow] INFO: Block {block.index} | Nonce {nonce:,} | Time: {elapsed_time:.2f}s | Last Hash: {block_hash_hex[:12]}...")
+                elapsed_time = time.time() - start_time
+                print(f"[PowManager.perform_pow] INFO: Block {block.index} | Nonce {nonce:,} | Time: {elapsed_time:.2f}s | "
+                      f"Hashrate: {nonce / max(elapsed_time, 1e-9):,.0f} H/s")
+
+                if refresh_check and refresh_check():
+                    self.last_pow_interrupted = True
+                    print(f"[PowManager.perform_pow] ⚠️ WARNING: PoW for block {block.index} interrupted at nonce {nonce:,} "
+                          f"to refresh block contents.")
+                    return None, None
 
             print(f"[PowManager.perform_pow] ❌ ERROR: Block {block.index} reached max nonce limit without valid hash.")
             return None, None
@@ -128,36 +358,36 @@ class PowManager:
         - Implements fallbacks for block height, index, previous block hash, and difficulty.
         - Parses difficulty as a hex string and converts it to an integer.
         - Uses a dynamic scaling ratio for difficulty adjustment.
+        - Reads only the rolling header window kept by BlockStorage (O(1) in chain length).
         """
         try:
             print("[PowManager.adjust_difficulty] INFO: Initiating difficulty adjustment...")
 
-            stored_blocks = self.block_storage.get_all_blocks()
-            num_blocks = len(stored_blocks)
+            recent_headers = self.block_storage.get_recent_headers()
 
-            if num_blocks == 0:
+            if not recent_headers:
                 print("[PowManager.adjust_difficulty] INFO: No blocks found; using Genesis Target.")
                 return Constants.GENESIS_TARGET
 
-            last_block = stored_blocks[-1]
-            header = last_block.get("header", last_block)
+            last_header = recent_headers[-1]
 
             # ✅ **Ensure Block Height & Index Exist (Fallback)**
-            block_height = last_block.get("header", {}).get("index", num_blocks - 1)
+            block_height = int(last_header.get("index", len(recent_headers) - 1))
+            num_blocks = block_height + 1
             print(f"[PowManager.adjust_difficulty] INFO: Using block height {block_height} for difficulty adjustment.")
 
             # ✅ **Ensure Previous Block Hash Exists (Fallback)**
-            previous_block_hash = last_block.get("header", {}).get("previous_hash", Constants.ZERO_HASH)
+            previous_block_hash = last_header.get("previous_hash", Constants.ZERO_HASH)
             if previous_block_hash == Constants.ZERO_HASH:
                 print("[PowManager.adjust_difficulty] WARNING: Missing previous block hash. Using ZERO_HASH fallback.")
 
             # ✅ **Ensure Last Block's Difficulty Exists (Fallback)**
-            if "header" not in last_block or "difficulty" not in last_block["header"]:
+            if "difficulty" not in last_header:
                 print("[PowManager.adjust_difficulty] ERROR: Last block missing difficulty in header. Using Genesis Target.")
                 return Constants.GENESIS_TARGET
 
             try:
-                last_diff_str = str(last_block["header"]["difficulty"]).lower().strip()
+                last_diff_str = str(last_header["difficulty"]).lower().strip()
 
                 # Ensure it starts with `0x`, otherwise convert manually
                 if last_diff_str.startswith("0x"):
@@ -170,16 +400,16 @@ class PowManager:
                 return Constants.GENESIS_TARGET
 
             # ✅ **Ensure Enough Blocks for Difficulty Adjustment**
-            if num_blocks < Constants.DIFFICULTY_ADJUSTMENT_INTERVAL:
+            if num_blocks < Constants.DIFFICULTY_ADJUSTMENT_INTERVAL or len(recent_headers) < Constants.DIFFICULTY_ADJUSTMENT_INTERVAL:
                 print(f"[PowManager.adjust_difficulty] INFO: Insufficient blocks ({num_blocks}) for adjustment. Using last difficulty.")
                 return last_difficulty
 
-            first_block = stored_blocks[-Constants.DIFFICULTY_ADJUSTMENT_INTERVAL]
+            first_header = recent_headers[-Constants.DIFFICULTY_ADJUSTMENT_INTERVAL]
 
             # ✅ **Ensure Timestamps Exist (Fallback)**
             try:
-                last_timestamp = int(last_block.get("header", {}).get("timestamp", time.time()))
-                first_timestamp = int(first_block.get("header", {}).get("timestamp", last_timestamp - Constants.TARGET_BLOCK_TIME * Constants.DIFFICULTY_ADJUSTMENT_INTERVAL))
+                last_timestamp = int(last_header.get("timestamp", time.time()))
+                first_timestamp = int(first_header.get("timestamp", last_timestamp - Constants.TARGET_BLOCK_TIME * Constants.DIFFICULTY_ADJUSTMENT_INTERVAL))
             except (ValueError, TypeError) as e:
                 print(f"[PowManager.adjust_difficulty] ERROR: Invalid timestamp format: {e}. Using estimated fallback values.")
                 last_timestamp = time.time()
@@ -224,39 +454,39 @@ class PowManager:
         try:
             print("[PowManager.get_average_block_time] INFO: Calculating average block time...")
 
-            stored_blocks = self.block_storage.get_all_blocks()  # ✅ Uses `block_storage`
-            num_blocks = len(stored_blocks)
+            recent_headers = self.block_storage.get_recent_headers()  # ✅ Rolling window from `block_storage`
+            num_blocks = int(recent_headers[-1].get("index", 0)) + 1 if recent_headers else 0
 
             # ✅ **Ensure Enough Blocks for Calculation**
-            if num_blocks < Constants.DIFFICULTY_ADJUSTMENT_INTERVAL + 1:
+            if num_blocks < Constants.DIFFICULTY_ADJUSTMENT_INTERVAL + 1 or len(recent_headers) < Constants.DIFFICULTY_ADJUSTMENT_INTERVAL:
                 print(f"[PowManager.get_average_block_time] WARNING: Only {num_blocks} blocks available. Using target block time.")
                 return Constants.TARGET_BLOCK_TIME
 
             times = []
-            start_index = num_blocks - Constants.DIFFICULTY_ADJUSTMENT_INTERVAL
+            window = recent_headers[-Constants.DIFFICULTY_ADJUSTMENT_INTERVAL:]
 
             # ✅ **Calculate Time Differences Between Blocks**
-            for i in range(start_index + 1, num_blocks):
+            for i in range(1, len(window)):
                 try:
-                    prev_timestamp = int(stored_blocks[i - 1]["header"].get("timestamp", 0))
-                    curr_timestamp = int(stored_blocks[i]["header"].get("timestamp", 0))
+                    prev_timestamp = int(window[i - 1].get("timestamp", 0))
+                    curr_timestamp = int(window[i].get("timestamp", 0))
 
                     # ✅ **Validate Timestamps Before Processing**
                     if prev_timestamp == 0 or curr_timestamp == 0:
-                        print(f"[PowManager.get_average_block_time] ERROR: Block {i} has invalid timestamps. Skipping.")
+                        print(f"[PowManager.get_average_block_time] ERROR: Block {window[i].get('index', i)} has invalid timestamps. Skipping.")
                         continue
 
                     diff = max(1, curr_timestamp - prev_timestamp)  # ✅ Prevents division errors
 
                     # ✅ **Ensure Timestamp Validation Within Allowed Drift**
                     if diff > Constants.MAX_TIME_DRIFT:
-                        print(f"[PowManager.get_average_block_time] ERROR: Block {i} timestamp drift exceeds {Constants.MAX_TIME_DRIFT}s. Skipping.")
+                        print(f"[PowManager.get_average_block_time] ERROR: Block {window[i].get('index', i)} timestamp drift exceeds {Constants.MAX_TIME_DRIFT}s. Skipping.")
                         continue
 
                     times.append(diff)
 
                 except (ValueError, TypeError) as e:
-                    print(f"[PowManager.get_average_block_time] ERROR: Invalid timestamp format in block {i}: {e}")
+                    print(f"[PowManager.get_average_block_time] ERROR: Invalid timestamp format in block {window[i].get('index', i)}: {e}")
 
             avg_time = sum(times) / len(times) if times else Constants.TARGET_BLOCK_TIME
             print(f"[PowManager.get_average_block_time] SUCCESS: Computed average block time: {avg_time:.2f} sec.")
@@ -1,31 +1,96 @@
+import sys
+import os
 import heapq
-from collections import defaultdict
-import heapq
-from collections import defaultdict
+import itertools
+from collections import OrderedDict, defaultdict
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from Zyiron_Chain.blockchain.constants import Constants
+
 
 class NetworkGraph:
-    """Manages the network graph and provides advanced pathfinding algorithms."""
+    """
+    Manages the network graph and provides advanced pathfinding algorithms.
 
-    def __init__(self):
+    - Channels are stored as per-node adjacency maps (node → neighbor → channel), so expanding
+      a node only touches its own channels.
+    - Each channel carries a distance, a per-hop fee and an optional capacity; routes for a
+      payment amount skip channels whose capacity is too small.
+    - Up to k shortest routes (Yen's algorithm) are cached per (start, end, amount, k) and
+      invalidated when a channel they use is removed or restricted. Adding a channel or
+      making one cheaper/larger clears the cache, since it can improve any route.
+    """
+
+    def __init__(self, route_cache_size=None):
         """
         Initialize the network graph.
+        :param route_cache_size: Maximum cached route lookups (defaults to Constants.MULTIHOP_ROUTE_CACHE_SIZE).
         """
         self.nodes = set()
-        self.edges = {}  # (node_a, node_b): {"distance": x}
+        self.adjacency = defaultdict(dict)  # node_a: {node_b: {"distance": x, "fee": y, "capacity": z}}
+        self.route_cache_size = max(1, int(route_cache_size or Constants.MULTIHOP_ROUTE_CACHE_SIZE))
+        self._route_cache = OrderedDict()  # (start, end, amount, k): [(cost, path), ...]
+        self._routes_by_channel = defaultdict(set)  # frozenset({node_a, node_b}): {cache keys}
 
-    def add_channel(self, node_a, node_b, distance):
+    # -------------------------------------------------------------------------
+    # Channels
+    # -------------------------------------------------------------------------
+    def add_channel(self, node_a, node_b, distance, capacity=None, fee=0):
         """
-        Add a channel to the network graph.
+        Add a channel to the network graph (or replace an existing one).
         :param node_a: First node.
         :param node_b: Second node.
         :param distance: Distance or cost between the nodes.
+        :param capacity: Maximum amount the channel can forward (None for unlimited).
+        :param fee: Fee charged for forwarding over the channel.
         """
         if distance < 0:
             raise ValueError("[ERROR] Distance must be non-negative.")
+        if fee < 0:
+            raise ValueError("[ERROR] Fee must be non-negative.")
+        if capacity is not None and capacity < 0:
+            raise ValueError("[ERROR] Capacity must be non-negative.")
+
+        previous = self.adjacency.get(node_a, {}).get(node_b)
+        channel = {"distance": distance, "fee": fee, "capacity": capacity}
         self.nodes.add(node_a)
         self.nodes.add(node_b)
-        self.edges[(node_a, node_b)] = {"distance": distance}
-        self.edges[(node_b, node_a)] = {"distance": distance}
+        self.adjacency[node_a][node_b] = channel
+        self.adjacency[node_b][node_a] = channel
+        self._invalidate_channel(node_a, node_b, previous, channel)
+
+    def update_channel(self, node_a, node_b, distance=None, capacity=None, fee=None):
+        """
+        Update the distance, capacity and/or fee of an existing channel.
+        """
+        channel = self.get_channel(node_a, node_b)
+        if channel is None:
+            raise ValueError(f"[ERROR] Channel between '{node_a}' and '{node_b}' does not exist.")
+        self.add_channel(
+            node_a, node_b,
+            distance=channel["distance"] if distance is None else distance,
+            capacity=channel["capacity"] if capacity is None else capacity,
+            fee=channel["fee"] if fee is None else fee
+        )
+
+    def remove_channel(self, node_a, node_b):
+        """
+        Remove a channel from the network graph.
+        :return: True if the channel existed.
+        """
+        channel = self.adjacency.get(node_a, {}).pop(node_b, None)
+        if channel is None:
+            return False
+        self.adjacency[node_b].pop(node_a, None)
+        self._invalidate_channel(node_a, node_b, channel, None)
+        return True
+
+    def get_channel(self, node_a, node_b):
+        """
+        Return the channel between two nodes, or None.
+        """
+        return self.adjacency.get(node_a, {}).get(node_b)
 
     def get_neighbors(self, node):
         """
@@ -33,61 +98,237 @@ class NetworkGraph:
         :param node: Node to get neighbors for.
         :return: List of neighboring nodes.
         """
-        return [neighbor for (a, neighbor) in self.edges if a == node]
+        return list(self.adjacency.get(node, {}))
+
+    @staticmethod
+    def _edge_cost(channel):
+        return channel["distance"] + channel["fee"]
+
+    @staticmethod
+    def _can_forward(channel, amount):
+        return channel["capacity"] is None or channel["capacity"] >= amount
+
+    # -------------------------------------------------------------------------
+    # Route cache
+    # -------------------------------------------------------------------------
+    def _invalidate_channel(self, node_a, node_b, previous, current):
+        """
+        Drop cached routes affected by a channel change.
+        - New, cheaper or larger channels can improve any route: clear everything.
+        - Removed, costlier or smaller channels only affect routes that use them.
+        """
+        if not self._route_cache:
+            return
+
+        widened = (
+            previous is None
+            or (current is not None and (
+                self._edge_cost(current) < self._edge_cost(previous)
+                or (previous["capacity"] is not None
+                    and (current["capacity"] is None or current["capacity"] > previous["capacity"]))
+            ))
+        )
+        if widened:
+            self.clear_route_cache()
+            return
+
+        for key in self._routes_by_channel.pop(frozenset((node_a, node_b)), set()):
+            self._drop_cached_routes(key)
+
+    def _drop_cached_routes(self, key):
+        routes = self._route_cache.pop(key, None)
+        for _, path in routes or []:
+            for hop in zip(path, path[1:]):
+                keys = self._routes_by_channel.get(frozenset(hop))
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del self._routes_by_channel[frozenset(hop)]
+
+    def _cache_routes(self, key, routes):
+        self._route_cache[key] = routes
+        for _, path in routes:
+            for hop in zip(path, path[1:]):
+                self._routes_by_channel[frozenset(hop)].add(key)
+        while len(self._route_cache) > self.route_cache_size:
+            self._drop_cached_routes(next(iter(self._route_cache)))
+
+    def clear_route_cache(self):
+        self._route_cache.clear()
+        self._routes_by_channel.clear()
 
-    def find_advanced_path(self, start, end, algorithm="dijkstra"):
+    # -------------------------------------------------------------------------
+    # Routing
+    # -------------------------------------------------------------------------
+    def find_routes(self, start, end, amount=0, k=None):
+        """
+        Find up to `k` cheapest routes able to forward `amount`, shortest first.
+        Routes longer than Constants.MULTIHOP_MAX_HOPS are discarded.
+        :param start: Starting node.
+        :param end: Target node.
+        :param amount: Payment amount every channel on the route must be able to carry.
+        :param k: Number of alternative routes (defaults to Constants.MULTIHOP_MAX_ROUTES).
+        :return: List of (cost, path) tuples; empty if no route exists.
+        """
+        if start not in self.nodes or end not in self.nodes:
+            raise ValueError(f"[ERROR] Either start node '{start}' or end node '{end}' does not exist in the network.")
+
+        k = max(1, int(k or Constants.MULTIHOP_MAX_ROUTES))
+        key = (start, end, amount, k)
+        routes = self._route_cache.get(key)
+        if routes is not None:
+            self._route_cache.move_to_end(key)
+            return list(routes)
+
+        routes = [route for route in self._k_shortest_paths(start, end, amount, k)
+                  if len(route[1]) - 1 <= Constants.MULTIHOP_MAX_HOPS]
+        self._cache_routes(key, routes)
+        return list(routes)
+
+    def find_advanced_path(self, start, end, algorithm="dijkstra", amount=0):
         """
         Find a path between two nodes using the specified algorithm.
         :param start: Starting node.
         :param end: Target node.
         :param algorithm: Algorithm to use (default: "dijkstra").
+        :param amount: Payment amount every channel on the path must be able to carry.
         :return: List of nodes representing the path.
         """
         if start not in self.nodes or end not in self.nodes:
             raise ValueError(f"[ERROR] Either start node '{start}' or end node '{end}' does not exist in the network.")
         
         if algorithm == "dijkstra":
-            return self._dijkstra_path(start, end)
+            routes = self.find_routes(start, end, amount, k=1)
+            if not routes:
+                raise ValueError(f"[ERROR] No path found from {start} to {end}.")
+            return list(routes[0][1])
         elif algorithm == "astar":
-            return self._astar_path(start, end)
+            return self._astar_path(start, end, amount)
         else:
             raise ValueError(f"[ERROR] Unsupported algorithm: {algorithm}")
 
-    def _dijkstra_path(self, start, end):
+    def _distances_from(self, source, amount=0):
         """
-        Dijkstra's algorithm for finding the shortest path.
+        Cost of the cheapest path from `source` to every reachable node (channels are symmetric,
+        so this is also the cost to reach `source`). Used as an exact A* bound by Yen's search.
         """
-        distances = {node: float('inf') for node in self.nodes}
-        previous_nodes = {node: None for node in self.nodes}
-        distances[start] = 0
-        priority_queue = [(0, start)]
+        distances = {source: 0}
+        counter = itertools.count()
+        priority_queue = [(0, next(counter), source)]
 
         while priority_queue:
-            current_distance, current_node = heapq.heappop(priority_queue)
-
+            current_distance, _, current_node = heapq.heappop(priority_queue)
             if current_distance > distances[current_node]:
                 continue
+            for neighbor, channel in self.adjacency.get(current_node, {}).items():
+                if not self._can_forward(channel, amount):
+                    continue
+                new_distance = current_distance + self._edge_cost(channel)
+                if new_distance < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = new_distance
+                    heapq.heappush(priority_queue, (new_distance, next(counter), neighbor))
+
+        return distances
+
+    def _dijkstra_path(self, start, end, amount=0, excluded_nodes=(), excluded_edges=(), lower_bounds=None):
+        """
+        Dijkstra's algorithm for finding the shortest path.
+        Skips channels that cannot carry `amount`, plus the excluded nodes and directed edges
+        (used by the k-shortest-paths search). With `lower_bounds` (node → cost to `end`),
+        the search is goal-directed and never expands nodes that cannot reach `end`.
+        :return: (cost, path) or None if no path exists.
+        """
+        if lower_bounds is not None and start not in lower_bounds:
+            return None
 
-            for neighbor in self.get_neighbors(current_node):
-                edge = self.edges[(current_node, neighbor)]
-                new_distance = current_distance + edge["distance"]
-                if new_distance < distances[neighbor]:
+        distances = {start: 0}
+        previous_nodes = {start: None}
+        settled = set()
+        counter = itertools.count()
+        priority_queue = [(lower_bounds[start] if lower_bounds else 0, next(counter), start)]
+
+        while priority_queue:
+            _, _, current_node = heapq.heappop(priority_queue)
+            if current_node in settled:
+                continue
+            settled.add(current_node)
+            current_distance = distances[current_node]
+
+            if current_node == end:
+                path = []
+                while current_node is not None:
+                    path.append(current_node)
+                    current_node = previous_nodes[current_node]
+                path.reverse()
+                return current_distance, path
+
+            for neighbor, channel in self.adjacency.get(current_node, {}).items():
+                if neighbor in excluded_nodes or (current_node, neighbor) in excluded_edges:
+                    continue
+                if not self._can_forward(channel, amount):
+                    continue
+                if lower_bounds is not None and neighbor not in lower_bounds:
+                    continue
+                new_distance = current_distance + self._edge_cost(channel)
+                if new_distance < distances.get(neighbor, float('inf')):
                     distances[neighbor] = new_distance
                     previous_nodes[neighbor] = current_node
-                    heapq.heappush(priority_queue, (new_distance, neighbor))
+                    priority = new_distance + (lower_bounds[neighbor] if lower_bounds else 0)
+                    heapq.heappush(priority_queue, (priority, next(counter), neighbor))
+
+        return None
 
-        # Reconstruct the path
-        path = []
-        current = end
-        while current:
-            path.append(current)
-            current = previous_nodes[current]
-        path.reverse()
-        if not path or path[0] != start:
-            raise ValueError(f"[ERROR] No path found from {start} to {end}.")
-        return path
+    def _path_cost(self, path):
+        return sum(self._edge_cost(self.adjacency[a][b]) for a, b in zip(path, path[1:]))
 
-    def _astar_path(self, start, end):
+    def _k_shortest_paths(self, start, end, amount, k):
+        """
+        Yen's algorithm: the k cheapest loopless paths that can carry `amount`.
+        """
+        if k == 1:
+            first = self._dijkstra_path(start, end, amount)
+            return [first] if first is not None else []
+
+        to_end = self._distances_from(end, amount)
+        first = self._dijkstra_path(start, end, amount, lower_bounds=to_end)
+        if first is None:
+            return []
+
+        routes = [first]
+        seen = {tuple(first[1])}
+        candidates = []
+        counter = itertools.count()
+
+        while len(routes) < k:
+            last_path = routes[-1][1]
+            for i in range(len(last_path) - 1):
+                spur_node = last_path[i]
+                root_path = last_path[:i + 1]
+
+                excluded_edges = {
+                    (path[i], path[i + 1]) for _, path in routes
+                    if len(path) > i + 1 and path[:i + 1] == root_path
+                }
+                excluded_nodes = set(root_path[:-1])
+
+                spur = self._dijkstra_path(spur_node, end, amount, excluded_nodes, excluded_edges, to_end)
+                if spur is None:
+                    continue
+
+                total_path = root_path[:-1] + spur[1]
+                if tuple(total_path) in seen:
+                    continue
+                seen.add(tuple(total_path))
+                heapq.heappush(candidates, (self._path_cost(root_path) + spur[0], next(counter), total_path))
+
+            if not candidates:
+                break
+            cost, _, path = heapq.heappop(candidates)
+            routes.append((cost, path))
+
+        return routes
+
+    def _astar_path(self, start, end, amount=0):
         """
         A* algorithm for finding the shortest path.
         """
@@ -95,15 +336,14 @@ class NetworkGraph:
             # Placeholder heuristic function
             return abs(hash(node) - hash(target)) % 100
 
-        open_set = {start}
+        counter = itertools.count()
+        open_heap = [(heuristic(start, end), next(counter), start)]
         came_from = {}
-        g_score = {node: float('inf') for node in self.nodes}
-        g_score[start] = 0
-        f_score = {node: float('inf') for node in self.nodes}
-        f_score[start] = heuristic(start, end)
+        g_score = {start: 0}
+        closed = set()
 
-        while open_set:
-            current = min(open_set, key=lambda node: f_score[node])
+        while open_heap:
+            _, _, current = heapq.heappop(open_heap)
             if current == end:
                 # Reconstruct path
                 path = []
@@ -114,15 +354,18 @@ class NetworkGraph:
                 path.reverse()
                 return path
 
-            open_set.remove(current)
-            for neighbor in self.get_neighbors(current):
-                tentative_g_score = g_score[current] + self.edges[(current, neighbor)]["distance"]
-                if tentative_g_score < g_score[neighbor]:
+            if current in closed:
+                continue
+            closed.add(current)
+
+            for neighbor, channel in self.adjacency.get(current, {}).items():
+                if not self._can_forward(channel, amount):
+                    continue
+                tentative_g_score = g_score[current] + self._edge_cost(channel)
+                if tentative_g_score < g_score.get(neighbor, float('inf')):
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = tentative_g_score + heuristic(neighbor, end)
-                    if neighbor not in open_set:
-                        open_set.add(neighbor)
+                    heapq.heappush(open_heap, (tentative_g_score + heuristic(neighbor, end), next(counter), neighbor))
 
         raise ValueError(f"[ERROR] No path found from {start} to {end}.")
 
@@ -136,23 +379,33 @@ class MultiHop:
         self.network = NetworkGraph()  # Graph to manage channels and nodes
         self.batched_transactions = defaultdict(list)  # Batches of transactions grouped by path
 
-    def add_channel(self, node_a, node_b, distance):
+    def add_channel(self, node_a, node_b, distance, capacity=None, fee=0):
         """
         Add an open channel to the network graph.
         :param node_a: Starting node.
         :param node_b: Ending node.
         :param distance: Cost or distance between nodes.
+        :param capacity: Maximum amount the channel can forward (None for unlimited).
+        :param fee: Fee charged for forwarding over the channel.
         """
-        self.network.add_channel(node_a, node_b, distance)
+        self.network.add_channel(node_a, node_b, distance, capacity=capacity, fee=fee)
 
-    def find_shortest_path(self, start, end):
+    def find_shortest_path(self, start, end, amount=0):
         """
         Find the shortest path using Dijkstra's algorithm.
         :param start: Starting node.
         :param end: Target node.
+        :param amount: Payment amount every channel on the path must be able to carry.
         :return: List of nodes representing the shortest path.
         """
-        return self.network.find_advanced_path(start, end, algorithm="dijkstra")
+        return self.network.find_advanced_path(start, end, algorithm="dijkstra", amount=amount)
+
+    def find_routes(self, start, end, amount=0, k=None):
+        """
+        Find up to `k` alternative routes (cheapest first) able to carry `amount`.
+        :return: List of (cost, path) tuples.
+        """
+        return self.network.find_routes(start, end, amount, k)
 
     def batch_transactions(self, transactions):
         """
@@ -162,7 +415,7 @@ class MultiHop:
         """
         for tx in transactions:
             sender, recipient, amount = tx
-            path = tuple(self.find_shortest_path(sender, recipient))
+            path = tuple(self.find_shortest_path(sender, recipient, amount))
             self.batched_transactions[path].append(tx)
         return self.batched_transactions
 
@@ -0,0 +1,257 @@
+import os
+import sys
+import json
+from contextlib import ExitStack
+from typing import Dict, List, Optional, Tuple
+
+import lmdb
+
+# Adjust Python path for project structure
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+sys.path.append(project_root)
+
+from Zyiron_Chain.storage.write_ahead_log import GroupCommitWriter
+from Zyiron_Chain.storage.lmdb_capacity import MapSizeController
+
+
+class StagedTransaction:
+    """
+    Stand-in for an LMDB write transaction that buffers `put`/`delete` calls
+    for one environment instead of writing them.
+
+    - `get` sees the staged writes first, then a read snapshot of the environment,
+      so existing `*_in_txn` helpers can run against it unchanged.
+    - Named sub-databases are tracked by name so the staged operations can be
+      serialized into the recovery marker and replayed later.
+    """
+
+    def __init__(self, name: str, env, named_dbs: Optional[Dict[str, object]] = None):
+        self.name = name
+        self.env = env
+        self.named_dbs = dict(named_dbs or {})
+        self._db_names = {id(handle): db_name for db_name, handle in self.named_dbs.items()}
+        self.ops: List[Tuple[str, Optional[str], bytes, Optional[bytes]]] = []
+        self._overlay: Dict[Tuple[Optional[str], bytes], Optional[bytes]] = {}
+        self._read_scope: Optional[ExitStack] = None
+        self._read_txn = None
+
+    def _db_name(self, db) -> Optional[str]:
+        if db is None:
+            return None
+        db_name = self._db_names.get(id(db))
+        if db_name is None:
+            raise ValueError(f"Sub-database handle not registered for staged environment '{self.name}'.")
+        return db_name
+
+    @staticmethod
+    def _to_bytes(value) -> bytes:
+        if isinstance(value, memoryview):
+            return value.tobytes()
+        if isinstance(value, str):
+            return value.encode("utf-8")
+        return bytes(value)
+
+    def get(self, key, default=None, db=None):
+        key = self._to_bytes(key)
+        overlay_key = (self._db_name(db), key)
+        if overlay_key in self._overlay:
+            value = self._overlay[overlay_key]
+            return default if value is None else value
+
+        if self._read_txn is None:
+            # Held open until close(), inside the read gate so a resize waits for it.
+            self._read_scope = ExitStack()
+            self._read_txn = self._read_scope.enter_context(MapSizeController.transaction(self.env))
+        value = self._read_txn.get(key, db=db)
+        return default if value is None else value
+
+    def put(self, key, value, db=None) -> bool:
+        key = self._to_bytes(key)
+        value = self._to_bytes(value)
+        db_name = self._db_name(db)
+        self.ops.append(("put", db_name, key, value))
+        self._overlay[(db_name, key)] = value
+        return True
+
+    def delete(self, key, db=None) -> bool:
+        key = self._to_bytes(key)
+        existed = self.get(key, db=db) is not None
+        db_name = self._db_name(db)
+        self.ops.append(("delete", db_name, key, None))
+        self._overlay[(db_name, key)] = None
+        return existed
+
+    def close(self) -> None:
+        """
+        Release the read snapshot (must happen before the environment is written).
+        """
+        if self._read_scope is not None:
+            self._read_scope.close()
+            self._read_scope = None
+            self._read_txn = None
+
+    def apply(self, txn) -> None:
+        """
+        Replay the staged operations inside a real write transaction.
+        """
+        for op, db_name, key, value in self.ops:
+            db = self.named_dbs[db_name] if db_name is not None else None
+            if op == "put":
+                txn.put(key, value, db=db)
+            else:
+                txn.delete(key, db=db)
+
+    def size_bytes(self) -> int:
+        return sum(len(key) + len(value or b"") for _, _, key, value in self.ops)
+
+    def serialize(self) -> Dict:
+        return {
+            "name": self.name,
+            "ops": [[op, db_name, key.hex(), value.hex() if value is not None else None]
+                    for op, db_name, key, value in self.ops]
+        }
+
+
+class BlockCommitBatch:
+    """
+    Crash-consistent commit of everything a block writes, across several LMDB environments.
+
+    Commit protocol:
+        1. Every change is staged in a `StagedTransaction` per environment (no writes yet).
+        2. The serialized operations are written as a recovery marker into the marker
+           environment (`block_metadata.lmdb`) in one durable write.
+        3. Each environment is committed once, in the order it was staged.
+        4. The marker is deleted in the same transaction as the last environment's writes.
+
+    If the process dies between steps 2 and 4, `recover()` replays the marker on the next
+    start. Replaying is idempotent (plain puts and deletes of staged values), so environments
+    that had already committed are unaffected.
+    """
+
+    MARKER_KEY = b"pending_block_commit"
+
+    def __init__(self, marker_env, label: str = ""):
+        self.marker_env = marker_env
+        self.label = label
+        self.stages: List[StagedTransaction] = []
+
+    def stage(self, name: str, env, named_dbs: Optional[Dict[str, object]] = None) -> StagedTransaction:
+        """
+        Return the staged transaction for `name`, creating it (and fixing its commit position) on first use.
+        """
+        for staged in self.stages:
+            if staged.name == name:
+                return staged
+        staged = StagedTransaction(name, env, named_dbs)
+        self.stages.append(staged)
+        return staged
+
+    def close(self) -> None:
+        for staged in self.stages:
+            staged.close()
+
+    def commit(self) -> bool:
+        """
+        Write the recovery marker, then commit each staged environment once in order.
+        """
+        try:
+            self.close()
+            if not self.stages:
+                return True
+
+            marker = json.dumps({
+                "label": self.label,
+                "stages": [staged.serialize() for staged in self.stages]
+            }, separators=(",", ":")).encode("utf-8")
+
+            # Queued group-commit writes must land before the block's direct writes
+            for staged in self.stages:
+                GroupCommitWriter.flush_path(staged.env.path())
+
+            with MapSizeController.transaction(self.marker_env, write=True) as txn:
+                txn.put(self.MARKER_KEY, marker)
+
+            for staged in self.stages:
+                self._commit_stage(staged, delete_marker=staged.env is self.marker_env and staged is self.stages[-1])
+
+            if self.stages[-1].env is not self.marker_env:
+                with MapSizeController.transaction(self.marker_env, write=True) as txn:
+                    txn.delete(self.MARKER_KEY)
+
+            print(f"[BlockCommitBatch.commit] ✅ SUCCESS: Committed {self.label} across {len(self.stages)} environments "
+                  f"({sum(len(staged.ops) for staged in self.stages)} writes).")
+            return True
+
+        except Exception as e:
+            print(f"[BlockCommitBatch.commit] ❌ ERROR: Commit of {self.label} interrupted: {e}. "
+                  f"Recovery marker left in place for replay.")
+            return False
+
+    def _commit_stage(self, staged: StagedTransaction, delete_marker: bool) -> None:
+        """
+        Commit one staged environment; grow its map and retry once if it is full.
+        """
+        needed_bytes = staged.size_bytes()
+        for attempt in range(2):
+            try:
+                with MapSizeController.write_gate(staged.env, needed_bytes), staged.env.begin(write=True) as txn:
+                    staged.apply(txn)
+                    if delete_marker:
+                        txn.delete(self.MARKER_KEY)
+                return
+            except (lmdb.MapFullError, lmdb.MapResizedError):
+                controller = MapSizeController._controllers.get(os.path.abspath(staged.env.path()))
+                if attempt or controller is None or not controller.handle_map_full(needed_bytes):
+                    raise
+
+    @classmethod
+    def has_pending(cls, marker_env) -> bool:
+        with MapSizeController.transaction(marker_env) as txn:
+            return txn.get(cls.MARKER_KEY) is not None
+
+    @classmethod
+    def recover(cls, marker_env, environments: Dict[str, Tuple[object, Dict[str, object]]]) -> bool:
+        """
+        Replay an interrupted commit from the recovery marker.
+
+        Args:
+            marker_env: Environment holding the marker.
+            environments: Stage name → (env, named sub-databases) for every environment a commit may touch.
+
+        Returns:
+            bool: True if there was nothing to recover or the replay completed.
+        """
+        try:
+            with MapSizeController.transaction(marker_env) as txn:
+                raw_marker = txn.get(cls.MARKER_KEY)
+                raw_marker = bytes(raw_marker) if raw_marker is not None else None
+            if raw_marker is None:
+                return True
+
+            marker = json.loads(raw_marker.decode("utf-8"))
+            label = marker.get("label", "")
+            print(f"[BlockCommitBatch.recover] ⚠️ WARNING: Found interrupted commit of {label}. Replaying...")
+
+            missing = [stage["name"] for stage in marker["stages"] if stage["name"] not in environments]
+            if missing:
+                print(f"[BlockCommitBatch.recover] ❌ ERROR: Cannot replay {label}; environments not available: {missing}")
+                return False
+
+            for stage in marker["stages"]:
+                env, named_dbs = environments[stage["name"]]
+                staged = StagedTransaction(stage["name"], env, named_dbs)
+                for op, db_name, key_hex, value_hex in stage["ops"]:
+                    value = bytes.fromhex(value_hex) if value_hex is not None else None
+                    staged.ops.append((op, db_name, bytes.fromhex(key_hex), value))
+                with MapSizeController.transaction(env, write=True) as txn:
+                    staged.apply(txn)
+
+            with MapSizeController.transaction(marker_env, write=True) as txn:
+                txn.delete(cls.MARKER_KEY)
+
+            print(f"[BlockCommitBatch.recover] ✅ SUCCESS: Replayed interrupted commit of {label}.")
+            return True
+
+        except Exception as e:
+            print(f"[BlockCommitBatch.recover] ❌ ERROR: Failed to replay interrupted commit: {e}")
+            return False
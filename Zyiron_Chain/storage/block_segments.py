@@ -0,0 +1,323 @@
+import os
+import sys
+import json
+import bisect
+from collections import OrderedDict
+from threading import RLock
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import lmdb
+
+# Adjust Python path for project structure
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+sys.path.append(project_root)
+
+from Zyiron_Chain.blockchain.constants import Constants
+from Zyiron_Chain.storage.lmdatabase import LMDBManager
+from Zyiron_Chain.storage.lmdb_capacity import MapSizeController
+
+
+class BlockSegmentStore:
+    """
+    Routes full-block reads and writes across the `full_block_chain/NNNN.lmdb` segment files.
+
+    - Only the head segment is writable; it is opened through LMDBManager like every other store.
+    - Sealed segments are immutable. They are opened read-only on first use and kept in an LRU
+      of at most `Constants.BLOCK_SEGMENT_MAX_OPEN` environments.
+    - The height range of every sealed segment, plus the head segment and its first height, is
+      persisted in `block_metadata.lmdb` (`block_segment:NNNN`, `block_segment_head`), so a
+      height resolves to its file with one bisect.
+    - Each segment keeps its own `block_index` sub-database (hash / tx → height) for the blocks
+      it holds, written in the same transaction as the block bodies.
+    - One store is shared per directory (`shared()`), so every BlockStorage in the process sees
+      the same head after a rollover and a segment file is never opened twice.
+    """
+
+    INDEX_PREFIX = b"block_segment:"
+    HEAD_KEY = b"block_segment_head"
+
+    _stores = {}
+    _stores_lock = RLock()
+
+    def __init__(self, blockchain_dir: str, index_env, max_open_segments: Optional[int] = None,
+                 segment_size_bytes: Optional[int] = None):
+        """
+        :param blockchain_dir: Directory holding the `NNNN.lmdb` segment files.
+        :param index_env: LMDB environment that stores the segment index (block_metadata).
+        :param max_open_segments: LRU size for read-only sealed segments.
+        :param segment_size_bytes: Head size that triggers a rollover.
+        """
+        self.blockchain_dir = blockchain_dir
+        self.index_env = index_env
+        self.max_open_segments = max(1, int(max_open_segments or Constants.BLOCK_SEGMENT_MAX_OPEN))
+        self.segment_size_bytes = int(segment_size_bytes or Constants.BLOCK_DATA_FILE_SIZE_BYTES)
+        self._lock = RLock()
+
+        self._ranges: Dict[int, Tuple[int, int]] = {}  # sealed segment → (start_height, end_height)
+        self._starts: List[int] = []  # sorted start heights of sealed segments
+        self._segments_by_start: List[int] = []  # segment numbers aligned with `_starts`
+        self._open_segments: "OrderedDict[int, Tuple[object, object]]" = OrderedDict()
+
+        os.makedirs(self.blockchain_dir, exist_ok=True)
+        self.head_segment, self.head_start = self._load_index()
+
+        self.head = LMDBManager(self.segment_path(self.head_segment))
+        self.head_index_db = self.head.env.open_db(b"block_index")
+
+        print(f"[BlockSegmentStore.__init__] ✅ Head segment {self.head_segment:04d} (from height {self.head_start}) | "
+              f"Sealed segments: {len(self._ranges)}")
+
+    @classmethod
+    def shared(cls, blockchain_dir: str, index_env) -> "BlockSegmentStore":
+        """
+        Return the process-wide store for `blockchain_dir`, creating it on first use.
+        """
+        path = os.path.abspath(blockchain_dir)
+        with cls._stores_lock:
+            store = cls._stores.get(path)
+            if store is None or store.head.env is None:
+                store = cls._stores[path] = cls(path, index_env)
+            return store
+
+    # -------------------------------------------------------------------------
+    # Segment index
+    # -------------------------------------------------------------------------
+    def segment_path(self, segment: int) -> str:
+        return os.path.join(self.blockchain_dir, f"{segment:04d}.lmdb")
+
+    def _segment_files(self) -> List[int]:
+        return sorted(
+            int(name.split(".")[0]) for name in os.listdir(self.blockchain_dir)
+            if name.endswith(".lmdb") and name.split(".")[0].isdigit()
+        )
+
+    def _register_sealed(self, segment: int, start_height: int, end_height: int) -> None:
+        self._ranges[segment] = (start_height, end_height)
+        position = bisect.bisect_left(self._starts, start_height)
+        self._starts.insert(position, start_height)
+        self._segments_by_start.insert(position, segment)
+
+    def _load_index(self) -> Tuple[int, int]:
+        """
+        Load the persisted segment index, or build it once from the segment files on disk.
+        Returns (head segment, head start height).
+        """
+        with MapSizeController.transaction(self.index_env) as txn:
+            raw_head = txn.get(self.HEAD_KEY)
+            sealed = []
+            cursor = txn.cursor()
+            if cursor.set_range(self.INDEX_PREFIX):
+                for key, value in cursor:
+                    if not key.startswith(self.INDEX_PREFIX):
+                        break
+                    sealed.append((int(key[len(self.INDEX_PREFIX):].decode("utf-8")), json.loads(bytes(value).decode("utf-8"))))
+
+        if raw_head is None:
+            return self._rebuild_index()
+
+        for segment, entry in sealed:
+            self._register_sealed(segment, int(entry["start_height"]), int(entry["end_height"]))
+
+        head = json.loads(bytes(raw_head).decode("utf-8"))
+        return int(head["segment"]), int(head["start_height"])
+
+    def _rebuild_index(self) -> Tuple[int, int]:
+        """
+        Build the segment index from the files on disk (first start, or upgrade from an
+        unindexed `full_block_chain/` directory). The newest file becomes the head.
+        """
+        files = self._segment_files()
+        if not files:
+            head_segment, head_start = 1, 0
+        else:
+            head_segment, head_start = files[-1], 0
+            for segment in files[:-1]:
+                heights = self._scan_segment_heights(segment)
+                if not heights:
+                    continue
+                start_height, end_height = heights
+                self._register_sealed(segment, start_height, end_height)
+                head_start = max(head_start, end_height + 1)
+
+        with MapSizeController.transaction(self.index_env, write=True) as txn:
+            for segment, (start_height, end_height) in self._ranges.items():
+                txn.put(self.INDEX_PREFIX + f"{segment:04d}".encode("utf-8"),
+                        json.dumps({"start_height": start_height, "end_height": end_height}).encode("utf-8"))
+            txn.put(self.HEAD_KEY, json.dumps({"segment": head_segment, "start_height": head_start}).encode("utf-8"))
+
+        print(f"[BlockSegmentStore._rebuild_index] ✅ Indexed {len(self._ranges)} sealed segments; head {head_segment:04d}.")
+        return head_segment, head_start
+
+    def _scan_segment_heights(self, segment: int) -> Optional[Tuple[int, int]]:
+        """
+        Return the (lowest, highest) block height stored in a segment file, or None if it holds no blocks.
+        """
+        env = lmdb.open(self.segment_path(segment), readonly=True, lock=False, max_dbs=10, readahead=False)
+        try:
+            heights = []
+            with MapSizeController.transaction(env) as txn:
+                cursor = txn.cursor()
+                if cursor.set_range(b"block:"):
+                    for key in cursor.iternext(keys=True, values=False):
+                        if not key.startswith(b"block:"):
+                            break
+                        heights.append(int(key[len(b"block:"):].decode("utf-8")))
+            return (min(heights), max(heights)) if heights else None
+        finally:
+            env.close()
+
+    def segment_for_height(self, height: int) -> Optional[int]:
+        """
+        Return the segment number that holds `height`, or None if it lies in no known segment.
+        """
+        if height >= self.head_start:
+            return self.head_segment
+        position = bisect.bisect_right(self._starts, height) - 1
+        if position < 0:
+            return None
+        segment = self._segments_by_start[position]
+        return segment if height <= self._ranges[segment][1] else None
+
+    # -------------------------------------------------------------------------
+    # Environments
+    # -------------------------------------------------------------------------
+    def open_segment(self, segment: int) -> Tuple[object, object]:
+        """
+        Return (env, block_index_db) for a segment. Sealed segments are opened read-only
+        on demand and the least recently used one is closed when the LRU is full.
+        """
+        if segment == self.head_segment:
+            return self.head.env, self.head_index_db
+
+        with self._lock:
+            opened = self._open_segments.get(segment)
+            if opened is not None:
+                self._open_segments.move_to_end(segment)
+                return opened
+
+            env = lmdb.open(self.segment_path(segment), readonly=True, lock=False, max_dbs=10, readahead=False)
+            opened = (env, env.open_db(b"block_index", create=False))
+            self._open_segments[segment] = opened
+
+            while len(self._open_segments) > self.max_open_segments:
+                _, (old_env, _) = self._open_segments.popitem(last=False)
+                old_env.close()
+
+            return opened
+
+    def environment_for_height(self, height: int) -> Optional[Tuple[object, object]]:
+        segment = self.segment_for_height(height)
+        return self.open_segment(segment) if segment is not None else None
+
+    def segments_newest_first(self) -> List[int]:
+        return [self.head_segment] + sorted(self._ranges, reverse=True)
+
+    def close(self) -> None:
+        with self._lock:
+            for env, _ in self._open_segments.values():
+                env.close()
+            self._open_segments.clear()
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+    def get_raw_block(self, height: int) -> Optional[bytes]:
+        """
+        Return the stored JSON bytes of the block at `height` from the segment that holds it.
+        """
+        opened = self.environment_for_height(height)
+        if opened is None:
+            return None
+        with MapSizeController.transaction(opened[0]) as txn:
+            raw_block = txn.get(f"block:{height}".encode("utf-8"))
+            return bytes(raw_block) if raw_block is not None else None
+
+    def iter_raw_blocks(self, start: int, end: int) -> Iterator[Tuple[int, Optional[bytes]]]:
+        """
+        Yield (height, raw block or None) for `start..end`, using one read transaction per segment.
+        """
+        height = max(0, start)
+        while height <= end:
+            segment = self.segment_for_height(height)
+            if segment is None:
+                yield height, None
+                height += 1
+                continue
+
+            segment_end = end if segment == self.head_segment else min(end, self._ranges[segment][1])
+            env, _ = self.open_segment(segment)
+            with MapSizeController.transaction(env) as txn:
+                for current_height in range(height, segment_end + 1):
+                    raw_block = txn.get(f"block:{current_height}".encode("utf-8"))
+                    yield current_height, raw_block
+            height = segment_end + 1
+
+    def lookup(self, key: bytes, in_block_index: bool = True) -> Optional[bytes]:
+        """
+        Look up a key (in the `block_index` sub-database, or the main database) in the head
+        segment first, then in sealed segments from newest to oldest.
+        """
+        for segment in self.segments_newest_first():
+            env, index_db = self.open_segment(segment)
+            with MapSizeController.transaction(env) as txn:
+                value = txn.get(key, db=index_db if in_block_index else None)
+                if value is not None:
+                    return bytes(value)
+        return None
+
+    # -------------------------------------------------------------------------
+    # Rollover
+    # -------------------------------------------------------------------------
+    def head_used_bytes(self) -> int:
+        info = self.head.env.info()
+        return (info["last_pgno"] + 1) * self.head.env.stat()["psize"]
+
+    def rollover_limit(self) -> int:
+        """
+        Head size that triggers a rollover: `BLOCK_DATA_FILE_SIZE_BYTES`, capped to a fraction
+        of the head's map size so the segment is sealed before LMDB reports MapFull.
+        """
+        map_size = self.head.env.info()["map_size"]
+        return min(self.segment_size_bytes, int(map_size * Constants.BLOCK_SEGMENT_MAP_FILL_RATIO))
+
+    def rollover_if_full(self) -> bool:
+        """
+        Seal the head segment and open the next one once the head reaches its size limit.
+        Must be called under the block write lock, before a block's writes are staged.
+
+        Returns:
+            bool: True if a new head segment was opened.
+        """
+        with self._lock:
+            if self.head_used_bytes() < self.rollover_limit():
+                return False
+
+            with self.head.begin() as txn:
+                latest_index = txn.get(b"latest_block_index")
+            if latest_index is None:
+                return False
+            end_height = int(bytes(latest_index).decode("utf-8"))
+
+            sealed_segment, sealed_start = self.head_segment, self.head_start
+            new_segment = sealed_segment + 1
+
+            # Open the new head first and carry the tip marker over, so readers of
+            # `latest_block_index` never see an empty head.
+            new_head = LMDBManager(self.segment_path(new_segment))
+            new_index_db = new_head.env.open_db(b"block_index")
+            with new_head.begin(write=True) as txn:
+                txn.put(b"latest_block_index", str(end_height).encode("utf-8"))
+
+            with MapSizeController.transaction(self.index_env, write=True) as txn:
+                txn.put(self.INDEX_PREFIX + f"{sealed_segment:04d}".encode("utf-8"),
+                        json.dumps({"start_height": sealed_start, "end_height": end_height}).encode("utf-8"))
+                txn.put(self.HEAD_KEY, json.dumps({"segment": new_segment, "start_height": end_height + 1}).encode("utf-8"))
+
+            self.head.close()
+            self._register_sealed(sealed_segment, sealed_start, end_height)
+            self.head, self.head_index_db = new_head, new_index_db
+            self.head_segment, self.head_start = new_segment, end_height + 1
+
+            print(f"[BlockSegmentStore.rollover_if_full] ✅ Sealed segment {sealed_segment:04d} "
+                  f"(heights {sealed_start}-{end_height}); new head {new_segment:04d}.")
+            return True
@@ -7,7 +7,7 @@ import json
 import pickle
 import time
 from decimal import Decimal
-from typing import Optional, List, Dict, Tuple, Union
+from typing import Optional, List, Dict, Tuple, Union, Iterator
 
 # Ensure module path is set correctly
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
@@ -19,7 +19,11 @@ from Zyiron_Chain.storage.tx_storage import TxStorage
 import struct
 import os
 from threading import Lock
+from collections import deque
 from Zyiron_Chain.accounts.key_manager import KeyManager
+from Zyiron_Chain.accounts.signature_cache import SignatureCache
+from Zyiron_Chain.storage.block_commit import BlockCommitBatch
+from Zyiron_Chain.storage.block_segments import BlockSegmentStore
 import struct
 
 import os
@@ -34,7 +38,8 @@ class BlockStorage:
 
     Responsibilities:
       - Store block headers (metadata) in LMDB.
-      - Store full blocks in LMDB (`full_block_chain/0001.lmdb`, `0002.lmdb`, etc.).
+      - Store full blocks in LMDB (`full_block_chain/0001.lmdb`, `0002.lmdb`, etc.); reads are
+        routed by height to the segment holding the block (see BlockSegmentStore).
       - Use single SHA3-384 hashing.
       - Provide detailed print statements for every major step and error.
       - Ensure thread safety with locks.
@@ -73,20 +78,21 @@ class BlockStorage:
             self.blockchain_dir = os.path.join(Constants.BLOCKCHAIN_STORAGE_PATH, "full_block_chain")
             os.makedirs(self.blockchain_dir, exist_ok=True)
 
-            # ✅ Step 3: Determine the Latest LMDB File in `full_block_chain/`
-            lmdb_files = sorted([
-                f.split(".")[0] for f in os.listdir(self.blockchain_dir)
-                if f.endswith(".lmdb") and f.split(".")[0].isdigit()
-            ])
+            # ✅ Step 3: Load the height → segment index for `full_block_chain/NNNN.lmdb`
+            self.segments = BlockSegmentStore.shared(self.blockchain_dir, self.block_metadata_db.env)
 
-            if lmdb_files:
-                latest_file_number = int(lmdb_files[-1])
-                latest_lmdb = os.path.join(self.blockchain_dir, f"{latest_file_number:04}.lmdb")
-            else:
-                latest_lmdb = os.path.join(self.blockchain_dir, "0001.lmdb")
+            # ✅ Step 4/5: The head segment (with its hash/tx index) is the only writable block file
+            latest_lmdb = self.segments.segment_path(self.segments.head_segment)
+
+            # ✅ Step 6: Rolling header window for difficulty retargeting (rebuilt from the chain tail)
+            self._header_window = deque(maxlen=Constants.DIFFICULTY_ADJUSTMENT_INTERVAL + 1)
+            self._load_header_window()
 
-            # ✅ Step 4: Initialize LMDB Storage with the latest or new block file
-            self.full_block_store = LMDBManager(latest_lmdb)
+            # ✅ Step 7: Finish any block commit interrupted by a crash
+            self.recover_pending_commit()
+
+            # ✅ Step 8: Backfill the block → tx index for blocks stored before it existed
+            self._ensure_block_tx_index()
 
             print(f"[BlockStorage.__init__] ✅ Using LMDB file: {latest_lmdb}")
 
@@ -131,38 +137,13 @@ class BlockStorage:
 
     def _check_and_rollover_lmdb(self):
         """
-        Checks if the current LMDB file exceeds the size limit.
-        If it does, rolls over to a new sequential LMDB file inside `full_block_chain/`.
+        Checks if the head LMDB segment reached its size limit.
+        If it did, seals it and switches writes to a new sequential file inside `full_block_chain/`.
+        Must be called under `write_lock`, before a block's writes are staged.
         """
         try:
-            # ✅ **Ensure `full_block_chain/` Directory Exists**
-            if not os.path.exists(self.blockchain_dir):
-                os.makedirs(self.blockchain_dir, exist_ok=True)
-
-            # ✅ **Check the current LMDB file size**
-            current_lmdb_file = self.full_block_store.env.path()
-            if os.path.exists(current_lmdb_file) and os.path.getsize(current_lmdb_file) >= Constants.BLOCK_DATA_FILE_SIZE_BYTES:
-                print(f"[BlockStorage] INFO: LMDB file {current_lmdb_file} exceeded {Constants.BLOCK_DATA_FILE_SIZE_BYTES} bytes. Rolling over...")
-
-                # ✅ **Determine the next available file number inside `full_block_chain/`**
-                existing_files = sorted([
-                    f for f in os.listdir(self.blockchain_dir) if f.endswith(".lmdb") and f.isdigit()
-                ])
-                
-                if existing_files:
-                    next_file_number = int(existing_files[-1]) + 1  # ✅ Increment the last file number
-                else:
-                    next_file_number = 1  # ✅ Start from 1 if no files exist
-
-                new_lmdb_file = os.path.join(self.blockchain_dir, f"{next_file_number:04d}.lmdb")  # Format as "0001.lmdb"
-
-                # ✅ **Close the existing LMDB environment before switching**
-                self.full_block_store.env.close()
-
-                # ✅ **Switch to the new LMDB file**
-                self.full_block_store = LMDBManager(new_lmdb_file)
-
-                print(f"[BlockStorage] ✅ Rolled over to new LMDB file: {new_lmdb_file}")
+            if self.segments.rollover_if_full():
+                print(f"[BlockStorage] ✅ Rolled over to new LMDB file: {self.segments.segment_path(self.segments.head_segment)}")
 
         except Exception as e:
             print(f"[BlockStorage] ❌ ERROR: Failed to check LMDB rollover: {e}")
@@ -176,22 +157,20 @@ class BlockStorage:
         Verify that a block was correctly stored in LMDB.
         """
         try:
-            block_key = f"block:{block.index}".encode("utf-8")
-            with self.full_block_store.env.begin() as txn:
-                stored_data = txn.get(block_key)
+            stored_data = self.segments.get_raw_block(block.index)
 
-                if not stored_data:
-                    print(f"[BlockStorage.verify_stored_block] ❌ ERROR: Block {block.index} not found in LMDB.")
-                    return False
+            if not stored_data:
+                print(f"[BlockStorage.verify_stored_block] ❌ ERROR: Block {block.index} not found in LMDB.")
+                return False
 
-                try:
-                    stored_json = stored_data.decode("utf-8")
-                    stored_dict = json.loads(stored_json)
-                    print(f"[BlockStorage.verify_stored_block] ✅ Block {block.index} verified: {stored_dict}")
-                    return True
-                except (UnicodeDecodeError, json.JSONDecodeError) as e:
-                    print(f"[BlockStorage.verify_stored_block] ❌ ERROR: Failed to decode stored block {block.index}: {e}")
-                    return False
+            try:
+                stored_json = stored_data.decode("utf-8")
+                stored_dict = json.loads(stored_json)
+                print(f"[BlockStorage.verify_stored_block] ✅ Block {block.index} verified: {stored_dict}")
+                return True
+            except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                print(f"[BlockStorage.verify_stored_block] ❌ ERROR: Failed to decode stored block {block.index}: {e}")
+                return False
 
         except Exception as e:
             print(f"[BlockStorage.verify_stored_block] ❌ ERROR: Failed to verify block {block.index}: {e}")
@@ -215,8 +194,7 @@ class BlockStorage:
                     print(f"[BlockStorage.block_meta] ❌ ERROR: Invalid block hash length or type: {block_hash}")
                     return None
 
-                with self.full_block_store.env.begin() as txn:
-                    raw_data = txn.get(f"metadata:block:{block_hash}".encode())
+                raw_data = self.segments.lookup(f"metadata:block:{block_hash}".encode(), in_block_index=False)
 
                 if not raw_data:
                     print(f"[BlockStorage.block_meta] ⚠️ WARNING: No metadata found for block hash: {block_hash}")
@@ -250,7 +228,7 @@ class BlockStorage:
                     "miner_address": block.miner_address
                 }
 
-                with self.full_block_store.env.begin(write=True) as txn:
+                with self.full_block_store.begin(write=True) as txn:
                     txn.put(f"metadata:block:{block_hash_str}".encode(), json.dumps(metadata).encode("utf-8"))
 
                 print(f"[BlockStorage.block_meta] ✅ SUCCESS: Metadata stored for Block {block_hash_str}")
@@ -279,153 +257,354 @@ class BlockStorage:
         else:
             raise ValueError(f"Invalid difficulty format: {difficulty}")
 
-    def get_block_by_height(self, height: int) -> Optional[Block]:
+    def get_verified_height(self) -> int:
         """
-        Retrieve a block by height from LMDB with robust fallback mechanisms.
-        - Ensures the data is properly decoded as UTF-8 JSON.
-        - Validates the block structure.
-        - Handles missing or corrupted data gracefully.
-        - Enforces Genesis block integrity if height == 0.
+        Return the verified-height watermark: every block up to and including this height
+        has had its `previous_hash` linkage checked against the block below it.
+
+        Returns:
+            int: The highest verified height, or -1 if nothing has been verified yet.
         """
         try:
-            print(f"[BlockStorage.get_block_by_height] INFO: Retrieving Block {height}...")
+            with self.block_metadata_db.begin() as txn:
+                raw = txn.get(b"verified_height")
+            return int(raw.decode("utf-8")) if raw else -1
+        except Exception as e:
+            print(f"[BlockStorage.get_verified_height] ⚠️ WARNING: Failed to read verified-height watermark: {e}")
+            return -1
 
-            # ✅ Generate the block key for LMDB
-            block_key = f"block:{height}".encode("utf-8")
+    def _set_verified_height(self, height: int) -> None:
+        """
+        Persist the verified-height watermark in `block_metadata.lmdb`.
+        """
+        try:
+            with self.block_metadata_db.begin(write=True) as txn:
+                txn.put(b"verified_height", str(int(height)).encode("utf-8"))
+        except Exception as e:
+            print(f"[BlockStorage._set_verified_height] ❌ ERROR: Failed to store verified-height watermark {height}: {e}")
 
-            # ✅ Retrieve block data from LMDB
-            with self.full_block_store.env.begin() as txn:
-                block_data = txn.get(block_key)
+    def get_validated_height(self) -> int:
+        """
+        Return the full-validation checkpoint written by `Blockchain.validate_chain`:
+        every block up to and including this height passed PoW, Merkle, structure,
+        linkage and transaction checks.
 
-                if not block_data:
-                    print(f"[BlockStorage.get_block_by_height] ❌ ERROR: Block {height} not found in LMDB.")
-                    return None
+        Returns:
+            int: The highest fully validated height, or -1 if no checkpoint exists.
+        """
+        try:
+            with self.block_metadata_db.begin() as txn:
+                raw = txn.get(b"validated_height")
+            return int(raw.decode("utf-8")) if raw else -1
+        except Exception as e:
+            print(f"[BlockStorage.get_validated_height] ⚠️ WARNING: Failed to read validated-height checkpoint: {e}")
+            return -1
 
-                # ✅ Decode the data as UTF-8 JSON
-                try:
-                    block_dict = json.loads(block_data.decode("utf-8"))
-                except json.JSONDecodeError as e:
-                    print(f"[BlockStorage.get_block_by_height] ❌ ERROR: Failed to decode JSON for Block {height}: {e}")
-                    return None
+    def set_validated_height(self, height: int) -> None:
+        """
+        Persist the full-validation checkpoint in `block_metadata.lmdb`.
+        """
+        try:
+            with self.block_metadata_db.begin(write=True) as txn:
+                txn.put(b"validated_height", str(int(height)).encode("utf-8"))
+        except Exception as e:
+            print(f"[BlockStorage.set_validated_height] ❌ ERROR: Failed to store validated-height checkpoint {height}: {e}")
 
-                # ✅ Fallback for missing or invalid block data
-                if not isinstance(block_dict, dict):
-                    print(f"[BlockStorage.get_block_by_height] ⚠️ WARNING: Block {height} data is invalid. Attempting to repair...")
-                    block_dict = {"header": {}, "transactions": []}  # Fallback to empty block
+    def verify_chain_linkage(self, height: int) -> bool:
+        """
+        Explicit validation mode for chain linkage (replaces the old recursive check).
+        - Walks iteratively from the verified-height watermark up to `height` in one read txn.
+        - Reads only the stored `hash` and `previous_hash` of each block (no Block reconstruction).
+        - Enforces Genesis integrity (previous_hash == ZERO_HASH) at height 0.
+        - Advances the watermark to the last verified height, so repeated checks are O(1).
 
-                # ✅ Deserialize the block from the dictionary
-                block = Block.from_dict(block_dict)
-                if not block:
-                    print(f"[BlockStorage.get_block_by_height] ❌ ERROR: Failed to deserialize Block {height}.")
-                    return None
+        Args:
+            height (int): The height up to which linkage must be verified.
 
-                # ✅ **GENESIS BLOCK SPECIFIC CHECKS**
-                if height == 0:
-                    print("[BlockStorage.get_block_by_height] INFO: Validating Genesis Block integrity...")
+        Returns:
+            bool: True if every block up to `height` links correctly, False otherwise.
+        """
+        try:
+            verified_height = self.get_verified_height()
+            if verified_height >= height:
+                return True
 
-                    # **Ensure Genesis block has correct previous_hash**
-                    if block.previous_hash != Constants.ZERO_HASH:
-                        print(f"[BlockStorage.get_block_by_height] ❌ ERROR: Genesis Block previous_hash mismatch! Expected: {Constants.ZERO_HASH}, Found: {block.previous_hash}")
-                        return None
+            print(f"[BlockStorage.verify_chain_linkage] INFO: Verifying linkage from height {verified_height + 1} to {height}...")
 
-                    # **Ensure Genesis block index is 0**
-                    if block.index != 0:
-                        print(f"[BlockStorage.get_block_by_height] ❌ ERROR: Genesis Block index mismatch! Expected: 0, Found: {block.index}")
-                        return None
+            last_verified = verified_height
+            linkage_ok = True
 
-                    # **Ensure stored mined hash matches the expected hash**
-                    if block.mined_hash != block_dict.get("hash"):
-                        print(f"[BlockStorage.get_block_by_height] ❌ ERROR: Genesis Block hash mismatch! Expected: {block_dict.get('hash')}, Found: {block.mined_hash}")
-                        return None
+            previous_hash = None
+            if verified_height >= 0:
+                raw_prev = self.segments.get_raw_block(verified_height)
+                if not raw_prev:
+                    print(f"[BlockStorage.verify_chain_linkage] ❌ ERROR: Verified block {verified_height} missing from LMDB.")
+                    return False
+                previous_hash = json.loads(raw_prev.decode("utf-8")).get("hash")
 
-                    print("[BlockStorage.get_block_by_height] ✅ SUCCESS: Genesis Block integrity verified.")
+            for current_height, raw_block in self.segments.iter_raw_blocks(verified_height + 1, height):
+                if not raw_block:
+                    print(f"[BlockStorage.verify_chain_linkage] ❌ ERROR: Block {current_height} not found in LMDB.")
+                    linkage_ok = False
+                    break
 
-                # ✅ **Validate the block structure**
-                if not self.validate_block_structure(block):
-                    print(f"[BlockStorage.get_block_by_height] ⚠️ WARNING: Block {height} has an invalid structure. Attempting to repair...")
+                block_dict = json.loads(raw_block.decode("utf-8"))
+                header = block_dict.get("header", block_dict)
+                stored_previous_hash = header.get("previous_hash")
 
-                    # **Check if mined_hash exists before using fallback**
-                    stored_hash = block_dict.get("hash", None)
-                    if stored_hash and isinstance(stored_hash, str):
-                        block.hash = stored_hash  # ✅ Use stored mined hash
-                    else:
-                        print(f"[BlockStorage.get_block_by_height] ❌ ERROR: Block {height} missing valid stored hash! Cannot repair.")
-                        return None
+                if current_height == 0:
+                    if stored_previous_hash != Constants.ZERO_HASH or header.get("index", 0) != 0:
+                        print("[BlockStorage.verify_chain_linkage] ❌ ERROR: Genesis Block integrity check failed!")
+                        linkage_ok = False
+                        break
+                elif stored_previous_hash != previous_hash:
+                    print(f"[BlockStorage.verify_chain_linkage] ❌ ERROR: Block {current_height} previous_hash does not match previous block's mined hash!")
+                    print(f"Expected: {previous_hash}, Found: {stored_previous_hash}")
+                    linkage_ok = False
+                    break
 
-                    if not self.validate_block_structure(block):
-                        print(f"[BlockStorage.get_block_by_height] ❌ ERROR: Block {height} cannot be repaired.")
-                        return None
+                previous_hash = block_dict.get("hash")
+                last_verified = current_height
 
-                # ✅ **Ensure the previous block hash is valid**
-                if height > 0:
-                    prev_block = self.get_block_by_height(height - 1)
-                    if not prev_block:
-                        print(f"[BlockStorage.get_block_by_height] ❌ ERROR: Previous Block {height - 1} not found! Cannot validate chain consistency.")
-                        return None
+            if last_verified > verified_height:
+                self._set_verified_height(last_verified)
+
+            if linkage_ok:
+                print(f"[BlockStorage.verify_chain_linkage] ✅ SUCCESS: Chain linkage verified up to height {height}.")
+            return linkage_ok
+
+        except Exception as e:
+            print(f"[BlockStorage.verify_chain_linkage] ❌ ERROR: Linkage verification failed at height {height}: {e}")
+            return False
 
-                    if prev_block.mined_hash != block.previous_hash:
-                        print(f"[BlockStorage.get_block_by_height] ❌ ERROR: Block {height} previous_hash does not match previous block's mined hash!")
-                        print(f"Expected: {prev_block.mined_hash}, Found: {block.previous_hash}")
-                        return None
 
-                print(f"[BlockStorage.get_block_by_height] ✅ SUCCESS: Retrieved Block {height}.")
-                return block
+
+
+
+
+
+
+    def _load_header_window(self) -> None:
+        """
+        Rebuild the rolling header window from the last `DIFFICULTY_ADJUSTMENT_INTERVAL + 1`
+        stored blocks. Reads only the chain tail, never the full chain.
+        """
+        try:
+            self._header_window.clear()
+
+            latest_height = self.get_latest_height()
+            if latest_height < 0:
+                print("[BlockStorage._load_header_window] INFO: No blocks stored yet. Header window empty.")
+                return
+
+            start_height = max(0, latest_height - self._header_window.maxlen + 1)
+
+            # The window may straddle a segment boundary; iter_raw_blocks routes each height
+            for height, raw_block in self.segments.iter_raw_blocks(start_height, latest_height):
+                if not raw_block:
+                    print(f"[BlockStorage._load_header_window] ⚠️ WARNING: Block {height} missing while loading header window.")
+                    self._header_window.clear()
+                    continue
+
+                block_dict = json.loads(bytes(raw_block).decode("utf-8"))
+                self._header_window.append(block_dict.get("header", block_dict))
+
+            print(f"[BlockStorage._load_header_window] ✅ Loaded {len(self._header_window)} headers (tip: {latest_height}).")
 
         except Exception as e:
-            print(f"[BlockStorage.get_block_by_height] ❌ ERROR: Failed to retrieve Block {height}: {e}")
+            print(f"[BlockStorage._load_header_window] ❌ ERROR: Failed to load header window: {e}")
+            self._header_window.clear()
+
+    def _append_header_to_window(self, header: Dict) -> None:
+        """
+        Push a newly stored block header onto the rolling window.
+        Falls back to reloading from storage if the header does not extend the current tip.
+        """
+        if self._header_window and int(self._header_window[-1].get("index", -1)) != int(header.get("index", -1)) - 1:
+            print(f"[BlockStorage._append_header_to_window] ⚠️ WARNING: Header {header.get('index')} does not extend window tip. Reloading.")
+            self._load_header_window()
+            return
+
+        self._header_window.append(dict(header))
+
+    def get_recent_headers(self, count: Optional[int] = None) -> List[Dict]:
+        """
+        Return the most recent block headers (oldest first) from the in-memory window.
+
+        Args:
+            count (int, optional): Number of headers to return. Defaults to the whole window
+                                   (`DIFFICULTY_ADJUSTMENT_INTERVAL + 1`).
+        """
+        headers = list(self._header_window)
+        if count is not None:
+            headers = headers[-count:] if count > 0 else []
+        return headers
+
+    @property
+    def full_block_store(self) -> LMDBManager:
+        """
+        The writable head segment of `full_block_chain/` (follows rollovers).
+        """
+        return self.segments.head
+
+    @property
+    def block_index_db(self):
+        """
+        The `block_index` sub-database inside the head segment's LMDB environment
+        (same env as block bodies → atomic writes). Sealed segments keep their own
+        `block_index` (see BlockSegmentStore.lookup).
+
+        Keys:
+          - hash:{block_hash} → b"{height}"
+          - tx:{tx_id}        → b"{height}:{position}"
+          - indexed_height    → highest block height covered by the index
+        """
+        return self.segments.head_index_db
+
+    def _index_block_in_txn(self, txn, height: int, block_hash: str, transactions: List) -> None:
+        """
+        Write the hash→height and tx_id→(height, position) entries for a block
+        inside an already-open write transaction (so they commit with the block body).
+        """
+        height_bytes = str(height).encode("utf-8")
+        txn.put(f"hash:{block_hash}".encode("utf-8"), height_bytes, db=self.block_index_db)
+
+        for position, tx in enumerate(transactions):
+            tx_id = self._validate_and_extract_tx_id(tx)
+            if not tx_id:
+                continue
+            txn.put(f"tx:{tx_id}".encode("utf-8"), f"{height}:{position}".encode("utf-8"), db=self.block_index_db)
+
+        indexed_height = txn.get(b"indexed_height", db=self.block_index_db)
+        if indexed_height is None or int(indexed_height.decode("utf-8")) < height:
+            txn.put(b"indexed_height", height_bytes, db=self.block_index_db)
+
+    def get_block_height_by_hash(self, block_hash: str) -> Optional[int]:
+        """
+        Resolve a block hash to its height with one index lookup per segment (head first).
+        Falls back to the legacy `block_hash:` pointer written next to each block body.
+        """
+        try:
+            raw_height = self.segments.lookup(f"hash:{block_hash}".encode("utf-8"))
+            if raw_height:
+                return int(raw_height.decode("utf-8"))
+
+            legacy_pointer = self.segments.lookup(f"block_hash:{block_hash}".encode("utf-8"), in_block_index=False)
+            if legacy_pointer:
+                return int(legacy_pointer.decode("utf-8").split(":")[1])
+
             return None
 
+        except Exception as e:
+            print(f"[BlockStorage.get_block_height_by_hash] ❌ ERROR: Index lookup failed for hash {block_hash}: {e}")
+            return None
+
+    def get_transaction_location(self, tx_id: str) -> Optional[Tuple[int, int]]:
+        """
+        Resolve a transaction ID to (block height, position in block) with one index lookup per segment (head first).
+        """
+        try:
+            raw_location = self.segments.lookup(f"tx:{tx_id}".encode("utf-8"))
+
+            if not raw_location:
+                return None
 
+            height, position = raw_location.decode("utf-8").split(":")
+            return int(height), int(position)
 
+        except Exception as e:
+            print(f"[BlockStorage.get_transaction_location] ❌ ERROR: Index lookup failed for TX {tx_id}: {e}")
+            return None
 
+    def rebuild_block_index(self) -> int:
+        """
+        Rebuild the hash→height and tx_id→(height, position) index from stored block bodies.
+        Intended for offline use (e.g. after upgrading an existing node); see `main/reindex.py`.
+        Covers the writable head segment; sealed segments are immutable and were indexed
+        while they were the head.
 
+        Returns:
+            int: Number of blocks indexed.
+        """
+        try:
+            print("[BlockStorage.rebuild_block_index] INFO: Rebuilding block hash / transaction index...")
+            indexed = 0
 
+            with self.write_lock, self.full_block_store.begin(write=True) as txn:
+                txn.drop(self.block_index_db, delete=False)
 
+                cursor = txn.cursor()
+                if cursor.set_range(b"block:"):
+                    for key, value in cursor:
+                        if not key.startswith(b"block:"):
+                            break
+                        try:
+                            block_dict = json.loads(bytes(value).decode("utf-8"))
+                            header = block_dict.get("header", block_dict)
+                            height = int(header.get("index", key.decode("utf-8").split(":")[1]))
+                            block_hash = block_dict.get("hash")
+                            if not block_hash:
+                                print(f"[BlockStorage.rebuild_block_index] ⚠️ WARNING: Block {height} has no stored hash. Skipping.")
+                                continue
 
-    def get_block_by_hash(self, block_hash: str) -> Optional[dict]:
+                            self._index_block_in_txn(txn, height, block_hash, block_dict.get("transactions", []))
+                            indexed += 1
+                        except Exception as block_error:
+                            print(f"[BlockStorage.rebuild_block_index] ⚠️ WARNING: Failed to index {key[:32]}: {block_error}")
+
+            print(f"[BlockStorage.rebuild_block_index] ✅ SUCCESS: Indexed {indexed} blocks.")
+            return indexed
+
+        except Exception as e:
+            print(f"[BlockStorage.rebuild_block_index] ❌ ERROR: Failed to rebuild block index: {e}")
+            return 0
+
+    def _ensure_block_tx_index(self) -> None:
+        """
+        Build the block → tx index once for transaction indexes created before it existed.
+        """
+        if self.tx_storage.block_tx_index_built():
+            return
+
+        print("[BlockStorage._ensure_block_tx_index] ⚠️ WARNING: Block → transaction index missing. Building from stored blocks...")
+        self.rebuild_block_tx_index()
+
+    def rebuild_block_tx_index(self) -> int:
+        """
+        Rebuild the block → tx index in `txindex.lmdb` from every stored block body.
+
+        Returns:
+            int: Number of blocks indexed.
+        """
+        with self.write_lock:
+            return self.tx_storage.rebuild_block_tx_index(self.iter_blocks())
+
+    def get_block_by_hash(self, block_hash: str) -> Optional[Block]:
         """
-        Retrieve a full block dictionary using its hash.
-        Falls back to full block storage if metadata is missing.
+        Retrieve a full block using its hash.
+        Uses the hash→height secondary index, so the lookup is a single B-tree get
+        followed by one block read regardless of chain length.
 
         Args:
             block_hash (str): The hash of the block (hexadecimal).
 
         Returns:
-            Optional[dict]: The block dictionary if found, or None.
+            Optional[Block]: The block if found, or None.
         """
         try:
             print(f"[BlockStorage.get_block_by_hash] 🔍 Looking up block hash: {block_hash}")
 
-            # Try metadata first
-            key = f"block_hash:{block_hash}".encode()
-            metadata_bytes = self.block_metadata_db.get(key)
+            height = self.get_block_height_by_hash(block_hash)
+            if height is None:
+                print(f"[BlockStorage.get_block_by_hash] ❌ Block hash {block_hash} not found in block index.")
+                return None
 
-            if metadata_bytes:
-                try:
-                    metadata = json.loads(metadata_bytes.decode())
-                    height = metadata.get("height")
-                    if height is None:
-                        print(f"[BlockStorage.get_block_by_hash] ❌ ERROR: Metadata missing block height for hash {block_hash}.")
-                        return None
-                    block_data = self.get_block_by_height(height)
-                    if block_data:
-                        print(f"[BlockStorage.get_block_by_hash] ✅ SUCCESS: Block {height} loaded via metadata.")
-                        return block_data
-                    else:
-                        print(f"[BlockStorage.get_block_by_hash] ❌ ERROR: Block at height {height} not found in full storage.")
-                except Exception as decode_error:
-                    print(f"[BlockStorage.get_block_by_hash] ❌ ERROR: Failed to decode metadata: {decode_error}")
-
-            # Fallback: Scan all full blocks
-            print(f"[BlockStorage.get_block_by_hash] ⚠️ Metadata missing or invalid. Scanning full block store for {block_hash}...")
-            all_blocks = self.get_all_blocks()
-            for block in all_blocks:
-                block_hash_check = block.get("hash") if isinstance(block, dict) else getattr(block, "hash", None)
-                if block_hash_check == block_hash:
-                    print(f"[BlockStorage.get_block_by_hash] 🔁 Fallback match: Found block in full storage.")
-                    return block
+            block = self.get_block_by_height(height)
+            if block:
+                print(f"[BlockStorage.get_block_by_hash] ✅ SUCCESS: Block {height} loaded via hash index.")
+                return block
 
-            print(f"[BlockStorage.get_block_by_hash] ❌ Block not found in full storage for hash {block_hash}")
+            print(f"[BlockStorage.get_block_by_hash] ❌ ERROR: Block at height {height} not found in full storage.")
             return None
 
         except Exception as e:
@@ -436,8 +615,9 @@ class BlockStorage:
 
     def store_block(self, block: Block) -> bool:
         """
-        Store a block in the blockchain with robust fallback logic, transaction serialization,
-        and total supply cache invalidation. Ensures UTXO updates are synchronized with block storage.
+        Store a block in the blockchain with robust fallback logic and transaction serialization.
+        The block body, hash/tx index, transaction records, UTXO changes and metadata are staged and
+        committed as one `BlockCommitBatch` (one durable write per LMDB environment).
         Handles both hex and bytes transaction IDs for backward compatibility.
         """
         try:
@@ -453,14 +633,17 @@ class BlockStorage:
                 print(f"[BlockStorage.store_block] ⚠️ WARNING: Hash mismatch for Block {block.index}")
                 block.hash = block.mined_hash
 
+            linkage_verified = False
             if block.index == 0:
                 block.previous_hash = Constants.ZERO_HASH
+                linkage_verified = True
             else:
                 prev_block = self.get_block_by_height(block.index - 1)
                 if prev_block and prev_block.mined_hash != block.previous_hash:
                     print(f"[BlockStorage.store_block] ❌ ERROR: Block {block.index} previous_hash mismatch")
                     print(f"Expected: {prev_block.mined_hash}, Found: {block.previous_hash}")
                     return False
+                linkage_verified = prev_block is not None
 
             # ===== Block Data Preparation =====
             try:
@@ -489,84 +672,102 @@ class BlockStorage:
             block_hash_key = f"block_hash:{block.mined_hash}".encode("utf-8")
 
             # Check for existing block
-            with self.full_block_store.env.begin() as txn:
-                if txn.get(block_key):
-                    print(f"[BlockStorage.store_block] ⚠️ Block {block.index} already exists")
-                    return True  # Consider existing block as success
+            if self.segments.get_raw_block(block.index):
+                print(f"[BlockStorage.store_block] ⚠️ Block {block.index} already exists")
+                return True  # Consider existing block as success
+
+            block_json = json.dumps(block_data, separators=(',', ':'), ensure_ascii=False)
+            block_bytes = block_json.encode("utf-8")
+
+            # ===== Stage & Commit =====
+            # Every write for the block is staged first, then committed once per environment
+            # in a fixed order (tx index → UTXO → UTXO history → block body → metadata)
+            # behind a recovery marker, so a crash can always be replayed to a consistent state.
+            with self.write_lock:
+                if not self.recover_pending_commit():
+                    print(f"[BlockStorage.store_block] ❌ ERROR: Unfinished commit could not be replayed. Refusing to store Block {block.index}.")
+                    return False
 
-            # Store serialized block
-            try:
-                block_json = json.dumps(block_data, separators=(',', ':'), ensure_ascii=False)
-                block_bytes = block_json.encode("utf-8")
-                
-                with self.full_block_store.env.begin(write=True) as txn:
-                    txn.put(block_key, block_bytes)
-                    txn.put(block_hash_key, block_key)
-                    txn.put(b"latest_block_index", str(block.index).encode("utf-8"))
-            except Exception as e:
-                print(f"[BlockStorage.store_block] ❌ ERROR: Failed to store block: {e}")
-                return False
+                # Seal the head segment first if it is full, so the block lands in the new head
+                self._check_and_rollover_lmdb()
 
-            # ===== Transaction Indexing =====
-            for tx in block.transactions:
-                try:
-                    # Convert transaction to proper object if it's a dict
-                    if isinstance(tx, dict):
-                        from Zyiron_Chain.transactions.coinbase import CoinbaseTx
-                        from Zyiron_Chain.transactions.tx import Transaction
-                        tx = CoinbaseTx.from_dict(tx) if tx.get("type") == "COINBASE" else Transaction.from_dict(tx)
-
-                    tx_dict = tx.to_dict()
-                    
-                    # Ensure tx_id is in hex format
-                    tx_id = tx_dict.get("tx_id")
-                    if isinstance(tx_id, bytes):
-                        tx_dict["tx_id"] = tx_id.hex()
-
-                    self.tx_storage.store_transaction(
-                        tx_id=tx_dict["tx_id"],
-                        block_hash=block.mined_hash,
-                        tx_data=tx_dict,
-                        outputs=tx_dict.get("outputs", []),
-                        timestamp=block.timestamp,
-                        tx_signature=getattr(tx, "tx_signature", b""),
-                        falcon_signature=getattr(tx, "falcon_signature", b"")
-                    )
-                    print(f"[BlockStorage.store_block] ✅ Indexed transaction {tx_dict['tx_id']}")
-                except Exception as tx_err:
-                    print(f"[BlockStorage.store_block] ⚠️ TX indexing failed: {tx_err}")
-                    continue
+                utxo_lock = self.utxo_storage._db_lock if self.utxo_storage else Lock()
+                with utxo_lock:
+                    batch = BlockCommitBatch(self.block_metadata_db.env, label=f"Block {block.index}")
+                    try:
+                        # ===== Transaction Indexing =====
+                        tx_txn = batch.stage("txindex", self.tx_storage.txindex_db.env)
+                        staged_txs = []
+                        staged_positions = []
+                        for position, tx in enumerate(block.transactions):
+                            try:
+                                # Convert transaction to proper object if it's a dict
+                                if isinstance(tx, dict):
+                                    from Zyiron_Chain.transactions.coinbase import CoinbaseTx
+                                    from Zyiron_Chain.transactions.tx import Transaction
+                                    tx = CoinbaseTx.from_dict(tx) if tx.get("type") == "COINBASE" else Transaction.from_dict(tx)
+
+                                tx_dict = tx.to_dict()
+
+                                # Ensure tx_id is in hex format
+                                tx_id = tx_dict.get("tx_id")
+                                if isinstance(tx_id, bytes):
+                                    tx_dict["tx_id"] = tx_id.hex()
+
+                                staged_txs.append((tx_dict, getattr(tx, "falcon_signature", b"")))
+                                staged_positions.append(position)
+                            except Exception as tx_err:
+                                print(f"[BlockStorage.store_block] ⚠️ TX indexing failed: {tx_err}")
+                                continue
 
-            # ===== UTXO Updates =====
-            if self.utxo_storage:
-                try:
-                    # Ensure all tx_ids in block are hex strings for UTXO storage
-                    for tx in block.transactions:
-                        if hasattr(tx, 'tx_id') and isinstance(tx.tx_id, bytes):
-                            tx.tx_id = tx.tx_id.hex()
-                    
-                    if not self.utxo_storage.update_utxos(block):
-                        print(f"[BlockStorage.store_block] ❌ ERROR: Failed to update UTXOs")
+                        # Records and signatures go into the txindex stage as one batch
+                        self.tx_storage.stage_transactions(
+                            tx_txn, block.mined_hash, block.timestamp, staged_txs, block.index,
+                            positions=staged_positions
+                        )
+
+                        # ===== UTXO Updates =====
+                        if self.utxo_storage:
+                            # Ensure all tx_ids in block are hex strings for UTXO storage
+                            for tx in block.transactions:
+                                if hasattr(tx, 'tx_id') and isinstance(tx.tx_id, bytes):
+                                    tx.tx_id = tx.tx_id.hex()
+
+                            utxo_txn = batch.stage("utxo", self.utxo_storage.utxo_db.env,
+                                                   {"utxo_by_address": self.utxo_storage.address_index_db})
+                            history_txn = batch.stage("utxo_history", self.utxo_storage.utxo_history_db.env)
+                            self.utxo_storage.apply_block_in_txn(block, utxo_txn, history_txn)
+                        else:
+                            print(f"[BlockStorage.store_block] ⚠️ WARNING: UTXOStorage not attached")
+
+                        # ===== Block Body & Index =====
+                        block_txn = batch.stage("blocks", self.full_block_store.env, {"block_index": self.block_index_db})
+                        block_txn.put(block_key, block_bytes)
+                        block_txn.put(block_hash_key, block_key)
+                        block_txn.put(b"latest_block_index", str(block.index).encode("utf-8"))
+                        self._index_block_in_txn(block_txn, block.index, block.mined_hash, block_data.get("transactions", []))
+
+                        # ===== Metadata & Verified-Height Watermark =====
+                        # Linkage to the parent was checked above, so extend the watermark if it was contiguous.
+                        meta_txn = batch.stage("block_metadata", self.block_metadata_db.env)
+                        if not self._write_block_metadata_in_txn(meta_txn, block):
+                            print(f"[BlockStorage.store_block] ⚠️ WARNING: Failed to stage metadata")
+                        if linkage_verified and self.get_verified_height() == block.index - 1:
+                            meta_txn.put(b"verified_height", str(block.index).encode("utf-8"))
+
+                    except Exception as e:
+                        batch.close()
+                        print(f"[BlockStorage.store_block] ❌ ERROR: Failed to stage Block {block.index}: {e}")
                         return False
-                except Exception as e:
-                    print(f"[BlockStorage.store_block] ❌ ERROR: UTXO update exception: {e}")
-                    return False
-            else:
-                print(f"[BlockStorage.store_block] ⚠️ WARNING: UTXOStorage not attached")
 
-            # ===== Metadata Handling =====
-            if not self.store_block_metadata(block):
-                print(f"[BlockStorage.store_block] ⚠️ WARNING: Failed to store metadata")
-                try:
-                    fallback_block = self.get_block_by_height(block.index)
-                    if fallback_block and self.store_block_metadata(fallback_block):
-                        print(f"[BlockStorage.store_block] ✅ Fallback metadata restored")
-                except Exception as rebuild_e:
-                    print(f"[BlockStorage.store_block] ❌ Fallback metadata failed: {rebuild_e}")
+                    if not batch.commit():
+                        return False
+
+            self._append_header_to_window(block_data["header"])
 
-            # ===== Cache Invalidation =====
-            with self.block_metadata_db.env.begin(write=True) as txn:
-                txn.delete(b"total_mined_supply")
+            # ===== Signature Cache =====
+            # Confirmed transactions will not be verified again; free their cache entries.
+            SignatureCache.shared().evict_transactions(block.transactions)
 
             print(f"[BlockStorage.store_block] ✅ SUCCESS: Block {block.index} stored")
             return True
@@ -575,6 +776,34 @@ class BlockStorage:
             print(f"[BlockStorage.store_block] ❌ ERROR: Block store exception: {e}")
             return False
 
+    def recover_pending_commit(self) -> bool:
+        """
+        Replay a block commit that was interrupted after its recovery marker was written.
+        Returns True if nothing was pending or the replay completed.
+        """
+        try:
+            if not BlockCommitBatch.has_pending(self.block_metadata_db.env):
+                return True
+
+            environments = {
+                "txindex": (self.tx_storage.txindex_db.env, {}),
+                "blocks": (self.full_block_store.env, {"block_index": self.block_index_db}),
+                "block_metadata": (self.block_metadata_db.env, {}),
+            }
+            if self.utxo_storage:
+                environments["utxo"] = (self.utxo_storage.utxo_db.env, {"utxo_by_address": self.utxo_storage.address_index_db})
+                environments["utxo_history"] = (self.utxo_storage.utxo_history_db.env, {})
+
+            if not BlockCommitBatch.recover(self.block_metadata_db.env, environments):
+                return False
+
+            self._load_header_window()
+            return True
+
+        except Exception as e:
+            print(f"[BlockStorage.recover_pending_commit] ❌ ERROR: Recovery failed: {e}")
+            return False
+
     def initialize_txindex(self):
         """
         Ensures the `txindex_db` is properly initialized.
@@ -590,7 +819,7 @@ class BlockStorage:
             # ✅ **Prevent Redundant Initialization**
             print("[BlockStorage.initialize_txindex] INFO: Using shared `txindex_db` instance.")
 
-            with self.txindex_db.env.begin(write=True) as txn:
+            with self.txindex_db.begin(write=True) as txn:
                 txn.put(b"txindex_initialized", b"true")
 
             print("[BlockStorage.initialize_txindex] SUCCESS: Transaction index database verified.")
@@ -656,7 +885,7 @@ class BlockStorage:
                 raise ValueError("Invalid TX_ID format")
 
             # ✅ Store Transaction in `txindex.lmdb`
-            with self.txindex_db.env.begin(write=True) as txn:
+            with self.txindex_db.begin(write=True) as txn:
                 txn.put(f"tx:{tx_id}".encode(), json.dumps({
                     "block_hash": block_hash,
                     "inputs": tx_data.get("inputs", []),
@@ -741,28 +970,35 @@ class BlockStorage:
 
 
 
-    def get_block_by_height(self, height: int, include_headers: bool = False) -> Optional[Union[Block, Tuple[Block, List[Dict]]]]:
+    def get_block_by_height(self, height: int, include_headers: bool = False, validate_linkage: bool = False) -> Optional[Union[Block, Tuple[Block, List[Dict]]]]:
         """
         Retrieve a block by height, prioritizing metadata and falling back to full block store if needed.
+        A normal read decodes only the requested block; chain linkage is checked only when
+        `validate_linkage` is set (see `verify_chain_linkage`).
 
         Args:
             height (int): The height of the block to retrieve.
             include_headers (bool): If True, returns all block headers along with the block.
+            validate_linkage (bool): If True, verifies previous_hash linkage up to `height` first.
 
         Returns:
             - Block object or (Block, Headers) if found.
-            - None if not found in either store.
+            - None if not found in either store (or if linkage validation fails).
         """
         try:
             print(f"[BlockStorage.get_block_by_height] 🔍 INFO: Attempting to retrieve block at height {height}...")
 
+            if validate_linkage and not self.verify_chain_linkage(height):
+                print(f"[BlockStorage.get_block_by_height] ❌ ERROR: Chain linkage validation failed for Block {height}.")
+                return None
+
             block = None
             found_source = None
 
             # Step 1: Try metadata LMDB first
             if self.block_metadata_db:
                 try:
-                    with self.block_metadata_db.env.begin() as txn:
+                    with self.block_metadata_db.begin() as txn:
                         meta_key = f"block_meta:{height}".encode("utf-8")
                         metadata_bytes = txn.get(meta_key)
 
@@ -780,9 +1016,7 @@ class BlockStorage:
             # Step 2: Fallback to full block store
             if not block and self.full_block_store:
                 try:
-                    with self.full_block_store.env.begin() as txn:
-                        block_key = f"block:{height}".encode("utf-8")
-                        block_bytes = txn.get(block_key)
+                    block_bytes = self.segments.get_raw_block(height)
 
                     if block_bytes:
                         try:
@@ -828,7 +1062,7 @@ class BlockStorage:
 
             # ✅ Attempt from `block_metadata_db` first
             if self.block_metadata_db:
-                with self.block_metadata_db.env.begin() as txn:
+                with self.block_metadata_db.begin() as txn:
                     cursor = txn.cursor()
                     for key, value in cursor:
                         if key.startswith(b"block_meta:"):
@@ -849,19 +1083,17 @@ class BlockStorage:
 
                 # 🔁 Fallback to full block store
                 if self.full_block_store:
-                    with self.full_block_store.env.begin() as txn:
-                        cursor = txn.cursor()
-                        for key, value in cursor:
-                            if key.startswith(b"block:"):
-                                try:
-                                    full_block = json.loads(value.decode("utf-8"))
-                                    required_keys = {"index", "previous_hash", "timestamp", "nonce", "difficulty", "hash"}
-                                    if required_keys.issubset(full_block.keys()):
-                                        headers.append({k: full_block[k] for k in required_keys})
-                                    else:
-                                        print(f"[BlockStorage._get_all_block_headers] WARNING: Incomplete header in full block {full_block.get('hash', 'unknown')}")
-                                except Exception as e:
-                                    print(f"[BlockStorage._get_all_block_headers] ERROR: Failed to parse full block header: {e}")
+                    for _, value in self.segments.iter_raw_blocks(0, self.get_latest_height()):
+                        if value:
+                            try:
+                                full_block = json.loads(value.decode("utf-8"))
+                                required_keys = {"index", "previous_hash", "timestamp", "nonce", "difficulty", "hash"}
+                                if required_keys.issubset(full_block.keys()):
+                                    headers.append({k: full_block[k] for k in required_keys})
+                                else:
+                                    print(f"[BlockStorage._get_all_block_headers] WARNING: Incomplete header in full block {full_block.get('hash', 'unknown')}")
+                            except Exception as e:
+                                print(f"[BlockStorage._get_all_block_headers] ERROR: Failed to parse full block header: {e}")
                     if headers:
                         print(f"[BlockStorage._get_all_block_headers] ✅ FALLBACK: Retrieved {len(headers)} headers from full block store.")
                     else:
@@ -918,8 +1150,7 @@ class BlockStorage:
                 return False
 
             # ✅ Check that the block exists in LMDB
-            with self.full_block_store.env.begin() as txn:
-                stored_block_raw = txn.get(f"block:{block.index}".encode())
+            stored_block_raw = self.segments.get_raw_block(block.index)
 
             if not stored_block_raw:
                 print(f"[BlockStorage.validate_block_structure] ❌ ERROR: Block {block_index} not found in LMDB.")
@@ -927,24 +1158,23 @@ class BlockStorage:
 
             # ✅ Verify previous hash via LMDB
             if block.index > 0:
-                with self.full_block_store.env.begin() as txn:
-                    prev_raw = txn.get(f"block:{block.index - 1}".encode())
-                    if not prev_raw:
-                        print(f"[BlockStorage.validate_block_structure] ❌ ERROR: Previous block {block.index - 1} not found in LMDB.")
-                        return False
+                prev_raw = self.segments.get_raw_block(block.index - 1)
+                if not prev_raw:
+                    print(f"[BlockStorage.validate_block_structure] ❌ ERROR: Previous block {block.index - 1} not found in LMDB.")
+                    return False
 
-                    try:
-                        from Zyiron_Chain.blockchain.block import Block as BlockClass
-                        previous_block = BlockClass.deserialize(prev_raw)
-                        prev_hash = getattr(previous_block, "hash", None)
-                    except Exception as e:
-                        print(f"[BlockStorage.validate_block_structure] ❌ ERROR: Failed to deserialize previous block: {e}")
-                        return False
+                try:
+                    from Zyiron_Chain.blockchain.block import Block as BlockClass
+                    previous_block = BlockClass.deserialize(prev_raw)
+                    prev_hash = getattr(previous_block, "hash", None)
+                except Exception as e:
+                    print(f"[BlockStorage.validate_block_structure] ❌ ERROR: Failed to deserialize previous block: {e}")
+                    return False
 
-                    if block.previous_hash != prev_hash:
-                        print(f"[BlockStorage.validate_block_structure] ❌ ERROR: Invalid previous hash at Block {block.index}.\n"
-                              f"Expected: {prev_hash}\nFound:    {block.previous_hash}")
-                        return False
+                if block.previous_hash != prev_hash:
+                    print(f"[BlockStorage.validate_block_structure] ❌ ERROR: Invalid previous hash at Block {block.index}.\n"
+                          f"Expected: {prev_hash}\nFound:    {block.previous_hash}")
+                    return False
 
             # ✅ Transaction structure validation
             txs = getattr(block, "transactions", [])
@@ -985,63 +1215,87 @@ class BlockStorage:
             return False
 
 
-    def load_chain(self) -> List[Dict]:
+    def get_latest_height(self) -> int:
         """
-        Load all blocks from `full_block_chain.lmdb` and return as a list of dictionaries.
-
-        - Fetches full blocks instead of just metadata.
-        - Ensures blocks are retrieved in correct order.
-        - Uses `latest_block_index` for efficient retrieval.
+        Return the height of the latest stored block, or -1 if the chain is empty.
         """
         try:
-            print("[BlockStorage.load_chain] INFO: Loading full blockchain from LMDB...")
-
-            # ✅ **Ensure LMDB Storage Is Used**
-            if not self.full_block_store:
-                print("[BlockStorage.load_chain] ❌ ERROR: `full_block_store` is not set. Cannot load blockchain data.")
-                return []
-
-            chain_data = []
+            with self.full_block_store.begin() as txn:
+                latest_index = txn.get(b"latest_block_index")
+            return int(latest_index.decode("utf-8")) if latest_index else -1
+        except Exception as e:
+            print(f"[BlockStorage.get_latest_height] ❌ ERROR: Failed to read latest block index: {e}")
+            return -1
 
-            # ✅ **Retrieve Latest Block Index for Faster Retrieval**
-            with self.full_block_store.env.begin() as txn:
-                latest_block_index_bytes = txn.get(b"latest_block_index")
+    def iter_blocks(self, start: int = 0, end: Optional[int] = None, headers_only: bool = False) -> Iterator[Dict]:
+        """
+        Stream stored blocks in height order, one LMDB read transaction per segment.
+        Only one decoded block is held at a time, so memory stays flat as the chain grows.
 
-            if not latest_block_index_bytes:
-                print("[BlockStorage.load_chain] WARNING: No latest block index found. Blockchain may be empty.")
-                return []
+        Args:
+            start (int): First block height to yield.
+            end (int, optional): Last block height to yield (inclusive). Defaults to the chain tip.
+            headers_only (bool): Yield only the header dict (with `hash` attached) instead of the full block.
 
-            latest_block_index = int(latest_block_index_bytes.decode("utf-8"))
+        Yields:
+            Dict: Block dictionaries (repaired like `get_all_blocks`), or header dictionaries.
+        """
+        if not self.full_block_store:
+            print("[BlockStorage.iter_blocks] ❌ ERROR: Full block store not initialized")
+            return
 
-            # ✅ **Retrieve Blocks from LMDB Using Index**
-            with self.full_block_store.env.begin() as txn:
-                for block_index in range(latest_block_index + 1):
-                    block_key = f"block:{block_index}".encode()
-                    block_data_bytes = txn.get(block_key)
+        try:
+            self.full_block_store.env.stat()
+        except Exception as e:
+            print(f"[BlockStorage.iter_blocks] ⚠️ LMDB environment closed. Reopening... ({e})")
+            self.full_block_store.reopen()
+
+        stop_at_gap = False
+        if end is None:
+            latest_height = self.get_latest_height()
+            if latest_height >= 0:
+                end = latest_height
+            else:
+                end, stop_at_gap = sys.maxsize, True  # ✅ No tip marker: stop at the first gap
 
-                    if not block_data_bytes:
-                        print(f"[BlockStorage.load_chain] WARNING: Block {block_index} not found in LMDB.")
-                        continue
+        for height, raw_block in self.segments.iter_raw_blocks(start, end):
+            if raw_block is None:
+                if stop_at_gap:
+                    break
+                print(f"[BlockStorage.iter_blocks] ⚠️ WARNING: Block {height} not found in LMDB.")
+                continue
 
-                    try:
-                        block_data = json.loads(block_data_bytes.decode("utf-8"))
-                        if "index" not in block_data:
-                            print(f"[BlockStorage.load_chain] ERROR: Block {block_index} metadata missing 'index'. Skipping.")
-                            continue
-                        chain_data.append(block_data)
-                    except json.JSONDecodeError as e:
-                        print(f"[BlockStorage.load_chain] ERROR: Failed to parse block metadata for block {block_index}: {e}")
-                        continue
+            try:
+                block_data = json.loads(raw_block.decode("utf-8"))
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                print(f"[BlockStorage.iter_blocks] ⚠️ Corrupted JSON for block {height}: {e}")
+                block_data = self._recover_block_from_bytes(raw_block, height)
+
+            block_data = self._validate_and_repair_block(block_data, height) if block_data else None
+            if block_data:
+                block_data.setdefault("index", height)
+                if headers_only:
+                    header = dict(block_data["header"])
+                    header["hash"] = block_data.get("hash")
+                    yield header
+                else:
+                    yield block_data
 
-            # ✅ **Sort Blocks by Height to Ensure Correct Chain Order**
-            sorted_chain = sorted(chain_data, key=lambda b: b["index"])
+    def load_chain(self) -> List[Dict]:
+        """
+        Load all blocks from `full_block_chain.lmdb` and return as a list of dictionaries.
+        Prefer `iter_blocks()` for full-chain scans; this materializes the whole chain.
+        """
+        try:
+            print("[BlockStorage.load_chain] INFO: Loading full blockchain from LMDB...")
+            chain_data = list(self.iter_blocks())
 
-            if not sorted_chain:
+            if not chain_data:
                 print("[BlockStorage.load_chain] WARNING: No blocks found in LMDB. Chain may be empty.")
                 return []
 
-            print(f"[BlockStorage.load_chain] ✅ SUCCESS: Loaded {len(sorted_chain)} blocks from LMDB.")
-            return sorted_chain
+            print(f"[BlockStorage.load_chain] ✅ SUCCESS: Loaded {len(chain_data)} blocks from LMDB.")
+            return chain_data
 
         except Exception as e:
             print(f"[BlockStorage.load_chain] ❌ ERROR: Failed to load blockchain: {e}")
@@ -1051,69 +1305,15 @@ class BlockStorage:
     def get_all_blocks(self) -> List[Dict]:
         """
         Retrieve all stored blocks from `full_block_chain.lmdb` as a list of dictionaries.
-        Includes multiple layers of fallback logic for handling:
-        - Closed LMDB environments
-        - Corrupted/malformed blocks
-        - Missing required fields
-        - Invalid transaction structures
+        Prefer `iter_blocks()` for full-chain scans; this materializes the whole chain.
         """
-        blocks = []
         attempts = 0
         max_attempts = 3
-        
+
         while attempts < max_attempts:
             try:
                 print(f"[BlockStorage.get_all_blocks] Attempt {attempts + 1}/{max_attempts}")
-
-                # Fallback 1: Handle closed LMDB environment
-                if not self.full_block_store:
-                    print("[BlockStorage.get_all_blocks] ❌ ERROR: Full block store not initialized")
-                    break
-
-                try:
-                    self.full_block_store.env.stat()
-                except Exception as e:
-                    print(f"[BlockStorage.get_all_blocks] ⚠️ LMDB environment closed. Reopening... ({e})")
-                    self.full_block_store.reopen()
-                    continue
-
-                # Fallback 2: Handle corrupted LMDB reads
-                with self.full_block_store.env.begin() as txn:
-                    cursor = txn.cursor()
-                    
-                    for key, value in cursor:
-                        if not key.startswith(b"block:"):
-                            continue
-
-                        try:
-                            # Fallback 3: Handle malformed block keys
-                            try:
-                                block_index = int(key.decode().split(":")[1])
-                            except (IndexError, ValueError) as e:
-                                print(f"[BlockStorage.get_all_blocks] ⚠️ Malformed block key {key}: {e}")
-                                continue
-
-                            # Fallback 4: Handle JSON decode errors
-                            try:
-                                block_data = json.loads(value.decode('utf-8'))
-                            except json.JSONDecodeError as e:
-                                print(f"[BlockStorage.get_all_blocks] ⚠️ Corrupted JSON for block {block_index}: {e}")
-                                # Attempt raw recovery of critical fields
-                                block_data = self._recover_block_from_bytes(value, block_index)
-                                if not block_data:
-                                    continue
-
-                            # Fallback 5: Handle missing/invalid fields
-                            block_data = self._validate_and_repair_block(block_data, block_index)
-                            if block_data:
-                                blocks.append(block_data)
-
-                        except Exception as e:
-                            print(f"[BlockStorage.get_all_blocks] ⚠️ Unexpected error processing block: {e}")
-                            continue
-
-                # Success case
-                blocks.sort(key=lambda b: b["index"])
+                blocks = list(self.iter_blocks())
                 print(f"[BlockStorage.get_all_blocks] ✅ Retrieved {len(blocks)} blocks")
                 return blocks
 
@@ -1225,7 +1425,7 @@ class BlockStorage:
                 return None
 
             # ✅ Step 1: Fetch latest block index
-            with self.full_block_store.env.begin() as txn:
+            with self.full_block_store.begin() as txn:
                 latest_block_index_bytes = txn.get(b"latest_block_index")
 
             if not latest_block_index_bytes:
@@ -1240,7 +1440,7 @@ class BlockStorage:
             # ✅ Step 2: Attempt to retrieve metadata from block_metadata.lmdb
             metadata = None
             for attempt in range(retries):
-                with self.block_metadata_db.env.begin() as txn:
+                with self.block_metadata_db.begin() as txn:
                     metadata_bytes = txn.get(blockmeta_key)
 
                 if metadata_bytes:
@@ -1279,15 +1479,13 @@ class BlockStorage:
                 return None
 
             block_pointer_key = f"block_hash:{block_hash}".encode("utf-8")
-            with self.full_block_store.env.begin() as txn:
-                block_ref_key = txn.get(block_pointer_key)
+            block_ref_key = self.segments.lookup(block_pointer_key, in_block_index=False)
 
             if not block_ref_key:
                 print(f"[BlockStorage.get_latest_block] ❌ ERROR: Block hash {block_hash} not found in block_hash index.")
                 return None
 
-            with self.full_block_store.env.begin() as txn:
-                full_block_bytes = txn.get(block_ref_key)
+            full_block_bytes = self.segments.get_raw_block(int(block_ref_key.decode("utf-8").split(":")[1]))
 
             if not full_block_bytes:
                 print(f"[BlockStorage.get_latest_block] ❌ ERROR: Full block data not found at {block_ref_key.decode()}.")
@@ -1312,49 +1510,66 @@ class BlockStorage:
             return None
 
 
-    def store_block_metadata(self, block) -> bool:
+    def _write_block_metadata_in_txn(self, txn, block) -> bool:
         """
-        Store lightweight block metadata in `block_metadata.lmdb`.
-        If this fails, fallback to full block store to reconstruct the block and try again.
+        Write `blockmeta:{height}` and advance the total-supply counter inside an open
+        (or staged) `block_metadata.lmdb` write transaction.
         """
-        try:
-            block_height = getattr(block, "height", None) or getattr(block, "index", None)
-            block_hash = getattr(block, "hash", None) or getattr(block, "mined_hash", None)
+        block_height = getattr(block, "height", None) or getattr(block, "index", None)
+        block_hash = getattr(block, "hash", None) or getattr(block, "mined_hash", None)
 
-            if block_height is None or block_hash is None:
-                print(f"[store_block_metadata] ❌ ERROR: Missing block height or hash.")
-                return False
-            if not isinstance(block_height, int) or block_height < 0:
-                print(f"[store_block_metadata] ❌ ERROR: Invalid block height: {block_height}")
-                return False
-            if not isinstance(block_hash, str) or len(block_hash) != Constants.SHA3_384_HASH_SIZE:
-                print(f"[store_block_metadata] ❌ ERROR: Invalid block hash format: {block_hash}")
-                return False
+        if block_height is None or block_hash is None:
+            print(f"[store_block_metadata] ❌ ERROR: Missing block height or hash.")
+            return False
+        if not isinstance(block_height, int) or block_height < 0:
+            print(f"[store_block_metadata] ❌ ERROR: Invalid block height: {block_height}")
+            return False
+        if not isinstance(block_hash, str) or len(block_hash) != Constants.SHA3_384_HASH_SIZE:
+            print(f"[store_block_metadata] ❌ ERROR: Invalid block hash format: {block_hash}")
+            return False
 
-            difficulty = getattr(block, "difficulty", None)
-            difficulty_hex = DifficultyConverter.to_hex(
-                int(difficulty, 16) if isinstance(difficulty, str) else difficulty or 0
-            )
+        difficulty = getattr(block, "difficulty", None)
+        difficulty_hex = DifficultyConverter.to_hex(
+            int(difficulty, 16) if isinstance(difficulty, str) else difficulty or 0
+        )
+
+        metadata = {
+            "index": block_height,
+            "hash": block_hash,
+            "timestamp": getattr(block, "timestamp", int(time.time())),
+            "difficulty": difficulty_hex,
+            "previous_hash": getattr(block, "previous_hash", Constants.ZERO_HASH),
+            "merkle_root": getattr(block, "merkle_root", Constants.ZERO_HASH),
+            "miner_address": getattr(block, "miner_address", "UNKNOWN"),
+            "transaction_count": len(getattr(block, "transactions", [])),
+            "total_fees": str(getattr(block, "fees", Decimal("0")))
+        }
 
-            metadata = {
-                "index": block_height,
-                "hash": block_hash,
-                "timestamp": getattr(block, "timestamp", int(time.time())),
-                "difficulty": difficulty_hex,
-                "previous_hash": getattr(block, "previous_hash", Constants.ZERO_HASH),
-                "merkle_root": getattr(block, "merkle_root", Constants.ZERO_HASH),
-                "miner_address": getattr(block, "miner_address", "UNKNOWN"),
-                "transaction_count": len(getattr(block, "transactions", [])),
-                "total_fees": str(getattr(block, "fees", Decimal("0")))
-            }
+        key = f"blockmeta:{block_height}".encode("utf-8")
 
-            key = f"blockmeta:{block_height}".encode("utf-8")
-            value = json.dumps(metadata, sort_keys=True).encode("utf-8")
+        # ✅ Cumulative supply = parent's counter + this block's coinbase outputs
+        parent_supply = self._get_cumulative_supply_in_txn(txn, block_height - 1)
+        if parent_supply is None:
+            parent_supply = self._scan_mined_supply(end=block_height - 1)
+        cumulative_supply = parent_supply + self._get_coinbase_amount(getattr(block, "transactions", []))
+        metadata["cumulative_supply"] = str(cumulative_supply)
 
-            with self.block_metadata_db.env.begin(write=True) as txn:
-                txn.put(key, value)
+        txn.put(key, json.dumps(metadata, sort_keys=True).encode("utf-8"))
+        if not txn.get(f"blockmeta:{block_height + 1}".encode("utf-8")):
+            txn.put(b"total_mined_supply", str(cumulative_supply).encode("utf-8"))
+        return True
 
-            print(f"[store_block_metadata] ✅ SUCCESS: Stored metadata for Block #{block_height}")
+    def store_block_metadata(self, block) -> bool:
+        """
+        Store lightweight block metadata in `block_metadata.lmdb`.
+        If this fails, fallback to full block store to reconstruct the block and try again.
+        """
+        try:
+            with self.block_metadata_db.begin(write=True) as txn:
+                if not self._write_block_metadata_in_txn(txn, block):
+                    return False
+
+            print(f"[store_block_metadata] ✅ SUCCESS: Stored metadata for Block #{getattr(block, 'index', None)}")
             return True
 
         except Exception as e:
@@ -1373,83 +1588,132 @@ class BlockStorage:
 
 
 
+    @staticmethod
+    def _get_coinbase_amount(transactions: List) -> Decimal:
+        """
+        Sum the output amounts of the Coinbase transactions in a block.
+        Accepts transaction dictionaries or objects.
+        """
+        minted = Decimal("0")
+        for tx in transactions or []:
+            tx_type = tx.get("type") if isinstance(tx, dict) else getattr(tx, "type", None)
+            if tx_type != "COINBASE":
+                continue
+
+            outputs = tx.get("outputs", []) if isinstance(tx, dict) else getattr(tx, "outputs", [])
+            for output in outputs or []:
+                amount = output.get("amount") if isinstance(output, dict) else getattr(output, "amount", None)
+                if amount is None:
+                    continue
+                try:
+                    minted += Decimal(str(amount))
+                except (ValueError, TypeError, ArithmeticError) as e:
+                    print(f"[BlockStorage._get_coinbase_amount] ERROR: Invalid reward amount {amount}: {e}")
+        return minted
+
+    def _get_cumulative_supply_in_txn(self, txn, height: int) -> Optional[Decimal]:
+        """
+        Read the cumulative supply counter stored with `blockmeta:{height}`.
+        Returns Decimal(0) below genesis and None if the counter is missing (legacy metadata).
+        """
+        if height < 0:
+            return Decimal("0")
+
+        raw_meta = txn.get(f"blockmeta:{height}".encode("utf-8"))
+        if not raw_meta:
+            return None
+
+        cumulative = json.loads(raw_meta.decode("utf-8")).get("cumulative_supply")
+        return Decimal(cumulative) if cumulative is not None else None
+
+    def _scan_mined_supply(self, end: Optional[int] = None) -> Decimal:
+        """
+        Sum Coinbase outputs by streaming blocks up to `end` (inclusive).
+        Only used to seed the counter for metadata written before it existed.
+        """
+        if end is not None and end < 0:
+            return Decimal("0")
+
+        print(f"[BlockStorage._scan_mined_supply] ⚠️ WARNING: Supply counter missing. Scanning blocks up to {end if end is not None else 'tip'}...")
+        total_supply = Decimal("0")
+        for block_data in self.iter_blocks(end=end):
+            total_supply += self._get_coinbase_amount(block_data.get("transactions", []))
+        return total_supply
+
+    def get_supply_at_height(self, height: int) -> Optional[Decimal]:
+        """
+        Return the cumulative mined supply up to and including `height` (single key read).
+        """
+        try:
+            with self.block_metadata_db.begin() as txn:
+                return self._get_cumulative_supply_in_txn(txn, height)
+        except Exception as e:
+            print(f"[BlockStorage.get_supply_at_height] ERROR: Failed to read supply at height {height}: {e}")
+            return None
+
+    def rollback_block_metadata(self, height: int) -> bool:
+        """
+        Remove block metadata above `height` and rewind the total-supply counter to the
+        cumulative value stored at `height`, in a single write transaction.
+        Cached signature verifications for the transactions of the rolled-back blocks are evicted.
+        """
+        try:
+            signature_cache = SignatureCache.shared()
+            for block_data in self.iter_blocks(height + 1):
+                signature_cache.evict_transactions(block_data.get("transactions", []))
+
+            with self.block_metadata_db.begin(write=True) as txn:
+                supply_at_height = self._get_cumulative_supply_in_txn(txn, height)
+                if supply_at_height is None:
+                    print(f"[BlockStorage.rollback_block_metadata] ERROR: No supply counter stored at height {height}.")
+                    return False
+
+                removed = 0
+                next_height = height + 1
+                while txn.delete(f"blockmeta:{next_height}".encode("utf-8")):
+                    removed += 1
+                    next_height += 1
+
+                txn.put(b"total_mined_supply", str(supply_at_height).encode("utf-8"))
+
+                for watermark_key in (b"verified_height", b"validated_height"):
+                    watermark = txn.get(watermark_key)
+                    if watermark and int(watermark.decode("utf-8")) > height:
+                        txn.put(watermark_key, str(height).encode("utf-8"))
+
+            print(f"[BlockStorage.rollback_block_metadata] ✅ SUCCESS: Removed {removed} metadata entries; supply rewound to {supply_at_height} ZYC at height {height}.")
+            return True
+
+        except Exception as e:
+            print(f"[BlockStorage.rollback_block_metadata] ERROR: Failed to roll back metadata to height {height}: {e}")
+            return False
+
     def get_total_mined_supply(self) -> Decimal:
         """
-        Retrieve and update the total mined coin supply by summing all Coinbase rewards from stored blocks.
-        - Uses a cached value for performance but updates it dynamically after each mined block.
+        Retrieve the total mined coin supply.
+        - Reads the running counter maintained by `store_block_metadata` (single key read).
+        - Falls back to a one-time block scan for stores created before the counter existed.
         - Ensures the total supply is always valid (returns `Decimal(0)` instead of `None`).
         """
         try:
             print("[BlockStorage.get_total_mined_supply] INFO: Retrieving total mined supply...")
 
-            # ✅ **Check Cached Supply in LMDB**
-            with self.block_metadata_db.env.begin() as txn:
+            # ✅ **Read the Running Supply Counter**
+            with self.block_metadata_db.begin() as txn:
                 cached_supply = txn.get(b"total_mined_supply")
 
             if cached_supply:
                 try:
                     total_supply = Decimal(cached_supply.decode("utf-8"))
-                    print(f"[BlockStorage.get_total_mined_supply] INFO: Cached total mined supply retrieved: {total_supply} ZYC")
+                    print(f"[BlockStorage.get_total_mined_supply] INFO: Total mined supply: {total_supply} ZYC")
                     return total_supply
-                except (UnicodeDecodeError, ValueError) as decode_error:
-                    print(f"[BlockStorage.get_total_mined_supply] WARNING: Failed to decode cached total supply: {decode_error}")
-
-            # ✅ **Initialize Total Supply Counter**
-            total_supply = Decimal("0")
-            blocks_found = False
-
-            # ✅ **Iterate Through Stored Blocks**
-            with self.full_block_store.env.begin() as txn:
-                cursor = txn.cursor()
-                for key, value in cursor:
-                    if key.startswith(b"block:"):
-                        try:
-                            block_metadata = json.loads(value.decode("utf-8"))
-
-                            # ✅ **Ensure Block Metadata is Valid**
-                            if not isinstance(block_metadata, dict):
-                                print(f"[BlockStorage.get_total_mined_supply] ERROR: Skipping invalid block metadata: {block_metadata}")
-                                continue
-
-                            # ✅ **Check for `header` Format & Handle Legacy Blocks**
-                            header = block_metadata.get("header", block_metadata)
-                            if not isinstance(header, dict) or "index" not in header:
-                                print(f"[BlockStorage.get_total_mined_supply] ERROR: Block metadata missing 'header' or 'index'. Skipping...")
-                                continue
-
-                            block_index = header["index"]
-                            print(f"[BlockStorage.get_total_mined_supply] INFO: Processing Block {block_index}...")
+                except (UnicodeDecodeError, ValueError, ArithmeticError) as decode_error:
+                    print(f"[BlockStorage.get_total_mined_supply] WARNING: Failed to decode supply counter: {decode_error}")
 
-                            # ✅ **Process Coinbase Transactions for Mining Rewards**
-                            transactions = block_metadata.get("transactions", [])
-                            if not transactions:
-                                print(f"[BlockStorage.get_total_mined_supply] WARNING: Block {block_index} has no transactions.")
-                                continue
+            # ✅ **Legacy Store: Seed the Counter From a Block Scan**
+            total_supply = self._scan_mined_supply()
 
-                            blocks_found = True
-                            for tx in transactions:
-                                if tx.get("type") == "COINBASE":
-                                    outputs = tx.get("outputs", [])
-                                    if outputs and isinstance(outputs, list):
-                                        for output in outputs:
-                                            if "amount" in output:
-                                                try:
-                                                    reward_amount = Decimal(str(output["amount"]))
-                                                    total_supply += reward_amount
-                                                except (ValueError, TypeError) as e:
-                                                    print(f"[BlockStorage.get_total_mined_supply] ERROR: Invalid reward amount in Block {block_index}: {e}")
-
-                        except json.JSONDecodeError as e:
-                            print(f"[BlockStorage.get_total_mined_supply] ERROR: Failed to parse block metadata: {e}")
-                            continue
-
-            # ✅ **Ensure We Don't Return None**
-            if not blocks_found:
-                print("[BlockStorage.get_total_mined_supply] WARNING: No blocks found in storage. Returning 0.")
-                return Decimal(0)  # ✅ Ensure it always returns a valid value
-
-            # ✅ **Cache the Total Mined Supply for Faster Access**
-            with self.block_metadata_db.env.begin(write=True) as txn:
+            with self.block_metadata_db.begin(write=True) as txn:
                 txn.put(b"total_mined_supply", str(total_supply).encode("utf-8"))
 
             print(f"[BlockStorage.get_total_mined_supply] ✅ SUCCESS: Total mined supply calculated & cached: {total_supply} ZYC")
@@ -1462,8 +1726,9 @@ class BlockStorage:
 
     def get_block_by_tx_id(self, tx_id: str) -> Optional[Block]:
         """
-        Retrieve a block using a transaction ID from the `txindex.lmdb` database.
-        Includes full fallback logic and auto-recovery from LMDB errors.
+        Retrieve the block containing a transaction.
+        Uses the tx_id→(height, position) secondary index, falling back to the
+        `block_tx:` record in `txindex.lmdb` (block hash → hash index) if needed.
 
         :param tx_id: Transaction ID to look up.
         :return: The Block instance containing the transaction, or None.
@@ -1471,63 +1736,37 @@ class BlockStorage:
         try:
             print(f"[BlockStorage.get_block_by_tx_id] INFO: Searching for block containing transaction {tx_id}...")
 
-            # ✅ Ensure all LMDB instances are initialized
-            if not self.txindex_db or not self.block_metadata_db or not self.full_block_store:
-                print("[BlockStorage.get_block_by_tx_id] ❌ ERROR: Required LMDB instances are not set.")
-                return None
+            if isinstance(tx_id, bytes):
+                tx_id = tx_id.hex()
 
-            block_hash_bytes = None
-            key = f"tx:{tx_id}".encode("utf-8")
+            # ✅ Step 1: Secondary index lookup
+            location = self.get_transaction_location(tx_id)
+            if location:
+                height, position = location
+                block = self.get_block_by_height(height)
+                if block:
+                    print(f"[BlockStorage.get_block_by_tx_id] ✅ SUCCESS: TX {tx_id} found in Block #{height} at position {position}.")
+                    return block
 
-            # ✅ Step 1: Try accessing the txindex
+            # ✅ Step 2: Fallback to the txindex record's block hash
+            tx_record = None
             try:
-                with self.txindex_db.env.begin() as txn:
-                    block_hash_bytes = txn.get(key)
+                with self.txindex_db.begin() as txn:
+                    tx_record = txn.get(f"block_tx:{tx_id}".encode("utf-8"))
             except Exception as e:
-                print(f"[BlockStorage.get_block_by_tx_id] ⚠️ ERROR: Failed to access txindex DB: {e}. Retrying with reopen...")
-                try:
-                    self.txindex_db.reopen()
-                    with self.txindex_db.env.begin() as txn:
-                        block_hash_bytes = txn.get(key)
-                except Exception as e2:
-                    print(f"[BlockStorage.get_block_by_tx_id] ❌ ERROR: Retry failed for txindex DB: {e2}")
-                    return None
+                print(f"[BlockStorage.get_block_by_tx_id] ⚠️ ERROR: Failed to access txindex DB: {e}")
 
-            if not block_hash_bytes:
+            if not tx_record:
                 print(f"[BlockStorage.get_block_by_tx_id] ⚠️ WARNING: No block found for transaction {tx_id}.")
                 return None
 
-            block_hash = block_hash_bytes.decode("utf-8", errors="ignore")
-            print(f"[BlockStorage.get_block_by_tx_id] INFO: Transaction {tx_id} maps to block hash {block_hash}")
-
-            # ✅ Step 2: Retrieve block data from full block store
-            block_data_bytes = None
-            try:
-                with self.full_block_store.env.begin() as txn:
-                    block_data_bytes = txn.get(f"block:{block_hash}".encode("utf-8"))
-            except Exception as e:
-                print(f"[BlockStorage.get_block_by_tx_id] ⚠️ ERROR: Full block store access failed: {e}. Reopening and retrying...")
-                try:
-                    self.full_block_store.reopen()
-                    with self.full_block_store.env.begin() as txn:
-                        block_data_bytes = txn.get(f"block:{block_hash}".encode("utf-8"))
-                except Exception as e2:
-                    print(f"[BlockStorage.get_block_by_tx_id] ❌ ERROR: Full block retry failed: {e2}")
-                    return None
-
-            if not block_data_bytes:
-                print(f"[BlockStorage.get_block_by_tx_id] ❌ ERROR: Full block data not found for hash {block_hash}.")
+            block_hash = json.loads(tx_record.decode("utf-8")).get("block_hash")
+            if not block_hash:
+                print(f"[BlockStorage.get_block_by_tx_id] ❌ ERROR: txindex record for {tx_id} has no block hash.")
                 return None
 
-            # ✅ Step 3: Parse block JSON and construct Block instance
-            try:
-                block_dict = json.loads(block_data_bytes.decode("utf-8"))
-                block = Block.from_dict(block_dict)
-                print(f"[BlockStorage.get_block_by_tx_id] ✅ SUCCESS: Retrieved Block #{block.index} from full block storage.")
-                return block
-            except Exception as e:
-                print(f"[BlockStorage.get_block_by_tx_id] ❌ ERROR: Failed to deserialize block {block_hash}: {e}")
-                return None
+            print(f"[BlockStorage.get_block_by_tx_id] INFO: Transaction {tx_id} maps to block hash {block_hash}")
+            return self.get_block_by_hash(block_hash)
 
         except Exception as e:
             print(f"[BlockStorage.get_block_by_tx_id] ❌ FATAL ERROR: Unexpected failure for TX ID {tx_id}: {e}")
@@ -1552,7 +1791,7 @@ class BlockStorage:
                 return None
 
             # ✅ **Retrieve Transaction ID Using `txindex.lmdb`**
-            with self.txindex_db.env.begin() as txn:
+            with self.txindex_db.begin() as txn:
                 tx_id_bytes = txn.get(f"label:{tx_label}".encode("utf-8"))
 
             if not tx_id_bytes:
@@ -45,7 +45,7 @@ import lmdb
 import json
 import os
 import time
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator, Tuple
 from Zyiron_Chain.blockchain.constants import Constants
 
 
@@ -53,6 +53,8 @@ from Zyiron_Chain.blockchain.constants import Constants
 import os
 import lmdb
 from typing import Optional
+from Zyiron_Chain.storage.write_ahead_log import GroupCommitWriter
+from Zyiron_Chain.storage.lmdb_capacity import MapSizeController
 
 class LMDBManager:
     _environments = {}  # Singleton registry for environments
@@ -90,7 +92,7 @@ class LMDBManager:
         existing_env = LMDBManager._environments.get(self.db_path)
         if existing_env:
             try:
-                with existing_env.begin():  # Try to open a read txn
+                with MapSizeController.transaction(existing_env):  # Try to open a read txn
                     self.env = existing_env
                     print(f"[LMDBManager] Reused existing LMDB environment at {self.db_path}")
             except lmdb.Error as reuse_error:
@@ -107,7 +109,7 @@ class LMDBManager:
 
         # ✅ Initialize DB handles with fallback
         try:
-            with self.env.begin(write=True) as txn:
+            with self.begin(write=True) as txn:
                 self.mempool_db = self.env.open_db(b"mempool", txn=txn)
                 self.blocks_db = self.env.open_db(b"blocks", txn=txn)
                 self.transactions_db = self.env.open_db(b"transactions", txn=txn)
@@ -119,6 +121,22 @@ class LMDBManager:
             self.close()
             raise
 
+        # ✅ Group commit for high-write databases (replays any WAL left by a previous run)
+        self._db_names = {
+            id(self.mempool_db): "mempool",
+            id(self.blocks_db): "blocks",
+            id(self.transactions_db): "transactions",
+            id(self.metadata_db): "metadata",
+        }
+        self.group_commit = GroupCommitWriter.for_path(
+            self.db_path, lambda path=self.db_path: LMDBManager._environments.get(path)
+        )
+
+        # ✅ Map-size growth and capacity metrics (one controller per environment path)
+        self.capacity = MapSizeController.shared(
+            self.db_path, lambda path=self.db_path: LMDBManager._environments.get(path)
+        )
+
         # ✅ Perform capacity verification
         try:
             self._verify_capacity()
@@ -140,36 +158,40 @@ class LMDBManager:
         except Exception as e:
             print(f"[LMDBManager.reopen] ❌ ERROR: Failed to reopen LMDB: {e}")
 
+    def _group_commit_target(self, db_handle):
+        """
+        Return (writer, sub-database name) if writes to `db_handle` go through group commit,
+        else (None, None). Handles the writer cannot name are written synchronously.
+        """
+        writer = getattr(self, "group_commit", None)
+        if writer is None or id(db_handle) not in self._db_names:
+            return None, None
+        return writer, self._db_names[id(db_handle)]
+
     def _verify_capacity(self):
         """
-        Check database limits and dynamically increase LMDB map_size if usage exceeds 80%.
+        Grow the LMDB map now if it is already past `Constants.LMDB_MAP_GROWTH_THRESHOLD`.
         """
         try:
-            with self.env.begin() as txn:
-                stats = txn.stat()
-                info = self.env.info()
-
-                total_entries = stats.get("entries", 0)
-                map_size = info.get("map_size", 0)
-                last_page = info.get("last_pgno", 0)
-                page_size = info.get("psize", 4096)
-
-                if total_entries == 0:
-                    print("[LMDBManager] INFO: No database entries yet. Capacity check skipped.")
-                    return
-
-                file_usage = (last_page * page_size) / map_size if map_size > 0 else 0
-
-                if file_usage > 0.8:
-                    new_size = int(map_size * 1.5)  # ✅ Increase map_size by 50%
-                    self.env.set_mapsize(new_size)
-                    print(f"[LMDBManager] INFO: Increased LMDB map_size to {new_size} bytes due to high usage ({file_usage * 100:.2f}%).")
-
-            print("[LMDBManager] INFO: Capacity check completed.")
-
+            usage = self.capacity.usage()
+            if self.capacity.ensure_capacity():
+                print(f"[LMDBManager] INFO: Grew LMDB map at {self.db_path} (was {usage['fill_ratio'] * 100:.2f}% full).")
         except lmdb.Error as e:
             print(f"[LMDBManager] ERROR: Failed to verify LMDB capacity: {e}")
 
+    def get_capacity_metrics(self) -> dict:
+        """
+        Fill ratio, page counts and map resize events for this environment.
+        """
+        return self.capacity.metrics()
+
+    @staticmethod
+    def capacity_report() -> dict:
+        """
+        Capacity metrics for every LMDB environment opened in this process, keyed by path.
+        """
+        return MapSizeController.all_metrics()
+
 
     def get_all_transactions(self) -> List[Dict]:
         """
@@ -233,7 +255,7 @@ class LMDBManager:
                 raise ValueError(f"[LMDBManager] ❌ ERROR: No LMDB config found for network: {network}")
 
             try:
-                with self.env.begin(write=True) as txn:
+                with self.begin(write=True) as txn:
                     if not hasattr(self, "mempool_db"):
                         self.mempool_db = self.env.open_db(b"mempool", txn=txn)
                     if not hasattr(self, "blocks_db"):
@@ -292,13 +314,23 @@ class LMDBManager:
 
                 free_space = map_size - (used_pages * page_size)
 
-                return {
+                status = {
                     "max_databases": env_info.get("max_dbs", 0),
                     "used_entries": txn_stats.get("entries", 0),
                     "map_size_bytes": map_size,
                     "free_space_bytes": free_space
                 }
 
+            capacity = self.capacity.metrics()
+            status.update({
+                "free_space_bytes": capacity.get("free_bytes", status["free_space_bytes"]),
+                "fill_ratio": capacity.get("fill_ratio"),
+                "used_pages": capacity.get("used_pages"),
+                "total_pages": capacity.get("total_pages"),
+                "resize_count": capacity.get("resize_count", 0),
+            })
+            return status
+
         except Exception as e:
             print(f"[LMDBManager] ❌ ERROR: Failed to retrieve database status: {e}")
             return {}
@@ -561,19 +593,41 @@ class LMDBManager:
                 print(f"[LMDBManager.put] ❌ ERROR: Failed to reopen LMDB before put: {reopen_error}")
                 return False
 
-        # 🚀 Attempt write transaction
+        # 📝 High-write databases: append to the WAL, LMDB commit happens in the next group flush
+        writer, db_name = self._group_commit_target(db_handle)
+        if writer is not None:
+            try:
+                return writer.put(key_bytes, value_json, db_name)
+            except Exception as e:
+                print(f"[LMDBManager.put] ⚠️ WARNING: WAL append failed ({e}). Writing synchronously...")
+                writer.flush()
+
+        # 🚀 Attempt write transaction (map grows first if this write would fill it)
         try:
-            with self.env.begin(write=True, db=db_handle) as txn:
-                txn.put(key_bytes, value_json)
+            with self.capacity.write(len(key_bytes) + len(value_json)):
+                with self.env.begin(write=True, db=db_handle) as txn:
+                    txn.put(key_bytes, value_json)
             print(f"[LMDBManager.put] ✅ SUCCESS: Stored key: {key_bytes[:50]}")
             return True
+        except (lmdb.MapFullError, lmdb.MapResizedError) as e:
+            print(f"[LMDBManager.put] ⚠️ WARNING: {e}. Growing map and retrying...")
+            try:
+                self.capacity.handle_map_full(len(key_bytes) + len(value_json))
+                with self.capacity.write(len(key_bytes) + len(value_json)):
+                    with self.env.begin(write=True, db=db_handle) as txn:
+                        txn.put(key_bytes, value_json)
+                print(f"[LMDBManager.put] ✅ SUCCESS: Stored key after map growth: {key_bytes[:50]}")
+                return True
+            except Exception as retry_e:
+                print(f"[LMDBManager.put] ❌ ERROR: Put failed after map growth: {retry_e}")
+                return False
         except lmdb.Error as e:
             print(f"[LMDBManager.put] ❌ ERROR: LMDB write error: {e}")
             print("[LMDBManager.put] ⚠️ Attempting to reopen environment and retry...")
 
             try:
                 self.reopen()
-                with self.env.begin(write=True, db=db_handle) as txn:
+                with self.begin(write=True, db=db_handle) as txn:
                     txn.put(key_bytes, value_json)
                 print(f"[LMDBManager.put] ✅ SUCCESS: Retried and stored key: {key_bytes[:50]}")
                 return True
@@ -622,9 +676,19 @@ class LMDBManager:
                 print(f"[LMDB.get] ❌ ERROR: Failed to reopen LMDB before read: {reopen_error}")
                 return None
 
+        # 📝 Queued (not yet flushed) writes win over the LMDB snapshot
+        writer, db_name = self._group_commit_target(db_handle)
+        if writer is not None:
+            queued, queued_value = writer.pending(key_bytes, db_name)
+            if queued:
+                if queued_value is None:
+                    print(f"[LMDB.get] ⚠️ WARNING: Key not found: {key_str}")
+                    return None
+                return json.loads(queued_value.decode("utf-8"))
+
         # 🛡️ Attempt to read from LMDB
         try:
-            with self.env.begin(db=db_handle) as txn:
+            with self.capacity.read(), self.env.begin(db=db_handle) as txn:
                 value = txn.get(key_bytes)
 
                 if value is None:
@@ -655,7 +719,7 @@ class LMDBManager:
 
                 try:
                     self.reopen()
-                    with self.env.begin(db=db_handle) as txn:
+                    with self.begin(db=db_handle) as txn:
                         value = txn.get(key_bytes)
                         if value is None:
                             print(f"[LMDB.get] ⚠️ Retried: Key not found: {key_str}")
@@ -671,45 +735,141 @@ class LMDBManager:
 
 
 
-        
-    def get_all_blocks(self) -> List[dict]:
+
+    def delete(self, key: Union[str, bytes, bytearray, memoryview], db=None) -> bool:
         """
-        Retrieve all blocks stored in the 'blocks' LMDB DB.
-        Fallbacks:
-        - Use `block_metadata_db` if full block data is incomplete.
-        - Ensures robust loading from either LMDB source.
+        Delete a key from LMDB.
+
+        Args:
+            key: Key to delete.
+            db: Optional LMDB DB handle. Defaults to self.blocks_db.
+
+        Returns:
+            bool: True if the key existed and was deleted, False otherwise.
         """
-        blocks = []
+        db_handle = db or getattr(self, "blocks_db", None)
         try:
-            print("[LMDBManager.get_all_blocks] INFO: Scanning full_block_store for all blocks...")
+            key_bytes = key.encode("utf-8") if isinstance(key, str) else bytes(key)
 
-            with self.full_block_store.env.begin() as txn:
+            writer, db_name = self._group_commit_target(db_handle)
+            if writer is not None:
+                queued, queued_value = writer.pending(key_bytes, db_name)
+                if queued:
+                    existed = queued_value is not None
+                else:
+                    with self.capacity.read(), self.env.begin(db=db_handle) as txn:
+                        existed = txn.get(key_bytes) is not None
+                writer.delete(key_bytes, db_name)
+                return existed
+
+            with self.capacity.write(), self.env.begin(write=True, db=db_handle) as txn:
+                return txn.delete(key_bytes)
+        except Exception as e:
+            print(f"[LMDBManager.delete] ❌ ERROR: Failed to delete key {key}: {e}")
+            return False
+
+    def get_by_prefix(self, prefix: str, db=None) -> List[Tuple[str, dict]]:
+        """
+        Return every (key, JSON value) pair whose key starts with `prefix`, in key order.
+        Entries that are not valid JSON are skipped.
+
+        Args:
+            prefix (str): Key prefix to scan.
+            db: Optional LMDB DB handle. Defaults to self.blocks_db.
+        """
+        db_handle = db or getattr(self, "blocks_db", None)
+        prefix_bytes = prefix.encode("utf-8")
+        results = []
+        try:
+            with self.capacity.read(), self.env.begin(db=db_handle) as txn:
                 cursor = txn.cursor()
-                for key, value in cursor:
+                found = cursor.set_range(prefix_bytes)
+                for key, value in (cursor if found else ()):
+                    if not key.startswith(prefix_bytes):
+                        break
                     try:
-                        key_str = key.decode("utf-8")
-                        if not key_str.startswith("block:"):
-                            continue
+                        results.append((key.decode("utf-8"), json.loads(value.decode("utf-8"))))
+                    except (UnicodeDecodeError, json.JSONDecodeError):
+                        print(f"[LMDBManager.get_by_prefix] ⚠️ WARNING: Skipping undecodable entry {key[:50]}")
+
+            # 📝 Merge queued (not yet flushed) writes
+            writer, db_name = self._group_commit_target(db_handle)
+            queued = writer.pending_prefix(prefix_bytes, db_name) if writer is not None else {}
+            if queued:
+                merged = {key: value for key, value in results if key.encode("utf-8") not in queued}
+                for key, value in queued.items():
+                    if value is not None:
+                        merged[key.decode("utf-8")] = json.loads(value.decode("utf-8"))
+                results = sorted(merged.items())
+            return results
+        except Exception as e:
+            print(f"[LMDBManager.get_by_prefix] ❌ ERROR: Failed to scan prefix {prefix}: {e}")
+            return results
 
-                        block_dict = json.loads(value.decode("utf-8"))
+    def iter_blocks(self, start: int = 0, end: Optional[int] = None, headers_only: bool = False) -> Iterator[dict]:
+        """
+        Stream `block:{height}` entries from this environment in height order,
+        using a single read transaction and holding one decoded block at a time.
 
-                        if not isinstance(block_dict, dict):
-                            print(f"[LMDB WARNING] ⚠️ Malformed block data at {key_str}. Skipping.")
-                            continue
+        Args:
+            start (int): First block height to yield.
+            end (int, optional): Last height (inclusive). Defaults to `latest_block_index`,
+                                 or the first gap if no tip marker is stored.
+            headers_only (bool): Yield only each block's header dict (with `hash` attached).
+        """
+        with self.begin() as txn:
+            if end is None:
+                latest_index = txn.get(b"latest_block_index")
+                end = int(latest_index.decode("utf-8")) if latest_index else None
+
+            height = max(0, start)
+            while end is None or height <= end:
+                value = txn.get(f"block:{height}".encode("utf-8"))
+                if value is None:
+                    if end is None:
+                        break
+                    height += 1
+                    continue
 
-                        blocks.append(block_dict)
+                try:
+                    block_dict = json.loads(value.decode("utf-8"))
+                    if not isinstance(block_dict, dict):
+                        print(f"[LMDB WARNING] ⚠️ Malformed block data at block:{height}. Skipping.")
+                    elif headers_only:
+                        header = dict(block_dict.get("header", block_dict))
+                        header["hash"] = block_dict.get("hash")
+                        yield header
+                    else:
+                        yield block_dict
+                except (UnicodeDecodeError, json.JSONDecodeError) as e:
+                    print(f"[LMDB ERROR] ❌ Failed to parse block:{height}: {e}")
+
+                height += 1
 
-                    except (UnicodeDecodeError, json.JSONDecodeError) as e:
-                        print(f"[LMDB ERROR] ❌ Failed to parse block {key}: {e}")
+    def get_all_blocks(self) -> List[dict]:
+        """
+        Retrieve all blocks stored in this environment as a list.
+        Prefer `iter_blocks()` for full-chain scans; this materializes the whole chain.
+        Fallbacks:
+        - Use `block_metadata_db` if full block data is incomplete.
+        """
+        blocks = []
+        try:
+            print("[LMDBManager.get_all_blocks] INFO: Scanning block store for all blocks...")
+            blocks = list(self.iter_blocks())
 
             if blocks:
-                print(f"[LMDBManager.get_all_blocks] ✅ Retrieved {len(blocks)} blocks from full_block_store.")
-                return sorted(blocks, key=lambda b: b.get("index", 0))
+                print(f"[LMDBManager.get_all_blocks] ✅ Retrieved {len(blocks)} blocks from block store.")
+                return blocks
+
+            if not getattr(self, "block_metadata_db", None):
+                print("[LMDBManager.get_all_blocks] ⚠️ No full blocks found and no block_metadata_db attached.")
+                return []
 
             print("[LMDBManager.get_all_blocks] ⚠️ No full blocks found. Attempting fallback to block_metadata_db...")
 
             # Fallback: Scan block_metadata DB
-            with self.block_metadata_db.env.begin() as txn:
+            with self.block_metadata_db.begin() as txn:
                 cursor = txn.cursor()
                 for key, value in cursor:
                     if key.startswith(b"blockmeta:"):
@@ -749,7 +909,7 @@ class LMDBManager:
         """
         Delete a block from the 'blocks' DB by block_hash.
         """
-        with self.env.begin(write=True, db=self.blocks_db) as txn:
+        with self.begin(write=True, db=self.blocks_db) as txn:
             txn.delete(f"block:{block_hash}".encode())
         print(f"[LMDB] ✅ Block {block_hash} deleted from 'blocks' DB.")
 
@@ -802,7 +962,7 @@ class LMDBManager:
                 return
 
             # ✅ Store transaction in LMDB safely
-            with self.env.begin(write=True, db=self.transactions_db) as txn:
+            with self.begin(write=True, db=self.transactions_db) as txn:
                 txn.put(key, value)
 
             print(f"[LMDB] ✅ Transaction {tx_id} stored successfully.")
@@ -821,6 +981,7 @@ class LMDBManager:
     @staticmethod
     def close_all():
         print("[LMDBManager] INFO: Closing all LMDB environments globally...")
+        GroupCommitWriter.close_all()
         for path, env in list(LMDBManager._environments.items()):
             try:
                 env.close()
@@ -860,10 +1021,21 @@ class LMDBManager:
     def close(self):
         """Close the LMDB environment and remove it from the singleton registry."""
         if self.db_path in LMDBManager._environments:
+            GroupCommitWriter.flush_path(self.db_path)
             self.env.close()
             del LMDBManager._environments[self.db_path]
             print(f"[LMDBManager] Closed LMDB environment at {self.db_path}")
 
+    def begin(self, write: bool = False, needed_bytes: int = 0, **kwargs):
+        """
+        Open a transaction on this environment inside its capacity gate, so a map resize
+        cannot happen while it is open. Use in place of `self.env.begin(...)`.
+        Write transactions first flush the group-commit queue, like `safe_transaction`.
+        """
+        if write:
+            GroupCommitWriter.flush_path(self.db_path)
+        return MapSizeController.transaction(self.env, write=write, needed_bytes=needed_bytes, **kwargs)
+
     @contextmanager
     def safe_transaction(self, write=False, db=None):
         """
@@ -877,8 +1049,11 @@ class LMDBManager:
                 self.env = self._open_env()
 
             db_handle = db or self.blocks_db
-            with self.env.begin(write=write, db=db_handle) as txn:
-                yield txn
+            if write:
+                GroupCommitWriter.flush_path(self.db_path)
+            with (self.capacity.write() if write else self.capacity.read()):
+                with self.env.begin(write=write, db=db_handle) as txn:
+                    yield txn
         except lmdb.Error as e:
             print(f"[LMDBManager.safe_transaction] ❌ LMDB error during transaction: {e}")
             self._open_env()
@@ -892,7 +1067,7 @@ class LMDBManager:
         print("[LMDBManager] 🔄 Attempting to reopen all LMDB environments...")
         for path, env in list(LMDBManager._environments.items()):
             try:
-                with env.begin():
+                with MapSizeController.transaction(env):
                     print(f"[LMDBManager] ✅ Environment active at {path}")
             except lmdb.Error:
                 print(f"[LMDBManager] ⚠️ Environment at {path} is closed or invalid. Reopening...")
@@ -0,0 +1,257 @@
+import os
+import sys
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, Optional
+
+# Adjust Python path for project structure
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+sys.path.append(project_root)
+
+from Zyiron_Chain.blockchain.constants import Constants
+
+
+class MapSizeController:
+    """
+    Grows an LMDB environment's map size before it fills, and reports its capacity.
+
+    - Usage comes from `env.info()` (last page number, map size) and `env.stat()` (page size).
+    - `ensure_capacity(n)` is called before each write. When the fill ratio would pass
+      `LMDB_MAP_GROWTH_THRESHOLD`, the map is multiplied by `LMDB_MAP_GROWTH_FACTOR`
+      (up to `LMDB_MAP_SIZE_MAX`) instead of waiting for `MapFullError`.
+    - `set_mapsize` needs every transaction in the process closed. Gated writes (`write()`) and
+      reads (`read()`) are counted, and a resize waits for them to finish while holding new
+      ones back. That pause is recorded in the resize event.
+    - One controller is shared per environment path, so all managers of an environment
+      coordinate through the same gate and metrics.
+    - Every transaction on a managed environment goes through `transaction()` (or
+      `LMDBManager.begin()`), so no ungated transaction can be open when the map is resized.
+    """
+
+    _controllers: Dict[str, "MapSizeController"] = {}
+    _controllers_lock = threading.Lock()
+
+    def __init__(self, db_path: str, env_provider: Callable):
+        self.db_path = os.path.abspath(db_path)
+        self.env_provider = env_provider
+        self.growth_threshold = Constants.LMDB_MAP_GROWTH_THRESHOLD
+        self.growth_factor = Constants.LMDB_MAP_GROWTH_FACTOR
+        self.max_map_size = Constants.LMDB_MAP_SIZE_MAX
+
+        self._gate = threading.Condition(threading.RLock())
+        self._active = 0
+        self._active_by_thread: Dict[int, int] = {}
+        self._resizing = False
+        self._owner: Optional[int] = None
+
+        self.resize_events = deque(maxlen=Constants.LMDB_RESIZE_EVENT_HISTORY)
+        self.map_full_errors = 0
+
+    @classmethod
+    def shared(cls, db_path: str, env_provider: Callable) -> "MapSizeController":
+        """
+        Return the process-wide controller for `db_path`.
+        """
+        path = os.path.abspath(db_path)
+        with cls._controllers_lock:
+            controller = cls._controllers.get(path)
+            if controller is None:
+                controller = cls._controllers[path] = cls(path, env_provider)
+            return controller
+
+    @classmethod
+    def write_gate(cls, env, needed_bytes: int = 0):
+        """
+        Gate for a write transaction opened directly on `env` (outside LMDBManager).
+        Environments without a controller get a no-op context.
+        """
+        controller = cls._controllers.get(os.path.abspath(env.path()))
+        return controller.write(needed_bytes) if controller is not None else nullcontext()
+
+    @classmethod
+    def read_gate(cls, env):
+        """
+        Gate for a read transaction opened directly on `env` (outside LMDBManager).
+        Environments without a controller get a no-op context.
+        """
+        controller = cls._controllers.get(os.path.abspath(env.path()))
+        return controller.read() if controller is not None else nullcontext()
+
+    @classmethod
+    @contextmanager
+    def transaction(cls, env, write: bool = False, needed_bytes: int = 0, **kwargs):
+        """
+        `env.begin(write=write, **kwargs)` inside the environment's read or write gate.
+        Use in place of `env.begin()` for any environment that may be resized.
+        """
+        gate = cls.write_gate(env, needed_bytes) if write else cls.read_gate(env)
+        with gate, env.begin(write=write, **kwargs) as txn:
+            yield txn
+
+    @classmethod
+    def all_metrics(cls) -> Dict[str, Dict]:
+        """
+        Capacity metrics for every environment opened in this process, keyed by path.
+        """
+        with cls._controllers_lock:
+            controllers = list(cls._controllers.values())
+        return {controller.db_path: controller.metrics() for controller in controllers}
+
+    # -------------------------------------------------------------------------
+    # Transaction gate
+    # -------------------------------------------------------------------------
+    @contextmanager
+    def _enter(self):
+        me = threading.get_ident()
+        with self._gate:
+            # The resizing thread may re-enter (e.g. a retry inside its own pause), and a thread
+            # already inside the gate may nest transactions (the resize is waiting for it anyway).
+            while self._resizing and self._owner != me and me not in self._active_by_thread:
+                self._gate.wait()
+            self._active += 1
+            self._active_by_thread[me] = self._active_by_thread.get(me, 0) + 1
+        try:
+            yield
+        finally:
+            with self._gate:
+                self._active -= 1
+                if self._active_by_thread[me] == 1:
+                    del self._active_by_thread[me]
+                else:
+                    self._active_by_thread[me] -= 1
+                if self._active == 0:
+                    self._gate.notify_all()
+
+    def read(self):
+        """
+        Context manager around a read transaction; held back while the map is being resized.
+        """
+        return self._enter()
+
+    def write(self, needed_bytes: int = 0):
+        """
+        Context manager around a write transaction: makes room for `needed_bytes`, then
+        enters the gate so a resize cannot start while the transaction is open.
+        """
+        self.ensure_capacity(needed_bytes)
+        return self._enter()
+
+    # -------------------------------------------------------------------------
+    # Usage
+    # -------------------------------------------------------------------------
+    def usage(self) -> Dict:
+        env = self.env_provider()
+        # Read under the gate lock: `env.stat()` fails if it races `set_mapsize` in grow().
+        with self._gate:
+            info = env.info()
+            stat = env.stat()
+        page_size = stat.get("psize", 4096)
+        map_size = info.get("map_size", 0)
+        used_pages = info.get("last_pgno", 0) + 1
+        used_bytes = used_pages * page_size
+        return {
+            "map_size_bytes": map_size,
+            "page_size": page_size,
+            "used_pages": used_pages,
+            "total_pages": map_size // page_size if page_size else 0,
+            "used_bytes": used_bytes,
+            "free_bytes": max(0, map_size - used_bytes),
+            "fill_ratio": used_bytes / map_size if map_size else 0.0,
+            "entries": stat.get("entries", 0),
+            "depth": stat.get("depth", 0),
+        }
+
+    def metrics(self) -> Dict:
+        """
+        Fill ratio, page counts and resize history for this environment.
+        """
+        try:
+            metrics = self.usage()
+        except Exception as e:
+            metrics = {"error": str(e)}
+        metrics.update({
+            "path": self.db_path,
+            "resize_count": len(self.resize_events),
+            "resize_events": list(self.resize_events),
+            "map_full_errors": self.map_full_errors,
+        })
+        return metrics
+
+    # -------------------------------------------------------------------------
+    # Growth
+    # -------------------------------------------------------------------------
+    def ensure_capacity(self, needed_bytes: int = 0) -> bool:
+        """
+        Grow the map if `needed_bytes` more would push it past the growth threshold.
+        Returns True if the map was resized.
+        """
+        usage = self.usage()
+        # B-tree writes copy pages (copy-on-write), so reserve twice the payload.
+        projected = usage["used_bytes"] + 2 * max(0, needed_bytes)
+        if usage["map_size_bytes"] and projected < usage["map_size_bytes"] * self.growth_threshold:
+            return False
+        return self.grow(projected)
+
+    def grow(self, required_bytes: int = 0, reason: str = "threshold") -> bool:
+        """
+        Multiply the map size by the growth factor (or more, to fit `required_bytes` under the
+        threshold) while no gated transaction is open.
+        """
+        me = threading.get_ident()
+        with self._gate:
+            if (self._resizing and self._owner == me) or me in self._active_by_thread:
+                # Remapping under this thread's own open transaction is unsafe; a later write retries.
+                return False
+            while self._resizing:
+                self._gate.wait()
+
+            pause_started = time.time()
+            self._resizing = True
+            self._owner = me
+            try:
+                while self._active > 0:
+                    self._gate.wait(timeout=1.0)
+
+                env = self.env_provider()
+                usage = self.usage()
+                old_size = usage["map_size_bytes"]
+                if reason == "threshold" and old_size and max(required_bytes, usage["used_bytes"]) < old_size * self.growth_threshold:
+                    return False  # Another thread already grew it.
+
+                new_size = max(int(old_size * self.growth_factor),
+                               int(required_bytes / self.growth_threshold) + usage["page_size"])
+                new_size = min(new_size, self.max_map_size)
+                new_size -= new_size % usage["page_size"]
+                if new_size <= old_size:
+                    print(f"[MapSizeController.grow] ⚠️ WARNING: {self.db_path} is at LMDB_MAP_SIZE_MAX ({old_size} bytes).")
+                    return False
+
+                env.set_mapsize(new_size)
+                event = {
+                    "timestamp": int(time.time()),
+                    "old_size": old_size,
+                    "new_size": new_size,
+                    "fill_ratio": round(usage["fill_ratio"], 4),
+                    "reason": reason,
+                    "pause_seconds": round(time.time() - pause_started, 6),
+                }
+                self.resize_events.append(event)
+                print(f"[MapSizeController.grow] ✅ SUCCESS: Grew {os.path.basename(self.db_path)} map "
+                      f"{old_size} → {new_size} bytes ({reason}, fill {usage['fill_ratio'] * 100:.1f}%).")
+                return True
+
+            finally:
+                self._resizing = False
+                self._owner = None
+                self._gate.notify_all()
+
+    def handle_map_full(self, needed_bytes: int = 0) -> bool:
+        """
+        Recover from `MapFullError` / `MapResizedError` by growing the map (the failed
+        transaction must already be aborted). Returns True if a retry can proceed.
+        """
+        self.map_full_errors += 1
+        usage = self.usage()
+        return self.grow(usage["map_size_bytes"] + 2 * max(0, needed_bytes), reason="map_full")
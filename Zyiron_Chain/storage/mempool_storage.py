@@ -90,7 +90,7 @@ class MempoolStorage:
             tx_key = f"tx:{tx_id}".encode("utf-8")
             serialized_data = json.dumps(transaction, sort_keys=True).encode("utf-8")
 
-            with self.mempool_db.env.begin(write=True) as txn:
+            with self.mempool_db.begin(write=True) as txn:
                 txn.put(tx_key, serialized_data)
 
             print(f"[MempoolStorage] INFO: Transaction {tx_id} stored in mempool.")
@@ -107,7 +107,7 @@ class MempoolStorage:
         """
         transactions = []
         try:
-            with self.mempool_db.env.begin() as txn:
+            with self.mempool_db.begin() as txn:
                 cursor = txn.cursor()
                 for key, value in cursor:
                     if key.startswith(b"tx:"):
@@ -138,7 +138,7 @@ class MempoolStorage:
 
             tx_key = f"tx:{tx_id}".encode("utf-8")
 
-            with self.mempool_db.env.begin(write=True) as txn:
+            with self.mempool_db.begin(write=True) as txn:
                 if not txn.delete(tx_key):
                     print(f"[MempoolStorage.remove_transaction] WARNING: Transaction {tx_id} not found in mempool.")
                     return False
@@ -155,7 +155,7 @@ class MempoolStorage:
         Clear all transactions from the mempool.
         """
         try:
-            with self.mempool_db.env.begin(write=True) as txn:
+            with self.mempool_db.begin(write=True) as txn:
                 txn.drop(self.mempool_db.mempool_db, delete=True)
 
             print("[MempoolStorage.clear_mempool] INFO: Mempool cleared successfully.")
@@ -183,7 +183,7 @@ class MempoolStorage:
     def get_transaction_count(self) -> int:
         try:
             count = 0
-            with self.txindex_db.env.begin(write=False) as txn:
+            with self.txindex_db.begin(write=False) as txn:
                 cursor = txn.cursor()
                 for key, _ in cursor:
                     if key.startswith(b"tx:") or key.startswith(b"block_tx:"):
@@ -199,7 +199,7 @@ class MempoolStorage:
         Return the number of transactions currently in the mempool.
         """
         try:
-            with self.mempool_db.env.begin() as txn:
+            with self.mempool_db.begin() as txn:
                 stat = txn.stat()
                 count = stat.get("entries", 0)
                 print(f"[MempoolStorage] ✅ Pending transaction count: {count}")
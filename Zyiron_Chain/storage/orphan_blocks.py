@@ -64,7 +64,7 @@ class OrphanBlocks:
             }
             serialized_data = json.dumps(orphan_metadata, sort_keys=True).encode("utf-8")
             key = f"orphan:{computed_hash}".encode("utf-8")
-            with self.orphan_db.env.begin(write=True) as txn:
+            with self.orphan_db.begin(write=True) as txn:
                 txn.put(key, serialized_data)
             print(f"[OrphanBlocks.store_orphan_block] INFO: Orphan block {computed_hash} stored successfully.")
         except Exception as e:
@@ -78,7 +78,7 @@ class OrphanBlocks:
         """
         try:
             key = f"orphan:{block_hash}".encode("utf-8")
-            with self.orphan_db.env.begin() as txn:
+            with self.orphan_db.begin() as txn:
                 data = txn.get(key)
             if data is None:
                 print(f"[OrphanBlocks.get_orphan_block] WARNING: Orphan block {block_hash} not found.")
@@ -97,7 +97,7 @@ class OrphanBlocks:
         """
         try:
             key = f"orphan:{block_hash}".encode("utf-8")
-            with self.orphan_db.env.begin(write=True) as txn:
+            with self.orphan_db.begin(write=True) as txn:
                 if txn.get(key) is None:
                     print(f"[OrphanBlocks.remove_orphan_block] WARNING: Orphan block {block_hash} not found for removal.")
                     return False
@@ -115,7 +115,7 @@ class OrphanBlocks:
         """
         orphan_blocks = []
         try:
-            with self.orphan_db.env.begin() as txn:
+            with self.orphan_db.begin() as txn:
                 cursor = txn.cursor()
                 for key, value in cursor:
                     key_str = key.decode("utf-8")
@@ -156,7 +156,7 @@ class OrphanBlocks:
         """
         results = []
         try:
-            with self.orphan_db.env.begin() as txn:
+            with self.orphan_db.begin() as txn:
                 cursor = txn.cursor()
                 for key_bytes, value_bytes in cursor:
                     key_str = key_bytes.decode("utf-8", errors="ignore")
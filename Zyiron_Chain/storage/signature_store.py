@@ -0,0 +1,146 @@
+import os
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, Optional, Tuple, Union
+
+# Adjust Python path for project structure
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+sys.path.append(project_root)
+
+from Zyiron_Chain.blockchain.constants import Constants, hash_transaction_signature
+from Zyiron_Chain.storage.lmdatabase import LMDBManager
+
+
+class SignatureStore:
+    """
+    Long-lived store for full Falcon-512 signatures in `txindex.lmdb`.
+
+    - Keys are the transaction ID bytes; values are the 512-byte salt followed by the signature.
+      Blocks only carry the SHA3-384 hash of signature + salt (`tx_signature_hash`).
+    - The environment is opened once per path through LMDBManager and shared by every caller,
+      instead of opening and closing `txindex.lmdb` for each signature.
+    - `put_many()` writes a whole batch in one write transaction, or inside a caller's open
+      (or staged) transaction so a block's signatures commit with the rest of the block.
+    - `read_signature()` yields a zero-copy memoryview of a stored signature.
+    """
+
+    SALT_SIZE = 512
+
+    _stores = {}
+    _stores_lock = threading.Lock()
+
+    def __init__(self, txindex_path: Optional[str] = None):
+        self.txindex_path = os.path.abspath(txindex_path or Constants.get_db_path("txindex"))
+        self.db = LMDBManager(self.txindex_path)
+        print(f"[SignatureStore.__init__] ✅ SUCCESS: Signature store ready at {self.txindex_path}")
+
+    @classmethod
+    def shared(cls, txindex_path: Optional[str] = None) -> "SignatureStore":
+        """
+        Return the process-wide store for `txindex_path` (defaults to the network's txindex).
+        """
+        path = os.path.abspath(txindex_path or Constants.get_db_path("txindex"))
+        with cls._stores_lock:
+            store = cls._stores.get(path)
+            if store is None:
+                store = cls._stores[path] = cls(path)
+            return store
+
+    @property
+    def env(self):
+        return self.db.env
+
+    # -------------------------------------------------------------------------
+    # Normalization
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _key(tx_id: Union[str, bytes]) -> bytes:
+        return tx_id if isinstance(tx_id, bytes) else str(tx_id).encode("utf-8")
+
+    @staticmethod
+    def _signature_bytes(falcon_signature) -> bytes:
+        if isinstance(falcon_signature, str):
+            try:
+                return bytes.fromhex(falcon_signature)
+            except ValueError:
+                return falcon_signature.encode("utf-8")
+        return bytes(falcon_signature or b"")
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+    def put_many(self, signatures: Iterable[Tuple[Union[str, bytes], bytes]], txn=None) -> Dict[bytes, bytes]:
+        """
+        Store a batch of (tx_id, falcon_signature) pairs.
+
+        Args:
+            signatures: Iterable of (tx_id, signature) pairs (or a dict tx_id → signature).
+            txn: Optional open write transaction (real or staged) on this environment;
+                 when omitted, the batch is written in a single new write transaction.
+
+        Returns:
+            Dict[bytes, bytes]: tx_id key → SHA3-384 hash of signature + salt (for `block.data`).
+        """
+        if isinstance(signatures, dict):
+            signatures = signatures.items()
+
+        records = []
+        hashes = {}
+        for tx_id, falcon_signature in signatures:
+            key = self._key(tx_id)
+            signature = self._signature_bytes(falcon_signature)
+            salt, signature_hash = hash_transaction_signature(signature)
+            records.append((key, salt + signature))
+            hashes[key] = signature_hash
+
+        if not records:
+            return hashes
+
+        if txn is not None:
+            for key, value in records:
+                txn.put(key, value)
+            return hashes
+
+        with self.db.begin(write=True, needed_bytes=sum(len(key) + len(value) for key, value in records)) as write_txn:
+            cursor = write_txn.cursor()
+            cursor.putmulti(records)
+
+        print(f"[SignatureStore.put_many] ✅ SUCCESS: Stored {len(records)} Falcon-512 signatures.")
+        return hashes
+
+    def put(self, tx_id: Union[str, bytes], falcon_signature: bytes, txn=None) -> bytes:
+        """
+        Store one signature and return its SHA3-384 hash (see `put_many`).
+        """
+        return self.put_many([(tx_id, falcon_signature)], txn=txn)[self._key(tx_id)]
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+    @contextmanager
+    def read_signature(self, tx_id: Union[str, bytes]) -> Iterator[Optional[memoryview]]:
+        """
+        Yield a zero-copy view of the stored signature (salt stripped), or None if missing.
+        The view points into the LMDB map and is only valid inside the `with` block.
+        """
+        with self.db.begin(buffers=True) as txn:
+            value = txn.get(self._key(tx_id))
+            yield value[self.SALT_SIZE:] if value is not None else None
+
+    def get_signature(self, tx_id: Union[str, bytes]) -> Optional[bytes]:
+        """
+        Return a copy of the stored signature (salt stripped), or None if missing.
+        """
+        with self.read_signature(tx_id) as view:
+            return bytes(view) if view is not None else None
+
+    def get_salted_signature(self, tx_id: Union[str, bytes]) -> Optional[Tuple[bytes, bytes]]:
+        """
+        Return (salt, signature) so `tx_signature_hash` can be re-derived, or None if missing.
+        """
+        with self.db.begin(buffers=True) as txn:
+            value = txn.get(self._key(tx_id))
+            if value is None:
+                return None
+            return bytes(value[:self.SALT_SIZE]), bytes(value[self.SALT_SIZE:])
@@ -13,8 +13,9 @@ import lmdb
 # Set module search path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from Zyiron_Chain.blockchain.constants import Constants, store_transaction_signature
+from Zyiron_Chain.blockchain.constants import Constants
 from Zyiron_Chain.storage.lmdatabase import LMDBManager
+from Zyiron_Chain.storage.signature_store import SignatureStore
 from Zyiron_Chain.utils.hashing import Hashing
 from Zyiron_Chain.transactions.tx import Transaction
 from Zyiron_Chain.utils.deserializer import Deserializer
@@ -27,7 +28,7 @@ import sys
 import json
 import time
 from decimal import Decimal
-from typing import List, Optional, Dict, Union
+from typing import Iterable, List, Optional, Dict, Tuple, Union
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
@@ -76,6 +77,9 @@ class TxStorage:
                 self.txindex_db = LMDBManager(txindex_path)  # Final retry
                 print(f"[TxStorage.__init__] 🔁 Retried and reinitialized LMDB.")
 
+            # Falcon-512 signatures share the txindex environment
+            self.signature_store = SignatureStore.shared(txindex_path)
+
             if not fee_model:
                 raise ValueError("[TxStorage.__init__] ERROR: FeeModel instance is required.")
             self.fee_model = fee_model
@@ -142,7 +146,7 @@ class TxStorage:
             seen_blocks = set()
 
             # Step 1: Use block_storage metadata DB
-            with self.block_storage.block_metadata_db.env.begin() as txn:
+            with self.block_storage.block_metadata_db.begin() as txn:
                 cursor = txn.cursor()
                 for key, value in cursor:
                     if key.startswith(b"blockmeta:"):
@@ -156,22 +160,17 @@ class TxStorage:
                         except Exception as e:
                             print(f"[TxStorage] ⚠️ Failed to parse metadata for {key}: {e}")
 
-            # Step 2: Fallback to full block store if any are missing
-            with self.block_storage.full_block_store.env.begin() as txn:
-                cursor = txn.cursor()
-                for key, value in cursor:
-                    if key.startswith(b"block:"):
-                        try:
-                            block_index = int(key.decode().split(":")[1])
-                            if block_index in seen_blocks:
-                                continue
-
-                            block_data = json.loads(value.decode("utf-8"))
-                            txs = block_data.get("transactions", [])
-                            total_count += len(txs)
-                            print(f"[TxStorage] 📕 Block {block_index} via full block: {len(txs)} txs")
-                        except Exception as e:
-                            print(f"[TxStorage] ⚠️ Failed to parse block {key}: {e}")
+            # Step 2: Fallback to full block store (every segment) if any are missing
+            for block_index, value in self.block_storage.segments.iter_raw_blocks(0, self.block_storage.get_latest_height()):
+                if value is None or block_index in seen_blocks:
+                    continue
+                try:
+                    block_data = json.loads(value.decode("utf-8"))
+                    txs = block_data.get("transactions", [])
+                    total_count += len(txs)
+                    print(f"[TxStorage] 📕 Block {block_index} via full block: {len(txs)} txs")
+                except Exception as e:
+                    print(f"[TxStorage] ⚠️ Failed to parse block {block_index}: {e}")
 
             print(f"[TxStorage] ✅ Total transaction count: {total_count}")
             return total_count
@@ -183,39 +182,287 @@ class TxStorage:
 
 
 
-    def get_transactions_by_block(self, block_hash: str) -> List[Dict[str, Any]]:
+    # -------------------------------------------------------------------------
+    # Block → transactions index
+    #   block_txs:{block_hash}:{position:06d} → tx_id   (one key per transaction, in block order)
+    #   block_hash_at:{height:012d}           → block_hash (overwritten on reorg)
+    # Keys sort by position, so a block's transactions are one `set_range` walk.
+    # -------------------------------------------------------------------------
+    BLOCK_TXS_PREFIX = "block_txs:"
+    BLOCK_HASH_AT_PREFIX = "block_hash_at:"
+    BLOCK_TX_INDEX_MARKER = b"__block_tx_index_built__"
+
+    @classmethod
+    def _block_txs_key(cls, block_hash: str, position: int) -> bytes:
+        return f"{cls.BLOCK_TXS_PREFIX}{block_hash}:{position:06d}".encode("utf-8")
+
+    @classmethod
+    def _block_hash_at_key(cls, height: int) -> bytes:
+        return f"{cls.BLOCK_HASH_AT_PREFIX}{int(height):012d}".encode("utf-8")
+
+    def get_block_tx_ids(self, block: Union[str, int], txn=None) -> List[str]:
+        """
+        Return the transaction IDs of a block, in block order, from the block → tx index.
+
+        Args:
+            block: Block hash (str) or block height (int).
+            txn: Optional open read transaction on `txindex.lmdb`.
+        """
+        if txn is None:
+            with self.txindex_db.begin() as read_txn:
+                return self.get_block_tx_ids(block, read_txn)
+
+        if isinstance(block, int):
+            block_hash = txn.get(self._block_hash_at_key(block))
+            if block_hash is None:
+                return []
+            block_hash = bytes(block_hash).decode("utf-8")
+        else:
+            block_hash = block
+
+        prefix = f"{self.BLOCK_TXS_PREFIX}{block_hash}:".encode("utf-8")
+        tx_ids = []
+        cursor = txn.cursor()
+        if cursor.set_range(prefix):
+            for key, value in cursor:
+                if not key.startswith(prefix):
+                    break
+                tx_ids.append(bytes(value).decode("utf-8"))
+        return tx_ids
+
+    def get_transactions_by_block(self, block: Union[str, int]) -> List[Dict[str, Any]]:
         """
-        Retrieve all transactions associated with a specific block hash.
+        Retrieve all transactions of a block, in block order, without decoding the block body.
 
         Args:
-            block_hash (str): The hash of the block to retrieve transactions for.
+            block: Block hash (str) or block height (int).
 
         Returns:
-            List of transaction dictionaries.
+            List of transaction dictionaries (`block_tx:{tx_id}` records).
         """
         transactions = []
         try:
-            prefix = f"block_tx:{block_hash}:".encode("utf-8")
-
-            with self.txindex_db.env.begin() as txn:
-                cursor = txn.cursor()
-                for key, value in cursor:
-                    if key.startswith(prefix):
-                        try:
-                            tx_data = json.loads(value.decode("utf-8"))
-                            transactions.append(tx_data)
-                        except Exception as e:
-                            print(f"[TxStorage.get_transactions_by_block] ⚠️ Failed to decode tx: {e}")
-            print(f"[TxStorage.get_transactions_by_block] ✅ Retrieved {len(transactions)} transactions for block {block_hash[:12]}...")
+            with self.txindex_db.begin() as txn:
+                for tx_id in self.get_block_tx_ids(block, txn):
+                    value = txn.get(f"block_tx:{tx_id}".encode("utf-8"))
+                    if value is None:
+                        print(f"[TxStorage.get_transactions_by_block] ⚠️ Indexed TX {tx_id} has no record.")
+                        continue
+                    try:
+                        transactions.append(json.loads(bytes(value).decode("utf-8")))
+                    except Exception as e:
+                        print(f"[TxStorage.get_transactions_by_block] ⚠️ Failed to decode tx: {e}")
+            print(f"[TxStorage.get_transactions_by_block] ✅ Retrieved {len(transactions)} transactions for block {str(block)[:12]}...")
             return transactions
 
         except Exception as e:
-            print(f"[TxStorage.get_transactions_by_block] ❌ ERROR: Could not retrieve transactions for block {block_hash}: {e}")
+            print(f"[TxStorage.get_transactions_by_block] ❌ ERROR: Could not retrieve transactions for block {block}: {e}")
             return []
 
+    def stage_block_index(self, txn, block_hash: str, tx_ids: List[str], block_height: Optional[int] = None,
+                          positions: Optional[List[int]] = None) -> None:
+        """
+        Write the block → tx index entries for a block into an open (or staged) write transaction.
+        `positions` gives each transaction's index in `block.transactions` (defaults to list order).
+        """
+        if positions is None:
+            positions = range(len(tx_ids))
+        for position, tx_id in zip(positions, tx_ids):
+            txn.put(self._block_txs_key(block_hash, position), tx_id.encode("utf-8"))
+        if block_height is not None:
+            txn.put(self._block_hash_at_key(block_height), block_hash.encode("utf-8"))
+
+    def block_tx_index_built(self) -> bool:
+        """
+        True once the block → tx index covers every stored block (new blocks are indexed as they commit).
+        """
+        try:
+            with self.txindex_db.begin() as txn:
+                return txn.get(self.BLOCK_TX_INDEX_MARKER) is not None
+        except Exception as e:
+            print(f"[TxStorage.block_tx_index_built] ❌ ERROR: Could not read index marker: {e}")
+            return False
 
+    def rebuild_block_tx_index(self, blocks: Iterable[Dict]) -> int:
+        """
+        Rebuild the block → tx index from stored block bodies (e.g. `BlockStorage.iter_blocks()`),
+        replacing any existing `block_txs:` / `block_hash_at:` entries.
 
+        Args:
+            blocks: Block dictionaries with `hash`, `header.index` and `transactions`, in height order.
 
+        Returns:
+            int: Number of blocks indexed.
+        """
+        try:
+            print("[TxStorage.rebuild_block_tx_index] INFO: Rebuilding block → transaction index...")
+            entries = []
+            needed_bytes = 0
+            for block_dict in blocks:
+                header = block_dict.get("header", block_dict)
+                block_hash = block_dict.get("hash") or header.get("hash")
+                if not block_hash:
+                    print(f"[TxStorage.rebuild_block_tx_index] ⚠️ WARNING: Block {header.get('index')} has no stored hash. Skipping.")
+                    continue
+
+                tx_ids, positions = [], []
+                for position, tx in enumerate(block_dict.get("transactions", [])):
+                    tx_id = tx.get("tx_id") if isinstance(tx, dict) else getattr(tx, "tx_id", None)
+                    if isinstance(tx_id, bytes):
+                        tx_id = tx_id.hex()
+                    if not tx_id:
+                        continue
+                    tx_ids.append(tx_id)
+                    positions.append(position)
+                    needed_bytes += len(block_hash) + len(tx_id) + 32
+
+                entries.append((block_hash, int(header.get("index", block_dict.get("index", 0))), tx_ids, positions))
+
+            with self.txindex_db.begin(write=True, needed_bytes=needed_bytes) as txn:
+                cursor = txn.cursor()
+                for prefix in (self.BLOCK_TXS_PREFIX.encode("utf-8"), self.BLOCK_HASH_AT_PREFIX.encode("utf-8")):
+                    if cursor.set_range(prefix):
+                        while cursor.key().startswith(prefix):
+                            if not cursor.delete():
+                                break
+
+                for block_hash, height, tx_ids, positions in entries:
+                    self.stage_block_index(txn, block_hash, tx_ids, height, positions)
+                txn.put(self.BLOCK_TX_INDEX_MARKER, b"1")
+
+            print(f"[TxStorage.rebuild_block_tx_index] ✅ SUCCESS: Indexed transactions of {len(entries)} blocks.")
+            return len(entries)
+
+        except Exception as e:
+            print(f"[TxStorage.rebuild_block_tx_index] ❌ ERROR: Failed to rebuild block → transaction index: {e}")
+            return 0
+
+
+    def _build_transaction_record(
+        self, tx_id: str, block_hash: str, tx_data: dict, outputs: List[Dict], timestamp: int
+    ) -> Optional[Dict]:
+        """
+        Validate the inputs and build the `block_tx:{tx_id}` record (type and fee breakdown).
+        The caller fills in `tx_signature_hash`. Returns None if the transaction cannot be stored.
+        """
+        if not isinstance(tx_data, dict):
+            print(f"[TxStorage.store_transaction] ERROR: Transaction data must be a dictionary.")
+            return None
+
+        if not outputs or not all(isinstance(o, dict) for o in outputs):
+            print(f"[TxStorage.store_transaction] ERROR: Outputs must be a list of dictionaries.")
+            return None
+
+        if not isinstance(timestamp, int) or not isinstance(tx_id, str) or not isinstance(block_hash, str):
+            print(f"[TxStorage.store_transaction] ERROR: Invalid transaction parameters.")
+            return None
+
+        if not hasattr(self, "fee_model") or not self.fee_model:
+            print(f"[TxStorage.store_transaction] ERROR: FeeModel is missing.")
+            return None
+
+        # Use helper for transaction type detection
+        tx_type_enum = self._detect_transaction_type(tx_data)
+        tx_type = tx_type_enum.name if hasattr(tx_type_enum, "name") else str(tx_type_enum)
+        print(f"[TxStorage.store_transaction] INFO: Detected transaction type: {tx_type}")
+
+        # Fee calculation
+        if tx_type == "COINBASE":
+            tax_fee = miner_fee = Decimal("0.00")
+        else:
+            try:
+                total_output_amount = sum(Decimal(str(out["amount"])) for out in outputs)
+                fee_details = self.fee_model.calculate_fee_and_tax(
+                    block_size=1,
+                    payment_type=tx_type,
+                    amount=total_output_amount,
+                    tx_size=tx_data.get("size", 250)
+                )
+
+                tax_fee = Decimal(str(fee_details.get("tax_fee", Constants.MIN_TRANSACTION_FEE)))
+                miner_fee = Decimal(str(fee_details.get("miner_fee", Constants.MIN_TRANSACTION_FEE)))
+
+                print(f"[TxStorage.store_transaction] INFO: Fee Breakdown - Tax Fee: {tax_fee}, Miner Fee: {miner_fee}")
+            except Exception as fee_error:
+                print(f"[TxStorage.store_transaction] ERROR: Fee calculation failed - {fee_error}")
+                return None
+
+        return {
+            "tx_id": tx_id,
+            "block_hash": block_hash,
+            "data": tx_data,
+            "outputs": outputs,
+            "timestamp": timestamp,
+            "type": tx_type,
+            "tax_fee": str(tax_fee),
+            "miner_fee": str(miner_fee),
+            "tx_signature_hash": None
+        }
+
+    def stage_transactions(self, txn, block_hash: str, timestamp: int, transactions: List[Tuple[Dict, bytes]],
+                           block_height: Optional[int] = None, index_block: bool = True,
+                           positions: Optional[List[int]] = None) -> int:
+        """
+        Write a block's transaction records and salted Falcon signatures into an open (or staged)
+        `txindex.lmdb` write transaction, so all of a block's transactions commit together.
+        Signatures are written as one `SignatureStore.put_many` batch, and the block → tx
+        index (`stage_block_index`) is written in the same transaction.
+
+        Args:
+            transactions: (transaction dictionary with hex `tx_id` and `outputs`, Falcon signature) pairs,
+                in block order.
+            block_height: Height of the block, to make it addressable by height as well as hash.
+            index_block: False when `transactions` is not the block's full list (no position index).
+            positions: Index of each entry in `block.transactions`, when some were dropped before
+                staging. Defaults to the order of `transactions`.
+
+        Returns:
+            int: Number of transactions staged.
+        """
+        if positions is None:
+            positions = range(len(transactions))
+
+        records = []
+        signatures = []
+        for position, (tx_dict, falcon_signature) in zip(positions, transactions):
+            tx_id = tx_dict.get("tx_id")
+            try:
+                if isinstance(tx_id, bytes):
+                    tx_id = tx_id.hex()
+
+                transaction_data = self._build_transaction_record(
+                    tx_id, block_hash, tx_dict, tx_dict.get("outputs", []), timestamp
+                )
+                if transaction_data is None:
+                    print(f"[TxStorage.stage_transactions] ⚠️ TX indexing skipped for {tx_id}")
+                    continue
+
+                records.append((tx_id, transaction_data, position))
+                signatures.append((tx_id, falcon_signature or b""))
+            except Exception as e:
+                print(f"[TxStorage.stage_transactions] ❌ EXCEPTION: Failed to stage transaction {tx_id}: {e}")
+
+        signature_hashes = self.signature_store.put_many(signatures, txn=txn)
+        for tx_id, transaction_data, _ in records:
+            transaction_data["tx_signature_hash"] = signature_hashes[tx_id.encode()].hex()
+            txn.put(f"block_tx:{tx_id}".encode(), json.dumps(transaction_data).encode())
+        if index_block:
+            self.stage_block_index(
+                txn, block_hash, [tx_id for tx_id, _, _ in records], block_height,
+                [position for _, _, position in records]
+            )
+
+        return len(records)
+
+    def stage_transaction(
+        self, txn, tx_id: Union[str, bytes], block_hash: str, tx_data: dict, outputs: List[Dict], timestamp: int,
+        falcon_signature: bytes = b""
+    ) -> bool:
+        """
+        Stage a single transaction (see `stage_transactions`).
+        """
+        tx_dict = dict(tx_data, tx_id=tx_id.hex() if isinstance(tx_id, bytes) else tx_id, outputs=outputs)
+        return self.stage_transactions(txn, block_hash, timestamp, [(tx_dict, falcon_signature)], index_block=False) == 1
 
     def store_transaction(
         self, tx_id: Union[str, bytes], block_hash: str, tx_data: dict, outputs: List[Dict], timestamp: int,
@@ -227,74 +474,21 @@ class TxStorage:
 
             print(f"[TxStorage.store_transaction] INFO: Storing transaction {tx_id} for block {block_hash}...")
 
-            if not isinstance(tx_data, dict):
-                print(f"[TxStorage.store_transaction] ERROR: Transaction data must be a dictionary.")
-                return
-
-            if not outputs or not all(isinstance(o, dict) for o in outputs):
-                print(f"[TxStorage.store_transaction] ERROR: Outputs must be a list of dictionaries.")
+            transaction_data = self._build_transaction_record(tx_id, block_hash, tx_data, outputs, timestamp)
+            if transaction_data is None:
                 return
 
-            if not isinstance(timestamp, int) or not isinstance(tx_id, str) or not isinstance(block_hash, str):
-                print(f"[TxStorage.store_transaction] ERROR: Invalid transaction parameters.")
-                return
-
-            if not hasattr(self, "fee_model") or not self.fee_model:
-                print(f"[TxStorage.store_transaction] ERROR: FeeModel is missing.")
-                return
-
-            # Use helper for transaction type detection
-            tx_type_enum = self._detect_transaction_type(tx_data)
-            tx_type = tx_type_enum.name if hasattr(tx_type_enum, "name") else str(tx_type_enum)
-            print(f"[TxStorage.store_transaction] INFO: Detected transaction type: {tx_type}")
-
-            # Fee calculation
-            if tx_type == "COINBASE":
-                tax_fee = miner_fee = Decimal("0.00")
-            else:
-                try:
-                    total_output_amount = sum(Decimal(str(out["amount"])) for out in outputs)
-                    fee_details = self.fee_model.calculate_fee_and_tax(
-                        block_size=1,
-                        payment_type=tx_type,
-                        amount=total_output_amount,
-                        tx_size=tx_data.get("size", 250)
-                    )
-
-                    tax_fee = Decimal(str(fee_details.get("tax_fee", Constants.MIN_TRANSACTION_FEE)))
-                    miner_fee = Decimal(str(fee_details.get("miner_fee", Constants.MIN_TRANSACTION_FEE)))
-
-                    print(f"[TxStorage.store_transaction] INFO: Fee Breakdown - Tax Fee: {tax_fee}, Miner Fee: {miner_fee}")
-                except Exception as fee_error:
-                    print(f"[TxStorage.store_transaction] ERROR: Fee calculation failed - {fee_error}")
-                    return
-
             # Store Falcon Signature Hash
             try:
-                txindex_path = Constants.get_db_path("txindex")
-                hashed_signature = store_transaction_signature(
-                    tx_id=tx_id.encode(),
-                    falcon_signature=falcon_signature,
-                    txindex_path=txindex_path
-                )
+                hashed_signature = self.signature_store.put(tx_id, falcon_signature)
             except Exception as sig_error:
                 print(f"[TxStorage.store_transaction] WARNING: Failed to hash/store Falcon signature: {sig_error}")
                 hashed_signature = b"\x00" * 48  # Fallback empty hash
 
-            transaction_data = {
-                "tx_id": tx_id,
-                "block_hash": block_hash,
-                "data": tx_data,
-                "outputs": outputs,
-                "timestamp": timestamp,
-                "type": tx_type,
-                "tax_fee": str(tax_fee),
-                "miner_fee": str(miner_fee),
-                "tx_signature_hash": hashed_signature.hex()
-            }
+            transaction_data["tx_signature_hash"] = hashed_signature.hex()
 
             try:
-                with self.txindex_db.env.begin(write=True) as txn:
+                with self.txindex_db.begin(write=True) as txn:
                     txn.put(f"block_tx:{tx_id}".encode(), json.dumps(transaction_data).encode())
                 print(f"[TxStorage.store_transaction] ✅ SUCCESS: Stored transaction {tx_id}.")
             except Exception as lmdb_error:
@@ -305,7 +499,7 @@ class TxStorage:
                 try:
                     if hasattr(self.txindex_db, "reopen"):
                         self.txindex_db.reopen()
-                    with self.txindex_db.env.begin(write=True) as txn:
+                    with self.txindex_db.begin(write=True) as txn:
                         txn.put(f"block_tx:{tx_id}".encode(), json.dumps(transaction_data).encode())
                     print(f"[TxStorage.store_transaction] ✅ SUCCESS after retry: Stored transaction {tx_id}.")
                 except Exception as retry_error:
@@ -364,9 +558,7 @@ class TxStorage:
             from Zyiron_Chain.transactions.tx import Transaction
 
             fallback_storage = BlockStorage(tx_storage=self, key_manager=KeyManager())
-            all_blocks = fallback_storage.get_all_blocks()
-
-            for block_dict in all_blocks:
+            for block_dict in fallback_storage.iter_blocks():
                 transactions = block_dict.get("transactions", [])
                 for tx in transactions:
                     if isinstance(tx, dict):
@@ -391,11 +583,7 @@ class TxStorage:
                             falcon_sig = b""
 
                     # Store Falcon-512 signature
-                    tx_sig_hash = store_transaction_signature(
-                        tx_id=tx_id.encode(),
-                        falcon_signature=falcon_sig,
-                        txindex_path=Constants.get_db_path("txindex")
-                    )
+                    tx_sig_hash = self.signature_store.put(tx_id, falcon_sig)
 
                     # Reconstruct transaction object
                     if tx_dict.get("type") == "COINBASE":
@@ -417,7 +605,7 @@ class TxStorage:
 
                     # Reinserting into txindex.lmdb
                     try:
-                        with self.txindex_db.env.begin(write=True) as txn:
+                        with self.txindex_db.begin(write=True) as txn:
                             txn.put(key, json.dumps(transaction_data).encode("utf-8"))
                         print(f"[TxStorage.get_transaction] ✅ Reinjected TX {tx_id} into txindex.lmdb from full block store.")
                     except Exception as lmdb_error:
@@ -445,7 +633,7 @@ class TxStorage:
             print("[TxStorage.get_all_transactions] INFO: Scanning txindex.lmdb for all transactions...")
 
             # Step 1: Load from txindex.lmdb
-            with self.txindex_db.env.begin() as txn:
+            with self.txindex_db.begin() as txn:
                 cursor = txn.cursor()
                 for key_bytes, value_bytes in cursor:
                     try:
@@ -470,10 +658,9 @@ class TxStorage:
             from Zyiron_Chain.storage.block_storage import BlockStorage
             fallback_store = BlockStorage(self, self.fee_model.key_manager)  # Pass required args
 
-            all_blocks = fallback_store.get_all_blocks()
-            print(f"[TxStorage.get_all_transactions] INFO: Scanning {len(all_blocks)} blocks from full_block_chain for missing TXs...")
+            print(f"[TxStorage.get_all_transactions] INFO: Scanning full_block_chain for missing TXs...")
 
-            for block in all_blocks:
+            for block in fallback_store.iter_blocks():
                 block_txns = block.get("transactions", []) if isinstance(block, dict) else getattr(block, "transactions", [])
 
                 for tx in block_txns:
@@ -484,11 +671,7 @@ class TxStorage:
 
                     # Fallback reindex
                     falcon_sig = getattr(tx, "falcon_signature", b"")
-                    sig_hash = store_transaction_signature(
-                        tx_id=tx_id.encode(),
-                        falcon_signature=falcon_sig,
-                        txindex_path=Constants.get_db_path("txindex")
-                    )
+                    sig_hash = self.signature_store.put(tx_id, falcon_sig)
 
                     transaction_data = {
                         "tx_id": tx_id,
@@ -502,7 +685,7 @@ class TxStorage:
                         "tx_signature_hash": sig_hash.hex()
                     }
 
-                    with self.txindex_db.env.begin(write=True) as txn:
+                    with self.txindex_db.begin(write=True) as txn:
                         txn.put(f"block_tx:{tx_id}".encode(), json.dumps(transaction_data).encode())
 
                     transactions[tx_id] = transaction_data
@@ -23,6 +23,7 @@ from Zyiron_Chain.storage.lmdatabase import LMDBManager
 from Zyiron_Chain.transactions.txout import TransactionOut
 from Zyiron_Chain.utils.hashing import Hashing
 from Zyiron_Chain.utils.deserializer import Deserializer
+from Zyiron_Chain.utils.utxo_codec import UTXOCodec
 from Zyiron_Chain.blockchain.block import Block
 
 from decimal import Decimal, InvalidOperation
@@ -92,6 +93,10 @@ class UTXOStorage:
             self._cache: Dict[str, dict] = {}
             self._db_lock = threading.Lock()
 
+            # ✅ Address index sub-database: `address|tx_id|output_index` → `utxo:{tx_id}:{output_index}`
+            self.address_index_db = self.utxo_db.env.open_db(b"utxo_by_address")
+            self._ensure_address_index()
+
             print(f"[UTXOStorage.__init__] ✅ Initialized for {network_flag}")
             print(f"[UTXOStorage.__init__] INFO: UTXO DB Path: {utxo_db_path}")
             print(f"[UTXOStorage.__init__] INFO: UTXO History DB Path: {utxo_history_db_path}")
@@ -110,6 +115,149 @@ class UTXOStorage:
     def env(self):
         return self.utxo_db.env  # ✅ gives access to LMDB env from outside
 
+    @staticmethod
+    def _address_index_key(address: str, tx_id: str, output_index: int) -> bytes:
+        """
+        Build the address index key: `address|tx_id|output_index`.
+        """
+        return f"{address}|{tx_id}|{output_index}".encode("utf-8")
+
+    def _add_address_index(self, txn, utxo_data: Dict) -> None:
+        """
+        Add an address index entry for an unspent UTXO inside an open write transaction.
+        """
+        address = utxo_data.get("script_pub_key")
+        tx_id = utxo_data.get("tx_id")
+        output_index = utxo_data.get("output_index")
+        if not address or not tx_id or output_index is None:
+            return
+
+        txn.put(
+            self._address_index_key(address, tx_id, output_index),
+            f"utxo:{tx_id}:{output_index}".encode("utf-8"),
+            db=self.address_index_db
+        )
+
+    def _remove_address_index(self, txn, utxo_data: Dict) -> None:
+        """
+        Remove the address index entry for a UTXO inside an open write transaction.
+        """
+        address = utxo_data.get("script_pub_key")
+        tx_id = utxo_data.get("tx_id")
+        output_index = utxo_data.get("output_index")
+        if not address or not tx_id or output_index is None:
+            return
+
+        txn.delete(self._address_index_key(address, tx_id, output_index), db=self.address_index_db)
+
+    def _ensure_address_index(self) -> None:
+        """
+        Build the address index once for UTXO databases created before it existed.
+        """
+        with self.utxo_db.begin() as txn:
+            if txn.get(b"__address_index_built__", db=self.address_index_db):
+                return
+
+        print("[UTXOStorage._ensure_address_index] ⚠️ WARNING: Address index missing. Building from UTXO set...")
+        self.rebuild_address_index()
+
+    def rebuild_address_index(self) -> int:
+        """
+        Rebuild the address index from the `utxo:` keyspace in a single cursor pass.
+
+        Returns:
+            int: Number of unspent UTXOs indexed.
+        """
+        try:
+            indexed = 0
+            with self._db_lock:
+                with self.utxo_db.begin(write=True) as txn:
+                    txn.drop(self.address_index_db, delete=False)
+
+                    cursor = txn.cursor()
+                    if cursor.set_range(b"utxo:"):
+                        for key_bytes, value_raw in cursor:
+                            if not key_bytes.startswith(b"utxo:"):
+                                break
+                            try:
+                                utxo = UTXOCodec.decode(value_raw)
+                                if not isinstance(utxo, dict) or utxo.get("spent_status", False):
+                                    continue
+                                self._add_address_index(txn, utxo)
+                                indexed += 1
+                            except Exception as decode_err:
+                                print(f"[UTXOStorage.rebuild_address_index] ⚠️ Skipping invalid entry {key_bytes[:64]}: {decode_err}")
+                                continue
+
+                    txn.put(b"__address_index_built__", b"1", db=self.address_index_db)
+
+            print(f"[UTXOStorage.rebuild_address_index] ✅ SUCCESS: Indexed {indexed} unspent UTXOs by address.")
+            return indexed
+
+        except Exception as e:
+            print(f"[UTXOStorage.rebuild_address_index] ❌ ERROR: Failed to rebuild address index: {e}")
+            return 0
+
+    def migrate_to_binary_records(self, batch_size: int = 10000) -> int:
+        """
+        Convert legacy JSON UTXO records to the binary `UTXOCodec` format in place.
+        Runs in batches of `batch_size` records per write transaction so large sets
+        do not hold one long-lived writer. Safe to re-run; binary records are skipped.
+
+        Returns:
+            int: Number of records converted.
+        """
+        try:
+            converted = 0
+            resume_key = b"utxo:"
+
+            while True:
+                batch_converted = 0
+                with self._db_lock:
+                    with self.utxo_db.begin(write=True) as txn:
+                        cursor = txn.cursor()
+                        if not cursor.set_range(resume_key):
+                            break
+
+                        for key_bytes, value_raw in cursor:
+                            if not key_bytes.startswith(b"utxo:"):
+                                resume_key = None
+                                break
+
+                            resume_key = bytes(key_bytes)
+                            if UTXOCodec.is_binary(value_raw):
+                                continue
+
+                            try:
+                                encoded = UTXOCodec.encode(UTXOCodec.decode(value_raw))
+                            except Exception as decode_err:
+                                print(f"[UTXOStorage.migrate_to_binary_records] ⚠️ Skipping invalid entry {key_bytes[:64]}: {decode_err}")
+                                continue
+
+                            if UTXOCodec.is_binary(encoded):
+                                cursor.put(resume_key, encoded)
+                                batch_converted += 1
+
+                            if batch_converted >= batch_size:
+                                break
+                        else:
+                            resume_key = None
+
+                converted += batch_converted
+                print(f"[UTXOStorage.migrate_to_binary_records] INFO: Converted {converted} UTXO records so far...")
+
+                if resume_key is None or batch_converted < batch_size:
+                    break
+                resume_key += b"\x00"  # ✅ Resume strictly after the last processed key
+
+            self._cache.clear()
+            print(f"[UTXOStorage.migrate_to_binary_records] ✅ SUCCESS: Converted {converted} UTXO records to binary format.")
+            return converted
+
+        except Exception as e:
+            print(f"[UTXOStorage.migrate_to_binary_records] ❌ ERROR: Migration failed: {e}")
+            return 0
+
     def validate_utxos(self, transactions: Union[List[Dict], Block]) -> bool:
         """
         Validate that all transactions reference valid, unspent UTXOs.
@@ -204,21 +352,22 @@ class UTXOStorage:
             raise
 
 
-    def _serialize_utxo(tx_id: str, output_index: int, amount: Decimal, script_pub_key: str, is_locked: bool, block_height: int, spent_status: bool) -> Dict:
+    @staticmethod
+    def _serialize_utxo(tx_id: str, output_index: int, amount: Decimal, script_pub_key: str, is_locked: bool, block_height: int, spent_status: bool) -> bytes:
         """
-        Serializes a UTXO into dictionary format for LMDB storage.
+        Serializes a UTXO into the binary record format for LMDB storage (see `UTXOCodec`).
 
         Fields:
             - tx_id (str)            → SHA3-384 transaction hash (hex)
             - output_index (int)      → Output index of the UTXO
-            - amount (Decimal)        → Amount stored with standardized precision
+            - amount (Decimal)        → Amount, stored as integer base units
             - script_pub_key (str)    → Locking script as a string
             - is_locked (bool)        → Lock status (True = Locked, False = Unlocked)
             - block_height (int)      → Block height where the UTXO was created
             - spent_status (bool)     → Spent status (True = Spent, False = Unspent)
 
         Returns:
-            - Dictionary representing the serialized UTXO
+            - Encoded UTXO record bytes
         """
         try:
             if not isinstance(tx_id, str) or len(tx_id) != 96:
@@ -233,33 +382,29 @@ class UTXOStorage:
             utxo_data = {
                 "tx_id": tx_id,
                 "output_index": output_index,
-                "amount": str(amount),  # Store amount as a string for precision
+                "amount": str(amount),
                 "script_pub_key": script_pub_key,
-                "is_locked": is_locked,  # Old key for backward compatibility
-                "locked": is_locked,     # New key for TransactionOut compatibility
+                "is_locked": is_locked,
                 "block_height": block_height,
                 "spent_status": spent_status
             }
 
-            print(f"[UTXOStorage._serialize_utxo] INFO: Serialized UTXO {tx_id} at index {output_index}.")
-            return utxo_data
+            return UTXOCodec.encode(utxo_data)
 
         except Exception as e:
             print(f"[UTXOStorage._serialize_utxo] ERROR: Failed to serialize UTXO: {e}")
             raise
 
-    def _deserialize_utxo(utxo_data: str) -> dict:
+    @staticmethod
+    def _deserialize_utxo(utxo_data: Union[bytes, memoryview, str]) -> dict:
         """
-        Deserializes a UTXO from a JSON string back into a dictionary.
+        Deserializes a stored UTXO record (binary or legacy JSON) into a dictionary.
 
         Returns:
             - Dictionary with UTXO fields.
         """
         try:
-            if not isinstance(utxo_data, str):
-                raise ValueError(f"[UTXOStorage._deserialize_utxo] ERROR: Expected a JSON string, got {type(utxo_data)}.")
-
-            utxo_dict = json.loads(utxo_data)
+            utxo_dict = UTXOCodec.decode(utxo_data)
 
             # Backward compatible field checking
             required_fields = {"tx_id", "output_index", "amount", "script_pub_key", "block_height", "spent_status"}
@@ -275,7 +420,7 @@ class UTXOStorage:
                 raise ValueError("[UTXOStorage._deserialize_utxo] ERROR: Missing lock status field (neither 'locked' nor 'is_locked' found)")
 
             # Ensure all keys are present in the returned dict
-            utxo_dict = {
+            return {
                 "tx_id": utxo_dict["tx_id"],
                 "output_index": utxo_dict["output_index"],
                 "amount": Decimal(utxo_dict["amount"]),  # Ensure precision for stored amounts
@@ -285,16 +430,10 @@ class UTXOStorage:
                 "spent_status": utxo_dict["spent_status"]
             }
 
-            print(f"[UTXOStorage._deserialize_utxo] INFO: Deserialized UTXO {utxo_dict['tx_id']} at index {utxo_dict['output_index']}.")
-            return utxo_dict
-
-        except json.JSONDecodeError as e:
-            print(f"[UTXOStorage._deserialize_utxo] ERROR: JSON decoding failed: {e}")
-            return {}
-
-        except Exception as e:
+        except (ValueError, struct.error) as e:
             print(f"[UTXOStorage._deserialize_utxo] ERROR: Failed to deserialize UTXO: {e}")
             return {}
+
     def store_utxo(self, tx_id: str, output_index: int, amount: Decimal, script_pub_key: str, is_locked: bool, block_height: int) -> bool:
         """
         Stores a UTXO in `utxo.lmdb` with full fallback validation, key standardization, and duplicate protection.
@@ -341,15 +480,16 @@ class UTXOStorage:
                 "spent_status": False  # Always unspent at creation
             }
 
-            serialized = json.dumps(utxo_data, sort_keys=True).encode("utf-8")
+            serialized = UTXOCodec.encode(utxo_data)
 
-            with self.utxo_db.env.begin(write=True) as txn:
+            with self.utxo_db.begin(write=True) as txn:
                 # ✅ Check for existing entry before overwrite
                 if txn.get(utxo_key):
                     print(f"[UTXOStorage.store_utxo] ⚠️ WARNING: UTXO {tx_id}:{output_index} already exists. Skipping storage.")
                     return False
 
                 txn.put(utxo_key, serialized)
+                self._add_address_index(txn, utxo_data)
 
             print(f"[UTXOStorage.store_utxo] ✅ SUCCESS: Stored UTXO {tx_id}:{output_index} for {amount} ZYC.")
             return True
@@ -360,7 +500,7 @@ class UTXOStorage:
 
 
 
-    def get_utxo(self, tx_id: str, output_index: int) -> Optional[Dict]:
+    def get_utxo(self, tx_id: str, output_index: int, use_cache: bool = True) -> Optional[Dict]:
         """
         Retrieve a UTXO from LMDB.
         Checks internal cache first, then queries the LMDB database.
@@ -368,6 +508,7 @@ class UTXOStorage:
         Args:
             tx_id (str): Transaction ID (SHA3-384 hash as a hex string).
             output_index (int): Output index.
+            use_cache (bool): Set False to re-read LMDB (e.g. to see outputs spent by another instance).
 
         Returns:
             Optional[Dict]: UTXO data if found, otherwise None.
@@ -382,25 +523,25 @@ class UTXOStorage:
             utxo_key = f"utxo:{tx_id}:{output_index}"
 
             # ✅ Check in-memory cache
-            if utxo_key in self._cache:
+            if use_cache and utxo_key in self._cache:
                 print(f"[UTXOStorage.get_utxo] ✅ Retrieved {utxo_key} from cache.")
                 return self._cache[utxo_key]
 
             # ✅ Thread-safe access to LMDB
             with self._db_lock:
-                with self.utxo_db.env.begin(write=False) as txn:
+                with self.utxo_db.begin(write=False) as txn:
                     raw_value = txn.get(utxo_key.encode("utf-8"))
                     if not raw_value:
                         print(f"[UTXOStorage.get_utxo] ⚠️ UTXO {utxo_key} not found in LMDB.")
                         return None
 
                     try:
-                        utxo_dict = json.loads(raw_value.decode("utf-8"))
+                        utxo_dict = UTXOCodec.decode(raw_value)
                         self._cache[utxo_key] = utxo_dict  # Cache it
                         print(f"[UTXOStorage.get_utxo] ✅ Retrieved {utxo_key} from LMDB and cached.")
                         return utxo_dict
-                    except json.JSONDecodeError as json_err:
-                        print(f"[UTXOStorage.get_utxo] ❌ JSON decode error for {utxo_key}: {json_err}")
+                    except (ValueError, struct.error) as decode_err:
+                        print(f"[UTXOStorage.get_utxo] ❌ Decode error for {utxo_key}: {decode_err}")
                         return None
 
         except Exception as e:
@@ -443,7 +584,7 @@ class UTXOStorage:
         """
         results = []
         try:
-            with self.utxo_db.env.begin() as txn:
+            with self.utxo_db.begin() as txn:
                 cursor = txn.cursor()
                 for key_bytes, value_bytes in cursor:
                     key_str = key_bytes.decode("utf-8", errors="ignore")
@@ -451,8 +592,7 @@ class UTXOStorage:
                         continue
 
                     try:
-                        data = value_bytes.tobytes() if isinstance(value_bytes, memoryview) else value_bytes
-                        utxo_dict = json.loads(data.decode("utf-8"))
+                        utxo_dict = UTXOCodec.decode(value_bytes)
                         results.append(utxo_dict)
                     except Exception as decode_err:
                         print(f"[get_all_utxos] ⚠️ Skipping invalid entry {key_str}: {decode_err}")
@@ -466,7 +606,7 @@ class UTXOStorage:
             return []
 
 
-    def update_utxos(self, block) -> None:
+    def update_utxos(self, block) -> bool:
         """
         Update UTXO databases (`utxo.lmdb` & `utxo_history.lmdb`) for the given block.
         """
@@ -483,87 +623,97 @@ class UTXOStorage:
                 self.utxo_history_db.reopen()
 
             with self._db_lock:
-                with self.utxo_db.env.begin(write=True) as utxo_txn, \
-                    self.utxo_history_db.env.begin(write=True) as history_txn:
+                with self.utxo_db.begin(write=True) as utxo_txn, \
+                    self.utxo_history_db.begin(write=True) as history_txn:
+                    self.apply_block_in_txn(block, utxo_txn, history_txn)
 
-                    # ✅ Step 1: Archive and remove spent UTXOs
-                    for tx in block.transactions:
-                        inputs = tx.get("inputs", []) if isinstance(tx, dict) else getattr(tx, "inputs", [])
+            # ✅ Step 3: Fallback UTXO Integrity Check (reads the committed UTXO set)
+            self._verify_utxo_integrity(block)
 
-                        for tx_input in inputs:
-                            input_tx_id = tx_input.get("tx_id") if isinstance(tx_input, dict) else getattr(tx_input, "tx_id", None)
-                            input_index = tx_input.get("output_index") if isinstance(tx_input, dict) else getattr(tx_input, "output_index", None)
+            print(f"[UTXOStorage.update_utxos] ✅ SUCCESS: All UTXOs updated for Block {block.index}.")
+            return True
 
-                            if not input_tx_id or input_index is None:
-                                print("[UTXOStorage.update_utxos] ⚠️ WARNING: Invalid TX input format. Skipping.")
-                                continue
+        except Exception as e:
+            print(f"[UTXOStorage.update_utxos] ❌ ERROR: Failed to update UTXOs for block {getattr(block, 'index', '?')}: {e}")
+            raise
 
-                            utxo_key = f"utxo:{input_tx_id}:{input_index}".encode()
-                            spent_utxo = utxo_txn.get(utxo_key)
+    def apply_block_in_txn(self, block, utxo_txn, history_txn) -> None:
+        """
+        Archive the UTXOs spent by `block` and register the ones it creates, inside already-open
+        (or staged) write transactions on `utxo.lmdb` and `utxo_history.lmdb`.
+        The caller owns the transactions and `self._db_lock`.
+        """
+        # ✅ Step 1: Archive and remove spent UTXOs
+        for tx in block.transactions:
+            inputs = tx.get("inputs", []) if isinstance(tx, dict) else getattr(tx, "inputs", [])
 
-                            if spent_utxo:
-                                history_key = f"spent_utxo:{input_tx_id}:{input_index}:{block.timestamp}".encode()
-                                history_txn.put(history_key, spent_utxo)
-                                utxo_txn.delete(utxo_key)
-                                print(f"[UTXOStorage.update_utxos] ✅ Archived and removed spent UTXO: {input_tx_id}:{input_index}")
-                            else:
-                                print(f"[UTXOStorage.update_utxos] ⚠️ Spent UTXO not found: {input_tx_id}:{input_index}")
+            for tx_input in inputs:
+                input_tx_id = tx_input.get("tx_id") if isinstance(tx_input, dict) else getattr(tx_input, "tx_id", None)
+                input_index = tx_input.get("output_index") if isinstance(tx_input, dict) else getattr(tx_input, "output_index", None)
 
-                    # ✅ Step 2: Register new UTXOs
-                    for tx in block.transactions:
-                        tx_id = tx.get("tx_id") if isinstance(tx, dict) else getattr(tx, "tx_id", None)
-                        outputs = tx.get("outputs", []) if isinstance(tx, dict) else getattr(tx, "outputs", [])
+                if not input_tx_id or input_index is None:
+                    print("[UTXOStorage.update_utxos] ⚠️ WARNING: Invalid TX input format. Skipping.")
+                    continue
 
-                        if not tx_id:
-                            print(f"[UTXOStorage.update_utxos] ⚠️ WARNING: Transaction missing tx_id. Skipping.")
-                            continue
+                utxo_key = f"utxo:{input_tx_id}:{input_index}".encode()
+                spent_utxo = utxo_txn.get(utxo_key)
 
-                        is_coinbase = isinstance(tx, CoinbaseTx) or (isinstance(tx, dict) and tx.get("type") == "COINBASE")
+                if spent_utxo:
+                    history_key = f"spent_utxo:{input_tx_id}:{input_index}:{block.timestamp}".encode()
+                    history_txn.put(history_key, spent_utxo)
+                    utxo_txn.delete(utxo_key)
+                    self._remove_address_index(utxo_txn, UTXOCodec.decode(spent_utxo))
+                    print(f"[UTXOStorage.update_utxos] ✅ Archived and removed spent UTXO: {input_tx_id}:{input_index}")
+                else:
+                    print(f"[UTXOStorage.update_utxos] ⚠️ Spent UTXO not found: {input_tx_id}:{input_index}")
 
-                        for idx, output in enumerate(outputs):
-                            try:
-                                # Convert output if it's a dict
-                                if isinstance(output, dict):
-                                    output = TransactionOut.from_dict(output)
-
-                                if not isinstance(output, TransactionOut):
-                                    raise ValueError("Invalid TransactionOut format")
-
-                                utxo_key = f"utxo:{tx_id}:{idx}".encode()
-                                utxo_data = {
-                                    "tx_id": tx_id,
-                                    "output_index": idx,
-                                    "amount": str(output.amount),
-                                    "script_pub_key": output.script_pub_key,
-                                    "is_locked": output.locked,
-                                    "block_height": block.index,
-                                    "spent_status": False
-                                }
-                                utxo_value = json.dumps(utxo_data, sort_keys=True).encode()
-
-                                # Insert only if not already exists
-                                if not utxo_txn.get(utxo_key):
-                                    utxo_txn.put(utxo_key, utxo_value)
-                                    label = "Coinbase" if is_coinbase else "Standard"
-                                    print(f"[UTXOStorage.update_utxos] ✅ Stored {label} UTXO {tx_id}:{idx} amount {output.amount}")
-                                else:
-                                    print(f"[UTXOStorage.update_utxos] ⚠️ UTXO {tx_id}:{idx} already exists. Skipping.")
-
-                                archive_key = f"new_utxo:{tx_id}:{idx}:{block.timestamp}".encode()
-                                history_txn.put(archive_key, utxo_value)
-
-                            except Exception as e:
-                                print(f"[UTXOStorage.update_utxos] ❌ ERROR: Failed to process output {idx} in tx {tx_id}: {e}")
-                                continue
+        # ✅ Step 2: Register new UTXOs
+        for tx in block.transactions:
+            tx_id = tx.get("tx_id") if isinstance(tx, dict) else getattr(tx, "tx_id", None)
+            outputs = tx.get("outputs", []) if isinstance(tx, dict) else getattr(tx, "outputs", [])
 
-                    # ✅ Step 3: Fallback UTXO Integrity Check
-                    self._verify_utxo_integrity(block)
+            if not tx_id:
+                print(f"[UTXOStorage.update_utxos] ⚠️ WARNING: Transaction missing tx_id. Skipping.")
+                continue
 
-            print(f"[UTXOStorage.update_utxos] ✅ SUCCESS: All UTXOs updated for Block {block.index}.")
+            is_coinbase = isinstance(tx, CoinbaseTx) or (isinstance(tx, dict) and tx.get("type") == "COINBASE")
 
-        except Exception as e:
-            print(f"[UTXOStorage.update_utxos] ❌ ERROR: Failed to update UTXOs for block {getattr(block, 'index', '?')}: {e}")
-            raise
+            for idx, output in enumerate(outputs):
+                try:
+                    # Convert output if it's a dict
+                    if isinstance(output, dict):
+                        output = TransactionOut.from_dict(output)
+
+                    if not isinstance(output, TransactionOut):
+                        raise ValueError("Invalid TransactionOut format")
+
+                    utxo_key = f"utxo:{tx_id}:{idx}".encode()
+                    utxo_data = {
+                        "tx_id": tx_id,
+                        "output_index": idx,
+                        "amount": str(output.amount),
+                        "script_pub_key": output.script_pub_key,
+                        "is_locked": output.locked,
+                        "block_height": block.index,
+                        "spent_status": False
+                    }
+                    utxo_value = UTXOCodec.encode(utxo_data)
+
+                    # Insert only if not already exists
+                    if not utxo_txn.get(utxo_key):
+                        utxo_txn.put(utxo_key, utxo_value)
+                        self._add_address_index(utxo_txn, utxo_data)
+                        label = "Coinbase" if is_coinbase else "Standard"
+                        print(f"[UTXOStorage.update_utxos] ✅ Stored {label} UTXO {tx_id}:{idx} amount {output.amount}")
+                    else:
+                        print(f"[UTXOStorage.update_utxos] ⚠️ UTXO {tx_id}:{idx} already exists. Skipping.")
+
+                    archive_key = f"new_utxo:{tx_id}:{idx}:{block.timestamp}".encode()
+                    history_txn.put(archive_key, utxo_value)
+
+                except Exception as e:
+                    print(f"[UTXOStorage.update_utxos] ❌ ERROR: Failed to process output {idx} in tx {tx_id}: {e}")
+                    continue
 
 
     def validate_utxo(self, tx_id: str, output_index: int, amount: Decimal) -> bool:
@@ -582,13 +732,14 @@ class UTXOStorage:
 
             utxo_key = f"utxo:{tx_id}:{output_index}"
 
-            # ✅ Retrieve UTXO from LMDB as JSON
-            utxo_data = self.utxo_db.get(utxo_key)
-            if not utxo_data:
-                print(f"[UTXOStorage.validate_utxo] ERROR: UTXO {tx_id}:{output_index} does not exist.")
-                return False
+            # ✅ Retrieve and decode the stored UTXO record
+            with self.utxo_db.begin() as txn:
+                utxo_data = txn.get(utxo_key.encode("utf-8"))
+                if not utxo_data:
+                    print(f"[UTXOStorage.validate_utxo] ERROR: UTXO {tx_id}:{output_index} does not exist.")
+                    return False
 
-            utxo = json.loads(utxo_data)
+                utxo = UTXOCodec.decode(utxo_data)
 
             # ✅ Check if UTXO is locked
             if utxo["is_locked"]:
@@ -690,7 +841,7 @@ class UTXOStorage:
             else:
                 # Very old version - direct LMDB access
                 print("[UTXOStorage] ⚠️ Using direct LMDB access (legacy)")
-                with self.utxo_db.env.begin() as txn:
+                with self.utxo_db.begin() as txn:
                     cursor = txn.cursor()
                     prefix = f"utxo:{tx_id}:".encode('utf-8')
                     cursor.set_range(prefix)
@@ -698,7 +849,7 @@ class UTXOStorage:
                         if not key.startswith(prefix):
                             break
                         try:
-                            results.append(json.loads(value.decode('utf-8')))
+                            results.append(UTXOCodec.decode(value))
                         except Exception as e:
                             print(f"[UTXOStorage] ⚠️ Failed to decode UTXO: {e}")
 
@@ -718,10 +869,10 @@ class UTXOStorage:
             # Cache found UTXOs in LMDB for future access (if available)
             if block_results and hasattr(self, "utxo_db"):
                 try:
-                    with self.utxo_db.env.begin(write=True) as txn:
+                    with self.utxo_db.begin(write=True) as txn:
                         for utxo in block_results:
                             key = f"utxo:{utxo['tx_id']}:{utxo['output_index']}".encode('utf-8')
-                            txn.put(key, json.dumps(utxo).encode('utf-8'))
+                            txn.put(key, UTXOCodec.encode(utxo))
                     print(f"[UTXOStorage] 💾 Cached {len(block_results)} UTXOs to LMDB")
                 except Exception as cache_err:
                     print(f"[UTXOStorage] ⚠️ Failed to cache UTXOs: {cache_err}")
@@ -763,7 +914,7 @@ class UTXOStorage:
         """LMDB lookup with transaction type awareness"""
         results = []
         try:
-            with self.utxo_db.env.begin() as txn:
+            with self.utxo_db.begin() as txn:
                 # Handle different lookup patterns based on transaction type
                 if tx_type == "COINBASE":
                     # COINBASE transactions have special handling
@@ -778,7 +929,7 @@ class UTXOStorage:
                 cursor = txn.cursor()
                 for key_bytes, value_bytes in cursor.iternext(prefix=prefix):
                     try:
-                        utxo = json.loads(value_bytes.decode('utf-8'))
+                        utxo = UTXOCodec.decode(value_bytes)
                         results.append(self._standardize_utxo_format(utxo))
                     except Exception as e:
                         print(f"[UTXOStorage] ⚠️ Skipping corrupt UTXO entry: {e}")
@@ -803,7 +954,7 @@ class UTXOStorage:
                 return None
 
             output_index = int(parts[2])
-            utxo_data = json.loads(value_bytes.decode("utf-8"))
+            utxo_data = UTXOCodec.decode(value_bytes)
             
             return self._standardize_utxo_format(
                 tx_id=parts[1],  # Original tx_id from key
@@ -827,9 +978,8 @@ class UTXOStorage:
         blocks_scanned = 0
         try:
             print(f"[UTXOStorage] 🔍 Starting block scan for tx_id: {tx_id}")
-            all_blocks = self.block_storage.get_all_blocks()
-            
-            for block in all_blocks:
+
+            for block in self.block_storage.iter_blocks():
                 blocks_scanned += 1
                 try:
                     # Normalize block format (handles both dict and Block objects)
@@ -996,15 +1146,16 @@ class UTXOStorage:
     def mark_spent(self, tx_id: str, output_index: int) -> bool:
         try:
             utxo_key = f"utxo:{tx_id}:{output_index}".encode()
-            with self.utxo_db.env.begin(write=True) as txn:
+            with self.utxo_db.begin(write=True) as txn:
                 raw = txn.get(utxo_key)
                 if not raw:
                     print(f"[mark_spent] ⚠️ UTXO {tx_id}:{output_index} not found.")
                     return False
 
-                utxo = json.loads(raw.decode("utf-8"))
+                utxo = UTXOCodec.decode(raw)
                 utxo["spent_status"] = True
-                txn.put(utxo_key, json.dumps(utxo, sort_keys=True).encode())
+                txn.put(utxo_key, UTXOCodec.encode(utxo))
+                self._remove_address_index(txn, utxo)
                 print(f"[mark_spent] ✅ UTXO {tx_id}:{output_index} marked as spent.")
                 return True
 
@@ -1039,7 +1190,7 @@ class UTXOStorage:
 
             # Verify each UTXO in the block against the full block storage
             for utxo_key in block_utxos:
-                with self.utxo_db.env.begin() as txn:
+                with self.utxo_db.begin() as txn:
                     utxo_data = txn.get(utxo_key.encode())
 
                     if not utxo_data:
@@ -1049,8 +1200,10 @@ class UTXOStorage:
                         fallback_utxo = self._get_utxo_from_full_block_storage(utxo_key)
                         if fallback_utxo:
                             print(f"[UTXOStorage._verify_utxo_integrity] ✅ FALLBACK: Retrieved UTXO {utxo_key} from full block storage.")
-                            with self.utxo_db.env.begin(write=True) as txn:
-                                txn.put(utxo_key.encode(), json.dumps(fallback_utxo).encode())
+                            with self.utxo_db.begin(write=True) as txn:
+                                txn.put(utxo_key.encode(), UTXOCodec.encode(fallback_utxo))
+                                if not fallback_utxo.get("spent_status", False):
+                                    self._add_address_index(txn, fallback_utxo)
                         else:
                             print(f"[UTXOStorage._verify_utxo_integrity] ❌ ERROR: UTXO {utxo_key} not found in full block storage either.")
 
@@ -1148,34 +1301,36 @@ class UTXOStorage:
         found_in_lmdb = False
 
         try:
-            # ✅ Try primary LMDB lookup
-            with self.utxo_db.env.begin(write=False) as txn:
-                cursor = txn.cursor()
-                for key_bytes, value_raw in cursor:
-                    try:
-                        key_str = key_bytes.decode("utf-8", errors="ignore")
-                        if not key_str.startswith("utxo:"):
-                            continue
+            # ✅ Try primary LMDB lookup: prefix range scan over the address index
+            prefix = f"{address}|".encode("utf-8")
+            with self.utxo_db.begin(write=False) as txn:
+                cursor = txn.cursor(db=self.address_index_db)
+                if cursor.set_range(prefix):
+                    for index_key, utxo_key in cursor:
+                        if not index_key.startswith(prefix):
+                            break
+                        try:
+                            value_raw = txn.get(bytes(utxo_key))
+                            if not value_raw:
+                                continue
 
-                        value_bytes = value_raw.tobytes() if isinstance(value_raw, memoryview) else value_raw
-                        utxo_json = value_bytes.decode("utf-8", errors="replace")
-                        utxo = json.loads(utxo_json)
+                            utxo = UTXOCodec.decode(value_raw)
 
-                        if not isinstance(utxo, dict):
-                            continue
-                        if utxo.get("script_pub_key") != address:
-                            continue
-                        if utxo.get("spent_status", True):
-                            continue
+                            if not isinstance(utxo, dict):
+                                continue
+                            if utxo.get("script_pub_key") != address:
+                                continue
+                            if utxo.get("spent_status", True):
+                                continue
 
-                        from Zyiron_Chain.transactions.txout import TransactionOut
-                        tx_out = TransactionOut.from_dict(utxo)
-                        results.append(tx_out.to_dict())
-                        found_in_lmdb = True
+                            from Zyiron_Chain.transactions.txout import TransactionOut
+                            tx_out = TransactionOut.from_dict(utxo)
+                            results.append(tx_out.to_dict())
+                            found_in_lmdb = True
 
-                    except Exception as e:
-                        print(f"[UTXOStorage.get_utxos_by_address] ⚠️ Skipping invalid UTXO: {e}")
-                        continue
+                        except Exception as e:
+                            print(f"[UTXOStorage.get_utxos_by_address] ⚠️ Skipping invalid UTXO: {e}")
+                            continue
 
             if found_in_lmdb:
                 print(f"[UTXOStorage.get_utxos_by_address] ✅ Found {len(results)} UTXOs from LMDB for address: {address}")
@@ -1187,11 +1342,10 @@ class UTXOStorage:
                 return []
 
             print(f"[UTXOStorage.get_utxos_by_address] ⚠️ No valid UTXOs in LMDB. Scanning block storage...")
-            all_blocks = self.block_storage.get_all_blocks()
 
-            for block in all_blocks:
-                block_index = getattr(block, "index", 0)
-                transactions = getattr(block, "transactions", [])
+            for block in self.block_storage.iter_blocks():
+                block_index = block.get("index", 0)
+                transactions = block.get("transactions", [])
                 for tx in transactions:
                     tx_id = tx.get("tx_id") if isinstance(tx, dict) else getattr(tx, "tx_id", None)
                     outputs = tx.get("outputs", []) if isinstance(tx, dict) else getattr(tx, "outputs", [])
@@ -1260,26 +1414,31 @@ class UTXOStorage:
         try:
             print(f"[recover_missing_utxos_from_blockchain] 🔍 Scanning full block storage for address: {address}")
 
-            all_blocks = self.block_storage.get_all_blocks()
-            for block in all_blocks:
-                for tx in block.transactions:
-                    for idx, output in enumerate(tx.outputs):
-                        if output.script_pub_key != address:
+            for block in self.block_storage.iter_blocks():
+                for tx in block.get("transactions", []):
+                    tx_id = tx.get("tx_id") if isinstance(tx, dict) else getattr(tx, "tx_id", None)
+                    outputs = tx.get("outputs", []) if isinstance(tx, dict) else getattr(tx, "outputs", [])
+
+                    for idx, output in enumerate(outputs):
+                        script = output.get("script_pub_key") if isinstance(output, dict) else getattr(output, "script_pub_key", None)
+                        if script != address:
                             continue
 
-                        utxo_key = f"utxo:{tx.tx_id}:{idx}".encode("utf-8")
+                        utxo_key = f"utxo:{tx_id}:{idx}".encode("utf-8")
 
-                        with self.utxo_db.env.begin() as txn:
+                        with self.utxo_db.begin() as txn:
                             if txn.get(utxo_key):
                                 continue  # Already stored
 
+                        amount = output.get("amount", "0") if isinstance(output, dict) else getattr(output, "amount", 0)
+                        locked = output.get("locked", False) if isinstance(output, dict) else getattr(output, "locked", False)
                         self.store_utxo(
-                            tx_id=tx.tx_id,
+                            tx_id=tx_id,
                             output_index=idx,
-                            amount=Decimal(output.amount),
-                            script_pub_key=output.script_pub_key,
-                            is_locked=output.locked,
-                            block_height=block.index
+                            amount=Decimal(str(amount)),
+                            script_pub_key=script,
+                            is_locked=locked,
+                            block_height=block.get("index", 0)
                         )
                         recovered += 1
 
@@ -1299,7 +1458,7 @@ class UTXOStorage:
         Args:
             block_storage: An instance of BlockStorage.
         """
-        if not hasattr(block_storage, "get_all_blocks"):
+        if not hasattr(block_storage, "iter_blocks"):
             raise ValueError("[UTXOStorage.enable_block_storage_fallback] ERROR: Invalid block_storage instance provided.")
 
         self.block_storage = block_storage
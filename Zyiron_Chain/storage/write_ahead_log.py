@@ -0,0 +1,351 @@
+import os
+import sys
+import time
+import zlib
+import atexit
+import struct
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+import lmdb
+
+# Adjust Python path for project structure
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+sys.path.append(project_root)
+
+from Zyiron_Chain.blockchain.constants import Constants
+from Zyiron_Chain.storage.lmdb_capacity import MapSizeController
+
+
+class GroupCommitWriter:
+    """
+    Write-behind group commit for the high-write LMDB environments (`Constants.HIGH_WRITE_DATABASES`).
+
+    - `put`/`delete` append the mutation to a local write-ahead log (`WAL_FOLDER_NAME/<db>.wal`)
+      and to an in-memory overlay, then return without an LMDB commit.
+    - A background thread applies the pending mutations in one LMDB write transaction every
+      `LMDB_WAL_FLUSH_INTERVAL` seconds, or as soon as `LMDB_WAL_MAX_PENDING_OPS` are queued.
+    - Readers consult `pending()` / `pending_prefix()` first, so writes are visible immediately.
+    - On startup the log is replayed into LMDB before the environment is used.
+    - Log records are written to the OS on every append (a process crash loses nothing);
+      only an OS crash or power loss can drop the last flush interval.
+
+    Record layout: crc32 | op | db-name length | key length | value length | db name | key | value.
+    """
+
+    RECORD_HEADER = struct.Struct(">IBHII")
+    OP_PUT = 1
+    OP_DELETE = 2
+
+    _writers: Dict[str, "GroupCommitWriter"] = {}
+    _writers_lock = threading.Lock()
+
+    def __init__(self, db_path: str, env_provider: Callable, wal_dir: Optional[str] = None,
+                 flush_interval: Optional[float] = None, max_pending_ops: Optional[int] = None):
+        """
+        :param db_path: Path of the LMDB environment the log belongs to.
+        :param env_provider: Returns the current LMDB environment for `db_path` (survives reopen).
+        :param wal_dir: Directory for the log files (defaults to `WAL_FOLDER_NAME` under the storage path).
+        :param flush_interval: Seconds between group commits.
+        :param max_pending_ops: Pending mutations that trigger an early group commit.
+        """
+        self.db_path = os.path.abspath(db_path)
+        self.env_provider = env_provider
+        self.wal_dir = wal_dir or os.path.join(Constants.BLOCKCHAIN_STORAGE_PATH, Constants.WAL_FOLDER_NAME)
+        self.flush_interval = float(flush_interval or Constants.LMDB_WAL_FLUSH_INTERVAL)
+        self.max_pending_ops = int(max_pending_ops or Constants.LMDB_WAL_MAX_PENDING_OPS)
+
+        os.makedirs(self.wal_dir, exist_ok=True)
+        name = os.path.basename(self.db_path.rstrip(os.sep))
+        self.wal_path = os.path.join(self.wal_dir, f"{name}.wal")
+        self.flushing_path = self.wal_path + ".flushing"
+
+        self.lock = threading.RLock()
+        self.flush_lock = threading.Lock()
+        self._ops: List[Tuple[int, int, Optional[str], bytes, Optional[bytes]]] = []
+        self._overlay: Dict[Tuple[Optional[str], bytes], Tuple[int, Optional[bytes]]] = {}
+        self._sequence = 0
+        self._db_handles: Dict[Optional[str], object] = {}
+
+        self.flush_count = 0
+        self.flushed_ops = 0
+        self.last_flush_seconds = 0.0
+
+        self.replay()
+        self._log = open(self.wal_path, "ab")
+
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name=f"wal-flush-{name}", daemon=True)
+        self._thread.start()
+
+        print(f"[GroupCommitWriter.__init__] ✅ Group commit enabled for {name} "
+              f"(every {self.flush_interval}s or {self.max_pending_ops} ops) | WAL: {self.wal_path}")
+
+    # -------------------------------------------------------------------------
+    # Registry
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def is_high_write(db_path: str) -> bool:
+        """
+        True if `db_path` is one of the network's `Constants.HIGH_WRITE_DATABASES`.
+        """
+        path = os.path.abspath(db_path)
+        for file_name in Constants.HIGH_WRITE_DATABASES:
+            try:
+                if os.path.abspath(Constants.get_db_path(file_name.replace(".lmdb", ""))) == path:
+                    return True
+            except ValueError:
+                continue
+        return False
+
+    @classmethod
+    def for_path(cls, db_path: str, env_provider: Callable) -> Optional["GroupCommitWriter"]:
+        """
+        Return the process-wide writer for a high-write environment (created and replayed on
+        first use), or None if group commit is disabled or `db_path` is not a high-write database.
+        """
+        if not Constants.LMDB_GROUP_COMMIT_ENABLED or not cls.is_high_write(db_path):
+            return None
+
+        path = os.path.abspath(db_path)
+        with cls._writers_lock:
+            writer = cls._writers.get(path)
+            if writer is None or writer._stopped:
+                writer = cls._writers[path] = cls(path, env_provider)
+            return writer
+
+    @classmethod
+    def flush_path(cls, db_path) -> int:
+        """
+        Flush the writer for `db_path` if one exists. Call before writing the environment directly
+        so the direct write is not overtaken by older queued mutations.
+        """
+        if isinstance(db_path, bytes):
+            db_path = db_path.decode("utf-8")
+        writer = cls._writers.get(os.path.abspath(db_path))
+        return writer.flush() if writer is not None else 0
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._writers_lock:
+            writers = list(cls._writers.values())
+            cls._writers.clear()
+        for writer in writers:
+            writer.close()
+
+    # -------------------------------------------------------------------------
+    # Log records
+    # -------------------------------------------------------------------------
+    @classmethod
+    def _encode(cls, op: int, db_name: Optional[str], key: bytes, value: Optional[bytes]) -> bytes:
+        name_bytes = (db_name or "").encode("utf-8")
+        value = value or b""
+        body = struct.pack(">BHII", op, len(name_bytes), len(key), len(value)) + name_bytes + key + value
+        return struct.pack(">I", zlib.crc32(body)) + body
+
+    @classmethod
+    def _read_records(cls, path: str) -> List[Tuple[int, Optional[str], bytes, Optional[bytes]]]:
+        """
+        Decode a log file, stopping at the first torn or corrupt record (an interrupted append).
+        """
+        records = []
+        if not os.path.exists(path):
+            return records
+
+        with open(path, "rb") as log_file:
+            data = log_file.read()
+
+        offset = 0
+        header_size = cls.RECORD_HEADER.size
+        while offset + header_size <= len(data):
+            crc, op, name_len, key_len, value_len = cls.RECORD_HEADER.unpack_from(data, offset)
+            end = offset + header_size + name_len + key_len + value_len
+            if end > len(data) or zlib.crc32(data[offset + 4:end]) != crc or op not in (cls.OP_PUT, cls.OP_DELETE):
+                print(f"[GroupCommitWriter._read_records] ⚠️ WARNING: Truncated WAL record at byte {offset} in {path}; "
+                      f"ignoring the tail.")
+                break
+
+            cursor = offset + header_size
+            db_name = data[cursor:cursor + name_len].decode("utf-8") or None
+            cursor += name_len
+            key = data[cursor:cursor + key_len]
+            cursor += key_len
+            value = data[cursor:end] if op == cls.OP_PUT else None
+            records.append((op, db_name, key, value))
+            offset = end
+
+        return records
+
+    def _db_handle(self, env, db_name: Optional[str], txn):
+        if db_name is None:
+            return None
+        handle = self._db_handles.get(db_name)
+        if handle is None:
+            handle = self._db_handles[db_name] = env.open_db(db_name.encode("utf-8"), txn=txn)
+        return handle
+
+    def _apply(self, records) -> None:
+        env = self.env_provider()
+        needed_bytes = sum(len(record[-2]) + len(record[-1] or b"") for record in records)
+        try:
+            self._apply_once(env, records, needed_bytes)
+        except (lmdb.MapFullError, lmdb.MapResizedError):
+            MapSizeController.shared(self.db_path, self.env_provider).handle_map_full(needed_bytes)
+            self._apply_once(env, records, needed_bytes)
+
+    def _apply_once(self, env, records, needed_bytes: int) -> None:
+        with MapSizeController.write_gate(env, needed_bytes), env.begin(write=True) as txn:
+            for record in records:
+                op, db_name, key, value = record[-4:]
+                db = self._db_handle(env, db_name, txn)
+                if op == self.OP_PUT:
+                    txn.put(key, value, db=db)
+                else:
+                    txn.delete(key, db=db)
+
+    def replay(self) -> int:
+        """
+        Apply any log left by a previous run (an interrupted flush first, then the live log),
+        then discard both files.
+        """
+        replayed = 0
+        try:
+            for path in (self.flushing_path, self.wal_path):
+                records = self._read_records(path)
+                if records:
+                    self._apply(records)
+                    replayed += len(records)
+            for path in (self.flushing_path, self.wal_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            if replayed:
+                print(f"[GroupCommitWriter.replay] ✅ SUCCESS: Replayed {replayed} WAL records into {self.db_path}.")
+            return replayed
+        except Exception as e:
+            print(f"[GroupCommitWriter.replay] ❌ ERROR: Failed to replay WAL for {self.db_path}: {e}")
+            raise
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+    def _append(self, op: int, db_name: Optional[str], key: bytes, value: Optional[bytes]) -> None:
+        with self.lock:
+            self._log.write(self._encode(op, db_name, key, value))
+            self._log.flush()
+            self._sequence += 1
+            self._ops.append((self._sequence, op, db_name, key, value))
+            self._overlay[(db_name, key)] = (self._sequence, value)
+            pending = len(self._ops)
+        if pending >= self.max_pending_ops:
+            self._wake.set()
+
+    def put(self, key: bytes, value: bytes, db_name: Optional[str] = None) -> bool:
+        self._append(self.OP_PUT, db_name, bytes(key), bytes(value))
+        return True
+
+    def delete(self, key: bytes, db_name: Optional[str] = None) -> None:
+        self._append(self.OP_DELETE, db_name, bytes(key), None)
+
+    # -------------------------------------------------------------------------
+    # Reads (pending mutations)
+    # -------------------------------------------------------------------------
+    def pending(self, key: bytes, db_name: Optional[str] = None) -> Tuple[bool, Optional[bytes]]:
+        """
+        Return (True, value) if `key` has a queued mutation (value None = deleted), else (False, None).
+        """
+        with self.lock:
+            entry = self._overlay.get((db_name, bytes(key)))
+        return (True, entry[1]) if entry is not None else (False, None)
+
+    def pending_prefix(self, prefix: bytes, db_name: Optional[str] = None) -> Dict[bytes, Optional[bytes]]:
+        """
+        Return every queued mutation whose key starts with `prefix` (value None = deleted).
+        """
+        with self.lock:
+            return {
+                key: entry[1] for (name, key), entry in self._overlay.items()
+                if name == db_name and key.startswith(prefix)
+            }
+
+    def pending_count(self) -> int:
+        with self.lock:
+            return len(self._ops)
+
+    # -------------------------------------------------------------------------
+    # Group commit
+    # -------------------------------------------------------------------------
+    def flush(self) -> int:
+        """
+        Apply every queued mutation in one LMDB write transaction. Returns the number applied.
+
+        The live log is rotated to `.flushing` while the batch commits, so appends continue
+        against a fresh log; the rotated file is removed only after the commit succeeds.
+        """
+        with self.flush_lock:
+            with self.lock:
+                if not self._ops:
+                    return 0
+                batch = self._ops
+                self._ops = []
+                self._log.close()
+                if os.path.exists(self.flushing_path):
+                    # A previous flush failed: keep its records ahead of the live log.
+                    with open(self.wal_path, "rb") as live_log, open(self.flushing_path, "ab") as rotated_log:
+                        rotated_log.write(live_log.read())
+                    os.remove(self.wal_path)
+                else:
+                    os.replace(self.wal_path, self.flushing_path)
+                self._log = open(self.wal_path, "ab")
+
+            start_time = time.time()
+            try:
+                self._apply(batch)
+            except Exception as e:
+                # Put the batch back in front of newer mutations; the rotated log stays for replay.
+                with self.lock:
+                    self._ops = batch + self._ops
+                print(f"[GroupCommitWriter.flush] ❌ ERROR: Group commit of {len(batch)} ops to {self.db_path} failed: {e}")
+                return 0
+
+            last_sequence = batch[-1][0]
+            with self.lock:
+                for (db_name_key, key), (sequence, _) in list(self._overlay.items()):
+                    if sequence <= last_sequence:
+                        del self._overlay[(db_name_key, key)]
+            os.remove(self.flushing_path)
+
+            self.flush_count += 1
+            self.flushed_ops += len(batch)
+            self.last_flush_seconds = time.time() - start_time
+            return len(batch)
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[GroupCommitWriter._run] ❌ ERROR: Background flush failed for {self.db_path}: {e}")
+
+    def close(self) -> None:
+        """
+        Stop the background thread and flush what is left.
+        """
+        if self._stopped:
+            return
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join(timeout=self.flush_interval + 1)
+        self.flush()
+        with self.lock:
+            self._log.close()
+        with GroupCommitWriter._writers_lock:
+            if GroupCommitWriter._writers.get(self.db_path) is self:
+                del GroupCommitWriter._writers[self.db_path]
+        print(f"[GroupCommitWriter.close] ✅ Flushed and closed WAL for {self.db_path}.")
+
+
+atexit.register(GroupCommitWriter.close_all)
@@ -0,0 +1,282 @@
+import sys
+import os
+import json
+import bisect
+from decimal import Decimal
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+# Set module search path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from Zyiron_Chain.blockchain.constants import Constants
+from Zyiron_Chain.blockchain.merkle_tree import MerkleTree
+
+
+class BlockTemplate:
+    """
+    Persistent block template kept up to date as transactions arrive and blocks connect.
+
+    - Candidates are grouped by category (SMART / STANDARD / INSTANT), each in a list of
+      (fee_per_byte, -arrival, tx_id) kept sorted ascending, with sizes computed once on insert.
+    - Each category fills its own byte budget (Constants.BLOCK_ALLOCATION_SMART,
+      BLOCK_ALLOCATION_STANDARD, INSTANT_PAYMENT_ALLOCATION) from the highest fee-rate down,
+      under the overall block size limit.
+    - `get_transactions()` returns the current selection without any work; `version`
+      changes whenever the selection does, so the miner can refresh mid-PoW.
+    - Connecting a block drops its transactions and any candidate spending the same outputs.
+    - Each candidate's Merkle leaf digest is computed once on insert (`leaf_digests()`), so the
+      miner's tree only hashes paths when the selection changes.
+    - The mempools keep it current: admissions are added and evictions, expiries and removals
+      are dropped under the mempool's own transaction ID.
+    """
+
+    CATEGORY_ALLOCATIONS = {
+        "SMART": "BLOCK_ALLOCATION_SMART",
+        "STANDARD": "BLOCK_ALLOCATION_STANDARD",
+        "INSTANT": "INSTANT_PAYMENT_ALLOCATION",
+    }
+
+    def __init__(self, max_block_size_mb: Optional[float] = None):
+        self.lock = Lock()
+        self._candidates: Dict[str, List[Tuple[float, int, str]]] = {category: [] for category in self.CATEGORY_ALLOCATIONS}
+        self._entries: Dict[str, Dict] = {}  # tx_id → {"tx", "category", "size", "fee", "key", "inputs", "leaf"}
+        self._spent_by: Dict[str, str] = {}  # tx_out_id → tx_id
+        self._by_object: Dict[int, str] = {}  # id(tx) → tx_id, for the leaf cache
+        self._arrivals = 0
+
+        self._selection: List = []
+        self._selected_size = 0
+        self.total_fees = Decimal("0")
+        self.version = 0
+
+        self.resize(max_block_size_mb if max_block_size_mb is not None else Constants.MAX_BLOCK_SIZE_MB)
+
+    # -------------------------------------------------------------------------
+    # Transaction field helpers (Transaction objects or mempool records)
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _field(tx, name, default=None):
+        return tx.get(name, default) if isinstance(tx, dict) else getattr(tx, name, default)
+
+    @classmethod
+    def _tx_size(cls, tx) -> int:
+        size = cls._field(tx, "size")
+        if isinstance(size, (int, float)) and size > 0:
+            return int(size)
+        tx_dict = tx.to_dict() if hasattr(tx, "to_dict") else tx
+        return len(json.dumps(tx_dict, sort_keys=True, default=str).encode("utf-8"))
+
+    @classmethod
+    def _tx_inputs(cls, tx) -> List[str]:
+        inputs = []
+        for tx_in in cls._field(tx, "inputs", []) or []:
+            if isinstance(tx_in, str):
+                inputs.append(tx_in)
+                continue
+            tx_out_id = tx_in.get("tx_out_id") if isinstance(tx_in, dict) else getattr(tx_in, "tx_out_id", None)
+            if not tx_out_id:
+                prev_tx = tx_in.get("tx_id") if isinstance(tx_in, dict) else getattr(tx_in, "tx_id", None)
+                index = tx_in.get("output_index") if isinstance(tx_in, dict) else getattr(tx_in, "output_index", None)
+                tx_out_id = f"{prev_tx}:{index}" if prev_tx and index is not None else None
+            if tx_out_id:
+                inputs.append(tx_out_id)
+        return inputs
+
+    @staticmethod
+    def classify(tx_id: str) -> str:
+        """
+        Map a transaction ID to its block category using Constants.TRANSACTION_MEMPOOL_MAP prefixes.
+        """
+        for tx_type, config in Constants.TRANSACTION_MEMPOOL_MAP.items():
+            if any(tx_id.startswith(prefix) for prefix in config["prefixes"]):
+                return tx_type
+        return "STANDARD"
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+    def resize(self, max_block_size_mb: float) -> None:
+        """
+        Set the block size limit and recompute the per-category byte budgets.
+        """
+        with self.lock:
+            self.max_size_bytes = int(max_block_size_mb * 1024 * 1024)
+            self.budgets = {
+                category: int(self.max_size_bytes * getattr(Constants, attribute))
+                for category, attribute in self.CATEGORY_ALLOCATIONS.items()
+            }
+            self._reselect()
+
+    def add_transaction(self, tx, category: Optional[str] = None, tx_id: Optional[str] = None) -> bool:
+        """
+        Add a validated mempool transaction as a block candidate.
+        `tx_id` overrides the transaction's own ID as the candidate key (the ID its mempool removes it by).
+        Returns False for duplicates, Coinbase transactions and unsupported categories.
+        """
+        try:
+            tx_id = tx_id or self._field(tx, "tx_id")
+            if isinstance(tx_id, bytes):
+                tx_id = tx_id.hex()
+            if not tx_id:
+                return False
+
+            category = (category or self._field(tx, "tx_type") or self.classify(tx_id)).upper()
+            if category not in self._candidates:
+                return False
+
+            size = self._tx_size(tx)
+            fee = Decimal(str(self._field(tx, "fee", 0) or 0))
+            fee_per_byte = float(fee) / size if size > 0 else 0.0
+            leaf = MerkleTree.hash_transaction(tx)
+
+            with self.lock:
+                if tx_id in self._entries:
+                    return False
+
+                self._arrivals += 1
+                key = (fee_per_byte, -self._arrivals, tx_id)
+                inputs = self._tx_inputs(tx)
+                self._entries[tx_id] = {"tx": tx, "category": category, "size": size, "fee": fee, "key": key, "inputs": inputs, "leaf": leaf}
+                for tx_out_id in inputs:
+                    self._spent_by.setdefault(tx_out_id, tx_id)
+                self._by_object[id(tx)] = tx_id
+                bisect.insort(self._candidates[category], key)
+                self._reselect()
+            return True
+
+        except Exception as e:
+            print(f"[BlockTemplate.add_transaction] ❌ ERROR: Failed to add transaction: {e}")
+            return False
+
+    def _drop(self, tx_id: str) -> bool:
+        entry = self._entries.pop(tx_id, None)
+        if entry is None:
+            return False
+
+        candidates = self._candidates[entry["category"]]
+        position = bisect.bisect_left(candidates, entry["key"])
+        if position < len(candidates) and candidates[position] == entry["key"]:
+            del candidates[position]
+        for tx_out_id in entry["inputs"]:
+            if self._spent_by.get(tx_out_id) == tx_id:
+                del self._spent_by[tx_out_id]
+        if self._by_object.get(id(entry["tx"])) == tx_id:
+            del self._by_object[id(entry["tx"])]
+        return True
+
+    def remove_transaction(self, tx_id: str) -> bool:
+        """
+        Remove a candidate (evicted, expired or replaced in the mempool).
+        """
+        with self.lock:
+            removed = self._drop(tx_id)
+            if removed:
+                self._reselect()
+            return removed
+
+    def discard(self, transactions: List) -> int:
+        """
+        Remove the given candidate objects (e.g. ones whose inputs are no longer spendable).
+        Returns the number removed.
+        """
+        with self.lock:
+            removed = 0
+            for tx in transactions:
+                tx_id = self._by_object.get(id(tx))
+                if tx_id and self._drop(tx_id):
+                    removed += 1
+            if removed:
+                self._reselect()
+            return removed
+
+    def connect_block(self, block) -> int:
+        """
+        Drop the transactions confirmed by `block` and every candidate that spends one of its inputs.
+        Returns the number of candidates removed.
+        """
+        transactions = self._field(block, "transactions", []) or []
+        with self.lock:
+            removed = 0
+            for tx in transactions:
+                tx_id = self._field(tx, "tx_id")
+                if tx_id and self._drop(tx_id):
+                    removed += 1
+                for tx_out_id in self._tx_inputs(tx):
+                    conflicting = self._spent_by.get(tx_out_id)
+                    if conflicting and self._drop(conflicting):
+                        removed += 1
+            if removed:
+                self._reselect()
+            return removed
+
+    def _reselect(self) -> None:
+        """
+        Refill every category budget from its best candidates (caller holds the lock).
+        Walks each category until its budget or the block limit is reached.
+        """
+        selection = []
+        total_size = 0
+        total_fees = Decimal("0")
+
+        for category, candidates in self._candidates.items():
+            budget = self.budgets.get(category, 0)
+            used = 0
+            for fee_per_byte, _, tx_id in reversed(candidates):
+                if fee_per_byte < Constants.MIN_TRANSACTION_FEE or used >= budget:
+                    break
+                entry = self._entries[tx_id]
+                if used + entry["size"] > budget or total_size + entry["size"] > self.max_size_bytes:
+                    continue
+                selection.append(entry["tx"])
+                used += entry["size"]
+                total_size += entry["size"]
+                total_fees += entry["fee"]
+
+        if [self._field(tx, "tx_id") for tx in selection] != [self._field(tx, "tx_id") for tx in self._selection]:
+            self.version += 1
+        self._selection = selection
+        self._selected_size = total_size
+        self.total_fees = total_fees
+
+    # -------------------------------------------------------------------------
+    # Read access
+    # -------------------------------------------------------------------------
+    def get_transactions(self) -> List:
+        """
+        Return the currently selected transactions (a copy of the prepared list).
+        """
+        with self.lock:
+            return list(self._selection)
+
+    def snapshot(self) -> Tuple[List, Decimal, int]:
+        """
+        Return (transactions, total_fees, version) as one consistent view.
+        """
+        with self.lock:
+            return list(self._selection), self.total_fees, self.version
+
+    def has_better_fees(self, version: int, total_fees: Decimal) -> bool:
+        """
+        True if the selection changed since `version` and now pays more than `total_fees`.
+        """
+        with self.lock:
+            return self.version != version and self.total_fees > total_fees
+
+    def leaf_digests(self, transactions: List) -> List[bytes]:
+        """
+        Merkle leaf digests for `transactions`, from the candidate cache where possible.
+        """
+        digests = []
+        with self.lock:
+            for tx in transactions:
+                entry = self._entries.get(self._by_object.get(id(tx)))
+                digests.append(entry["leaf"] if entry is not None and entry["tx"] is tx else MerkleTree.hash_transaction(tx))
+        return digests
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def selected_size(self) -> int:
+        return self._selected_size
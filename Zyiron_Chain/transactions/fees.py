@@ -234,9 +234,16 @@ class FeeModel:
                 congestion_level.encode("utf-8")
             )
 
-            # Store Fee Data in LMDB
-            with self.fee_stats_db.env.begin(write=True) as txn:
-                txn.put(fee_key, fee_data)
+            # Store Fee Data in LMDB (queued in the fee_stats WAL when group commit is enabled)
+            if getattr(self, "fee_stats_db", None) is None:
+                from Zyiron_Chain.storage.lmdatabase import LMDBManager
+                self.fee_stats_db = LMDBManager(Constants.get_db_path("fee_stats"))
+
+            if self.fee_stats_db.group_commit is not None:
+                self.fee_stats_db.group_commit.put(fee_key, fee_data)
+            else:
+                with self.fee_stats_db.begin(write=True) as txn:
+                    txn.put(fee_key, fee_data)
 
             print(f"[FeeModel.store_fee] ✅ SUCCESS: Stored fee data for transaction {transaction_id} in fee_stats.lmdb.")
             return True
@@ -9,6 +9,7 @@ from Zyiron_Chain.transactions.utxo_manager import UTXOManager
 from Zyiron_Chain.mempool.standardmempool import StandardMempool
 from Zyiron_Chain.mempool.smartmempool import SmartMempool
 from Zyiron_Chain.transactions.payment_type import PaymentTypeManager
+from Zyiron_Chain.transactions.block_template import BlockTemplate
 from decimal import Decimal
 from threading import Lock
 import hashlib
@@ -65,25 +66,77 @@ class TransactionManager:
         # ✅ Initialize UTXO storage from manager
         self.utxo_storage = UTXOStorage(utxo_manager=self.utxo_manager)
 
+        # ✅ Persistent block template; the mempools add, evict and remove its candidates
+        self.block_template = BlockTemplate(Constants.MAX_BLOCK_SIZE_MB)
+
         # ✅ Initialize Standard and Smart mempools with utxo_storage
         self.standard_mempool = StandardMempool(
             utxo_storage=self.utxo_storage,
-            max_size_mb=int(Constants.MEMPOOL_MAX_SIZE_MB * Constants.MEMPOOL_STANDARD_ALLOCATION)
+            max_size_mb=int(Constants.MEMPOOL_MAX_SIZE_MB * Constants.MEMPOOL_STANDARD_ALLOCATION),
+            key_manager=self.key_manager,
+            block_template=self.block_template
         )
         self.smart_mempool = SmartMempool(
             utxo_storage=self.utxo_storage,  # ✅ <-- this was missing
-            max_size_mb=int(Constants.MEMPOOL_MAX_SIZE_MB * Constants.MEMPOOL_SMART_ALLOCATION)
+            max_size_mb=int(Constants.MEMPOOL_MAX_SIZE_MB * Constants.MEMPOOL_SMART_ALLOCATION),
+            key_manager=self.key_manager,
+            block_template=self.block_template
         )
 
         self.transaction_mempool_map = Constants.TRANSACTION_MEMPOOL_MAP
         self._mempool = self.standard_mempool
         self.mempool_lock = Lock()
 
+        # ✅ Load the transactions persisted before startup into the template
+        self._seed_block_template()
+
         print(f"[TransactionManager.__init__] Initialized on {self.network.upper()} | Version {self.version} | "
               f"Standard Mempool: {Constants.MEMPOOL_STANDARD_ALLOCATION * 100}% | "
               f"Smart Mempool: {Constants.MEMPOOL_SMART_ALLOCATION * 100}% | "
               f"TX Index DB: {Constants.get_db_path('txindex')}")
 
+    def _seed_block_template(self):
+        """
+        Load the transactions already pending in both mempools into the block template.
+        """
+        try:
+            block_size_mb = Constants.MAX_BLOCK_SIZE_MB
+            for tx_type in ("STANDARD", "INSTANT"):
+                for tx_data in self.standard_mempool.get_pending_transactions(block_size_mb, transaction_type=tx_type):
+                    tx = self._rebuild_pending_transaction(tx_data)
+                    if tx is None:
+                        print(f"[TransactionManager._seed_block_template] ⚠️ WARNING: Mempool record {tx_data.get('tx_id', '')[:12]} "
+                              f"cannot be rebuilt as a transaction. Not seeding it.")
+                        continue
+                    self.block_template.add_transaction(tx, tx_type, tx_id=tx_data["tx_id"])
+
+            chain_height = self._get_chain_height()
+            for tx in self.smart_mempool.get_pending_transactions(block_size_mb, chain_height):
+                self.block_template.add_transaction(tx, "SMART")
+
+            print(f"[TransactionManager._seed_block_template] INFO: Block template seeded with {len(self.block_template)} candidates.")
+        except Exception as e:
+            print(f"[TransactionManager._seed_block_template] ⚠️ WARNING: Failed to seed block template: {e}")
+
+    @staticmethod
+    def _rebuild_pending_transaction(tx_data):
+        """
+        Rebuild the signed Transaction stored in a StandardMempool record.
+        Returns None for records without one (persisted before it was stored) or that do not match their key.
+        """
+        payload = tx_data.get("transaction") if isinstance(tx_data, dict) else None
+        if not isinstance(payload, dict):
+            return None
+
+        tx = Transaction.from_dict(payload)
+        if tx is None or not tx.inputs or not tx.outputs:
+            return None
+        if any(not inp.script_sig for inp in tx.inputs):
+            return None
+        if hashlib.sha3_384(tx.tx_id.encode()).hexdigest() != tx_data.get("tx_id"):
+            return None
+        return tx
+
     def create_transaction(self, sender, recipient_address=None, amount=None, fee=None, transaction_type="STANDARD", **kwargs):
         """
         Create a new transaction.
@@ -308,17 +361,9 @@ class TransactionManager:
             )
             transaction.tx_signature_hash = falcon_signature_hash.hex()
 
-            # Store transaction metadata
-            metadata_offset = self.tx_storage.store_transaction(
-                transaction.tx_id,
-                json.dumps(transaction.to_dict(), sort_keys=True).encode("utf-8")
-            )
-
-            if metadata_offset is None:
-                print(f"[TransactionManager.store_transaction_in_mempool] ❌ Failed to index metadata.")
-                return False
-
-            print(f"[TransactionManager.store_transaction_in_mempool] ✅ Stored TX {transaction.tx_id} in {mempool_type} at offset {metadata_offset}")
+            # Transaction metadata is indexed by TxStorage when its block is stored;
+            # the mempool has already added it to the block template.
+            print(f"[TransactionManager.store_transaction_in_mempool] ✅ Stored TX {transaction.tx_id} in {mempool_type}")
             return True
 
         except Exception as e:
@@ -327,108 +372,23 @@ class TransactionManager:
 
     def select_transactions_for_block(self, max_block_size_mb: int = 10):
         """
-        Chooses transactions for the next block, ensuring:
-        - Byte-level transaction validation before storing.
-        - SHA3-384 hash consistency between computed transaction ID and stored LMDB transaction index.
-        - UTXO spending rules are cross-checked before adding to mempool.
-        - Block storage offsets are updated after mempool storage.
-        - Falcon-512 signature verification is handled, ensuring only hashed signatures are stored in `full_block_chain.lmdb`.
+        Chooses transactions for the next block from the persistent block template.
+        - Candidates were validated (signatures, fees) and sized on mempool admission.
+        - Per-category byte budgets (Smart / Standard / Instant) are maintained incrementally,
+          so this returns the prepared selection without re-sorting the mempools.
+        - UTXO spending rules are re-checked for the selected candidates only (see `template_snapshot`).
+        - Falcon-512 signatures were offloaded to `txindex.lmdb` when the transaction was admitted.
         """
         try:
-            max_size_bytes = max_block_size_mb * 1024 * 1024
-            chain_height = self._get_chain_height()
-
-            # ✅ Allocation for different transaction types
-            smart_tx_allocation = int(max_size_bytes * Constants.BLOCK_ALLOCATION_SMART)
-            standard_tx_allocation = int(max_size_bytes * Constants.BLOCK_ALLOCATION_STANDARD)
-            instant_tx_allocation = int(max_size_bytes * Constants.INSTANT_PAYMENT_ALLOCATION)
-
-            # ✅ Retrieve pending transactions from both mempools
-            smart_txs = self.smart_mempool.get_pending_transactions(smart_tx_allocation, chain_height)
-            standard_txs = self.standard_mempool.get_pending_transactions(standard_tx_allocation)
-            instant_txs = self.standard_mempool.get_pending_transactions(instant_tx_allocation, transaction_type="Instant")
-
-            all_txs = smart_txs + standard_txs + instant_txs
-
-            # ✅ Sort transactions by highest fee-per-byte
-            sorted_txs = sorted(
-                all_txs,
-                key=lambda tx: tx.fee / self._calculate_transaction_size(tx),
-                reverse=True
-            )
-
-            selected_txs = []
-            current_smart_size = current_standard_size = current_instant_size = 0
-
-            for tx in sorted_txs:
-                tx_size = self._calculate_transaction_size(tx)
-
-                # ✅ Ensure transaction passes byte-level validation
-                if not self.validate_transaction(tx):
-                    print(f"[ERROR] Transaction {tx.tx_id} failed validation. Skipping.")
-                    continue
-
-                # ✅ Verify SHA3-384 hash consistency
-                stored_tx_data = self.tx_storage.get_transaction(tx.tx_id)
-                if not stored_tx_data:
-                    print(f"[ERROR] Transaction {tx.tx_id} not found in LMDB. Skipping.")
-                    continue
-
-                computed_tx_hash = hashlib.sha3_384(tx.tx_id.encode()).hexdigest()
-                if computed_tx_hash != tx.tx_id:
-                    print(f"[ERROR] Transaction ID hash mismatch for {tx.tx_id}. Skipping.")
-                    continue
-
-                # ✅ Verify UTXO spending rules
-                for tx_in in tx.inputs:
-                    utxo = self.utxo_manager.get_utxo(tx_in.tx_out_id)
-                    if not utxo or utxo["spent_status"] == 1:
-                        print(f"[ERROR] UTXO {tx_in.tx_out_id} is already spent or invalid. Skipping transaction {tx.tx_id}.")
-                        break
-                else:
-                    # ✅ Ensure transaction fits within allocation limits
-                    if tx in smart_txs and current_smart_size + tx_size > smart_tx_allocation:
-                        continue
-                    if tx in standard_txs and current_standard_size + tx_size > standard_tx_allocation:
-                        continue
-                    if tx in instant_txs and current_instant_size + tx_size > instant_tx_allocation:
-                        continue
-
-                    # ✅ Ensure block size is not exceeded
-                    total_used = current_smart_size + current_standard_size + current_instant_size
-                    if total_used + tx_size <= max_size_bytes:
-                        selected_txs.append(tx)
-
-                        # ✅ Update allocation sizes
-                        if tx in smart_txs:
-                            current_smart_size += tx_size
-                        elif tx in instant_txs:
-                            current_instant_size += tx_size
-                        else:
-                            current_standard_size += tx_size
-
-            total_size = current_smart_size + current_standard_size + current_instant_size
-
-            # ✅ **Ensure Falcon-512 signature is handled correctly**
-            for tx in selected_txs:
-                # ✅ Offload Falcon-512 signature into `txindex.lmdb`
-                txindex_db_path = Constants.get_db_path("txindex")
-                falcon_signature_hash = store_transaction_signature(
-                    tx_id=tx.tx_id.encode(),
-                    falcon_signature=tx.falcon_signature,
-                    txindex_path=txindex_db_path
-                )
-
-                # ✅ Store only the SHA3-384 hash of the Falcon signature in `blockchain.lmdb`
-                tx.tx_signature_hash = falcon_signature_hash.hex()
+            if self.block_template.max_size_bytes != int(max_block_size_mb * 1024 * 1024):
+                self.block_template.resize(max_block_size_mb)
 
-                # ✅ Store transaction metadata offsets dynamically
-                self.tx_storage.store_transaction(tx.tx_id, json.dumps(tx.to_dict(), sort_keys=True).encode("utf-8"))
+            selected_txs, total_fees, _ = self.template_snapshot()
 
             print(
                 "[TransactionManager.select_transactions_for_block] INFO: "
-                f"Selected {len(selected_txs)} transactions | Smart: {current_smart_size} bytes | "
-                f"Standard: {current_standard_size} bytes | Instant: {current_instant_size} bytes | Total: {total_size} bytes"
+                f"Selected {len(selected_txs)} transactions | Fees: {total_fees} | "
+                f"Total: {self.block_template.selected_size} bytes"
             )
 
             return selected_txs
@@ -437,7 +397,52 @@ class TransactionManager:
             print(f"[TransactionManager.select_transactions_for_block] ERROR: {str(e)}")
             return []
 
+    def _inputs_unspent(self, tx) -> bool:
+        """
+        True if every input of `tx` still references an existing, unspent UTXO.
+        """
+        for tx_out_id in BlockTemplate._tx_inputs(tx):
+            try:
+                parsed_tx_id, output_index = UTXOStorage.parse_tx_out_id(tx_out_id)
+                utxo = self.utxo_storage.get_utxo(parsed_tx_id, output_index, use_cache=False)
+            except Exception as e:
+                print(f"[TransactionManager._inputs_unspent] ❌ ERROR: Failed to check UTXO {tx_out_id}: {e}")
+                return False
+            if not utxo or utxo.get("spent_status"):
+                print(f"[TransactionManager._inputs_unspent] ⚠️ WARNING: UTXO {tx_out_id} is already spent or invalid.")
+                return False
+        return True
 
+    def template_snapshot(self):
+        """
+        Return (transactions, total_fees, version) from the block template after checking the
+        selected candidates' UTXOs. Candidates whose inputs were spent or disappeared are dropped
+        and the selection is refilled until every selected transaction is spendable.
+        """
+        while True:
+            selected_txs, total_fees, version = self.block_template.snapshot()
+            stale = [tx for tx in selected_txs if not self._inputs_unspent(tx)]
+            if not stale:
+                return selected_txs, total_fees, version
+
+            dropped = self.block_template.discard(stale)
+            print(f"[TransactionManager.template_snapshot] INFO: Dropped {dropped} template candidates with spent or missing UTXOs.")
+            if not dropped:
+                stale_ids = {id(tx) for tx in stale}
+                selected_txs = [tx for tx in selected_txs if id(tx) not in stale_ids]
+                return selected_txs, total_fees, version
+
+    def on_block_connected(self, block):
+        """
+        Drop a connected block's transactions (and any candidate spending the same outputs)
+        from the block template so the next template is immediately ready.
+        """
+        try:
+            removed = self.block_template.connect_block(block)
+            print(f"[TransactionManager.on_block_connected] INFO: Block {getattr(block, 'index', '?')} connected | "
+                  f"Removed {removed} template candidates | Remaining: {len(self.block_template)}")
+        except Exception as e:
+            print(f"[TransactionManager.on_block_connected] ❌ ERROR: Failed to update block template: {e}")
 
     def _get_chain_height(self) -> int:
         """
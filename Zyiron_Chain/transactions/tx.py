@@ -287,7 +287,7 @@ class Transaction:
 
             # ✅ Lazy import KeyManager
             from Zyiron_Chain.accounts.key_manager import KeyManager
-            key_manager = KeyManager()
+            key_manager = KeyManager.shared()
 
             # ✅ Detect current network
             network = key_manager.network
@@ -305,9 +305,11 @@ class Transaction:
             # ✅ Use Falcon to sign the message
             signature = key_manager.sign_transaction(message, network, identifier)
 
-            # ✅ Apply hex signature to all inputs
+            # ✅ Apply hex signature and signer public key to all inputs
+            public_key = key_manager.keys[network]["keys"][identifier]["public_key"]
             for txin in self.inputs:
                 txin.script_sig = signature.hex()
+                txin.public_key = public_key
 
             self.signature = signature
             print(f"[TRANSACTION SIGN] ✅ Transaction {self.tx_id} signed successfully.")
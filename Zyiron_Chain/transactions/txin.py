@@ -2,7 +2,7 @@ import sys
 import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
-from typing import Dict
+from typing import Dict, Optional
 from decimal import Decimal
 from hashlib import sha3_384
 from Zyiron_Chain.blockchain.constants import Constants
@@ -14,12 +14,13 @@ class TransactionIn:
     Represents a transaction input, referencing a previous UTXO.
     """
 
-    def __init__(self, tx_out_id: str, script_sig: str):
+    def __init__(self, tx_out_id: str, script_sig: str, public_key: Optional[str] = None):
         """
         Initialize a Transaction Input.
 
         :param tx_out_id: The UTXO being referenced.
         :param script_sig: The unlocking script (signature) or placeholder.
+        :param public_key: Signer's Base64 Falcon public key (its hash must match the spent output's script_pub_key).
         """
         if not isinstance(tx_out_id, str) or not tx_out_id.strip():
             print("[TransactionIn ERROR] ❌ tx_out_id must be a non-empty string.")
@@ -38,6 +39,7 @@ class TransactionIn:
 
         self.tx_out_id = tx_out_id.strip()
         self.script_sig = script_sig
+        self.public_key = public_key or None
 
         print(f"[TransactionIn INFO] ✅ Created TransactionIn: tx_out_id={self.tx_out_id}")
 
@@ -47,10 +49,13 @@ class TransactionIn:
 
         :return: Dictionary representation of the transaction input.
         """
-        return {
+        data = {
             "tx_out_id": self.tx_out_id,
             "script_sig": self.script_sig
         }
+        if self.public_key:
+            data["public_key"] = self.public_key
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict) -> "TransactionIn":
@@ -84,7 +89,7 @@ class TransactionIn:
                 raise ValueError("script_sig must be a non-empty string.")
 
             print(f"[TransactionIn.from_dict] ✅ Parsed TransactionIn: tx_out_id={tx_out_id}")
-            return cls(tx_out_id=tx_out_id, script_sig=script_sig)
+            return cls(tx_out_id=tx_out_id, script_sig=script_sig, public_key=data.get("public_key"))
 
         except Exception as e:
             print(f"[TransactionIn.from_dict] ❌ Failed to create TransactionIn: {e}")
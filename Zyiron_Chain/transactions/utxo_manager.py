@@ -106,19 +106,17 @@ class UTXOManager:
             output_index = 0  # Fallback default
             print(f"[UTXOManager.get_utxo] ⚠️ Using fallback mode for raw tx_id: {tx_id}")
 
-        # ✅ Try LMDB lookup
+        # ✅ Try LMDB lookup (through UTXOStorage, which owns utxo.lmdb)
         utxo_key = f"utxo:{tx_id}:{output_index}"
         try:
-            with self.utxo_db.env.begin() as txn:
-                value_bytes = txn.get(utxo_key.encode('utf-8'))
-                if value_bytes:
-                    try:
-                        utxo_data = json.loads(value_bytes.decode('utf-8'))
-                        utxo = TransactionOut.from_dict(utxo_data)
-                        self._cache[tx_out_id] = utxo
-                        return utxo
-                    except Exception as parse_err:
-                        print(f"[UTXOManager.get_utxo] ❌ Failed to parse LMDB UTXO for {utxo_key}: {parse_err}")
+            utxo_data = self.utxo_storage.get_utxo(tx_id, output_index)
+            if utxo_data:
+                try:
+                    utxo = TransactionOut.from_dict(utxo_data)
+                    self._cache[tx_out_id] = utxo
+                    return utxo
+                except Exception as parse_err:
+                    print(f"[UTXOManager.get_utxo] ❌ Failed to parse LMDB UTXO for {utxo_key}: {parse_err}")
         except Exception as e:
             print(f"[UTXOManager.get_utxo] ⚠️ LMDB lookup failed for {utxo_key}: {e}")
 
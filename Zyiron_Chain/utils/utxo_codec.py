@@ -0,0 +1,112 @@
+import sys
+import os
+import json
+import struct
+from decimal import Decimal
+from typing import Dict, Union
+
+# Adjust Python path for project structure
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+sys.path.append(project_root)
+
+from Zyiron_Chain.blockchain.constants import Constants
+
+
+class UTXOCodec:
+    """
+    Fixed-layout binary encoding for UTXO records stored in `utxo.lmdb`.
+
+    Layout (big-endian), version 1:
+        version        (1 byte)   → Constants.UTXO_RECORD_VERSION
+        amount         (8 bytes)  → Amount in base units (Constants.COIN)
+        flags          (1 byte)   → bit 0 = is_locked / locked, bit 1 = spent_status
+        block_height   (4 bytes)
+        tx_id          (48 bytes) → Raw SHA3-384 transaction hash
+        output_index   (4 bytes)
+        script_len     (2 bytes)
+        script_pub_key (script_len bytes, UTF-8)
+
+    Legacy JSON records (first byte `{`) are still decoded, so databases can be
+    migrated in place with `main/migrate_utxo.py`.
+    """
+
+    HEADER = struct.Struct(">BQBI48sIH")
+    FLAG_LOCKED = 0x01
+    FLAG_SPENT = 0x02
+    JSON_MARKER = ord("{")
+
+    @staticmethod
+    def is_binary(value: Union[bytes, bytearray, memoryview]) -> bool:
+        """
+        Return True if the stored value uses the binary record format.
+        """
+        return len(value) > 0 and value[0] == Constants.UTXO_RECORD_VERSION
+
+    @staticmethod
+    def encode(utxo_data: Dict) -> bytes:
+        """
+        Encode a UTXO dictionary into the binary record format.
+        Records that cannot be represented exactly (sub-unit amounts, non-hex tx_id,
+        missing fields) are stored as legacy JSON instead of being truncated.
+        """
+        try:
+            amount_units = Decimal(str(utxo_data["amount"])) / Constants.COIN
+            if amount_units != amount_units.to_integral_value() or amount_units < 0:
+                raise ValueError(f"Amount {utxo_data['amount']} is not a whole number of base units.")
+
+            script_bytes = str(utxo_data["script_pub_key"]).encode("utf-8")
+            tx_id_bytes = bytes.fromhex(utxo_data["tx_id"])
+            if len(tx_id_bytes) != 48:
+                raise ValueError(f"tx_id must be 48 bytes, got {len(tx_id_bytes)}.")
+
+            flags = 0
+            # Either key may carry the lock (utxo_manager sets `locked`, storage uses `is_locked`)
+            if utxo_data.get("is_locked") or utxo_data.get("locked"):
+                flags |= UTXOCodec.FLAG_LOCKED
+            if utxo_data.get("spent_status", False):
+                flags |= UTXOCodec.FLAG_SPENT
+
+            header = UTXOCodec.HEADER.pack(
+                Constants.UTXO_RECORD_VERSION,
+                int(amount_units),
+                flags,
+                int(utxo_data.get("block_height") or 0),
+                tx_id_bytes,
+                int(utxo_data["output_index"]),
+                len(script_bytes)
+            )
+            return header + script_bytes
+
+        except Exception as e:
+            print(f"[UTXOCodec.encode] ⚠️ WARNING: Falling back to JSON record: {e}")
+            return json.dumps(utxo_data, sort_keys=True).encode("utf-8")
+
+    @staticmethod
+    def decode(value: Union[bytes, bytearray, memoryview, str]) -> Dict:
+        """
+        Decode a stored UTXO record (binary or legacy JSON) into the dictionary
+        shape used throughout UTXOStorage. Binary records are unpacked straight
+        from the buffer, so LMDB memoryviews are read without copying the header.
+        """
+        if isinstance(value, str):
+            return json.loads(value)
+
+        if not UTXOCodec.is_binary(value):
+            raw = value.tobytes() if isinstance(value, memoryview) else bytes(value)
+            return json.loads(raw.decode("utf-8"))
+
+        _, amount_units, flags, block_height, tx_id_bytes, output_index, script_len = UTXOCodec.HEADER.unpack_from(value, 0)
+        script_start = UTXOCodec.HEADER.size
+        script_pub_key = bytes(value[script_start:script_start + script_len]).decode("utf-8")
+        is_locked = bool(flags & UTXOCodec.FLAG_LOCKED)
+
+        return {
+            "tx_id": tx_id_bytes.hex(),
+            "output_index": output_index,
+            "amount": str(Decimal(amount_units) * Constants.COIN),
+            "script_pub_key": script_pub_key,
+            "is_locked": is_locked,
+            "locked": is_locked,
+            "block_height": block_height,
+            "spent_status": bool(flags & UTXOCodec.FLAG_SPENT)
+        }